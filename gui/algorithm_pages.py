@@ -5,12 +5,26 @@ Algorithm selection and execution pages for the Job Schedule GUI.
 import tkinter as tk
 from tkinter import ttk, messagebox
 import threading
-import time
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
-from .constants import COLORS, FONTS, PADDING
-from src.cultural.cultural import cultural_algorithm, get_metrics as cultural_get_metrics
-from src.backTracking.backTracking import backtracking_algorithm
+from .constants import CARDS_PER_ROW, COLORS, FONTS, PADDING
+from src.solvers.registry import available_solvers, get_solver
+from src.solvers.solver import CancellationToken
+
+
+def result_metrics(result):
+    """A SolveResult's numeric metrics plus its wall time, kept numeric until display."""
+    return dict(result.metrics, execution_time=result.wall_time)
+
+
+def format_metrics(metrics):
+    """Display strings for numeric metrics (as returned by ``result_metrics``)."""
+    return {
+        'makespan': f"{metrics['makespan']} ms",
+        'idle_time': f"{metrics['idle_time']} ms",
+        'utilization': f"{metrics['utilization']:.2f}%",
+        'execTime': f"{round(metrics['execution_time'], 2)} s",
+    }
 
 
 class AlgorithmSelectionPage(tk.Frame):
@@ -75,107 +89,66 @@ class AlgorithmSelectionPage(tk.Frame):
         )
         summary_label.pack(anchor="w")
 
-        # Algorithm selection cards
+        # Algorithm selection cards, one per registered solver
         algo_container = tk.Frame(main_container, bg=COLORS['light_bg'])
         algo_container.pack(fill=tk.BOTH, expand=True, pady=(0, PADDING['large']))
 
-        # Left column - Backtracking
-        backtrack_card = tk.Frame(
-            algo_container,
-            bg='white',
-            relief='solid',
-            borderwidth=1,
-            padx=PADDING['medium'],
-            pady=PADDING['medium']
-        )
-        backtrack_card.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, PADDING['small']))
-
-        # Right column - Cultural
-        cultural_card = tk.Frame(
-            algo_container,
-            bg='white',
-            relief='solid',
-            borderwidth=1,
-            padx=PADDING['medium'],
-            pady=PADDING['medium']
-        )
-        cultural_card.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=(PADDING['small'], 0))
-
-        # Backtracking algorithm card content
-        backtrack_header = tk.Frame(backtrack_card, bg='white')
-        backtrack_header.pack(fill=tk.X, pady=(0, PADDING['medium']))
-
-        backtrack_radio = tk.Radiobutton(
-            backtrack_header,
-            text="Backtracking Search",
-            variable=self.selected_algorithm,
-            value="backtracking",
-            font=FONTS['header'],
-            bg='white',
-            fg=COLORS['text_dark'],
-            selectcolor=COLORS['light_bg'],
-            cursor="hand2"
-        )
-        backtrack_radio.pack(anchor="w")
-
-        backtrack_desc = tk.Label(
-            backtrack_card,
-            text="A systematic search algorithm that explores all possible solutions by searching the domain space and abandoning partial candidates when they cannot possibly lead to a valid solution.",
-            font=FONTS['body'],
-            bg='white',
-            fg=COLORS['text_light'],
-            wraplength=300,
-            justify='left'
-        )
-        backtrack_desc.pack(anchor="w", pady=(0, PADDING['medium']))
-
-        backtrack_features = tk.Label(
-            backtrack_card,
-            text="• Guaranteed optimal solution\n• Complete search space exploration\n• Best for small problem sizes",
-            font=FONTS['small'],
-            bg='white',
-            fg=COLORS['text_dark'],
-            justify='left'
-        )
-        backtrack_features.pack(anchor="w")
-
-        # Cultural algorithm card content
-        cultural_header = tk.Frame(cultural_card, bg='white')
-        cultural_header.pack(fill=tk.X, pady=(0, PADDING['medium']))
-
-        cultural_radio = tk.Radiobutton(
-            cultural_header,
-            text="Cultural Algorithm",
-            variable=self.selected_algorithm,
-            value="cultural",
-            font=FONTS['header'],
-            bg='white',
-            fg=COLORS['text_dark'],
-            selectcolor=COLORS['light_bg'],
-            cursor="hand2"
-        )
-        cultural_radio.pack(anchor="w")
-
-        cultural_desc = tk.Label(
-            cultural_card,
-            text="An evolutionary algorithm inspired by cultural evolution processes. Uses a belief space to guide the population-based search toward promising regions.",
-            font=FONTS['body'],
-            bg='white',
-            fg=COLORS['text_light'],
-            wraplength=300,
-            justify='left'
-        )
-        cultural_desc.pack(anchor="w", pady=(0, PADDING['medium']))
+        # Cards wrap into rows, so every registered solver fits in the window
+        solver_names = available_solvers()
+        for column in range(CARDS_PER_ROW):
+            algo_container.grid_columnconfigure(column, weight=1, uniform="algorithm_cards")
+        for index, name in enumerate(solver_names):
+            solver = get_solver(name)
+            card = tk.Frame(
+                algo_container,
+                bg='white',
+                relief='solid',
+                borderwidth=1,
+                padx=PADDING['medium'],
+                pady=PADDING['medium']
+            )
+            row, column = divmod(index, CARDS_PER_ROW)
+            left_pad = 0 if column == 0 else PADDING['small']
+            right_pad = 0 if column == CARDS_PER_ROW - 1 else PADDING['small']
+            top_pad = 0 if row == 0 else PADDING['small']
+            card.grid(row=row, column=column, sticky="nsew", padx=(left_pad, right_pad), pady=(top_pad, 0))
+
+            card_header = tk.Frame(card, bg='white')
+            card_header.pack(fill=tk.X, pady=(0, PADDING['medium']))
+
+            radio = tk.Radiobutton(
+                card_header,
+                text=solver.display_name,
+                variable=self.selected_algorithm,
+                value=name,
+                font=FONTS['header'],
+                bg='white',
+                fg=COLORS['text_dark'],
+                selectcolor=COLORS['light_bg'],
+                cursor="hand2"
+            )
+            radio.pack(anchor="w")
 
-        cultural_features = tk.Label(
-            cultural_card,
-            text="• Heuristic approach\n• Faster convergence\n• Good for larger problems\n• Cultural knowledge sharing",
-            font=FONTS['small'],
-            bg='white',
-            fg=COLORS['text_dark'],
-            justify='left'
-        )
-        cultural_features.pack(anchor="w")
+            desc = tk.Label(
+                card,
+                text=solver.description,
+                font=FONTS['body'],
+                bg='white',
+                fg=COLORS['text_light'],
+                wraplength=360,
+                justify='left'
+            )
+            desc.pack(anchor="w", pady=(0, PADDING['medium']))
+
+            features = tk.Label(
+                card,
+                text="\n".join(f"• {feature}" for feature in solver.features),
+                font=FONTS['small'],
+                bg='white',
+                fg=COLORS['text_dark'],
+                justify='left'
+            )
+            features.pack(anchor="w")
 
         # Button frame
         button_frame = tk.Frame(main_container, bg=COLORS['light_bg'])
@@ -196,7 +169,7 @@ class AlgorithmSelectionPage(tk.Frame):
 
         compare_button = tk.Button(
             button_frame,
-            text="Compare Both Algorithms",
+            text="Compare Algorithms",
             command=self.on_compare,
             bg=COLORS['secondary'],
             fg="white",
@@ -227,7 +200,7 @@ class AlgorithmSelectionPage(tk.Frame):
             self.on_run_callback(algorithm, self.machine_count, self.job_count, self.jobs_data)
 
     def on_compare(self):
-        """Handle compare both button."""
+        """Handle compare button."""
         if self.on_run_callback:
             self.on_run_callback("compare", self.machine_count, self.job_count, self.jobs_data)
 
@@ -247,10 +220,16 @@ class AlgorithmResultsPage(tk.Frame):
         self.job_count = job_count
         self.jobs_data = jobs_data
         self.on_back_callback = on_back_callback
-        self.timeline = None
+        self.solver = get_solver(algorithm)
+        # Solvers that report progress per step get the plot layout
+        self.shows_evolution = self.solver.progress_unit != 'node'
+        self.evolves = self.solver.progress_unit == 'generation'
+        self.cancel_token = CancellationToken()
+        self.schedule = None
         self.metrics = None
         self.is_running = False
         self.generation_data = []  # Store generation history for display
+        self.live_metrics = None  # Latest 'metrics' event snapshot
 
         self.create_widgets()
         self.run_algorithm()
@@ -263,7 +242,7 @@ class AlgorithmResultsPage(tk.Frame):
 
         title_label = tk.Label(
             header_frame,
-            text=f"{self.algorithm.title()} Algorithm Results",
+            text=f"{self.solver.display_name} Results",
             font=FONTS['title'],
             bg=COLORS['light_bg'],
             fg=COLORS['primary_dark']
@@ -283,11 +262,11 @@ class AlgorithmResultsPage(tk.Frame):
         )
         back_button.pack(side=tk.RIGHT)
 
-        # For cultural algorithm: different layout with more space for plot
-        if self.algorithm == "cultural":
+        # For population-based algorithms: different layout with more space for plot
+        if self.shows_evolution:
             self._create_cultural_layout()
         else:
-            # For backtracking: keep original layout
+            # For search algorithms: keep original layout
             self._create_backtracking_layout()
 
     def _create_backtracking_layout(self):
@@ -467,7 +446,7 @@ class AlgorithmResultsPage(tk.Frame):
 
         self.plot_button = tk.Button(
             toggle_frame,
-            text="Evolution Plot",
+            text="Evolution Plot" if self.evolves else "Progress Plot",
             command=lambda: self._toggle_view("plot"),
             bg=COLORS['text_light'],
             fg="white",
@@ -525,28 +504,18 @@ class AlgorithmResultsPage(tk.Frame):
         try:
             # Prepare data for the algorithm
             problem_data = self._prepare_problem_data()
-            
-            if self.algorithm == "cultural":
-                start_time = time.time()
-                timeline, fitness, fitness_history = cultural_algorithm(
-                    problem_data, 
-                    generation_callback=self._on_generation_update
-                )
-                exec_time = time.time() - start_time
-                self.metrics = cultural_get_metrics(timeline, exec_time)
-            elif self.algorithm == "backtracking":
-                timeline, self.metrics, step_history = backtracking_algorithm(
-                    problem_data,
-                    generation_callback=self._on_generation_update
-                )
-                # Convert to fitness-like format for consistency
-                fitness_history = step_history
-            else:
-                messagebox.showerror("Error", f"Unknown algorithm: {self.algorithm}")
+
+            result = self.solver.solve(
+                problem_data,
+                cancel=self.cancel_token,
+                on_progress=self._on_generation_update
+            )
+            if self.cancel_token.cancelled:
                 return
-            
+
             # Get metrics
-            self.timeline = timeline
+            self.metrics = result_metrics(result)
+            self.schedule = result.schedule
             
             # Update UI in main thread
             self.after(0, self._display_results)
@@ -557,17 +526,17 @@ class AlgorithmResultsPage(tk.Frame):
             import traceback
             traceback.print_exc()
 
-    def _on_generation_update(self, step, info):
-        """Callback for generation/step updates from the algorithm."""
-        # Handle both dict info (backtracking) and single fitness value (cultural)
-        if isinstance(info, dict):
-            # Backtracking format
-            fitness = info.get('best_makespan', 'N/A')
-        else:
-            # Cultural algorithm format
-            fitness = info
+    def _on_generation_update(self, event):
+        """Callback for progress events from the solver."""
+        if event.kind == 'metrics':
+            self.live_metrics = event.info
+            self.after(0, self._update_generation_display)
+            return
+        if event.kind != 'progress':
+            return
+        fitness = event.objective if event.objective is not None else 'N/A'
         
-        self.generation_data.append((step, fitness))
+        self.generation_data.append((event.step, fitness))
         # Update UI in main thread
         self.after(0, self._update_generation_display)
 
@@ -614,9 +583,9 @@ GENERATION EVOLUTION
         """Update generation display in real-time."""
         self.stats_text.config(state=tk.NORMAL)
         
-        algo_label = "GENERATIONS" if self.algorithm == "cultural" else "SEARCH PROGRESS"
-        step_name = "Node" if self.algorithm == "backtracking" else "Generation"
-        best_name = "Best Makespan" if self.algorithm == "backtracking" else "Best Fitness"
+        step_name = self.solver.progress_unit.title()
+        algo_label = f"{step_name.upper()}S" if self.shows_evolution else "SEARCH PROGRESS"
+        best_name = self.solver.objective_name
 
         
         stats_content = f"""ALGORITHM: {self.algorithm.upper()}
@@ -631,6 +600,18 @@ GENERATION EVOLUTION
                 stats_content += f"{step_name} {step:5d}: {best_name} = {fitness:.2f}\n"
             else:
                 stats_content += f"{step_name} {step:5d}: {best_name} = {fitness}\n"
+
+        live = self.live_metrics
+        if live and live['makespan'] is not None:
+            gap = f"{live['gap'] * 100:.2f}%" if live['gap'] is not None else 'N/A'
+            stats_content += f"""
+CURRENT BEST
+{'=' * 40}
+Makespan: {live['makespan']} (lower bound {live['lower_bound']})
+Gap: {gap}
+Utilization: {live['utilization']:.2f}%
+Idle Time: {live['idle_time']}
+"""
         
         self.stats_text.delete(1.0, tk.END)
         self.stats_text.insert(tk.END, stats_content)
@@ -649,9 +630,10 @@ GENERATION EVOLUTION
         except tk.TclError:
             return
         
-        algo_label = "GENERATIONS" if self.algorithm == "cultural" else "SEARCH PROGRESS"
-        step_name = "Node" if self.algorithm == "backtracking" else "Generation"
-        best_name = "Best Makespan" if self.algorithm == "backtracking" else "Best Fitness"
+        shown = format_metrics(self.metrics)
+        step_name = self.solver.progress_unit.title()
+        algo_label = f"{step_name.upper()}S" if self.shows_evolution else "SEARCH PROGRESS"
+        best_name = self.solver.objective_name
 
         
         stats_content = f"""ALGORITHM: {self.algorithm.upper()}
@@ -677,10 +659,10 @@ PROBLEM CONFIGURATION
 
 PERFORMANCE METRICS
 {'=' * 40}
-• Makespan: {self.metrics['makespan']}
-• Total Idle Time: {self.metrics['idle_time']}
-• Resource Utilization: {self.metrics['utilization']}%
-• Execution Time: {self.metrics['execTime']}
+• Makespan: {shown['makespan']}
+• Total Idle Time: {shown['idle_time']}
+• Resource Utilization: {shown['utilization']}
+• Execution Time: {shown['execTime']}
 
 {'=' * 40}
 Status: Optimization Complete
@@ -721,11 +703,12 @@ Status: Optimization Complete
 
     def _draw_gantt_chart(self):
         """Draw a simple Gantt chart representation."""
-        if not self.timeline:
+        schedule = self.schedule
+        if not schedule:
             return
         
-        # Use alternate canvas for cultural algorithm, regular for backtracking
-        canvas = self.gantt_canvas_alt if self.algorithm == "cultural" else self.gantt_canvas
+        # Use alternate canvas for population-based algorithms, regular for search
+        canvas = self.gantt_canvas_alt if self.shows_evolution else self.gantt_canvas
         
         # Check if widget still exists
         try:
@@ -740,10 +723,7 @@ Status: Optimization Complete
             return
         
         # Get timeline dimensions
-        makespan = max(max(
-            list(task_dict.values())[0][0] + list(task_dict.values())[0][1]
-            for task_dict in tasks
-        ) for tasks in self.timeline.values() if tasks)
+        makespan = schedule.makespan
         
         # Canvas dimensions
         canvas_width = canvas.winfo_width()
@@ -772,7 +752,7 @@ Status: Optimization Complete
         # Colors for different machines
         colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A', '#98D8C8', '#F7DC6F', '#BB8FCE', '#85C1E2']
         
-        machines = sorted(self.timeline.keys())
+        machines = schedule.used_machines()
         machine_height = chart_height / len(machines) if machines else 0
         
         # Draw machines and tasks
@@ -782,33 +762,33 @@ Status: Optimization Complete
             # Draw machine label
             canvas.create_text(
                 left_margin - 10, y_pos + machine_height / 2,
-                text=f"M{machine}",
+                text=f"M{machine + 1}",
                 font=FONTS['body'],
                 anchor='e'
             )
             
             # Draw tasks
-            for task_dict in self.timeline[machine]:
-                for (job_id, task_id), (start_time, duration) in task_dict.items():
-                    x_start = left_margin + (start_time / makespan) * chart_width
-                    x_width = (duration / makespan) * chart_width
-                    
-                    color = colors[(job_id - 1) % len(colors)]
-                    
-                    canvas.create_rectangle(
-                        x_start, y_pos,
-                        x_start + x_width, y_pos + machine_height - 2,
-                        fill=color, outline='black', width=1
+            for row in schedule.machine_order(machine):
+                job_id, task_id, _, start_time, duration = schedule.row(row)
+                x_start = left_margin + (start_time / makespan) * chart_width
+                x_width = (duration / makespan) * chart_width
+                
+                color = colors[(job_id - 1) % len(colors)]
+                
+                canvas.create_rectangle(
+                    x_start, y_pos,
+                    x_start + x_width, y_pos + machine_height - 2,
+                    fill=color, outline='black', width=1
+                )
+                
+                # Add label if space permits
+                if x_width > 30:
+                    canvas.create_text(
+                        x_start + x_width / 2, y_pos + machine_height / 2,
+                        text=f"J{job_id}T{task_id}",
+                        font=FONTS['small'],
+                        fill='white'
                     )
-                    
-                    # Add label if space permits
-                    if x_width > 30:
-                        canvas.create_text(
-                            x_start + x_width / 2, y_pos + machine_height / 2,
-                            text=f"J{job_id}T{task_id}",
-                            font=FONTS['small'],
-                            fill='white'
-                        )
         
         # Draw time axis
         canvas.create_line(
@@ -830,9 +810,9 @@ Status: Optimization Complete
             )
 
     def _draw_fitness_evolution_plot(self):
-        """Draw fitness evolution plot using matplotlib (only for cultural algorithm)."""
-        # Only draw for cultural algorithm
-        if self.algorithm != "cultural" or not self.generation_data:
+        """Draw the best objective per progress step using matplotlib (not for node-counting searches)."""
+        # Node-counting searches have no plot
+        if not self.shows_evolution or not self.generation_data:
             return
         
         # Check if widget still exists
@@ -854,9 +834,11 @@ Status: Optimization Complete
             
             # Plot
             ax.plot(generations, fitness_values, 'b-o', linewidth=2, markersize=5)
-            ax.set_xlabel('Generation', fontsize=12, fontweight='bold')
-            ax.set_ylabel('Best Fitness (ms)', fontsize=12, fontweight='bold')
-            ax.set_title('Cultural Algorithm Evolution Over Generations', fontsize=13, fontweight='bold')
+            ax.set_xlabel(self.solver.progress_unit.title(), fontsize=12, fontweight='bold')
+            ax.set_ylabel(f'{self.solver.objective_name} (ms)', fontsize=12, fontweight='bold')
+            title = 'Evolution' if self.evolves else 'Progress'
+            ax.set_title(f'{self.solver.display_name} {title} Over {self.solver.progress_unit.title()}s',
+                         fontsize=13, fontweight='bold')
             ax.grid(True, alpha=0.3, linestyle='--')
             ax.set_facecolor('#f8f9fa')
             
@@ -879,12 +861,30 @@ Status: Optimization Complete
 
     def on_back(self):
         """Handle back button."""
+        # Stop the background solver instead of letting it run to its time limit
+        self.cancel_token.cancel()
         if self.on_back_callback:
             self.on_back_callback()
 
 
+# Solvers compared side by side: registry name and the colour of their Gantt chart title
+COMPARED_SOLVERS = (
+    ('backtracking', COLORS['primary']),
+    ('cultural', COLORS['secondary']),
+    ('tabu', COLORS['success']),
+)
+
+
 class AlgorithmComparisonPage(tk.Frame):
-    """Page displaying comparison between Backtracking and Cultural algorithms."""
+    """Page displaying comparison between Backtracking, Cultural and Tabu Search algorithms."""
+
+    # Table rows: display name -> (numeric metrics key, format_metrics key, True if higher is better)
+    METRIC_KEYS = {
+        "Makespan (ms)": ('makespan', 'makespan', False),
+        "Total Idle Time (ms)": ('idle_time', 'idle_time', False),
+        "Resource Utilization (%)": ('utilization', 'utilization', True),
+        "Execution Time (s)": ('execution_time', 'execTime', False),
+    }
 
     def __init__(self, parent, machine_count, job_count, jobs_data, on_back_callback=None):
         super().__init__(parent, bg=COLORS['light_bg'])
@@ -892,15 +892,15 @@ class AlgorithmComparisonPage(tk.Frame):
         self.job_count = job_count
         self.jobs_data = jobs_data
         self.on_back_callback = on_back_callback
-        
-        # Store results
-        self.backtrack_metrics = None
-        self.cultural_metrics = None
-        self.backtrack_timeline = None
-        self.cultural_timeline = None
+
+        # Store results, keyed by solver name
+        self.solver_names = [name for name, _ in COMPARED_SOLVERS]
+        self.labels = {name: get_solver(name).display_name for name in self.solver_names}
+        self.metrics = {}
+        self.schedules = {}
+        self.threads = {}
         self.is_running = False
-        self.backtrack_thread = None
-        self.cultural_thread = None
+        self.cancel_token = CancellationToken()
 
         self.create_widgets()
         self.run_comparison()
@@ -977,8 +977,8 @@ class AlgorithmComparisonPage(tk.Frame):
         )
         table_title.pack()
 
-        # Create treeview for comparison
-        columns = ("Metric", "Backtracking", "Cultural", "Winner")
+        # Create treeview for comparison: one column per compared solver
+        columns = ("Metric", *self.solver_names, "Winner")
         self.comparison_tree = ttk.Treeview(
             table_card,
             columns=columns,
@@ -1003,27 +1003,18 @@ class AlgorithmComparisonPage(tk.Frame):
         self.comparison_tree.heading("Metric", text="Performance Metric")
         self.comparison_tree.column("Metric", width=200, anchor="w")
 
-        self.comparison_tree.heading("Backtracking", text="Backtracking")
-        self.comparison_tree.column("Backtracking", width=150, anchor="center")
-
-        self.comparison_tree.heading("Cultural", text="Cultural")
-        self.comparison_tree.column("Cultural", width=150, anchor="center")
+        for name in self.solver_names:
+            self.comparison_tree.heading(name, text=self.labels[name])
+            self.comparison_tree.column(name, width=150, anchor="center")
 
         self.comparison_tree.heading("Winner", text="Winner")
-        self.comparison_tree.column("Winner", width=100, anchor="center")
+        self.comparison_tree.column("Winner", width=120, anchor="center")
 
         # Initialize with pending status
         self.metric_rows = {}
-        metrics = [
-            ("Makespan (ms)", "Running...", "Running...", "..."),
-            ("Total Idle Time (ms)", "Running...", "Running...", "..."),
-            ("Resource Utilization (%)", "Running...", "Running...", "..."),
-            ("Execution Time (s)", "Running...", "Running...", "..."),
-        ]
-
-        for i, metric in enumerate(metrics):
-            row_id = self.comparison_tree.insert("", "end", values=metric)
-            self.metric_rows[metric[0]] = row_id
+        for metric_name in self.METRIC_KEYS:
+            values = (metric_name, *["Running..."] * len(self.solver_names), "...")
+            self.metric_rows[metric_name] = self.comparison_tree.insert("", "end", values=values)
 
         # Add scrollbar
         scrollbar = ttk.Scrollbar(table_card, orient="vertical", command=self.comparison_tree.yview)
@@ -1045,77 +1036,51 @@ class AlgorithmComparisonPage(tk.Frame):
         gantt_container = tk.Frame(self, bg=COLORS['light_bg'])
         gantt_container.pack(fill=tk.BOTH, expand=True, padx=PADDING['large'], pady=(0, PADDING['medium']))
 
-        # Left Gantt chart - Backtracking
-        backtrack_frame = tk.Frame(gantt_container, bg='white', relief='solid', borderwidth=1)
-        backtrack_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, PADDING['small']))
-
-        backtrack_title = tk.Label(
-            backtrack_frame,
-            text="Backtracking Schedule",
-            font=FONTS['body'],
-            bg=COLORS['primary'],
-            fg='white'
-        )
-        backtrack_title.pack(fill=tk.X, pady=5)
-
-        self.backtrack_gantt = tk.Canvas(
-            backtrack_frame,
-            bg='white',
-            height=200,
-            relief='flat'
-        )
-        self.backtrack_gantt.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-        
-        # Add scrollwheel support to backtracking canvas
-        self._setup_canvas_scrollwheel(self.backtrack_gantt, backtrack_frame)
-
-        # Right Gantt chart - Cultural
-        cultural_frame = tk.Frame(gantt_container, bg='white', relief='solid', borderwidth=1)
-        cultural_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=(PADDING['small'], 0))
+        # One Gantt chart per solver, side by side
+        self.gantt_canvases = {}
+        for index, (name, color) in enumerate(COMPARED_SOLVERS):
+            frame = tk.Frame(gantt_container, bg='white', relief='solid', borderwidth=1)
+            left_pad = 0 if index == 0 else PADDING['small']
+            right_pad = 0 if index == len(COMPARED_SOLVERS) - 1 else PADDING['small']
+            frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(left_pad, right_pad))
+
+            title = tk.Label(
+                frame,
+                text=f"{self.labels[name]} Schedule",
+                font=FONTS['body'],
+                bg=color,
+                fg='white'
+            )
+            title.pack(fill=tk.X, pady=5)
 
-        cultural_title = tk.Label(
-            cultural_frame,
-            text="Cultural Schedule",
-            font=FONTS['body'],
-            bg=COLORS['secondary'],
-            fg='white'
-        )
-        cultural_title.pack(fill=tk.X, pady=5)
+            canvas = tk.Canvas(
+                frame,
+                bg='white',
+                height=200,
+                relief='flat'
+            )
+            canvas.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
-        self.cultural_gantt = tk.Canvas(
-            cultural_frame,
-            bg='white',
-            height=200,
-            relief='flat'
-        )
-        self.cultural_gantt.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-        
-        # Add scrollwheel support to cultural canvas
-        self._setup_canvas_scrollwheel(self.cultural_gantt, cultural_frame)
+            # Add scrollwheel support to the canvas
+            self._setup_canvas_scrollwheel(canvas, frame)
+            self.gantt_canvases[name] = canvas
 
     def run_comparison(self):
-        """Run both algorithms in parallel."""
+        """Run every compared algorithm in parallel."""
         self.is_running = True
-        
+
         # Create problem data dict for algorithms using the same format as results page
         problem_data = self._prepare_problem_data()
-        
-        # Run backtracking in background thread
-        self.backtrack_thread = threading.Thread(
-            target=self._run_backtracking,
-            args=(problem_data,),
-            daemon=True
-        )
-        self.backtrack_thread.start()
-        
-        # Run cultural algorithm in background thread
-        self.cultural_thread = threading.Thread(
-            target=self._run_cultural,
-            args=(problem_data,),
-            daemon=True
-        )
-        self.cultural_thread.start()
-        
+
+        # Run each algorithm in a background thread
+        for name in self.solver_names:
+            self.threads[name] = threading.Thread(
+                target=self._run_solver,
+                args=(name, problem_data),
+                daemon=True
+            )
+            self.threads[name].start()
+
         # Start checking for completion
         self.check_completion()
 
@@ -1142,191 +1107,76 @@ class AlgorithmComparisonPage(tk.Frame):
         
         return problem_data
 
-    def _run_backtracking(self, problem_data):
-        """Run backtracking algorithm."""
+    def _run_solver(self, name, problem_data):
+        """Run one compared algorithm."""
         try:
-            start_time = time.time()
-            timeline, metrics, _ = backtracking_algorithm(problem_data)
-            exec_time = time.time() - start_time
-            self.backtrack_timeline = timeline
-            self.backtrack_metrics = metrics
+            result = get_solver(name).solve(problem_data, cancel=self.cancel_token)
+            self.schedules[name] = result.schedule
+            self.metrics[name] = result_metrics(result)
             # Draw Gantt chart
-            self.after(0, self._draw_backtrack_gantt)
+            self.after(0, lambda: self._draw_solver_gantt(name))
         except Exception as e:
-            print(f"Backtracking error: {e}")
+            print(f"{self.labels[name]} error: {e}")
             import traceback
             traceback.print_exc()
-            self.backtrack_metrics = None
-
-    def _run_cultural(self, problem_data):
-        """Run cultural algorithm."""
-        try:
-            start_time = time.time()
-            timeline, _, _ = cultural_algorithm(problem_data)
-            exec_time = time.time() - start_time
-            self.cultural_timeline = timeline
-            self.cultural_metrics = cultural_get_metrics(timeline, exec_time)
-            # Draw Gantt chart
-            self.after(0, self._draw_cultural_gantt)
-        except Exception as e:
-            print(f"Cultural error: {e}")
-            import traceback
-            traceback.print_exc()
-            self.cultural_metrics = None
+            # Mark as done so the page stops waiting for it
+            self.metrics[name] = None
 
     def check_completion(self):
-        """Check if both algorithms have completed and update display."""
-        # Update display if either algorithm has completed
-        if self.backtrack_metrics is not None:
-            self._update_backtrack_display()
-        
-        if self.cultural_metrics is not None:
-            self._update_cultural_display()
-        
-        # Both algorithms completed
-        if self.backtrack_metrics is not None and self.cultural_metrics is not None:
+        """Check if all algorithms have completed and update display."""
+        # Update display for every algorithm that has completed
+        for name in self.solver_names:
+            if self.metrics.get(name):
+                self._update_solver_display(name)
+
+        # All algorithms completed
+        if all(name in self.metrics for name in self.solver_names):
             self._update_winners()
             self.is_running = False
         elif self.is_running:
             # Still running, check again in 500ms
             self.after(500, self.check_completion)
 
-    def _update_backtrack_display(self):
-        """Update backtracking metrics in the table."""
-        if not self.backtrack_metrics:
-            return
-        
-        metrics_map = {
-            "Makespan (ms)": self.backtrack_metrics['makespan'],
-            "Total Idle Time (ms)": self.backtrack_metrics['idle_time'],
-            "Resource Utilization (%)": f"{self.backtrack_metrics['utilization']:.2f}%",
-            "Execution Time (s)": self.backtrack_metrics['execTime'],
-        }
-        
-        for metric_name, metric_value in metrics_map.items():
-            if metric_name in self.metric_rows:
-                row_id = self.metric_rows[metric_name]
-                current_values = self.comparison_tree.item(row_id)['values']
-                # Update backtracking column (index 1), keep others as is
-                self.comparison_tree.item(
-                    row_id,
-                    values=(current_values[0], metric_value, current_values[2], current_values[3])
-                )
+    def _update_solver_display(self, name):
+        """Update one algorithm's column in the table."""
+        shown = format_metrics(self.metrics[name])
+        column = self.solver_names.index(name) + 1
 
-    def _update_cultural_display(self):
-        """Update cultural metrics in the table."""
-        if not self.cultural_metrics:
-            return
-        
-        metrics_map = {
-            "Makespan (ms)": self.cultural_metrics['makespan'],
-            "Total Idle Time (ms)": self.cultural_metrics['idle_time'],
-            "Resource Utilization (%)": f"{self.cultural_metrics['utilization']:.2f}%",
-            "Execution Time (s)": self.cultural_metrics['execTime'],
-        }
-        
-        for metric_name, metric_value in metrics_map.items():
-            if metric_name in self.metric_rows:
-                row_id = self.metric_rows[metric_name]
-                current_values = self.comparison_tree.item(row_id)['values']
-                # Update cultural column (index 2), keep others as is
-                self.comparison_tree.item(
-                    row_id,
-                    values=(current_values[0], current_values[1], metric_value, current_values[3])
-                )
+        for metric_name, (_, shown_key, _) in self.METRIC_KEYS.items():
+            row_id = self.metric_rows[metric_name]
+            values = list(self.comparison_tree.item(row_id)['values'])
+            values[column] = shown[shown_key]
+            self.comparison_tree.item(row_id, values=values)
 
     def _update_winners(self):
-        """Update winner column when both algorithms have completed."""
-        if not self.backtrack_metrics or not self.cultural_metrics:
+        """Update winner column when all algorithms have completed."""
+        finished = [name for name in self.solver_names if self.metrics.get(name)]
+        if not finished:
             return
-        
-        # Extract numeric values for comparison
-        backtrack_makespan = float(self.backtrack_metrics['makespan'].split()[0])
-        cultural_makespan = float(self.cultural_metrics['makespan'].split()[0])
-        
-        backtrack_idle = float(self.backtrack_metrics['idle_time'].split()[0])
-        cultural_idle = float(self.cultural_metrics['idle_time'].split()[0])
-        
-        backtrack_util = float(self.backtrack_metrics['utilization'])
-        cultural_util = float(self.cultural_metrics['utilization'])
-        
-        backtrack_time = float(self.backtrack_metrics['execTime'].split()[0])
-        cultural_time = float(self.cultural_metrics['execTime'].split()[0])
-        
-        # Determine winners (lower is better for makespan/idle, higher is better for utilization)
-        winners = {
-            "Makespan (ms)": "Backtracking" if backtrack_makespan < cultural_makespan else "Cultural",
-            "Total Idle Time (ms)": "Backtracking" if backtrack_idle < cultural_idle else "Cultural",
-            "Resource Utilization (%)": "Cultural" if cultural_util > backtrack_util else "Backtracking",
-            "Execution Time (s)": "Cultural" if cultural_time < backtrack_time else "Backtracking",
-        }
-        
-        # Update winner column for each metric
-        for metric_name, winner in winners.items():
-            if metric_name in self.metric_rows:
-                row_id = self.metric_rows[metric_name]
-                current_values = self.comparison_tree.item(row_id)['values']
-                # Update winner column (index 3), keep others as is
-                self.comparison_tree.item(
-                    row_id,
-                    values=(current_values[0], current_values[1], current_values[2], winner)
-                )
 
-    def _update_comparison_display(self):
-        """Update the comparison table with actual results."""
-        # Extract numeric values for comparison
-        backtrack_makespan = float(self.backtrack_metrics['makespan'].split()[0])
-        cultural_makespan = float(self.cultural_metrics['makespan'].split()[0])
-        
-        backtrack_idle = float(self.backtrack_metrics['idle_time'].split()[0])
-        cultural_idle = float(self.cultural_metrics['idle_time'].split()[0])
-        
-        backtrack_util = float(self.backtrack_metrics['utilization'])
-        cultural_util = float(self.cultural_metrics['utilization'])
-        
-        backtrack_time = float(self.backtrack_metrics['execTime'].split()[0])
-        cultural_time = float(self.cultural_metrics['execTime'].split()[0])
-        
-        # Determine winners (lower is better for makespan/idle, higher is better for utilization)
-        makespan_winner = "Backtracking" if backtrack_makespan < cultural_makespan else "Cultural"
-        idle_winner = "Backtracking" if backtrack_idle < cultural_idle else "Cultural"
-        util_winner = "Cultural" if cultural_util > backtrack_util else "Backtracking"
-        time_winner = "Cultural" if cultural_time < backtrack_time else "Backtracking"
-        
-        # Update table rows
-        metrics_data = [
-            ("Makespan (ms)", self.backtrack_metrics['makespan'], self.cultural_metrics['makespan'], makespan_winner),
-            ("Total Idle Time (ms)", self.backtrack_metrics['idle_time'], self.cultural_metrics['idle_time'], idle_winner),
-            ("Resource Utilization (%)", f"{self.backtrack_metrics['utilization']:.2f}%", f"{self.cultural_metrics['utilization']:.2f}%", util_winner),
-            ("Execution Time (s)", self.backtrack_metrics['execTime'], self.cultural_metrics['execTime'], time_winner),
-        ]
-        
-        for metric_name, backtrack_val, cultural_val, winner in metrics_data:
-            if metric_name in self.metric_rows:
-                self.comparison_tree.item(
-                    self.metric_rows[metric_name],
-                    values=(metric_name, backtrack_val, cultural_val, winner)
-                )
-
-    def _draw_backtrack_gantt(self):
-        """Draw Gantt chart for backtracking algorithm."""
-        if not self.backtrack_timeline:
+        # Lower is better for makespan/idle/time, higher is better for utilization; ties go to the first column
+        for metric_name, (key, _, higher_is_better) in self.METRIC_KEYS.items():
+            if higher_is_better:
+                winner = max(finished, key=lambda name: self.metrics[name][key])
+            else:
+                winner = min(finished, key=lambda name: self.metrics[name][key])
+            row_id = self.metric_rows[metric_name]
+            values = list(self.comparison_tree.item(row_id)['values'])
+            values[-1] = self.labels[winner]
+            self.comparison_tree.item(row_id, values=values)
+
+    def _draw_solver_gantt(self, name):
+        """Draw Gantt chart for one compared algorithm."""
+        if not self.schedules.get(name):
             return
-        
-        self.backtrack_gantt.delete("all")
-        self._draw_gantt_on_canvas(self.backtrack_gantt, self.backtrack_timeline, "Backtracking")
 
-    def _draw_cultural_gantt(self):
-        """Draw Gantt chart for cultural algorithm."""
-        if not self.cultural_timeline:
-            return
-        
-        self.cultural_gantt.delete("all")
-        self._draw_gantt_on_canvas(self.cultural_gantt, self.cultural_timeline, "Cultural")
+        canvas = self.gantt_canvases[name]
+        canvas.delete("all")
+        self._draw_gantt_on_canvas(canvas, self.schedules[name], self.labels[name])
 
-    def _draw_gantt_on_canvas(self, canvas, timeline, algorithm_name):
+    def _draw_gantt_on_canvas(self, canvas, schedule, algorithm_name):
         """Generic method to draw Gantt chart on a canvas."""
-        if not timeline:
+        if not schedule:
             return
         
         # Get canvas dimensions
@@ -1339,16 +1189,7 @@ class AlgorithmComparisonPage(tk.Frame):
             canvas_height = 200
         
         # Get timeline dimensions
-        try:
-            max_time = max(
-                max(
-                    list(task_dict.values())[0][0] + list(task_dict.values())[0][1]
-                    for task_dict in tasks
-                )
-                for tasks in timeline.values() if tasks
-            )
-        except (ValueError, IndexError, KeyError):
-            max_time = 100
+        max_time = schedule.makespan or 100
         
         # Layout parameters
         margin_left = 40
@@ -1363,7 +1204,8 @@ class AlgorithmComparisonPage(tk.Frame):
         time_scale = chart_width / max(max_time, 1)
         
         # Machine height
-        num_machines = len(timeline)
+        machines = schedule.used_machines()
+        num_machines = len(machines)
         machine_height = chart_height / max(num_machines, 1)
         
         # Color palette for jobs
@@ -1373,13 +1215,13 @@ class AlgorithmComparisonPage(tk.Frame):
         ]
         
         # Draw machines and tasks
-        for machine_idx, (machine, tasks) in enumerate(sorted(timeline.items())):
+        for machine_idx, machine in enumerate(machines):
             y_pos = margin_top + machine_idx * machine_height
             
             # Draw machine label
             canvas.create_text(
                 margin_left - 10, y_pos + machine_height / 2,
-                text=f"M{machine}", anchor="e", font=(FONTS['small'][0], 8),
+                text=f"M{machine + 1}", anchor="e", font=(FONTS['small'][0], 8),
                 fill=COLORS['text_dark']
             )
             
@@ -1391,29 +1233,29 @@ class AlgorithmComparisonPage(tk.Frame):
             )
             
             # Draw tasks
-            for task_dict in tasks:
-                for (job_id, task_id), (start_time, duration) in task_dict.items():
-                    x1 = margin_left + start_time * time_scale
-                    x2 = x1 + duration * time_scale
-                    y1 = y_pos + 2
-                    y2 = y_pos + machine_height - 2
-                    
-                    # Get color for job
-                    color = colors[(job_id - 1) % len(colors)]
-                    
-                    # Draw task rectangle
-                    canvas.create_rectangle(
-                        x1, y1, x2, y2,
-                        fill=color, outline='#333333', width=1
+            for row in schedule.machine_order(machine):
+                job_id = schedule.job_ids[row]
+                x1 = margin_left + schedule.starts[row] * time_scale
+                x2 = x1 + schedule.durations[row] * time_scale
+                y1 = y_pos + 2
+                y2 = y_pos + machine_height - 2
+                
+                # Get color for job
+                color = colors[(job_id - 1) % len(colors)]
+                
+                # Draw task rectangle
+                canvas.create_rectangle(
+                    x1, y1, x2, y2,
+                    fill=color, outline='#333333', width=1
+                )
+                
+                # Draw task label if there's enough space
+                if x2 - x1 > 30:
+                    canvas.create_text(
+                        (x1 + x2) / 2, (y1 + y2) / 2,
+                        text=f"J{job_id}", anchor="center",
+                        font=(FONTS['small'][0], 7), fill='white'
                     )
-                    
-                    # Draw task label if there's enough space
-                    if x2 - x1 > 30:
-                        canvas.create_text(
-                            (x1 + x2) / 2, (y1 + y2) / 2,
-                            text=f"J{job_id}", anchor="center",
-                            font=(FONTS['small'][0], 7), fill='white'
-                        )
         
         # Draw time axis
         axis_y = margin_top + chart_height
@@ -1471,5 +1313,6 @@ class AlgorithmComparisonPage(tk.Frame):
 
     def on_back(self):
         """Handle back button."""
+        self.cancel_token.cancel()
         if self.on_back_callback:
             self.on_back_callback()
@@ -47,3 +47,6 @@ PADDING = {
     'xlarge': 20
 }
 
+# Algorithm selection cards per row
+CARDS_PER_ROW = 3
+
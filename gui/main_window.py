@@ -108,7 +108,7 @@ class MainWindow:
         self.current_page = "results"
 
     def show_comparison_page(self):
-        """Display comparison page for both algorithms."""
+        """Display comparison page for the compared algorithms."""
         self.clear_main_frame()
 
         comparison_page = AlgorithmComparisonPage(
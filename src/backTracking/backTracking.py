@@ -5,9 +5,17 @@ import time
 sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
 
 from src.helperFunctions.readFromCSV import read_dataset
+from src.backTracking.searchHooks import SearchHooks, SearchMonitor, NODE, solver_progress_hooks
+from src.solvers.liveMetrics import LiveMetrics, DEFAULT_METRICS_INTERVAL
+from src.solvers.registry import register_solver
+from src.helperFunctions.schedule import Schedule
+from src.helperFunctions.warmStart import adapt_schedule
+from src.helperFunctions.scheduleMetrics import schedule_metrics
+from src.solvers.solver import (Budget, ProgressEvent, SolveResult, debug_validate, FEASIBLE, NO_SOLUTION,
+                                CANCELLED)
 data = read_dataset('small')
 class backTracking:
-    def __init__(self):
+    def __init__(self, hooks=None):
         self.machines_count = data['machines_count']
         self.jobs = data['jobs']
         self.total_tasks = data['total_tasks']
@@ -24,6 +32,13 @@ class backTracking:
         # Search statistics
         self.nodes_visited = 0
         self.nodes_pruned = 0
+
+        # Optional SearchHooks subscriptions (progress, incumbents, ...)
+        self.hooks = hooks
+        self.monitor = None
+
+        # Warm start: (job_id, task_id) -> machine of the seed schedule
+        self.warm_hint = None
         
     def _assign_task(self, task, machine, start_time):
         """Add task to machine's timeline."""
@@ -185,12 +200,16 @@ class backTracking:
         
         return True
     
-    def schedule_tasks(self, time_limit=None):
+    def schedule_tasks(self, time_limit=None, node_limit=None, cancel=None, warm_start=None):
         """
         Find the optimal schedule that minimizes makespan.
         
         Args:
             time_limit: Optional time limit in seconds. If None, runs until completion.
+            node_limit: Optional maximum number of search nodes to visit.
+            cancel: Optional CancellationToken checked periodically.
+            warm_start: Optional feasible Schedule of this instance, used as the
+                initial best solution; each task tries its machine there first.
         
         Returns:
             bool: True if a valid schedule is found, False otherwise
@@ -208,12 +227,21 @@ class backTracking:
         self.start_time = time.time()
         self.time_limit = time_limit
         self.interupted = False
+        self.monitor = SearchMonitor(self, self.hooks, time_limit, node_limit, cancel)
         
         print("Starting backtracking search...")
         print(f"Problem size: {self.total_tasks} tasks, {self.total_jobs} jobs, {self.machines_count} machines")
         
         # Sort jobs
         self._sort_jobs()
+
+        self.warm_hint = None
+        if warm_start is not None:
+            self.warm_hint = {(job_id, task_id): machine for job_id, task_id, machine, _, _ in warm_start.rows()}
+            self.best_timeline = warm_start.to_backtracking()
+            self.best_makespan = warm_start.makespan
+            print(f"Warm start makespan: {self.best_makespan}")
+            self.monitor.incumbent(source='warm_start')
         
         # Find all possible schedules and keep the best one
         try:
@@ -238,13 +266,9 @@ class backTracking:
             job_index: Index of current job in self.jobs
             task_index: Index of current task within the current job
         """
-        # Increment node counter and print progress
+        # Count the node; budget checks and progress events only run at monitor checkpoints
         self.nodes_visited += 1
-        if self.nodes_visited % 10000 == 0:
-            print(f"Search progress: {self.nodes_visited} nodes visited, {self.nodes_pruned} nodes pruned")
-        
-        # Check timeout
-        if self.time_limit and (time.time() - self.start_time) > self.time_limit:
+        if self.nodes_visited >= self.monitor.next_check and self.monitor.node_checkpoint():
             self.interupted = True
             return
         
@@ -257,7 +281,7 @@ class backTracking:
             if current_makespan < self.best_makespan:
                 self.best_makespan = current_makespan
                 self.best_timeline = copy.deepcopy(self.timeline)
-                print(f"New best solution found! Makespan: {current_makespan}")
+                self.monitor.incumbent()
             return
         
         current_job = self.jobs[job_index]
@@ -276,8 +300,13 @@ class backTracking:
             'execution_time': current_task_data['execution_time']
         }
         
-        # Get machines ordered by current utilization 
+        # Get machines ordered by current utilization (the warm start's machine first)
         ordered_machines = self._sort_machines()
+        if self.warm_hint:
+            hint = self.warm_hint.get((current_task['job_id'], current_task['task_id']))
+            if hint in ordered_machines:
+                ordered_machines.remove(hint)
+                ordered_machines.insert(0, hint)
         
         # Try scheduling the current task on each machine 
         for machine in ordered_machines:
@@ -289,6 +318,8 @@ class backTracking:
             # Pruning 1: If this assignment alone exceeds best makespan, skip
             if estimated_end >= self.best_makespan:
                 self.nodes_pruned += 1
+                if self.nodes_pruned >= self.monitor.next_prune:
+                    self.monitor.prune_checkpoint()
                 continue
             
             # Pruning 2: Calculate remaining work and check if it can possibly improve best makespan
@@ -321,50 +352,17 @@ class backTracking:
     
         
     def get_metrics(self):
+        """Metrics of the current schedule (see ``schedule_metrics``) plus execution_time in seconds."""
         if not self.timeline:
             return {}
 
-        makespan = self._calculate_makespan()
-
-        total_busy_time = 0
-        total_idle_time = 0
-
-        for machine in range(self.machines_count):
-            machine_timeline = self.timeline.get(machine, [])
-
-            # Sort tasks
-            sorted_tasks = sorted(machine_timeline, key=lambda t: t['start_time'])
-
-            # Busy time (correct utilization)
-            busy_time = sum(task['execution_time'] for task in machine_timeline)
-            total_busy_time += busy_time
-
-            # idle before first task
-            total_idle_time += sorted_tasks[0]['start_time']
-
-            # idle between tasks
-            for i in range(1, len(sorted_tasks)):
-                total_idle_time += sorted_tasks[i]['start_time'] - sorted_tasks[i-1]['end_time']
-
-            # idle after last task
-            last_end = sorted_tasks[-1]['end_time']
-            if last_end < makespan:
-                total_idle_time += (makespan - last_end)
-
-        # Utilization across all machines
-        machine_utilization = total_busy_time / (makespan * self.machines_count)
-
-        self.total_idle_time = total_idle_time
-        self.machine_utilization = machine_utilization
+        metrics = schedule_metrics(Schedule.from_backtracking(self.timeline), self.machines_count)
+        self.total_idle_time = metrics['idle_time']
+        self.machine_utilization = metrics['utilization']
         self.execution_time = time.time() - self.start_time
+        metrics['execution_time'] = self.execution_time
+        return metrics
 
-        return {
-            "makespan": str(makespan) + ' ms',
-            "idle_time": str(total_idle_time) + ' ms',
-            "utilization": round(machine_utilization * 100, 2),
-            "execTime": str(round(self.execution_time, 2)) + " s"
-        }
- 
     def print_schedule(self):
         """Print the current schedule in a readable format."""
         if not self.timeline:
@@ -394,7 +392,74 @@ class backTracking:
             print(f"Machine utilization: {machine_end_time} time units")
 
 
-def backtracking_algorithm(problem_data, generation_callback=None):
+@register_solver
+class BacktrackingSolver:
+    """Task-level depth-first backtracking, exposed through the common Solver interface."""
+    name = 'backtracking'
+    display_name = 'Backtracking Search'
+    description = ("A systematic search algorithm that explores all possible solutions by searching the domain "
+                   "space and abandoning partial candidates when they cannot possibly lead to a valid solution.")
+    features = ('Exhaustive over whole-job placements', 'Lower-bound pruning', 'Best for small problem sizes')
+    progress_unit = 'node'
+    objective_name = 'Best Makespan'
+    default_budget = Budget(time_limit=60.0)
+    default_params = {'metrics_interval': DEFAULT_METRICS_INTERVAL}
+    progress_interval = 1000  # nodes between progress events
+
+    def solve(self, problem_data, budget=None, cancel=None, on_progress=None,
+              metrics_interval=DEFAULT_METRICS_INTERVAL, warm_start=None):
+        budget = budget or self.default_budget
+        start_time = time.time()
+        history = []
+        live = LiveMetrics(self.name, problem_data, on_progress, metrics_interval)
+        hooks = solver_progress_hooks(self.name, history, on_progress, self.progress_interval, live)
+
+        bt = backTracking(hooks)
+        bt.machines_count = problem_data['machines_count']
+        bt.total_jobs = problem_data['total_jobs']
+        bt.total_tasks = problem_data['total_tasks']
+        bt.jobs = copy.deepcopy(problem_data['jobs'])
+
+        warm = adapt_schedule(warm_start, problem_data) if warm_start is not None else None
+        found = bt.schedule_tasks(time_limit=budget.time_limit, node_limit=budget.node_limit, cancel=cancel,
+                                  warm_start=warm)
+        schedule = Schedule.from_backtracking(bt.timeline) if found else Schedule()
+
+        if cancel is not None and cancel.cancelled:
+            status = CANCELLED
+        elif not found:
+            status = NO_SOLUTION
+        else:
+            # Jobs are placed whole at their earliest fit, which doesn't reach every schedule: even a
+            # completed search proves nothing about optimality
+            status = FEASIBLE
+
+        stats = {'nodes_pruned': bt.nodes_pruned}
+        if warm is not None:
+            stats['warm_start_makespan'] = warm.makespan
+
+        result = SolveResult(
+            solver=self.name,
+            status=status,
+            schedule=schedule,
+            makespan=bt.best_makespan if found else None,
+            metrics=schedule.metrics(bt.machines_count),
+            wall_time=time.time() - start_time,
+            nodes=bt.nodes_visited,
+            history=history,
+            stats=stats,
+        )
+        debug_validate(result, problem_data)
+        if found:
+            live.update(result.makespan)
+        live.flush(bt.nodes_visited, result.wall_time)
+        if on_progress:
+            on_progress(ProgressEvent(self.name, 'finished', bt.nodes_visited, result.wall_time,
+                                      result.makespan, result.makespan))
+        return result
+
+
+def backtracking_algorithm(problem_data, generation_callback=None, time_limit=60):
     """
     Wrapper function for backtracking algorithm to integrate with GUI.
     Converts problem data format to backtracking format and runs the algorithm.
@@ -402,58 +467,40 @@ def backtracking_algorithm(problem_data, generation_callback=None):
     Args:
         problem_data: Problem configuration dict with machines_count, total_jobs, total_tasks, jobs
         generation_callback: Optional callback function(step, info) for progress updates
+        time_limit: Search time limit in seconds (None runs until completion)
         
     Returns:
         tuple: (timeline, makespan, step_history)
     """
-    # Create backtracking instance with modified initialization
-    bt = backTracking()
+    # Report progress through search hooks, sampled every 1000 nodes
+    step_history = []
+    hooks = SearchHooks()
+    if generation_callback:
+        def report_progress(event):
+            current_best = event.best_makespan if event.best_makespan is not None else 'N/A'
+            generation_callback(event.nodes_visited, {
+                'nodes_visited': event.nodes_visited,
+                'best_makespan': current_best
+            })
+            step_history.append((event.nodes_visited, current_best))
+
+        hooks.subscribe(NODE, report_progress, every_nodes=1000)
+
+    bt = backTracking(hooks)
     bt.machines_count = problem_data['machines_count']
     bt.total_jobs = problem_data['total_jobs']
     bt.total_tasks = problem_data['total_tasks']
     bt.jobs = problem_data['jobs']
     
-    # Track search progress
-    step_count = [0]  # Using list to modify in nested function
-    
-    # Monkey-patch the _backtrack method to call the callback
-    original_backtrack = bt._backtrack
-    step_history = []
-    
-    def wrapped_backtrack(job_index, task_index):
-        step_count[0] += 1
-        
-        # Call callback every 1000 steps for performance
-        if generation_callback and step_count[0] % 1000 == 0:
-            current_best = bt.best_makespan if bt.best_makespan != float('inf') else 'N/A'
-            generation_callback(step_count[0], {
-                'nodes_visited': bt.nodes_visited,
-                'best_makespan': current_best
-            })
-            step_history.append((step_count[0], current_best))
-        
-        return original_backtrack(job_index, task_index)
-    
-    bt._backtrack = wrapped_backtrack
-    
     # Run the algorithm
     start_time = time.time()
-    bt.schedule_tasks(time_limit= 60 * 1)  # Optional time limit of 5 minutes
+    bt.schedule_tasks(time_limit=time_limit)
     exec_time = time.time() - start_time
     
-    # Convert timeline format to match cultural algorithm's format
-    converted_timeline = {}
-    for machine, tasks in bt.timeline.items():
-        machine += 1  # Convert to 1-based index
-        converted_timeline[machine] = []
-        for task in tasks:
-            task_key = (task['job_id'], task['task_id'])
-            converted_timeline[machine].append({
-                task_key: (task['start_time'], task['execution_time'])
-            })
+    # Same format as the cultural algorithm, built per machine only when read
+    timeline = Schedule.from_backtracking(bt.timeline).cultural_view()
     
     # Get makespan from metrics
     metrics = bt.get_metrics()
-    print("timeline:", converted_timeline)
     
-    return converted_timeline, metrics, step_history
+    return timeline, metrics, step_history
@@ -3,13 +3,35 @@ import os
 import copy
 import time
 import math
+import bisect
+import heapq
+import itertools
 sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
 
 from src.helperFunctions.readFromCSV import read_dataset
+from src.backTracking.searchHooks import SearchMonitor, solver_progress_hooks, INCUMBENT
+from src.solvers.liveMetrics import LiveMetrics, DEFAULT_METRICS_INTERVAL
+from src.solvers.registry import register_solver
+from src.helperFunctions.schedule import Schedule
+from src.helperFunctions.warmStart import adapt_schedule
+from src.helperFunctions.scheduleMetrics import schedule_metrics, summary_metrics
+from src.solvers.solver import (Budget, ProgressEvent, SolveResult, debug_validate, OPTIMAL, FEASIBLE, NO_SOLUTION,
+                                CANCELLED)
 data = read_dataset('small')
 
+# Search strategies of schedule_tasks
+DFS = 'dfs'
+BEST_FIRST = 'best_first'
+BEAM = 'beam'
+DISCREPANCY = 'lds'
+SEARCH_MODES = (DFS, BEST_FIRST, BEAM, DISCREPANCY)
+# Open nodes kept by best-first search before it goes depth-first
+DEFAULT_MAX_OPEN_NODES = 100000
+# Nodes kept per level by the first beam search pass
+DEFAULT_BEAM_WIDTH = 2
+
 class backTracking2:
-    def __init__(self):
+    def __init__(self, hooks=None):
         self.machines_count = data['machines_count']
         self.jobs = data['jobs']
         self.total_tasks = data['total_tasks']
@@ -39,6 +61,38 @@ class backTracking2:
         self.nodes_visited = 0
         self.nodes_pruned = 0
 
+        # Optional SearchHooks subscriptions (progress, incumbents, ...)
+        self.hooks = hooks
+        self.monitor = None
+
+        # Warm start: (job_id, task_id) -> (start_time, machine) of the seed schedule
+        self.warm_hint = None
+
+        # Sub-problems of decomposition solvers: earliest start of each job's first task
+        # (job_id -> time) and time each machine becomes free (0-based list; None: every
+        # machine free at 0, sized by schedule_tasks once machines_count is final)
+        self.job_release = {}
+        self.machine_release = None
+
+        # Repair sub-problems (LNS): Timetable of the fixed tasks around the searched ones,
+        # their makespan, and (job_id, task_id) -> latest end before a fixed successor
+        self.blocked = None
+        self.fixed_makespan = 0
+        self.task_deadline = {}
+
+        # Portfolio runs: SharedIncumbent of the solvers running alongside, and the best
+        # makespan read from it; subtrees that can't beat either bound are pruned, and the
+        # bounds the search proves are published back to it
+        self.shared_incumbent = None
+        self.external_bound = float('inf')
+
+        # Search strategy (SEARCH_MODES), best-first memory cap in open nodes, first beam width,
+        # and the best lower bound of the whole instance the compact searches have proven
+        self.search_mode = DFS
+        self.max_open_nodes = DEFAULT_MAX_OPEN_NODES
+        self.beam_width = DEFAULT_BEAM_WIDTH
+        self.proven_lower_bound = 0
+
     # -------------------------
     # Constraint & utility code
     # -------------------------
@@ -52,6 +106,17 @@ class backTracking2:
         execution_time = task['execution_time']
         end_time = start_time + execution_time
 
+        # Release times of the job and the machine
+        if start_time < self.machine_release[machine] or start_time < self.job_release.get(job_id, 0):
+            return False
+
+        # Fixed tasks and fixed successors of a repair sub-problem
+        if self.blocked is not None:
+            if self.blocked.earliest_start(machine, start_time, execution_time) != start_time:
+                return False
+            if end_time > self.task_deadline.get((job_id, task_id), end_time):
+                return False
+
         # Initialize machine timeline if it doesn't exist
         if machine not in self.timeline:
             self.timeline[machine] = []
@@ -77,11 +142,15 @@ class backTracking2:
     # -------------------------
     # Scheduling orchestration
     # -------------------------
-    def schedule_tasks(self, time_limit=None):
+    def schedule_tasks(self, time_limit=None, node_limit=None, cancel=None, warm_start=None):
         """
         Entry point to find optimal schedule using job-level backtracking
         with correct lower bounds for parallel machines + precedence.
         time_limit: optional seconds to stop search early (keeps best found).
+        node_limit: optional maximum number of search nodes to visit.
+        cancel: optional CancellationToken checked periodically.
+        warm_start: optional feasible Schedule of this instance; used as the initial
+            incumbent instead of the greedy one, and branching tries its choices first.
         Returns True if found any feasible schedule (optimal or best-so-far).
         """
         # Reset for fresh scheduling attempt
@@ -91,6 +160,8 @@ class backTracking2:
         self.job_next_task = [0] * self.total_jobs
         self.earliest_start_cache.clear()
         self.time_expired = False
+        if self.machine_release is None:
+            self.machine_release = [0] * self.machines_count
         
         # Reset search statistics
         self.nodes_visited = 0
@@ -98,6 +169,8 @@ class backTracking2:
 
         # Reset analysis counters
         self.start_time = time.time()
+        self.external_bound = self.shared_incumbent.makespan if self.shared_incumbent is not None else float('inf')
+        self.monitor = SearchMonitor(self, self.hooks, time_limit, node_limit, cancel, self.shared_incumbent)
 
         print("Starting job-level Branch & Bound search...")
         print(f"Problem size: {self.total_tasks} tasks, {self.total_jobs} jobs, {self.machines_count} machines")
@@ -106,25 +179,58 @@ class backTracking2:
         self._sort_jobs()
         print("Jobs sorted by total job time (longest-first heuristic).")
 
-        # Build a strong initial upper bound via greedy list-scheduling
-        greedy_makespan = self._greedy_initial_solution()
-        print(f"Greedy initial makespan (upper bound): {greedy_makespan}")
-        if greedy_makespan < self.best_makespan:
-            self.best_makespan = greedy_makespan
-            self.best_timeline = copy.deepcopy(self.timeline)
-
-        # Start recursive job-level search (branch & bound)
+        if warm_start is not None:
+            # Start from the given schedule and steer branching toward it
+            self.warm_hint = {(job_id, task_id): (start, machine)
+                              for job_id, task_id, machine, start, _ in warm_start.rows()}
+            self.best_timeline = warm_start.to_backtracking()
+            self.best_makespan = max(warm_start.makespan, self.fixed_makespan)
+            print(f"Warm start makespan (upper bound): {self.best_makespan}")
+            self.monitor.incumbent(source='warm_start')
+        elif self.blocked is not None:
+            # The greedy list schedule ignores fixed tasks; repairs start from the current schedule instead
+            self.warm_hint = None
+        else:
+            self.warm_hint = None
+            # Build a strong initial upper bound via greedy list-scheduling
+            greedy_makespan = self._greedy_initial_solution()
+            print(f"Greedy initial makespan (upper bound): {greedy_makespan}")
+            if greedy_makespan < self.best_makespan:
+                # _greedy_initial_solution already stored its schedule in self.best_timeline
+                self.best_makespan = greedy_makespan
+                self.monitor.incumbent(source='greedy')
+
+        if self.shared_incumbent is not None and self.blocked is None:
+            # The root bound holds for the whole instance; the others can stop once they meet it
+            self.shared_incumbent.raise_lower_bound(self._compute_global_lower_bound())
+            self.adopt_shared_incumbent()
+
+        # Start recursive job-level search (branch & bound); repairs of fixed schedules always go depth-first
+        self.proven_lower_bound = 0
         try:
-            self._backtrack_job_level(time_limit)
+            if self.search_mode == BEST_FIRST and self.blocked is None:
+                self._best_first_search()
+            elif self.search_mode == BEAM and self.blocked is None:
+                self._beam_search()
+            elif self.search_mode == DISCREPANCY and self.blocked is None:
+                self._discrepancy_search()
+            else:
+                self._backtrack_job_level()
         except KeyboardInterrupt:
             print("Interrupted by user - returning best found solution so far.")
             self.time_expired = True
 
+        if self.shared_incumbent is not None:
+            self.adopt_shared_incumbent()
+            if not self.time_expired:
+                # A completed search proves nothing beats its own best or the bound it pruned with
+                self.shared_incumbent.raise_lower_bound(min(self.best_makespan, self.external_bound))
+
         # If solution found, set timeline and compute metrics
         if self.best_timeline is not None:
             self.timeline = self.best_timeline
             metrics = self.get_metrics()
-            print("Best metrics:", metrics)
+            print("Best metrics:", dict(summary_metrics(metrics), execution_time=metrics['execution_time']))
             # compute final lower bound to estimate gap
             final_lb = self._compute_global_lower_bound()
             gap = None
@@ -138,21 +244,29 @@ class backTracking2:
             print(f"Search statistics: {self.nodes_visited} nodes visited, {self.nodes_pruned} nodes pruned")
             return False
 
+    def adopt_shared_incumbent(self):
+        """
+        Take over the shared incumbent's schedule when it beats our own, so pruning tightens and the
+        final timeline is the best known one (called at monitor checkpoints).
+        """
+        offered = self.shared_incumbent.best_schedule()
+        if offered is not None and offered.makespan < self.best_makespan:
+            self.best_timeline = offered.to_backtracking()
+            self.best_makespan = offered.makespan
+            print(f"Adopted shared incumbent makespan (upper bound): {self.best_makespan}")
+            self.monitor.incumbent(source='shared')
+
     # -------------------------
     # Job-level backtracking (B&B)
     # -------------------------
-    def _backtrack_job_level(self, time_limit=None):
+    def _backtrack_job_level(self):
         """
         Backtracking that schedules exactly one task (the next task) of a job at each step.
         This is branch-and-bound: compute admissible lower bounds and prune.
         """
-        # Increment node counter and print progress
+        # Count the node; budget checks and progress events only run at monitor checkpoints
         self.nodes_visited += 1
-        if self.nodes_visited % 10000 == 0:
-            print(f"Search progress: {self.nodes_visited} nodes visited, {self.nodes_pruned} nodes pruned")
-        
-        # Enforce time limit if set
-        if time_limit is not None and (time.time() - self.start_time) > time_limit:
+        if self.nodes_visited >= self.monitor.next_check and self.monitor.node_checkpoint():
             self.time_expired = True
             return
 
@@ -162,29 +276,27 @@ class backTracking2:
             if current_makespan < self.best_makespan:
                 self.best_makespan = current_makespan
                 self.best_timeline = copy.deepcopy(self.timeline)
-                print(f"New best solution found! Makespan: {current_makespan}")
+                self.monitor.incumbent()
             return
 
         # Compute admissible lower bound for this partial schedule
         lb = self._compute_global_lower_bound()
         # Fail-fast: if LB already >= current best, prune this subtree
-        if lb >= self.best_makespan:
+        if lb >= self.best_makespan or lb >= self.external_bound:
             self.nodes_pruned += 1
+            if self.nodes_pruned >= self.monitor.next_prune:
+                self.monitor.prune_checkpoint()
             return
 
         # Candidate jobs (those with remaining tasks)
         candidate_jobs = [j for j in range(self.total_jobs) if self.job_next_task[j] < len(self.jobs[j]['tasks'])]
 
-        # Heuristic ordering: prefer jobs with small (ready_time + remaining_time)
-        candidate_jobs.sort(key=self._job_priority_key)
+        # Heuristic ordering: prefer jobs with small (ready_time + remaining_time);
+        # with a warm start, the job whose next task starts first there
+        candidate_jobs.sort(key=self._warm_priority_key if self.warm_hint else self._job_priority_key)
 
         # Try each candidate job: schedule its next task
         for job in candidate_jobs:
-            # Respect time limit at top of loop as well
-            if time_limit is not None and (time.time() - self.start_time) > time_limit:
-                self.time_expired = True
-                return
-
             task_idx = self.job_next_task[job]
             task_data = self.jobs[job]['tasks'][task_idx]
             current_task = {
@@ -193,8 +305,12 @@ class backTracking2:
                 'execution_time': task_data['execution_time']
             }
 
-            # Machines ordered by earliest finish time (better fit)
+            # Machines ordered by earliest finish time (better fit), the warm start's machine first
             ordered_machines = self._get_machines_by_earliest_finish()
+            if self.warm_hint:
+                hint = self.warm_hint.get((current_task['job_id'], current_task['task_id']))
+                if hint is not None and hint[1] in ordered_machines:
+                    ordered_machines = [hint[1]] + [m for m in ordered_machines if m != hint[1]]
 
             for machine in ordered_machines:
                 cache_key = (current_task['job_id'], current_task['task_id'], machine)
@@ -227,7 +343,7 @@ class backTracking2:
                     self.earliest_start_cache.clear()
 
                     # Recurse
-                    self._backtrack_job_level(time_limit)
+                    self._backtrack_job_level()
 
                     # Backtrack
                     self.job_next_task[job] -= 1
@@ -238,6 +354,278 @@ class backTracking2:
                     if self.time_expired:
                         return
 
+    # -------------------------
+    # Compact-node searches (best-first, beam, limited discrepancy)
+    # -------------------------
+    # A node is (lower bound, -depth, creation order, progress, machine_ready, job_ready, path): tasks
+    # scheduled per job, each machine's ready time and each job's ready time, plus a linked list of the
+    # placements (job index, machine, start) that led there. Tasks go at the end of a machine, which still
+    # reaches an optimal schedule (place its tasks in order of their start times) and makes the idle time
+    # before each machine's ready time count in the lower bound.
+    def _compact_root(self):
+        """Set up the per-job tables of the compact searches and return the root node."""
+        self._durations = [[t['execution_time'] for t in job['tasks']] for job in self.jobs]
+        self._remaining = [[sum(d[k:]) for k in range(len(d) + 1)] for d in self._durations]
+        self._task_counts = [len(d) for d in self._durations]
+        self._compact_tasks = sum(self._task_counts)
+        self._node_counter = itertools.count()
+        progress = (0,) * self.total_jobs
+        job_ready = tuple(self.job_release.get(job['job_id'], 0) for job in self.jobs)
+        machine_ready = tuple(self.machine_release)
+        return (self._compact_lower_bound(progress, machine_ready, job_ready), 0, next(self._node_counter),
+                progress, machine_ready, job_ready, None)
+
+    def _compact_lower_bound(self, progress, machine_ready, job_ready):
+        """
+        _compute_global_lower_bound on a compact node: the longest remaining job (finished jobs contribute
+        their end, i.e. the makespan so far) and the remaining work spread over the machines. Machines only
+        take work after their ready times, so no job continues before the first machine is ready, all work
+        is filled in above the ready times, and so is the work of the k longest remaining jobs on the k
+        first machines (a job runs on one machine at a time).
+        """
+        work = [self._remaining[j][progress[j]] for j in range(self.total_jobs)]
+        ready = sorted(machine_ready)
+        longest = sorted(job_work for job_work in work if job_work)
+        lb_job = max(max((job_ready[j] + work[j] for j in range(self.total_jobs)), default=0),
+                     ready[0] + (longest[-1] if longest else 0))
+        return self._load_bound(ready, longest, lb_job)
+
+    @staticmethod
+    def _load_bound(ready, longest, lb):
+        """
+        Raise ``lb`` by the work bounds of _compact_lower_bound, given the machine ready times and the remaining
+        work of each unfinished job, both ascending.
+
+        Work W on the first k machines reaches level ceil((P_i + W) / i), where P_i sums the first i ready times
+        and i is the first count whose level doesn't pass the next ready time. W only grows with k, so i only
+        moves forward and every k costs O(1).
+        """
+        loads = []
+        work = 0
+        for k, job_work in enumerate(itertools.islice(reversed(longest), len(ready) - 1), 1):
+            work += job_work
+            loads.append((k, work))
+        loads.append((len(ready), sum(longest)))
+        used, filled = 1, ready[0]
+        for k, work in loads:
+            while used < k and filled + work > ready[used] * used:
+                filled += ready[used]
+                used += 1
+            lb = max(lb, -(-(filled + work) // used))
+        return lb
+
+    def _compact_children(self, node, seen=None):
+        """
+        Children of a compact node in the depth-first branching order (jobs by ready time + remaining time,
+        machines by ready time). Complete schedules update the incumbent; children that can't beat it, and
+        with a ``seen`` set states already generated, are pruned. Of the machines free before the task is
+        ready only the latest one is tried (the others stay free earlier), and of machines with the same
+        ready time only one.
+
+        Child bounds are derived from the parent's sorted ready times and remaining work, since a child
+        changes one job and one machine.
+        """
+        _, neg_depth, _, progress, machine_ready, job_ready, path = node
+        jobs = range(self.total_jobs)
+        work = [self._remaining[j][progress[j]] for j in jobs]
+        ends = [job_ready[j] + work[j] for j in jobs]
+        latest = max(jobs, key=ends.__getitem__)
+        runner_up = max((ends[j] for j in jobs if j != latest), default=0)
+        ready = sorted(machine_ready)
+        longest = sorted(job_work for job_work in work if job_work)
+        upper = min(self.best_makespan, self.external_bound)
+
+        children = []
+        candidate_jobs = sorted((j for j in jobs if progress[j] < self._task_counts[j]), key=ends.__getitem__)
+        ordered_machines = sorted(range(self.machines_count), key=machine_ready.__getitem__)
+        for job in candidate_jobs:
+            task_idx = progress[job]
+            duration = self._durations[job][task_idx]
+            child_work = work[job] - duration
+            child_longest = longest
+            if duration:
+                child_longest = longest.copy()
+                del child_longest[bisect.bisect_left(child_longest, work[job])]
+                if child_work:
+                    bisect.insort(child_longest, child_work)
+            other_ends = runner_up if job == latest else ends[latest]
+
+            free = [m for m in ordered_machines if machine_ready[m] <= job_ready[job]]
+            tried = set()
+            for machine in free[-1:] + [m for m in ordered_machines if machine_ready[m] > job_ready[job]]:
+                if machine_ready[machine] in tried:
+                    continue
+                tried.add(machine_ready[machine])
+                start = max(job_ready[job], machine_ready[machine])
+                end = start + duration
+                child_progress = progress[:job] + (task_idx + 1,) + progress[job + 1:]
+                child_job_ready = job_ready[:job] + (end,) + job_ready[job + 1:]
+                child_machine_ready = machine_ready[:machine] + (end,) + machine_ready[machine + 1:]
+                child_path = (path, job, machine, start)
+
+                if 1 - neg_depth == self._compact_tasks:
+                    makespan = max(child_job_ready[j] for j in jobs if self._task_counts[j])
+                    if makespan < self.best_makespan:
+                        self._restore_path(child_path)
+                        self.best_makespan = makespan
+                        self.best_timeline = copy.deepcopy(self.timeline)
+                        self.monitor.incumbent(source=self.search_mode, lower_bound=self.proven_lower_bound)
+                        upper = min(self.best_makespan, self.external_bound)
+                    continue
+
+                child_ready = ready.copy()
+                del child_ready[bisect.bisect_left(child_ready, machine_ready[machine])]
+                bisect.insort(child_ready, end)
+                lb_job = max(other_ends, end + child_work,
+                             child_ready[0] + (child_longest[-1] if child_longest else 0))
+                child_lb = self._load_bound(child_ready, child_longest, lb_job)
+                state = (child_progress, tuple(child_ready), child_job_ready)
+                if child_lb >= upper or (seen is not None and state in seen):
+                    self.nodes_pruned += 1
+                    if self.nodes_pruned >= self.monitor.next_prune:
+                        self.monitor.prune_checkpoint()
+                    continue
+                if seen is not None:
+                    if len(seen) >= 10 * self.max_open_nodes:
+                        seen.clear()  # Only costs duplicate expansions
+                    seen.add(state)
+                children.append((child_lb, neg_depth - 1, next(self._node_counter), child_progress,
+                                 child_machine_ready, child_job_ready, child_path))
+        return children
+
+    def _expansion_checkpoint(self):
+        """Count an expansion; True if the search must stop. Expansions are costly, so each is a checkpoint."""
+        self.nodes_visited += 1
+        if self.monitor.node_checkpoint():
+            self.time_expired = True
+        return self.time_expired
+
+    def _best_first_search(self):
+        """
+        Best-first branch & bound: always expand the open node with the smallest lower bound (deepest first
+        on ties), so the smallest open bound is a lower bound for the whole instance and the search stops as
+        soon as it meets the best makespan. Identical states reached through different orders are expanded
+        once.
+
+        Once ``max_open_nodes`` nodes are open, the best one is no longer expanded into the queue but its
+        subtree is searched depth-first (a hybrid of best-first and depth-first search), so memory stays
+        bounded; its bound stays in the global bound until that subtree is exhausted.
+        """
+        open_nodes = [self._compact_root()]
+        seen = set()
+        while open_nodes:
+            if open_nodes[0][0] >= min(self.best_makespan, self.external_bound):
+                break  # Every open node is proven no better than the incumbent
+            node = heapq.heappop(open_nodes)
+            if node[0] > self.proven_lower_bound:
+                self.proven_lower_bound = node[0]
+                if self.shared_incumbent is not None:
+                    self.shared_incumbent.raise_lower_bound(node[0])
+
+            if len(open_nodes) < self.max_open_nodes:
+                if self._expansion_checkpoint():
+                    heapq.heappush(open_nodes, node)
+                    break
+                for child in self._compact_children(node, seen):
+                    heapq.heappush(open_nodes, child)
+                continue
+
+            # Memory cap: search this subtree depth-first instead; until it is exhausted its bound stays open
+            stack = [node]
+            while stack:
+                current = stack.pop()
+                if current[0] >= min(self.best_makespan, self.external_bound):
+                    continue
+                if self._expansion_checkpoint():
+                    break
+                stack.extend(sorted(self._compact_children(current, seen), reverse=True))  # smallest bound on top
+            if self.time_expired:
+                heapq.heappush(open_nodes, node)
+                break
+
+        if not self.time_expired:
+            self.proven_lower_bound = min(self.best_makespan, self.external_bound)
+        elif open_nodes:
+            self.proven_lower_bound = max(self.proven_lower_bound,
+                                          min(open_nodes[0][0], self.best_makespan, self.external_bound))
+        print(f"Best-first search: {len(open_nodes)} nodes left open, "
+              f"proven lower bound {self.proven_lower_bound}")
+
+    def _beam_search(self):
+        """
+        Beam search: go down the tree one level at a time, keeping only the ``beam_width`` children with the
+        smallest lower bounds (ties in branching order), so a pass builds schedules in about width x tasks
+        expansions. While budget remains, the next pass doubles the width; a pass that drops no child has
+        searched the whole tree, which proves the incumbent optimal.
+        """
+        root = self._compact_root()
+        self.proven_lower_bound = root[0]
+        width = self.beam_width
+        while root[0] < min(self.best_makespan, self.external_bound):
+            beam = [root]
+            seen = set()
+            dropped = False
+            while beam:
+                children = []
+                for node in beam:
+                    if node[0] >= min(self.best_makespan, self.external_bound):
+                        continue
+                    if self._expansion_checkpoint():
+                        return
+                    children.extend(self._compact_children(node, seen))
+                children.sort()  # by bound, then creation (i.e. branching) order
+                dropped = dropped or len(children) > width
+                beam = children[:width]
+            print(f"Beam search: width {width} pass done, best makespan {self.best_makespan}")
+            if not dropped:
+                break
+            width *= 2
+
+    def _discrepancy_search(self):
+        """
+        Limited discrepancy search: depth-first with children ranked by lower bound (ties in branching order),
+        where taking a node's i-th child instead of its first costs i discrepancies. Pass k searches every
+        path with at most k discrepancies, so the first pass follows the ranking straight down and each
+        later one strays a little further from it. A pass that never hits its limit has searched the whole
+        tree, which proves the incumbent optimal.
+        """
+        root = self._compact_root()
+        self.proven_lower_bound = root[0]
+        limit = 0
+        while root[0] < min(self.best_makespan, self.external_bound):
+            limited = False
+            stack = [(root, limit)]
+            while stack:
+                node, allowance = stack.pop()
+                if node[0] >= min(self.best_makespan, self.external_bound):
+                    continue
+                if self._expansion_checkpoint():
+                    return
+                children = sorted(self._compact_children(node))  # by bound, then branching order
+                limited = limited or len(children) > allowance + 1
+                for i in reversed(range(min(len(children), allowance + 1))):
+                    stack.append((children[i], allowance - i))
+            print(f"Limited discrepancy search: {limit} discrepancies done, best makespan {self.best_makespan}")
+            if not limited:
+                break
+            limit += 1
+
+    def _restore_path(self, path):
+        """Rebuild timeline and job progress from a best-first node's placements (job index, machine, start)."""
+        placements = []
+        while path is not None:
+            path, job, machine, start = path
+            placements.append((job, machine, start))
+        self.timeline = {}
+        self.job_next_task = [0] * self.total_jobs
+        for job, machine, start in reversed(placements):
+            task_data = self.jobs[job]['tasks'][self.job_next_task[job]]
+            self._assign_task({'job_id': self.jobs[job]['job_id'], 'task_id': task_data['task_id'],
+                               'execution_time': task_data['execution_time']}, machine, start)
+            self.job_next_task[job] += 1
+        self.earliest_start_cache.clear()
+        self.machine_order_cache = None
+
     # -------------------------
     # Lower bounds & heuristics
     # -------------------------
@@ -270,7 +658,7 @@ class backTracking2:
         job_ready_times = []
         for j in range(self.total_jobs):
             if self.job_next_task[j] == 0:
-                ready = 0
+                ready = self.job_release.get(self.jobs[j]['job_id'], 0)
             else:
                 prev_task_id = self.jobs[j]['tasks'][self.job_next_task[j] - 1]['task_id']
                 ready = self._find_previous_task_end_time(self.jobs[j]['job_id'], prev_task_id)
@@ -300,12 +688,18 @@ class backTracking2:
         next_idx = self.job_next_task[job]
         remaining_job_time = sum(t['execution_time'] for t in self.jobs[job]['tasks'][next_idx:])
         if next_idx == 0:
-            ready = 0
+            ready = self.job_release.get(self.jobs[job]['job_id'], 0)
         else:
             prev_task_id = self.jobs[job]['tasks'][next_idx - 1]['task_id']
             ready = self._find_previous_task_end_time(self.jobs[job]['job_id'], prev_task_id)
         return ready + remaining_job_time
 
+    def _warm_priority_key(self, job):
+        """Branching order under a warm start: the seed's start of the job's next task, then the usual key."""
+        task_id = self.jobs[job]['tasks'][self.job_next_task[job]]['task_id']
+        hint = self.warm_hint.get((self.jobs[job]['job_id'], task_id))
+        return (hint[0] if hint is not None else float('inf'), self._job_priority_key(job))
+
     # -------------------------
     # Simple dominance heuristic
     # -------------------------
@@ -423,7 +817,7 @@ class backTracking2:
                 if machine in self.timeline and self.timeline[machine]:
                     finish = max(t['end_time'] for t in self.timeline[machine])
                 else:
-                    finish = 0
+                    finish = self.machine_release[machine]
                 machine_finish.append((finish, machine))
             
             self.machine_order_cache = [m for finish, m in sorted(machine_finish)]
@@ -439,8 +833,8 @@ class backTracking2:
         job_id = task['job_id']
         task_id = task['task_id']
 
-        # Start with time 0
-        earliest_start = 0
+        # Start at the job's and the machine's release time (0 outside sub-problems)
+        earliest_start = max(self.job_release.get(job_id, 0), self.machine_release[machine])
 
         # Job dependency: must start after previous task in same job
         if task_id > 1:
@@ -448,19 +842,24 @@ class backTracking2:
             earliest_start = max(earliest_start, previous_task_end_time)
 
         # Machine availability
-        if machine in self.timeline:
-            machine_tasks = sorted(self.timeline[machine], key=lambda t: t['start_time'])
+        machine_tasks = sorted(self.timeline.get(machine, []), key=lambda t: t['start_time'])
+        while True:
+            # Skip past fixed tasks first, then past searched ones, until both leave the same gap
+            if self.blocked is not None:
+                earliest_start = self.blocked.earliest_start(machine, earliest_start, task['execution_time'])
+            candidate = earliest_start
             for scheduled_task in machine_tasks:
                 # Try to fit before this scheduled task
-                if earliest_start + task['execution_time'] <= scheduled_task['start_time']:
-                    return earliest_start
-                earliest_start = max(earliest_start, scheduled_task['end_time'])
-
-        return earliest_start
+                if candidate + task['execution_time'] <= scheduled_task['start_time']:
+                    break
+                candidate = max(candidate, scheduled_task['end_time'])
+            if self.blocked is None or candidate == earliest_start:
+                return candidate
+            earliest_start = candidate
 
     def _calculate_makespan(self):
-        """Calculate current makespan (maximum end time across all machines)."""
-        makespan = 0
+        """Calculate current makespan (maximum end time across all machines, fixed tasks included)."""
+        makespan = self.fixed_makespan
         for machine_timeline in self.timeline.values():
             for task in machine_timeline:
                 makespan = max(makespan, task['end_time'])
@@ -482,7 +881,7 @@ class backTracking2:
 
         # Helper to find earliest start on sim_timeline
         def sim_earliest_start(job_id, task_id, duration, sim_timeline):
-            earliest = 0
+            earliest = self.job_release.get(job_id, 0)
             # job dependency
             if task_id > 1:
                 # search sim_timeline for previous task end
@@ -540,7 +939,7 @@ class backTracking2:
                     if m in sim_timeline and sim_timeline[m]:
                         machine_ready = max(t['end_time'] for t in sim_timeline[m])
                     else:
-                        machine_ready = 0
+                        machine_ready = self.machine_release[m]
                     start = max(base_ready, machine_ready)
                     finish = start + duration
                     if finish < best_finish:
@@ -580,58 +979,18 @@ class backTracking2:
     # Metrics & printing
     # -------------------------
     def get_metrics(self):
-        """Calculate makespan, total idle time, machine utilization and execution time."""
+        """Metrics of the best schedule (see ``schedule_metrics``) plus execution_time in seconds."""
         if self.best_timeline is None and not self.timeline:
             return {}
 
         # Use current timeline (which is either best_timeline or current timeline)
         timeline_to_use = self.timeline if self.timeline else self.best_timeline
-        makespan = 0
-        for m_tasks in timeline_to_use.values():
-            for t in m_tasks:
-                makespan = max(makespan, t['end_time'])
-
-        total_machine_utilization = 0
-        total_idle_time = 0
-
-        for machine in range(self.machines_count):
-            machine_timeline = timeline_to_use.get(machine, [])
-            if machine_timeline:
-                # Sort tasks by start time
-                sorted_tasks = sorted(machine_timeline, key=lambda t: t['start_time'])
-
-                machine_end_time = max(task['end_time'] for task in machine_timeline)
-                machine_utilization = (machine_end_time / makespan) if makespan > 0 else 0
-                total_machine_utilization += machine_utilization
-
-                # Add gap before first task
-                first_start = sorted_tasks[0]['start_time']
-                total_idle_time += first_start
-
-                # Add gaps between tasks
-                for i in range(1, len(sorted_tasks)):
-                    prev_end = sorted_tasks[i-1]['end_time']
-                    current_start = sorted_tasks[i]['start_time']
-                    if current_start > prev_end:
-                        total_idle_time += (current_start - prev_end)
-
-                # Add waiting time after machine finishes until makespan
-                if makespan > machine_end_time:
-                    total_idle_time += (makespan - machine_end_time)
-            else:
-                # machine has no tasks, idle for whole makespan
-                total_idle_time += makespan
-
-        self.machine_utilization = (total_machine_utilization / self.machines_count) if self.machines_count > 0 else 0
-        self.total_idle_time = total_idle_time
+        metrics = schedule_metrics(Schedule.from_backtracking(timeline_to_use), self.machines_count)
+        self.total_idle_time = metrics['idle_time']
+        self.machine_utilization = metrics['utilization']
         self.execution_time = time.time() - self.start_time if self.start_time else 0
-
-        return {
-            'makespan': makespan,
-            'total_idle_time': total_idle_time,
-            'machine_utilization': self.machine_utilization,
-            'execution_time': self.execution_time
-        }
+        metrics['execution_time'] = self.execution_time
+        return metrics
 
     def print_schedule(self):
         """Print the current schedule in a readable format."""
@@ -662,4 +1021,99 @@ class backTracking2:
                       f"(Duration: {task['execution_time']})")
                 machine_end_time = max(machine_end_time, task['end_time'])
 
-            print(f"  Machine total busy time: {machine_end_time} time units")
\ No newline at end of file
+            print(f"  Machine total busy time: {machine_end_time} time units")
+
+
+@register_solver
+class BranchAndBoundSolver:
+    """Job-level branch & bound (backTracking2), exposed through the common Solver interface."""
+    name = 'backtracking2'
+    display_name = 'Branch & Bound'
+    description = ("Job-level branch and bound that starts from a greedy list schedule and prunes partial "
+                   "schedules whose admissible lower bound cannot beat the best makespan found so far.")
+    features = ('Optimal when it finishes', 'Greedy upper bound from the start', 'Lower-bound pruning',
+                'Depth-first, best-first, beam and limited discrepancy search')
+    progress_unit = 'node'
+    objective_name = 'Best Makespan'
+    default_budget = Budget(time_limit=60.0)
+    default_params = {'mode': DFS, 'max_open_nodes': DEFAULT_MAX_OPEN_NODES, 'beam_width': DEFAULT_BEAM_WIDTH,
+                      'metrics_interval': DEFAULT_METRICS_INTERVAL}
+    progress_interval = 1000  # nodes between progress events
+
+    def solve(self, problem_data, budget=None, cancel=None, on_progress=None, mode=DFS,
+              max_open_nodes=DEFAULT_MAX_OPEN_NODES, beam_width=DEFAULT_BEAM_WIDTH,
+              metrics_interval=DEFAULT_METRICS_INTERVAL, warm_start=None, incumbent=None):
+        """
+        ``mode``: one of SEARCH_MODES ('dfs' proves optimality, 'best_first' proves bounds fastest, 'beam'
+        and 'lds' find good schedules fast on large instances); ``max_open_nodes``: memory cap of best-first
+        search; ``beam_width``: width of the first beam search pass.
+        ``incumbent``: optional SharedIncumbent of solvers running alongside; its schedules are adopted and its
+        makespan prunes, and the bounds the search proves are published to it.
+        """
+        if mode not in SEARCH_MODES:
+            raise ValueError(f"Unknown search mode '{mode}', expected one of {list(SEARCH_MODES)}")
+        budget = budget or self.default_budget
+        start_time = time.time()
+        history = []
+        live = LiveMetrics(self.name, problem_data, on_progress, metrics_interval)
+        hooks = solver_progress_hooks(self.name, history, on_progress, self.progress_interval, live)
+        # (seconds, makespan) of every incumbent, to compare the search modes' anytime behaviour
+        quality = []
+        hooks.subscribe(INCUMBENT, lambda e: quality.append((round(e.elapsed, 3), e.best_makespan)))
+
+        bt = backTracking2(hooks)
+        bt.machines_count = problem_data['machines_count']
+        bt.total_jobs = problem_data['total_jobs']
+        bt.total_tasks = problem_data['total_tasks']
+        bt.jobs = copy.deepcopy(problem_data['jobs'])
+        bt.job_release = dict(problem_data.get('job_release') or {})
+        bt.machine_release = list(problem_data.get('machine_release') or [0] * bt.machines_count)
+        bt.shared_incumbent = incumbent
+        bt.search_mode = mode
+        bt.max_open_nodes = max_open_nodes
+        bt.beam_width = max(1, beam_width)
+
+        warm = adapt_schedule(warm_start, problem_data) if warm_start is not None else None
+        found = bt.schedule_tasks(time_limit=budget.time_limit, node_limit=budget.node_limit, cancel=cancel,
+                                  warm_start=warm)
+        schedule = Schedule.from_backtracking(bt.timeline) if found else Schedule()
+
+        stats = {'nodes_pruned': bt.nodes_pruned, 'mode': mode, 'quality_over_time': quality}
+        if warm is not None:
+            stats['warm_start_makespan'] = warm.makespan
+
+        if cancel is not None and cancel.cancelled:
+            status = CANCELLED
+        elif not found:
+            status = NO_SOLUTION
+        elif bt.time_expired:
+            status = FEASIBLE
+            if bt.proven_lower_bound:
+                # Best-first search proves a bound even when it runs out of time
+                stats['lower_bound'] = bt.proven_lower_bound
+        else:
+            # A completed search proves nothing beats its own best or the shared incumbent it pruned with;
+            # only in the first case is its own schedule optimal
+            status = OPTIMAL if bt.best_makespan <= bt.external_bound else FEASIBLE
+            stats['lower_bound'] = min(bt.best_makespan, bt.external_bound)
+
+        result = SolveResult(
+            solver=self.name,
+            status=status,
+            schedule=schedule,
+            makespan=bt.best_makespan if found else None,
+            metrics=schedule.metrics(bt.machines_count),
+            wall_time=time.time() - start_time,
+            nodes=bt.nodes_visited,
+            history=history,
+            stats=stats,
+        )
+        debug_validate(result, problem_data)
+        if status == OPTIMAL:
+            # A completed search proves its incumbent optimal
+            live.update(result.makespan, lower_bound=result.makespan)
+        live.flush(bt.nodes_visited, result.wall_time)
+        if on_progress:
+            on_progress(ProgressEvent(self.name, 'finished', bt.nodes_visited, result.wall_time,
+                                      result.makespan, result.makespan))
+        return result
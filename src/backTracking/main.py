@@ -1,9 +1,14 @@
-from backTracking import backTracking
-from backTracking2 import backTracking2
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+
+from src.backTracking.backTracking import backTracking
+from src.backTracking.backTracking2 import backTracking2
+from src.backTracking.searchHooks import SearchHooks, print_progress_hooks
 
 def main():
     # Create scheduler instance
-    scheduler = backTracking()
+    scheduler = backTracking(hooks=print_progress_hooks(SearchHooks()))
     
     print("Starting backtracking job scheduling...")
     print(f"Dataset: {scheduler.total_jobs} jobs, {scheduler.total_tasks} tasks, {scheduler.machines_count} machines\n")
@@ -17,8 +22,8 @@ def main():
     print("\nAnalysis Metrics:")
     metrics = scheduler.get_metrics()
     print(f" - Makespan: {metrics['makespan']}")
-    print(f" - Total Idle Time: {metrics['total_idle_time']}")
-    print(f" - Machine Utilization: {metrics['machine_utilization']*100:.2f}%")
+    print(f" - Total Idle Time: {metrics['idle_time']}")
+    print(f" - Machine Utilization: {metrics['utilization']:.2f}%")
     print(f" - Execution Time: {metrics['execution_time']:.4f} seconds")
 
 if __name__ == "__main__":
@@ -0,0 +1,262 @@
+"""
+Search instrumentation hooks
+
+The backtracking searches publish four kinds of events:
+
+    node       a search node was expanded
+    prune      a subtree was cut by a bound
+    incumbent  a better complete schedule was found
+    restart    a fresh search started
+
+Callbacks subscribe to one kind and are sampled by node count and/or time,
+so the search only pays for what is subscribed: with no subscribers and no
+budget to enforce, the per-node cost is one counter increment and one
+integer comparison.
+"""
+
+import time
+from collections import namedtuple
+
+from src.helperFunctions.schedule import Schedule
+from src.solvers.solver import ProgressEvent
+
+
+NODE = 'node'
+PRUNE = 'prune'
+INCUMBENT = 'incumbent'
+RESTART = 'restart'
+EVENT_KINDS = (NODE, PRUNE, INCUMBENT, RESTART)
+
+# Nodes between budget/time checks when a subscriber is only sampled by time
+DEFAULT_CHECK_INTERVAL = 256
+
+SearchEvent = namedtuple('SearchEvent', ['kind', 'nodes_visited', 'nodes_pruned', 'elapsed', 'best_makespan', 'info'])
+
+
+class _Subscription:
+    def __init__(self, kind, callback, every_nodes, every_seconds):
+        self.kind = kind
+        self.callback = callback
+        self.every_nodes = every_nodes
+        self.every_seconds = every_seconds
+        self.reset()
+
+    def reset(self):
+        self.next_count = self.every_nodes or 0
+        self.next_time = None
+
+    def due(self, count, now):
+        """True when the subscription's node-count or time sample point has been reached."""
+        if self.every_nodes is None and self.every_seconds is None:
+            return True
+        if self.every_nodes is not None and count >= self.next_count:
+            self.next_count = count + self.every_nodes
+            return True
+        if self.every_seconds is not None:
+            if self.next_time is None:
+                self.next_time = now + self.every_seconds
+            elif now >= self.next_time:
+                self.next_time = now + self.every_seconds
+                return True
+        return False
+
+
+class SearchHooks:
+    """Registry of search event subscriptions."""
+
+    def __init__(self):
+        self._subscriptions = {kind: [] for kind in EVENT_KINDS}
+
+    def subscribe(self, kind, callback, every_nodes=None, every_seconds=None):
+        """
+        Subscribe callback(SearchEvent) to one event kind.
+
+        Args:
+            kind: One of 'node', 'prune', 'incumbent', 'restart'
+            callback: Called with a SearchEvent
+            every_nodes: Sample node/prune events every N occurrences
+            every_seconds: Sample at most once per interval (checked at node checkpoints)
+
+        Returns:
+            Subscription handle for ``unsubscribe``
+        """
+        if kind not in self._subscriptions:
+            raise ValueError(f"Unknown search event '{kind}', expected one of {list(EVENT_KINDS)}")
+        subscription = _Subscription(kind, callback, every_nodes, every_seconds)
+        self._subscriptions[kind].append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        self._subscriptions[subscription.kind].remove(subscription)
+
+    def has(self, kind):
+        return bool(self._subscriptions[kind])
+
+    def check_interval(self, kind):
+        """Occurrences between checks needed to honour every subscription of ``kind`` (None if unsubscribed)."""
+        intervals = []
+        for subscription in self._subscriptions[kind]:
+            if subscription.every_nodes is None and subscription.every_seconds is None:
+                return 1
+            intervals.append(subscription.every_nodes or DEFAULT_CHECK_INTERVAL)
+        return min(intervals) if intervals else None
+
+    def reset(self):
+        """Restart sampling, e.g. when a new search begins."""
+        for subscriptions in self._subscriptions.values():
+            for subscription in subscriptions:
+                subscription.reset()
+
+    def emit(self, kind, count, make_event):
+        """
+        Deliver an event to the due subscribers of ``kind``.
+        ``make_event`` builds the SearchEvent lazily, only if someone is due.
+        """
+        event = None
+        now = time.time()
+        for subscription in self._subscriptions[kind]:
+            if subscription.due(count, now):
+                if event is None:
+                    event = make_event()
+                subscription.callback(event)
+
+
+def print_progress_hooks(hooks, every_nodes=10000):
+    """Subscribe the console progress output the searches used to print unconditionally."""
+    hooks.subscribe(NODE, lambda e: print(
+        f"Search progress: {e.nodes_visited} nodes visited, {e.nodes_pruned} nodes pruned"), every_nodes=every_nodes)
+    hooks.subscribe(INCUMBENT, lambda e: print(f"New best solution found! Makespan: {e.best_makespan}"))
+    return hooks
+
+
+def solver_progress_hooks(solver_name, history, on_progress=None, every_nodes=1000, live=None):
+    """
+    Hooks used by the Solver adapters: record (nodes, makespan) for every new
+    incumbent in ``history`` and, if ``on_progress`` is given, forward sampled
+    'progress' and every 'incumbent' as ProgressEvents. With a ``LiveMetrics``
+    in ``live``, incumbents also update it and it publishes at those points.
+    """
+    hooks = SearchHooks()
+    hooks.subscribe(INCUMBENT, lambda e: history.append((e.nodes_visited, e.best_makespan)))
+    if on_progress:
+        def forward(kind):
+            return lambda e: on_progress(ProgressEvent(solver_name, kind, e.nodes_visited, e.elapsed, e.best_makespan,
+                                                       e.best_makespan, {'nodes_pruned': e.nodes_pruned}))
+
+        hooks.subscribe(NODE, forward('progress'), every_nodes=every_nodes)
+        hooks.subscribe(INCUMBENT, forward('incumbent'))
+
+        if live is not None:
+            def update_live(e):
+                live.update(e.best_makespan, e.info.get('lower_bound'))
+                live.publish(e.nodes_visited, e.elapsed)
+
+            # Node samples send incumbents that were held back by the interval
+            hooks.subscribe(INCUMBENT, update_live)
+            hooks.subscribe(NODE, lambda e: live.publish(e.nodes_visited, e.elapsed), every_nodes=every_nodes)
+    return hooks
+
+
+class SearchMonitor:
+    """
+    Budget enforcement and event sampling for one search run.
+
+    The search keeps its own counters and only calls in when a threshold is
+    crossed:
+
+        self.nodes_visited += 1
+        if self.nodes_visited >= monitor.next_check and monitor.node_checkpoint():
+            stop the search
+
+        self.nodes_pruned += 1
+        if self.nodes_pruned >= monitor.next_prune:
+            monitor.prune_checkpoint()
+
+    Thresholds are infinite for anything that is neither subscribed nor
+    budgeted, so an unbudgeted, unobserved search never leaves its hot path.
+
+    With a ``SharedIncumbent`` in ``shared_incumbent``, node checkpoints also
+    copy its makespan into the search's ``external_bound`` when it is better
+    (and let the search take over the schedule behind it), and every new
+    incumbent of the search is offered to it.
+    """
+
+    def __init__(self, search, hooks=None, time_limit=None, node_limit=None, cancel=None, shared_incumbent=None):
+        self.search = search
+        self.hooks = hooks
+        self.time_limit = time_limit
+        self.node_limit = node_limit
+        self.cancel = cancel
+        self.shared_incumbent = shared_incumbent
+        self.start_time = time.time()
+
+        intervals = []
+        if time_limit is not None or cancel is not None or shared_incumbent is not None:
+            intervals.append(DEFAULT_CHECK_INTERVAL)
+        self.node_interval = hooks.check_interval(NODE) if hooks else None
+        if self.node_interval:
+            intervals.append(self.node_interval)
+        self.check_interval = min(intervals) if intervals else None
+        self.prune_interval = hooks.check_interval(PRUNE) if hooks else None
+
+        self.next_check = self._next_threshold(0, self.check_interval)
+        if node_limit is not None:
+            self.next_check = min(self.next_check, node_limit + 1)
+        self.next_prune = self._next_threshold(0, self.prune_interval)
+
+        if hooks:
+            hooks.reset()
+            if hooks.has(RESTART):
+                hooks.emit(RESTART, 0, lambda: self.event(RESTART))
+
+    @staticmethod
+    def _next_threshold(count, interval):
+        return count + interval if interval else float('inf')
+
+    def elapsed(self):
+        return time.time() - self.start_time
+
+    def event(self, kind, **info):
+        search = self.search
+        best = search.best_makespan if search.best_makespan != float('inf') else None
+        return SearchEvent(kind, search.nodes_visited, search.nodes_pruned, self.elapsed(), best, info)
+
+    def node_checkpoint(self):
+        """
+        Enforce the budget and emit sampled node events.
+
+        Returns:
+            bool: True if the search must stop (node/time budget spent or cancelled)
+        """
+        nodes = self.search.nodes_visited
+        if self.node_limit is not None and nodes > self.node_limit:
+            # The node over the budget is not expanded, so it does not count
+            self.search.nodes_visited = self.node_limit
+            return True
+        if self.cancel is not None and self.cancel.cancelled:
+            return True
+        if self.time_limit is not None and self.elapsed() > self.time_limit:
+            return True
+        if self.shared_incumbent is not None and self.shared_incumbent.makespan < self.search.external_bound:
+            self.search.external_bound = self.shared_incumbent.makespan
+            self.search.adopt_shared_incumbent()
+
+        if self.node_interval:
+            self.hooks.emit(NODE, nodes, lambda: self.event(NODE))
+        self.next_check = self._next_threshold(nodes, self.check_interval)
+        if self.node_limit is not None:
+            self.next_check = min(self.next_check, self.node_limit + 1)
+        return False
+
+    def prune_checkpoint(self):
+        pruned = self.search.nodes_pruned
+        self.hooks.emit(PRUNE, pruned, lambda: self.event(PRUNE))
+        self.next_prune = self._next_threshold(pruned, self.prune_interval)
+
+    def incumbent(self, **info):
+        """Report a new best schedule (rare, so not sampled)."""
+        search = self.search
+        if self.shared_incumbent is not None and search.best_makespan < self.shared_incumbent.makespan:
+            self.shared_incumbent.offer(search.best_makespan, Schedule.from_backtracking(search.best_timeline))
+        if self.hooks and self.hooks.has(INCUMBENT):
+            self.hooks.emit(INCUMBENT, self.search.nodes_visited, lambda: self.event(INCUMBENT, **info))
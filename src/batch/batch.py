@@ -0,0 +1,253 @@
+"""
+Headless batch runner
+
+Solves many dataset files with several solvers across a process pool and
+streams one JSON record per (instance, solver) pair, so nightly runs need
+neither a display nor the Tk application.
+"""
+
+import contextlib
+import glob
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, Iterable, List, Tuple
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+
+from src.helperFunctions.binaryInstance import BINARY_EXTENSION
+from src.helperFunctions.readFromCSV import read_dataset
+from src.helperFunctions.solutionCache import SolutionCache
+from src.solvers.registry import available_solvers, get_solver, parse_spec, resolve_params, split_params
+from src.solvers.solver import CANCELLED
+
+
+DATASET_TIERS = ('small', 'medium', 'large')
+
+def parse_solver_spec(spec: str) -> Tuple[str, Dict[str, Any]]:
+    """
+    Parse a solver spec of the form ``name[:key=value,...]``.
+
+    Args:
+        spec (str): e.g. 'backtracking2:time_limit=30', 'cultural:generation_limit=200'
+            or 'portfolio:members=tabu+annealing:seed=1,time_limit=10'
+
+    Returns:
+        Tuple[str, Dict[str, Any]]: Solver name and its parameters (defaults filled in)
+
+    Raises:
+        ValueError: If the solver or one of its parameters is unknown
+    """
+    name, overrides = parse_spec(spec)
+    return name, resolve_params(name, overrides)
+
+
+def expand_instances(sources: Iterable[str]) -> List[str]:
+    """
+    Expand directories, glob patterns, files and tier names into dataset paths.
+
+    Args:
+        sources: Directories (every ``*.csv`` and binary instance inside), glob patterns, dataset paths
+            or bundled tier names ('small', 'medium', 'large')
+
+    Returns:
+        List[str]: Dataset sources in a stable order, without duplicates
+    """
+    instances = []
+    for source in sources:
+        if source.lower() in DATASET_TIERS:
+            matches = [source.lower()]
+        elif os.path.isdir(source):
+            matches = sorted(glob.glob(os.path.join(source, '*.csv')) +
+                             glob.glob(os.path.join(source, '*' + BINARY_EXTENSION)))
+        elif glob.has_magic(source):
+            matches = sorted(glob.glob(source))
+        else:
+            matches = [source]
+
+        for match in matches:
+            if match not in instances:
+                instances.append(match)
+    return instances
+
+
+# One cache connection per worker process and cache file
+_solution_caches = {}
+
+
+def _get_cache(cache_path):
+    if cache_path not in _solution_caches:
+        _solution_caches[cache_path] = SolutionCache(cache_path)
+    return _solution_caches[cache_path]
+
+
+def solve_problem(problem_data, solver, params, progress=None, verbose=False, cache_path=None, cancel=None,
+                  budget=None):
+    """
+    Run one solver on an in-memory instance (the ``read_dataset`` dict shape).
+
+    Args:
+        problem_data: Instance dict with machines_count, total_jobs, total_tasks and jobs
+        solver (str): Name of a registered solver
+        params: Solver parameters as returned by ``parse_solver_spec``
+        progress: Optional callback receiving ``ProgressEvent``s
+        verbose: Forward solver output to stderr instead of discarding it
+        cache_path: Optional SQLite solution cache; equivalent instances solved
+            before with the same solver and parameters are answered from it
+        cancel: Optional CancellationToken
+        budget: Optional Budget used instead of the one in ``params`` (e.g. clamped to a
+            deadline); the cache is still keyed on ``params``
+
+    Returns:
+        tuple: (timeline in the cultural format, record dict with metrics and search statistics)
+    """
+    start_time = time.time()
+    cache = _get_cache(cache_path) if cache_path else None
+    if cache is not None:
+        cached = cache.get(problem_data, solver, params)
+        if cached is not None:
+            timeline, metrics = cached
+            record = {'wall_time': round(time.time() - start_time, 4)}
+            record.update(metrics)
+            record['cached'] = True
+            return timeline, record
+
+    params_budget, solver_kwargs = split_params(params)
+    budget = budget or params_budget
+    with open(os.devnull, 'w') as devnull, \
+            contextlib.redirect_stdout(sys.stderr if verbose else devnull):
+        result = get_solver(solver).solve(problem_data, budget, cancel=cancel, on_progress=progress, **solver_kwargs)
+
+    record = result.to_record()
+    del record['solver']
+    if cache is not None:
+        record['cached'] = False
+        # An interrupted run's schedule is not an answer to the request
+        if result.timeline and result.status != CANCELLED:
+            metrics = {key: value for key, value in record.items() if key not in ('wall_time', 'cached')}
+            cache.put(problem_data, solver, params, result.timeline, metrics)
+    return result.timeline, record
+
+
+def _print_live_metrics(source):
+    """Progress callback writing each 'metrics' event as one stderr line."""
+    def progress(event):
+        if event.kind == 'metrics':
+            print(json.dumps({'instance': source, 'solver': event.solver, 'step': event.step,
+                              'elapsed': round(event.elapsed, 3), **event.info}), file=sys.stderr, flush=True)
+    return progress
+
+
+def solve_instance(source, solver, params, seed=None, verbose=False, cache_path=None, live=False):
+    """
+    Solve one dataset with one solver and return its JSON record.
+    Runs inside a worker process; solver output goes to stderr (or nowhere)
+    so that stdout stays valid JSON Lines. With ``live``, incumbent metrics
+    are streamed to stderr while the solver runs.
+    """
+    record = {'instance': source, 'solver': solver, 'params': params, 'seed': seed}
+    start_time = time.time()
+    try:
+        if seed is not None:
+            random.seed(seed)
+        problem_data = read_dataset(source)
+        record.update({
+            'machines': problem_data['machines_count'],
+            'jobs': problem_data['total_jobs'],
+            'tasks': problem_data['total_tasks'],
+        })
+        progress = _print_live_metrics(source) if live else None
+        _, solve_record = solve_problem(problem_data, solver, params, progress=progress, verbose=verbose,
+                                        cache_path=cache_path)
+        record.update(solve_record)
+    except Exception as e:
+        record['wall_time'] = round(time.time() - start_time, 4)
+        record['status'] = 'error'
+        record['error'] = f"{type(e).__name__}: {e}"
+    return record
+
+
+def run_batch(instances, solvers, workers=None, seed=None, verbose=False, cache_path=None, live=False):
+    """
+    Run every (instance, solver) pair across a process pool.
+
+    Args:
+        instances: Dataset sources accepted by ``read_dataset``
+        solvers: List of (solver name, params) pairs
+        workers: Number of worker processes (defaults to the CPU count)
+        seed: Optional base seed; each pair gets ``seed + index`` for reproducibility
+        verbose: Forward solver progress output to stderr
+        cache_path: Optional SQLite solution cache shared by the workers
+        live: Stream incumbent metrics of running solves to stderr
+
+    Yields:
+        dict: One record per pair, in completion order
+    """
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = []
+        for index, (source, (solver, params)) in enumerate(
+                (source, solver) for source in instances for solver in solvers):
+            pair_seed = None if seed is None else seed + index
+            futures.append(pool.submit(solve_instance, source, solver, params, pair_seed, verbose, cache_path,
+                                       live))
+
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def main(argv=None):
+    """Command line entry point: ``python -m src.batch``."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog='python -m src.batch',
+        description='Solve many job scheduling instances in parallel and emit JSON Lines.'
+    )
+    parser.add_argument('instances', nargs='*',
+                        help="dataset directories, glob patterns, CSV files or tiers (small/medium/large)")
+    parser.add_argument('-s', '--solver', dest='solvers', action='append',
+                        help="solver spec name[:key=value,...], repeatable "
+                             "(e.g. backtracking2:time_limit=30, cultural:generation_limit=100, "
+                             "portfolio:members=tabu+annealing); "
+                             "default: backtracking2 and cultural")
+    parser.add_argument('--list-solvers', action='store_true', help='list registered solvers and exit')
+    parser.add_argument('-w', '--workers', type=int, default=None, help='worker processes (default: CPU count)')
+    parser.add_argument('-o', '--output', default='-', help='output file (default: stdout)')
+    parser.add_argument('--seed', type=int, default=None, help='base random seed')
+    parser.add_argument('-v', '--verbose', action='store_true', help='forward solver output to stderr')
+    parser.add_argument('--cache', default=None, metavar='PATH',
+                        help='SQLite solution cache; reuse schedules of equivalent instances')
+    parser.add_argument('--live', action='store_true',
+                        help='stream incumbent metrics (makespan, gap, utilization) of running solves to stderr')
+    args = parser.parse_args(argv)
+
+    if args.list_solvers:
+        for name in available_solvers():
+            print(f"{name}: {get_solver(name).display_name} {resolve_params(name, {})}")
+        return 0
+
+    try:
+        solvers = [parse_solver_spec(spec) for spec in (args.solvers or ['backtracking2', 'cultural'])]
+    except ValueError as e:
+        parser.error(str(e))
+
+    instances = expand_instances(args.instances)
+    if not instances:
+        parser.error('no dataset files matched')
+
+    out = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+    failures = 0
+    try:
+        for record in run_batch(instances, solvers, workers=args.workers, seed=args.seed,
+                                verbose=args.verbose, cache_path=args.cache, live=args.live):
+            failures += record['status'] == 'error'
+            out.write(json.dumps(record) + '\n')
+            out.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    return 1 if failures else 0
@@ -0,0 +1,415 @@
+"""
+Solver benchmark suite
+
+Runs every registered solver on the bundled dataset tiers and on generated
+instances of increasing size, with fixed seeds and repeated trials, and
+writes one JSON report:
+
+    python -m src.benchmarks -o bench.json
+    python -m src.benchmarks --baseline bench.json --threshold 0.1
+
+Search solvers get a node budget and population solvers a generation budget
+(no time limit), so every trial does the same amount of work and wall time
+and throughput are comparable between runs; LNS gets the node budget per
+repair and the rolling horizon per window. The portfolios race their members
+against a deadline, which no work budget replaces: they run for a fixed time,
+are tagged ``time_bounded`` in the report, and only their makespan is
+compared against a baseline. Peak memory is measured in a separate
+tracemalloc run so that tracing does not distort the timings.
+"""
+
+import contextlib
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+
+from src.helperFunctions.datasetCache import get_dataset_cache, load_dataset
+from src.helperFunctions.readFromCSV import read_dataset
+from src.helperFunctions.scheduleValidator import validate_schedule
+from src.solvers.registry import available_solvers, get_solver, resolve_params, solver_params, split_params
+
+
+DATASET_TIERS = ('small', 'medium', 'large')
+
+# Generated instances as JOBSxTASKSxMACHINES
+DEFAULT_GENERATED = ('10x5x3', '30x6x6', '60x8x12')
+
+DEFAULT_NODE_LIMIT = 5000
+DEFAULT_GENERATION_LIMIT = 10
+DEFAULT_TIME_LIMIT = 5.0
+DEFAULT_TRIALS = 3
+DEFAULT_THRESHOLD = 0.10
+
+# Wall times below this are dominated by noise and not compared against the baseline
+MIN_COMPARABLE_TIME = 0.05
+
+# Metrics of time-bounded cases that only measure the clock
+TIME_BOUNDED_METRICS = ('wall_time', 'rate')
+
+# Summary metric -> True if larger is better
+COMPARED_METRICS = {
+    'wall_time': False,
+    'rate': True,
+    'makespan': False,
+    'peak_memory_kb': False,
+}
+
+
+def generate_instance(spec: str, seed: int = 0, min_time: int = 5, max_time: int = 60) -> Dict[str, Any]:
+    """
+    Build a random instance in the ``read_dataset`` shape.
+
+    Args:
+        spec (str): 'JOBSxTASKSxMACHINES', every job gets exactly TASKS tasks
+        seed (int): Seed of the instance's private random generator
+        min_time, max_time: Inclusive range of task execution times
+
+    Raises:
+        ValueError: If the spec is malformed
+    """
+    try:
+        jobs_count, tasks_per_job, machines_count = (int(part) for part in spec.lower().split('x'))
+    except ValueError:
+        raise ValueError(f"Generated instance must be JOBSxTASKSxMACHINES, got '{spec}'") from None
+
+    rng = random.Random(seed)
+    tasks = []
+    jobs = []
+    for job_id in range(1, jobs_count + 1):
+        job_tasks = [{'task_id': task_id, 'execution_time': rng.randint(min_time, max_time)}
+                     for task_id in range(1, tasks_per_job + 1)]
+        jobs.append({'job_id': job_id, 'tasks': job_tasks})
+        tasks.extend({'job_id': job_id, **task} for task in job_tasks)
+
+    return {
+        'machines_count': machines_count,
+        'tasks': tasks,
+        'jobs': jobs,
+        'total_tasks': len(tasks),
+        'total_jobs': len(jobs),
+        'dataset_size': f'gen-{spec}',
+        'source_file': None,
+    }
+
+
+def load_instance(name: str, seed: int = 0) -> Dict[str, Any]:
+    """Load a dataset tier/CSV path, or generate 'gen-JOBSxTASKSxMACHINES'."""
+    if name.startswith('gen-'):
+        return generate_instance(name[len('gen-'):], seed)
+    return read_dataset(name)
+
+
+def lower_bound(problem_data) -> int:
+    """Makespan lower bound: total work spread over all machines, or the longest job."""
+    job_lengths = [sum(task['execution_time'] for task in job['tasks']) for job in problem_data['jobs']]
+    machines = problem_data['machines_count']
+    return max(max(job_lengths, default=0), -(-sum(job_lengths) // machines))
+
+
+def benchmark_params(solver: str, node_limit=DEFAULT_NODE_LIMIT, generation_limit=DEFAULT_GENERATION_LIMIT,
+                     time_limit=DEFAULT_TIME_LIMIT):
+    """
+    Fixed-work budget for a solver: a node budget for searches, a generation budget otherwise.
+
+    Solvers that run a search inside get the node budget per run instead of
+    their time per run: LNS per repair, the rolling horizon per window. A
+    portfolio gets ``time_limit``, see ``is_time_bounded``.
+    """
+    progress_unit = get_solver(solver).progress_unit
+    defaults = solver_params(solver)
+    if progress_unit == 'node':
+        return resolve_params(solver, {'time_limit': None, 'node_limit': node_limit})
+    if progress_unit == 'improvement':
+        return resolve_params(solver, {'time_limit': time_limit})
+    if 'repair_nodes' in defaults:
+        return resolve_params(solver, {'time_limit': None, 'generation_limit': generation_limit,
+                                       'repair_time': None, 'repair_nodes': node_limit})
+    if 'window_nodes' in defaults:
+        return resolve_params(solver, {'time_limit': None, 'window_time': None, 'window_nodes': node_limit})
+    return resolve_params(solver, {'time_limit': None, 'generation_limit': generation_limit})
+
+
+def is_time_bounded(params) -> bool:
+    """True if a case runs against the clock, so its wall time and rate say nothing about performance."""
+    return params.get('time_limit') is not None
+
+
+def run_trial(instance, solver, params, seed, measure_memory=False, instance_seed=0):
+    """
+    Solve one instance once, seeding the global random generator with ``seed``.
+
+    With ``measure_memory`` the solve runs under tracemalloc and only the
+    peak traced memory is meaningful; otherwise the record carries timings
+    and the number of feasibility violations in the returned schedule.
+    A solver exception is recorded as an 'error' trial instead of aborting the suite.
+    """
+    problem_data = load_instance(instance, instance_seed)
+    budget, solver_kwargs = split_params(params)
+    random.seed(seed)
+
+    start_time = time.perf_counter()
+    try:
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            if measure_memory:
+                tracemalloc.start()
+                try:
+                    get_solver(solver).solve(problem_data, budget, **solver_kwargs)
+                    _, peak = tracemalloc.get_traced_memory()
+                finally:
+                    tracemalloc.stop()
+                return {'peak_memory_kb': round(peak / 1024, 1)}
+
+            result = get_solver(solver).solve(problem_data, budget, **solver_kwargs)
+    except Exception as e:
+        if measure_memory:
+            return {'peak_memory_kb': None}
+        return {'seed': seed, 'status': 'error', 'error': f"{type(e).__name__}: {e}",
+                'wall_time': round(time.perf_counter() - start_time, 4), 'makespan': None,
+                'nodes': None, 'generations': None, 'rate': None, 'violations': None}
+    wall_time = time.perf_counter() - start_time
+    violations = validate_schedule(result.schedule, problem_data).total if len(result.schedule) else 0
+
+    work = result.nodes if result.nodes is not None else result.generations
+    return {
+        'seed': seed,
+        'status': result.status,
+        'wall_time': round(wall_time, 4),
+        'makespan': result.makespan,
+        'nodes': result.nodes,
+        'generations': result.generations,
+        'rate': round(work / wall_time, 2) if work and wall_time > 0 else None,
+        'violations': violations,
+    }
+
+
+def summarize(trials: List[Dict[str, Any]], bound: int, peak_memory_kb: Optional[float]) -> Dict[str, Any]:
+    """Aggregate the trials of one (instance, solver) case."""
+    errors = sum(trial['status'] == 'error' for trial in trials)
+    invalid = sum(bool(trial.get('violations')) for trial in trials)
+    trials = [trial for trial in trials if trial['status'] != 'error'] or trials
+    wall_times = [trial['wall_time'] for trial in trials]
+    rates = [trial['rate'] for trial in trials if trial['rate'] is not None]
+    makespans = [trial['makespan'] for trial in trials if trial['makespan'] is not None]
+    best = min(makespans) if makespans else None
+    return {
+        'wall_time': round(statistics.median(wall_times), 4),
+        'wall_time_min': min(wall_times),
+        'rate': round(statistics.median(rates), 2) if rates else None,
+        'makespan': statistics.median(makespans) if makespans else None,
+        'best_makespan': best,
+        'lower_bound': bound,
+        'gap': round((best - bound) / bound, 4) if best is not None and bound > 0 else None,
+        'peak_memory_kb': peak_memory_kb,
+        'errors': errors,
+        'invalid': invalid,
+    }
+
+
+def run_benchmarks(instances, solvers, trials=DEFAULT_TRIALS, seed=0, workers=1, measure_memory=True):
+    """
+    Benchmark every (instance, solver) pair.
+
+    Args:
+        instances: Tier names, CSV paths or 'gen-JOBSxTASKSxMACHINES' specs
+        solvers: List of (solver name, params) pairs
+        trials: Timed runs per pair; trial ``i`` uses seed ``seed + i``
+        seed: Base seed (generated instances always use ``seed`` itself)
+        workers: Worker processes; keep 1 for stable timings
+        measure_memory: Add one tracemalloc run per pair
+
+    Returns:
+        list: One case dict per pair with its trials and summary
+    """
+    jobs = []
+    for instance in instances:
+        for solver, params in solvers:
+            for trial in range(trials):
+                jobs.append((instance, solver, params, seed + trial, False, seed))
+            if measure_memory:
+                jobs.append((instance, solver, params, seed, True, seed))
+
+    if workers == 1:
+        outputs = [run_trial(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            outputs = list(pool.map(run_trial, *zip(*jobs)))
+
+    cases = {}
+    for (instance, solver, params, _, memory_run, _), output in zip(jobs, outputs):
+        case = cases.setdefault((instance, solver), {
+            'instance': instance, 'solver': solver, 'params': params, 'trials': [], 'peak_memory_kb': None,
+        })
+        if memory_run:
+            case['peak_memory_kb'] = output['peak_memory_kb']
+        else:
+            case['trials'].append(output)
+
+    results = []
+    for instance in instances:
+        problem_data = load_instance(instance, seed)
+        if instance.startswith('gen-'):
+            bound = lower_bound(problem_data)
+        else:
+            bound = load_dataset(instance).derived['lower_bound']
+        for solver, _ in solvers:
+            case = cases[(instance, solver)]
+            results.append({
+                'instance': instance,
+                'solver': solver,
+                'params': case['params'],
+                'time_bounded': is_time_bounded(case['params']),
+                'size': {'machines': problem_data['machines_count'], 'jobs': problem_data['total_jobs'],
+                         'tasks': problem_data['total_tasks']},
+                'summary': summarize(case['trials'], bound, case['peak_memory_kb']),
+                'trials': case['trials'],
+            })
+    return results
+
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Compare results against a baseline report.
+
+    Args:
+        results: Cases returned by ``run_benchmarks``
+        baseline: A previously written report (``{'results': [...]}``)
+        threshold: Relative change in the bad direction that counts as a regression
+
+    Returns:
+        list: One dict per compared metric with baseline, current, relative change
+            and a ``regression`` flag; cases absent from the baseline are skipped
+    """
+    baseline_cases = {(case['instance'], case['solver']): case for case in baseline.get('results', [])}
+    comparisons = []
+    for case in results:
+        base = baseline_cases.get((case['instance'], case['solver']))
+        if base is None or base['params'] != case['params']:
+            continue
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            if metric in TIME_BOUNDED_METRICS and is_time_bounded(case['params']):
+                continue
+            old, new = base['summary'].get(metric), case['summary'].get(metric)
+            if not old or new is None:
+                continue
+            if metric == 'wall_time' and max(old, new) < MIN_COMPARABLE_TIME:
+                continue
+            change = (new - old) / old
+            worse = -change if higher_is_better else change
+            comparisons.append({
+                'instance': case['instance'],
+                'solver': case['solver'],
+                'metric': metric,
+                'baseline': old,
+                'current': new,
+                'change': round(change, 4),
+                'regression': worse > threshold,
+            })
+    return comparisons
+
+
+def format_table(results) -> str:
+    """Human readable summary, one line per case; time-bounded solvers are marked with '*'."""
+    header = (f"{'instance':<16}{'solver':<15}{'wall s':>9}{'rate/s':>12}{'makespan':>10}"
+              f"{'LB':>7}{'gap':>8}{'peak KB':>10}{'errors':>8}{'invalid':>9}")
+    lines = [header, '-' * len(header)]
+    for case in results:
+        s = case['summary']
+        gap = f"{s['gap'] * 100:.1f}%" if s['gap'] is not None else '-'
+        solver = case['solver'] + ('*' if case.get('time_bounded') else '')
+        lines.append(
+            f"{case['instance']:<16}{solver:<15}{s['wall_time']:>9.3f}"
+            f"{s['rate'] if s['rate'] is not None else '-':>12}{s['makespan'] if s['makespan'] is not None else '-':>10}"
+            f"{s['lower_bound']:>7}{gap:>8}{s['peak_memory_kb'] if s['peak_memory_kb'] is not None else '-':>10}"
+            f"{s['errors']:>8}{s.get('invalid', 0):>9}"
+        )
+    if any(case.get('time_bounded') for case in results):
+        lines.append('* time-bounded: wall time and rate follow the time limit')
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    """Command line entry point: ``python -m src.benchmarks``."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog='python -m src.benchmarks',
+        description='Benchmark the registered solvers and optionally compare against a baseline report.'
+    )
+    parser.add_argument('instances', nargs='*',
+                        help="tiers, CSV paths or gen-JOBSxTASKSxMACHINES (default: all tiers and "
+                             f"gen-{', gen-'.join(DEFAULT_GENERATED)})")
+    parser.add_argument('-s', '--solver', dest='solvers', action='append',
+                        help='solver name, repeatable (default: every registered solver)')
+    parser.add_argument('--trials', type=int, default=DEFAULT_TRIALS, help='timed runs per case')
+    parser.add_argument('--seed', type=int, default=0, help='base random seed')
+    parser.add_argument('--nodes', type=int, default=DEFAULT_NODE_LIMIT, help='node budget of search solvers')
+    parser.add_argument('--generations', type=int, default=DEFAULT_GENERATION_LIMIT,
+                        help='generation budget of population solvers')
+    parser.add_argument('--time-limit', type=float, default=DEFAULT_TIME_LIMIT,
+                        help='seconds per run of the time-bounded portfolios')
+    parser.add_argument('-w', '--workers', type=int, default=1,
+                        help='worker processes (default: 1, parallel runs disturb timings)')
+    parser.add_argument('--no-memory', dest='memory', action='store_false', help='skip the tracemalloc run')
+    parser.add_argument('-o', '--output', default=None, help='write the JSON report to this file')
+    parser.add_argument('--baseline', default=None, help='JSON report to compare against')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='relative change counted as a regression (default: 0.10)')
+    args = parser.parse_args(argv)
+
+    instances = args.instances or list(DATASET_TIERS) + [f'gen-{spec}' for spec in DEFAULT_GENERATED]
+    try:
+        solvers = [(name, benchmark_params(name, args.nodes, args.generations, args.time_limit))
+                   for name in (args.solvers or available_solvers())]
+        for instance in instances:
+            load_instance(instance, args.seed)
+    except (ValueError, FileNotFoundError) as e:
+        parser.error(str(e))
+
+    results = run_benchmarks(instances, solvers, trials=args.trials, seed=args.seed,
+                             workers=args.workers, measure_memory=args.memory)
+    report = {
+        'meta': {
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'trials': args.trials,
+            'seed': args.seed,
+            'dataset_cache': get_dataset_cache().stats(),
+        },
+        'results': results,
+    }
+    print(format_table(results), file=sys.stderr)
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            comparisons = compare(results, json.load(f), args.threshold)
+        report['comparison'] = {'baseline': args.baseline, 'threshold': args.threshold, 'metrics': comparisons}
+        regressions = [c for c in comparisons if c['regression']]
+        for c in regressions:
+            print(f"REGRESSION {c['instance']} {c['solver']} {c['metric']}: "
+                  f"{c['baseline']} -> {c['current']} ({c['change'] * 100:+.1f}%)", file=sys.stderr)
+        print(f"{len(comparisons)} metrics compared, {len(regressions)} regressions", file=sys.stderr)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    invalid = [case for case in results if case['summary']['invalid']]
+    for case in invalid:
+        print(f"INFEASIBLE {case['instance']} {case['solver']}: "
+              f"{case['summary']['invalid']} trial(s) returned schedules with violations", file=sys.stderr)
+
+    return 1 if regressions or invalid else 0
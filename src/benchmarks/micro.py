@@ -0,0 +1,261 @@
+"""
+Micro-benchmarks of solver hot primitives
+
+Times the helpers that dominate solver profiles on representative schedules
+of increasing size and fits a scaling exponent k (latency ~ tasks^k) per
+primitive, so data-structure rewrites can be judged by what they change:
+
+    python -m src.benchmarks.micro
+    python -m src.benchmarks.micro --sizes 100,200,400,800 -p lower_bound -o micro.json
+
+Search primitives run on a partial schedule (each job's first half placed),
+metric and fitness primitives on a complete one. Instances have 8 tasks per
+job on 8 machines, so per-machine timelines grow with the instance.
+"""
+
+import contextlib
+import json
+import math
+import os
+import random
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+
+from src.benchmarks.benchmark import generate_instance
+from src.solvers.solver import to_cultural_timeline, timeline_metrics
+
+with contextlib.redirect_stdout(None):
+    from src.backTracking.backTracking import backTracking
+    from src.backTracking.backTracking2 import backTracking2
+    from src.cultural import cultural
+
+
+DEFAULT_SIZES = (64, 128, 256, 512, 1024)
+TASKS_PER_JOB = 8
+MACHINES = 8
+DEFAULT_REPEAT = 5
+DEFAULT_MIN_TIME = 0.05  # seconds per timing sample
+
+
+def list_schedule(problem_data, tasks_per_job=None):
+    """
+    Cheap feasible schedule in the backtracking format: jobs' tasks are placed
+    round-robin, each on the machine that frees up first.
+
+    Args:
+        tasks_per_job: Place only each job's first N tasks (a partial schedule)
+
+    Returns:
+        tuple: (timeline machine -> task dicts, tasks placed per job index)
+    """
+    jobs = problem_data['jobs']
+    placed = [0] * len(jobs)
+    limit = [len(job['tasks']) if tasks_per_job is None else min(tasks_per_job, len(job['tasks'])) for job in jobs]
+    job_ready = [0] * len(jobs)
+    machine_ready = [0] * problem_data['machines_count']
+    timeline = {}
+
+    while any(placed[j] < limit[j] for j in range(len(jobs))):
+        for j, job in enumerate(jobs):
+            if placed[j] >= limit[j]:
+                continue
+            task = job['tasks'][placed[j]]
+            machine = min(range(len(machine_ready)), key=machine_ready.__getitem__)
+            start = max(machine_ready[machine], job_ready[j])
+            end = start + task['execution_time']
+            timeline.setdefault(machine, []).append({
+                'job_id': job['job_id'],
+                'task_id': task['task_id'],
+                'execution_time': task['execution_time'],
+                'start_time': start,
+                'end_time': end,
+                'machine': machine,
+            })
+            machine_ready[machine] = job_ready[j] = end
+            placed[j] += 1
+    return timeline, placed
+
+
+def _configure(search, problem_data, timeline):
+    search.machines_count = problem_data['machines_count']
+    search.total_jobs = problem_data['total_jobs']
+    search.total_tasks = problem_data['total_tasks']
+    search.jobs = problem_data['jobs']
+    # The primitives run without schedule_tasks, which would otherwise size the releases
+    search.machine_release = [0] * search.machines_count
+    search.timeline = timeline
+    search.start_time = time.time()
+    return search
+
+
+def build_cases(tasks: int, seed: int = 0) -> Dict[str, Callable[[], Any]]:
+    """
+    Zero-argument callables, one per primitive, bound to an instance with ``tasks`` tasks.
+    """
+    problem_data = generate_instance(f'{max(1, tasks // TASKS_PER_JOB)}x{TASKS_PER_JOB}x{MACHINES}', seed)
+    full_timeline, _ = list_schedule(problem_data)
+    partial_timeline, placed = list_schedule(problem_data, TASKS_PER_JOB // 2)
+
+    # The next unplaced task of the middle job, as the searches build it
+    j = len(problem_data['jobs']) // 2
+    job = problem_data['jobs'][j]
+    task_data = job['tasks'][placed[j]]
+    task = {'job_id': job['job_id'], 'task_id': task_data['task_id'], 'execution_time': task_data['execution_time']}
+    machine = 0
+
+    bt = _configure(backTracking(), problem_data, partial_timeline)
+    bt2 = _configure(backTracking2(), problem_data, partial_timeline)
+    bt2.job_next_task = list(placed)
+    bt_start = bt._find_earliest_start_time(task, machine)
+    bt2_start = bt2._find_earliest_start_time(task, machine)
+
+    bt_full = _configure(backTracking(), problem_data, full_timeline)
+    bt2_full = _configure(backTracking2(), problem_data, full_timeline)
+
+    cultural.goal = problem_data
+    cultural_timeline = to_cultural_timeline(full_timeline)
+    # Same tasks on rotated machines, as a stand-in for the belief space's best individual
+    best_timeline = {(m % MACHINES) + 1: tasks for m, tasks in cultural_timeline.items()}
+    ind = cultural.individual(cultural_timeline)
+
+    def apply_influence():
+        random.seed(seed)
+        return ind._apply_influence(cultural_timeline, best_timeline, 0.3)
+
+    return {
+        'backtracking._find_earliest_start_time': lambda: bt._find_earliest_start_time(task, machine),
+        'backtracking._checkConstraints': lambda: bt._checkConstraints(task, machine, bt_start),
+        'backtracking._find_previous_task_end_time': lambda: bt._find_previous_task_end_time(
+            task['job_id'], task['task_id']),
+        'backtracking2._find_earliest_start_time': lambda: bt2._find_earliest_start_time(task, machine),
+        'backtracking2._checkConstraints': lambda: bt2._checkConstraints(task, machine, bt2_start),
+        'backtracking2._find_previous_task_end_time': lambda: bt2._find_previous_task_end_time(
+            task['job_id'], task['task_id'] - 1),
+        'backtracking2._compute_global_lower_bound': bt2._compute_global_lower_bound,
+        'cultural.individual.calc_fitness': ind.calc_fitness,
+        'cultural.individual._apply_influence': apply_influence,
+        'backtracking.get_metrics': bt_full.get_metrics,
+        'backtracking2.get_metrics': bt2_full.get_metrics,
+        'cultural.get_metrics': lambda: cultural.get_metrics(cultural_timeline, 0.0),
+        'solvers.timeline_metrics': lambda: timeline_metrics(cultural_timeline, MACHINES),
+    }
+
+
+def time_call(fn, repeat=DEFAULT_REPEAT, min_time=DEFAULT_MIN_TIME) -> float:
+    """Best per-call latency in seconds over ``repeat`` samples of at least ``min_time`` each."""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2
+
+    best = elapsed / number
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def scaling_exponent(sizes: List[int], latencies: List[float]):
+    """Least-squares slope of log(latency) over log(size); None with fewer than two points."""
+    points = [(math.log(size), math.log(latency)) for size, latency in zip(sizes, latencies) if latency > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    if variance == 0:
+        return None
+    return round(sum((x - mean_x) * (y - mean_y) for x, y in points) / variance, 2)
+
+
+def run_micro(sizes=DEFAULT_SIZES, primitives=None, repeat=DEFAULT_REPEAT, min_time=DEFAULT_MIN_TIME, seed=0):
+    """
+    Time every primitive (or those whose name contains one of ``primitives``) at every size.
+
+    Returns:
+        list: One dict per primitive with per-size latency (microseconds) and the scaling exponent;
+            a primitive that raises at some size records the error for that size
+    """
+    results = {}
+    for size in sizes:
+        with contextlib.redirect_stdout(None):
+            cases = build_cases(size, seed)
+        for name, fn in cases.items():
+            if primitives and not any(p in name for p in primitives):
+                continue
+            result = results.setdefault(name, {'primitive': name, 'latency_us': {}, 'errors': {}})
+            try:
+                with contextlib.redirect_stdout(None):
+                    result['latency_us'][size] = round(time_call(fn, repeat, min_time) * 1e6, 3)
+            except Exception as e:
+                result['errors'][size] = f"{type(e).__name__}: {e}"
+
+    for result in results.values():
+        timed = sorted(result['latency_us'])
+        result['exponent'] = scaling_exponent(timed, [result['latency_us'][size] for size in timed])
+    return list(results.values())
+
+
+def format_table(results, sizes) -> str:
+    """Latency in microseconds per size, plus the fitted exponent."""
+    header = f"{'primitive':<45}" + ''.join(f"{size:>11}" for size in sizes) + f"{'k':>7}"
+    lines = [header, '-' * len(header)]
+    for result in results:
+        cells = ''.join(f"{result['latency_us'].get(size, 'error'):>11}" for size in sizes)
+        exponent = result['exponent'] if result['exponent'] is not None else '-'
+        lines.append(f"{result['primitive']:<45}{cells}{exponent:>7}")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    """Command line entry point: ``python -m src.benchmarks.micro``."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog='python -m src.benchmarks.micro',
+        description='Per-call latency and scaling exponents of solver hot primitives.'
+    )
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)),
+                        help='comma separated task counts (default: %(default)s)')
+    parser.add_argument('-p', '--primitive', dest='primitives', action='append',
+                        help='only primitives whose name contains this, repeatable')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help='timing samples per measurement')
+    parser.add_argument('--min-time', type=float, default=DEFAULT_MIN_TIME, help='seconds per timing sample')
+    parser.add_argument('--seed', type=int, default=0, help='instance seed')
+    parser.add_argument('-o', '--output', default=None, help='write the JSON report to this file')
+    args = parser.parse_args(argv)
+
+    try:
+        sizes = sorted({int(size) for size in args.sizes.split(',') if size.strip()})
+    except ValueError:
+        parser.error(f"--sizes must be comma separated integers, got '{args.sizes}'")
+
+    results = run_micro(sizes, args.primitives, args.repeat, args.min_time, args.seed)
+    print(format_table(results, sizes), file=sys.stderr)
+
+    report = {
+        'meta': {'created': time.strftime('%Y-%m-%dT%H:%M:%S'), 'sizes': sizes,
+                 'tasks_per_job': TASKS_PER_JOB, 'machines': MACHINES, 'seed': args.seed},
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -5,6 +5,12 @@ import copy
 import time
 sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
 from src.helperFunctions.readFromCSV import read_dataset
+from src.solvers.registry import register_solver
+from src.solvers.liveMetrics import LiveMetrics, DEFAULT_METRICS_INTERVAL
+from src.helperFunctions.schedule import Schedule
+from src.helperFunctions.scheduleMetrics import schedule_metrics
+from src.helperFunctions.warmStart import adapt_schedule, mutate_schedule
+from src.solvers.solver import Budget, ProgressEvent, SolveResult, debug_validate, FEASIBLE, CANCELLED
 
 goal = None
 pop_count = 100
@@ -97,8 +103,9 @@ class individual(object):
         timeline = self.timeline
         idle_time = 0
         makespan = 0
-        if len(timeline)  < goal['machines_count']:
-            return 999 * (goal['machines_count'] - len(timeline))
+        # Penalty for every unused machine, on top of the fitness: on its own it could beat real schedules
+        # and throw the seeded individuals of a warm start away
+        unused_penalty = 999 * max(0, goal['machines_count'] - len(timeline))
         for machine, tasks in timeline.items(): 
             last_task = tasks[-1]
             for task_dict in last_task.values():
@@ -119,7 +126,7 @@ class individual(object):
             machine_end_time = pastValue
             idle_time += makespan - machine_end_time
 
-        fitness = makespan + idle_time
+        fitness = makespan + idle_time + unused_penalty
 
         return fitness
 
@@ -269,9 +276,11 @@ class individual(object):
         
         return influenced_timeline
 
-def _cultural_algorithm(generation_callback=None):
-    population=[]
-    for i in range(pop_count):
+def _cultural_algorithm(generation_callback=None, generations=generations, pop_count=pop_count, on_generation=None,
+                        seeds=None):
+    # Seed timelines (e.g. from a warm start) take the first places, random individuals fill the rest
+    population = [individual(timeline) for timeline in (seeds or [])[:pop_count]]
+    for i in range(pop_count - len(population)):
         population.append(individual.initialize_individual())
 
     belief = belief_space()
@@ -288,63 +297,116 @@ def _cultural_algorithm(generation_callback=None):
         # Call the callback if provided (for GUI updates)
         if generation_callback:
             generation_callback(i + 1, belief.situational.fitness)
-        else:
+        elif not on_generation:
             print(f"Generation {i + 1}: Best Fitness = {belief.situational.fitness}")
+
+        # on_generation(generation, best_individual) returns True to stop early
+        if on_generation and on_generation(i + 1, belief.situational):
+            break
     return belief.situational.timeline, belief.situational.fitness, fitness_history
 
 
-def cultural_algorithm(res, generation_callback=None):
+def cultural_algorithm(res, generation_callback=None, generations=generations, pop_count=pop_count,
+                       on_generation=None, seeds=None):
     global goal
     goal = res
 
-    return _cultural_algorithm(generation_callback=generation_callback)
-
-def get_metrics(timeline, exec_time):
-    metrics = {}
-    makespan = 0
-    idle_time = 0
-    total_execution_time = 0
-
-    # First pass: find makespan and total execution time
-    for machine, tasks in timeline.items(): 
-        if tasks:
-            last_task = tasks[-1]
-            for task_dict in last_task.values():
-                total_machine_time , total_execution_time_machine = task_dict
-                machine_completion_time = total_machine_time + total_execution_time_machine
-                if machine_completion_time > makespan:
-                    makespan = machine_completion_time
-            
-            for task_dict in tasks:
-                for task in task_dict.values():
-                    start , duration = task
-                    total_execution_time += duration  # Add all execution times
-
-    # Second pass: calculate idle time (between tasks and at the end of machines)
-    for machine, tasks in timeline.items(): 
-        if tasks:
-            pastValue = 0
-            # Idle time between tasks
-            for task_dict in tasks:
-                for task in task_dict.values():
-                    start , duration = task
-                    idle_time += start - pastValue
-                    pastValue = start + duration
-            
-            # Idle time at the end of machine execution
-            machine_end_time = pastValue
-            idle_time += makespan - machine_end_time
-
-    # Calculate utilization
-    total_available_time = makespan * len(timeline)
-    utilization = (total_execution_time / total_available_time * 100) if total_available_time > 0 else 0
-
-    metrics["makespan"] = str(makespan) + " ms"
-    metrics['idle_time'] = str(idle_time) + " ms"
-    metrics['utilization'] = round(utilization, 2)
-    metrics["execTime"] = str(round(exec_time, 2)) + ' s'
-
-
+    return _cultural_algorithm(generation_callback=generation_callback,
+                               generations=generations, pop_count=pop_count, on_generation=on_generation,
+                               seeds=seeds)
+
+
+def warm_start_seeds(warm_start, problem_data, count):
+    """
+    Cultural-format timelines around a warm start: the adapted schedule itself,
+    then ``count - 1`` mutations of it (one to three tasks moved to another machine).
+    """
+    schedule = adapt_schedule(warm_start, problem_data)
+    seeds = [schedule] + [mutate_schedule(schedule, problem_data, random, moves=1 + i % 3) for i in range(count - 1)]
+    return [dict(seed.cultural_view()) for seed in seeds]
+
+
+def _timeline_makespan(timeline):
+    return max((start + duration for tasks in timeline.values() for task_dict in tasks
+                for start, duration in task_dict.values()), default=0)
+
+
+@register_solver
+class CulturalSolver:
+    """Cultural algorithm, exposed through the common Solver interface."""
+    name = 'cultural'
+    display_name = 'Cultural Algorithm'
+    description = ("An evolutionary algorithm inspired by cultural evolution processes. Uses a belief space to "
+                   "guide the population-based search toward promising regions.")
+    features = ('Heuristic approach', 'Faster convergence', 'Good for larger problems', 'Cultural knowledge sharing')
+    progress_unit = 'generation'
+    objective_name = 'Best Fitness'
+    default_budget = Budget(generation_limit=generations)
+    default_params = {'pop_count': pop_count, 'metrics_interval': DEFAULT_METRICS_INTERVAL,
+                      'warm_start_share': 0.2}
+
+    def solve(self, problem_data, budget=None, cancel=None, on_progress=None, pop_count=pop_count,
+              metrics_interval=DEFAULT_METRICS_INTERVAL, warm_start=None, warm_start_share=0.2, incumbent=None):
+        budget = budget or self.default_budget
+        start_time = time.time()
+        state = {'generations': 0, 'cancelled': False}
+        live = LiveMetrics(self.name, problem_data, on_progress, metrics_interval)
+
+        def on_generation(generation, best):
+            state['generations'] = generation
+            if incumbent is not None and _timeline_makespan(best.timeline) < incumbent.makespan:
+                # Share the best individual with solvers running alongside (see sharedIncumbent.py)
+                incumbent.offer(_timeline_makespan(best.timeline), Schedule.from_cultural(best.timeline))
+            if on_progress:
+                elapsed = time.time() - start_time
+                makespan = _timeline_makespan(best.timeline)
+                on_progress(ProgressEvent(self.name, 'progress', generation, elapsed, makespan, best.fitness))
+                live.update(makespan)
+                live.publish(generation, elapsed)
+            state['cancelled'] = cancel is not None and cancel.cancelled
+            return state['cancelled'] or budget.time_exceeded(start_time)
+
+        # A warm start seeds a share of the population with itself and its mutations
+        seeds = None
+        if warm_start is not None:
+            seeds = warm_start_seeds(warm_start, problem_data, max(1, round(pop_count * warm_start_share)))
+
+        max_generations = budget.generation_limit if budget.generation_limit is not None else generations
+        timeline, fitness, fitness_history = cultural_algorithm(
+            problem_data, generations=max_generations, pop_count=pop_count, on_generation=on_generation,
+            seeds=seeds
+        )
+        schedule = Schedule.from_cultural(timeline)
+        makespan = schedule.makespan
+
+        result = SolveResult(
+            solver=self.name,
+            status=CANCELLED if state['cancelled'] else FEASIBLE,
+            schedule=schedule,
+            makespan=makespan,
+            metrics=schedule.metrics(problem_data['machines_count']),
+            wall_time=time.time() - start_time,
+            generations=state['generations'],
+            history=list(enumerate(fitness_history, 1)),
+            stats={'fitness': fitness},
+        )
+        debug_validate(result, problem_data)
+        live.update(makespan)
+        live.flush(state['generations'], result.wall_time)
+        if on_progress:
+            on_progress(ProgressEvent(self.name, 'finished', state['generations'], result.wall_time,
+                                      makespan, fitness))
+        return result
+
+def get_metrics(timeline, exec_time, machines_count=None):
+    """
+    Metrics of a cultural-format timeline (see ``schedule_metrics``) plus execution_time in seconds.
+    ``machines_count`` defaults to the current problem's, or to the highest machine in the timeline.
+    """
+    if machines_count is None:
+        machines_count = goal['machines_count'] if goal else max(timeline, default=0)
+    metrics = schedule_metrics(Schedule.from_cultural(timeline), machines_count)
+    metrics['execution_time'] = exec_time
     return metrics
 
     
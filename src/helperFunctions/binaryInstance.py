@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Binary Instance Format
+
+Compact on-disk form of an ``Instance`` that loads without parsing: the file
+is memory-mapped and the integer columns are used in place, so a solver
+starts immediately and worker processes reading the same file share its
+pages through the OS page cache.
+
+Layout (little-endian, every section 8-byte aligned):
+
+    header (64 bytes)  magic b'JSBINST\\0', format version (u32), checksum (u32,
+                       CRC-32 of everything after the header),
+                       machines_count, jobs, tasks (i64 each), zero padding
+    job_ids            jobs      x i64
+    job_offsets        jobs + 1  x i64
+    durations          tasks     x i64
+
+The columns are plain int64 arrays, so NumPy users can open them with
+``np.memmap(path, '<i8', 'r', offset=HEADER_SIZE)``.
+
+Converters:
+
+    python -m src.helperFunctions.binaryInstance to-binary large.csv large.jsb
+    python -m src.helperFunctions.binaryInstance to-csv large.jsb large.csv
+"""
+
+import mmap
+import os
+import struct
+import sys
+import zlib
+from array import array
+from typing import Optional
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+
+from src.helperFunctions.instance import Instance, INT_TYPECODE
+
+
+MAGIC = b'JSBINST\0'
+FORMAT_VERSION = 2
+BINARY_EXTENSION = '.jsb'
+
+HEADER = struct.Struct('<8sIIqqq')
+HEADER_SIZE = 64
+ITEM_SIZE = 8
+
+# Columns are stored little-endian; big-endian hosts get byte-swapped copies
+_NATIVE_LITTLE_ENDIAN = sys.byteorder == 'little'
+
+
+def is_binary_instance(path: str) -> bool:
+    """True if the file starts with the binary instance magic."""
+    try:
+        with open(path, 'rb') as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def write_binary(instance: Instance, path: str):
+    """Write an instance in the binary format."""
+    sections = []
+    checksum = 0
+    for column in (instance.job_ids, instance.job_offsets, instance.durations):
+        data = array(INT_TYPECODE, column)
+        if not _NATIVE_LITTLE_ENDIAN:
+            data.byteswap()
+        sections.append(data.tobytes())
+        checksum = zlib.crc32(sections[-1], checksum)
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, checksum, instance.machines_count,
+                         instance.total_jobs, instance.total_tasks)
+    with open(path, 'wb') as f:
+        f.write(header.ljust(HEADER_SIZE, b'\0'))
+        f.writelines(sections)
+
+
+def read_binary(path: str, name: Optional[str] = None, use_mmap: bool = True) -> Instance:
+    """
+    Open a binary instance.
+
+    Args:
+        path: File written by ``write_binary``
+        name: Instance name (defaults to the file stem)
+        use_mmap: Map the file and use the columns in place (read-only
+            memoryviews); otherwise read them into arrays
+
+    Raises:
+        ValueError: If the file is not a binary instance, has an unsupported
+            version, is truncated, fails its checksum or its columns break
+            the invariants the CSV loader enforces (see ``_check_columns``)
+    """
+    with open(path, 'rb') as f:
+        header = f.read(HEADER_SIZE)
+        if len(header) < HEADER.size or header[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not a binary instance file")
+        _, version, checksum, machines_count, jobs, tasks = HEADER.unpack_from(header)
+        if version != FORMAT_VERSION:
+            raise ValueError(f"{path}: unsupported binary instance version {version}, expected {FORMAT_VERSION}")
+
+        if jobs < 0 or tasks < 0:
+            raise ValueError(f"{path}: negative column sizes in the header ({jobs} jobs, {tasks} tasks)")
+        sizes = (jobs, jobs + 1, tasks)
+        expected = HEADER_SIZE + sum(sizes) * ITEM_SIZE
+        actual = os.fstat(f.fileno()).st_size
+        if actual < expected:
+            raise ValueError(f"{path} is truncated: {actual} bytes, expected {expected}")
+
+        if use_mmap and _NATIVE_LITTLE_ENDIAN:
+            buffer = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+            actual_checksum = zlib.crc32(buffer[HEADER_SIZE:expected])
+            columns = []
+            offset = HEADER_SIZE
+            for size in sizes:
+                columns.append(buffer[offset:offset + size * ITEM_SIZE].cast(INT_TYPECODE))
+                offset += size * ITEM_SIZE
+        else:
+            columns = []
+            actual_checksum = 0
+            for size in sizes:
+                column = array(INT_TYPECODE)
+                column.fromfile(f, size)
+                actual_checksum = zlib.crc32(column, actual_checksum)
+                if not _NATIVE_LITTLE_ENDIAN:
+                    column.byteswap()
+                columns.append(column)
+
+    if actual_checksum != checksum:
+        raise ValueError(f"{path} is corrupted: checksum {actual_checksum:#010x}, expected {checksum:#010x}")
+    job_ids, job_offsets, durations = columns
+    _check_columns(path, machines_count, job_ids, job_offsets, durations)
+    return Instance(machines_count, job_ids, job_offsets, durations,
+                    name or os.path.splitext(os.path.basename(path))[0], path)
+
+
+def _check_columns(path, machines_count, job_ids, job_offsets, durations):
+    """Reject a corrupted file instead of handing solvers impossible data."""
+    if machines_count < 1:
+        raise ValueError(f"{path}: machines_count must be positive, got {machines_count}")
+    if job_offsets[0] != 0 or job_offsets[-1] != len(durations):
+        raise ValueError(f"{path}: job offsets must run from 0 to {len(durations)}, "
+                         f"got {job_offsets[0]} to {job_offsets[-1]}")
+    for j in range(len(job_ids)):
+        if job_offsets[j] >= job_offsets[j + 1]:
+            raise ValueError(f"{path}: job offsets must increase, got {job_offsets[j]} then "
+                             f"{job_offsets[j + 1]} at job {j}")
+    if durations and min(durations) < 0:
+        raise ValueError(f"{path}: task execution times must not be negative")
+    if len(set(job_ids)) != len(job_ids):
+        raise ValueError(f"{path}: job IDs must be unique")
+
+
+def write_csv(instance: Instance, path: str):
+    """Write an instance in the CSV schema read by ``read_dataset``."""
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        f.write('job_id,task_id,execution_time,machines_count\n')
+        machines = instance.machines_count
+        offsets = instance.job_offsets
+        durations = instance.durations
+        for j, job_id in enumerate(instance.job_ids):
+            f.writelines(f"{job_id},{task_id},{durations[i]},{machines}\n"
+                         for task_id, i in enumerate(range(offsets[j], offsets[j + 1]), 1))
+
+
+def main(argv=None):
+    """Convert between the CSV and binary instance formats."""
+    import argparse
+
+    from src.helperFunctions.readFromCSV import read_instance
+
+    parser = argparse.ArgumentParser(prog='python -m src.helperFunctions.binaryInstance',
+                                     description='Convert job scheduling instances between CSV and binary.')
+    parser.add_argument('command', choices=['to-binary', 'to-csv'])
+    parser.add_argument('source', help="input file (or tier name for to-binary)")
+    parser.add_argument('destination', help='output file')
+    args = parser.parse_args(argv)
+
+    try:
+        instance = read_instance(args.source)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+
+    if args.command == 'to-binary':
+        write_binary(instance, args.destination)
+    else:
+        write_csv(instance, args.destination)
+    print(f"Wrote {args.destination}: {instance.total_jobs} jobs, {instance.total_tasks} tasks, "
+          f"{instance.machines_count} machines")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
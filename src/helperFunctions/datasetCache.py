@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Parsed Dataset Cache
+
+Keeps parsed instances in memory for the life of the process and on disk
+between processes, so the GUI, the CLIs and the benchmarks stop re-parsing
+the same CSV files. Each entry also carries derived data (per-job totals,
+critical path, trivial lower bounds) computed once at parse time.
+
+Entries are keyed on the absolute path and validated against the file's
+size and mtime; when those change the content hash decides whether the
+file really changed (touching a file does not force a re-parse).
+
+On disk an entry is a binary instance (memory-mapped on load) plus a JSON
+sidecar. The directory defaults to ``$XDG_CACHE_HOME/job-schedule/datasets``;
+set ``JOBSCHEDULE_DATASET_CACHE`` to another directory, or to ``off`` to keep
+the cache in memory only.
+"""
+
+import hashlib
+import json
+import math
+import os
+import sys
+import threading
+from array import array
+from collections import OrderedDict, namedtuple
+from typing import Any, Dict, Optional
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+
+from src.helperFunctions.binaryInstance import BINARY_EXTENSION, is_binary_instance, read_binary, write_binary
+from src.helperFunctions.instance import Instance, INT_TYPECODE
+from src.helperFunctions.readFromCSV import read_instance
+
+
+CACHE_DIR_ENV = 'JOBSCHEDULE_DATASET_CACHE'
+DEFAULT_MAX_ENTRIES = 32
+
+CachedDataset = namedtuple('CachedDataset', ['instance', 'derived'])
+
+
+def default_cache_dir() -> Optional[str]:
+    """Disk cache directory from the environment, or None if disabled."""
+    configured = os.environ.get(CACHE_DIR_ENV)
+    if configured is not None:
+        return None if configured.lower() in ('', '0', 'off', 'none') else configured
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'job-schedule', 'datasets')
+
+
+def file_digest(path: str) -> str:
+    """SHA-256 of a file's content."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def derive(instance: Instance) -> Dict[str, Any]:
+    """
+    Data derived from an instance that solvers and reports keep recomputing.
+
+    Returns:
+        Dict: job_totals (work per job), total_work, critical_path (longest
+            job chain), longest_task and lower_bound (makespan bound from the
+            critical path and from total work spread over all machines)
+    """
+    offsets = instance.job_offsets
+    durations = instance.durations
+    job_totals = array(INT_TYPECODE, (sum(durations[offsets[j]:offsets[j + 1]])
+                                      for j in range(instance.total_jobs)))
+    total_work = sum(job_totals)
+    critical_path = max(job_totals, default=0)
+    return {
+        'job_totals': job_totals,
+        'total_work': total_work,
+        'critical_path': critical_path,
+        'longest_task': max(durations, default=0),
+        'lower_bound': max(critical_path, math.ceil(total_work / instance.machines_count)),
+    }
+
+
+class _LazyDigest:
+    def __init__(self, path):
+        self.path = path
+        self._value = None
+
+    @property
+    def value(self):
+        if self._value is None:
+            self._value = file_digest(self.path)
+        return self._value
+
+
+class _Entry:
+    def __init__(self, signature, digest, instance, derived):
+        self.signature = signature
+        self.digest = digest
+        self.instance = instance
+        self.derived = derived
+
+
+class DatasetCache:
+    """
+    Process-wide cache of parsed instances with an optional disk layer.
+
+    Thread-safe; every process keeps its own memory layer and shares the disk one.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def load(self, path: str, name: Optional[str] = None) -> CachedDataset:
+        """
+        Parsed instance and derived data for a dataset file.
+
+        Args:
+            path: CSV or binary instance path
+            name: Name given to the returned instance (defaults to the file stem)
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            ValueError: If the file is not a valid dataset
+        """
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        signature = [stat.st_size, stat.st_mtime_ns]
+        name = name or os.path.splitext(os.path.basename(path))[0]
+
+        with self._lock:
+            # Hashed at most once per lookup, and only when the stat signature changed
+            digest = _LazyDigest(path)
+            entry = self._entries.get(path)
+            if entry is not None:
+                if entry.signature == signature or entry.digest == digest.value:
+                    entry.signature = signature
+                    self._entries.move_to_end(path)
+                    self.memory_hits += 1
+                    return self._result(entry, name, path)
+                del self._entries[path]
+                self.invalidations += 1
+
+            entry = self._load_from_disk(path, signature, digest, count_invalidation=entry is None)
+            if entry is not None:
+                self.disk_hits += 1
+            else:
+                self.misses += 1
+                entry = self._parse(path, signature, digest.value)
+
+            self._entries[path] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return self._result(entry, name, path)
+
+    @staticmethod
+    def _result(entry, name, path):
+        instance = entry.instance
+        # Share the columns, but name the instance after this caller's request
+        return CachedDataset(Instance(instance.machines_count, instance.job_ids, instance.job_offsets,
+                                      instance.durations, name, path), entry.derived)
+
+    def _parse(self, path, signature, digest):
+        instance = read_instance(path)
+        entry = _Entry(signature, digest, instance, derive(instance))
+        if self.cache_dir and not is_binary_instance(path):
+            self._store_on_disk(path, entry)
+        return entry
+
+    def _disk_paths(self, path):
+        key = hashlib.sha256(path.encode('utf-8')).hexdigest()[:32]
+        return os.path.join(self.cache_dir, key + BINARY_EXTENSION), os.path.join(self.cache_dir, key + '.json')
+
+    def _load_from_disk(self, path, signature, digest, count_invalidation=True):
+        if not self.cache_dir:
+            return None
+        binary_path, meta_path = self._disk_paths(path)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            if meta['source'] != path:
+                return None
+            if meta['signature'] != signature:
+                if digest.value != meta['digest']:
+                    if count_invalidation:
+                        self.invalidations += 1
+                    return None
+                meta['signature'] = signature
+                self._write_meta(meta_path, meta)
+            instance = read_binary(binary_path)
+        except (OSError, ValueError, KeyError):
+            return None
+
+        derived = dict(meta['derived'])
+        derived['job_totals'] = array(INT_TYPECODE, derived['job_totals'])
+        return _Entry(signature, meta['digest'], instance, derived)
+
+    def _store_on_disk(self, path, entry):
+        """Best effort: a read-only or full cache directory only costs the disk layer."""
+        binary_path, meta_path = self._disk_paths(path)
+        derived = dict(entry.derived)
+        derived['job_totals'] = derived['job_totals'].tolist()
+        meta = {'source': path, 'signature': entry.signature, 'digest': entry.digest, 'derived': derived}
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temp_path = f"{binary_path}.{os.getpid()}.tmp"
+            write_binary(entry.instance, temp_path)
+            os.replace(temp_path, binary_path)
+            self._write_meta(meta_path, meta)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _write_meta(meta_path, meta):
+        # Written after the binary file and replaced atomically, so readers never see a partial entry
+        temp_path = f"{meta_path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+        os.replace(temp_path, meta_path)
+
+    def clear(self):
+        """Drop the memory layer (the disk layer is left alone)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'memory_hits': self.memory_hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'invalidations': self.invalidations,
+            'hit_rate': round((self.memory_hits + self.disk_hits) / lookups, 4) if lookups else 0.0,
+            'cache_dir': self.cache_dir,
+        }
+
+
+_dataset_cache = None
+_dataset_cache_lock = threading.Lock()
+
+
+def get_dataset_cache() -> DatasetCache:
+    """The process-wide cache, created on first use from the environment."""
+    global _dataset_cache
+    with _dataset_cache_lock:
+        if _dataset_cache is None:
+            _dataset_cache = DatasetCache(default_cache_dir())
+        return _dataset_cache
+
+
+def load_dataset(source: str) -> CachedDataset:
+    """Cached instance and derived data for a tier name or dataset path."""
+    from src.helperFunctions.readFromCSV import resolve_dataset
+
+    path, name = resolve_dataset(source)
+    return get_dataset_cache().load(path, name)
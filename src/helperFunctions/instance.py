@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Columnar Instance
+
+Compact in-memory form of a job scheduling instance: one integer array per
+column instead of a dict per task. Job ``j`` owns tasks
+``job_offsets[j]:job_offsets[j + 1]`` of ``durations``; task IDs are implied
+(1, 2, ... within each job) and have been validated by the loader.
+
+``to_dict`` builds the legacy ``read_dataset`` shape for code that still
+expects it.
+"""
+
+from array import array
+from typing import Any, Dict, Optional
+
+
+# Typecode of every integer column
+INT_TYPECODE = 'q'
+
+
+class Instance:
+    """
+    Attributes:
+        machines_count: Number of machines
+        job_ids: Job ID of every job, in file order
+        job_offsets: Start of every job's tasks in ``durations``, plus the total task count
+        durations: Execution time of every task, job by job in chain order
+        name: Short name ('small', file stem, ...)
+        source: Path the instance was read from, if any
+    """
+
+    def __init__(self, machines_count: int, job_ids, job_offsets, durations,
+                 name: Optional[str] = None, source: Optional[str] = None):
+        self.machines_count = machines_count
+        self.job_ids = job_ids
+        self.job_offsets = job_offsets
+        self.durations = durations
+        self.name = name
+        self.source = source
+
+    @property
+    def total_jobs(self) -> int:
+        return len(self.job_ids)
+
+    @property
+    def total_tasks(self) -> int:
+        return len(self.durations)
+
+    def job_durations(self, job_index: int):
+        """Durations of one job's tasks, in chain order."""
+        return self.durations[self.job_offsets[job_index]:self.job_offsets[job_index + 1]]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The legacy ``read_dataset`` dict (one dict per task)."""
+        tasks_list = []
+        jobs_array = []
+        durations = self.durations
+        offsets = self.job_offsets
+        for j, job_id in enumerate(self.job_ids):
+            job_tasks = [{'task_id': task_id, 'execution_time': durations[i]}
+                         for task_id, i in enumerate(range(offsets[j], offsets[j + 1]), 1)]
+            jobs_array.append({'job_id': job_id, 'tasks': job_tasks})
+            tasks_list.extend({'job_id': job_id, **task} for task in job_tasks)
+
+        return {
+            'machines_count': self.machines_count,
+            'tasks': tasks_list,
+            'jobs': jobs_array,
+            'total_tasks': len(tasks_list),
+            'total_jobs': len(jobs_array),
+            'dataset_size': (self.name or '').lower(),
+            'source_file': self.source,
+        }
+
+    @classmethod
+    def from_dict(cls, problem_data: Dict[str, Any]) -> 'Instance':
+        """Columnar copy of a ``read_dataset``-shaped dict (tasks taken in list order)."""
+        job_ids = array(INT_TYPECODE)
+        job_offsets = array(INT_TYPECODE, [0])
+        durations = array(INT_TYPECODE)
+        for job in problem_data['jobs']:
+            job_ids.append(job['job_id'])
+            durations.extend(task['execution_time'] for task in job['tasks'])
+            job_offsets.append(len(durations))
+        return cls(problem_data['machines_count'], job_ids, job_offsets, durations,
+                   problem_data.get('dataset_size'), problem_data.get('source_file'))
+
+    def __repr__(self):
+        return (f"Instance(name={self.name!r}, machines={self.machines_count}, "
+                f"jobs={self.total_jobs}, tasks={self.total_tasks})")
@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+"""
+Machine Sequences
+
+Indexed schedule representation for the local-search solvers. Every task has
+an index (the jobs' tasks in instance order) and every machine an ordered
+list of task indices; start times follow from the sequences alone (each task
+starts as soon as its job predecessor and its machine predecessor have
+ended), so a move only rearranges the sequences.
+
+After ``evaluate`` (O(n)) every task knows its
+
+    head   earliest start
+    tail   longest chain of work after it ends, up to the end of the schedule
+
+and is critical when head + duration + tail equals the makespan. From heads
+and tails, the makespan after moving a task to another machine or swapping
+two adjacent tasks is estimated in O(1) by looking at the task's new
+neighbours only; the insertion point on another machine is found by
+bisection over that machine's heads, which are sorted.
+
+``apply_reassign`` and ``apply_swap`` make a move and update heads and tails
+incrementally: only tasks after the changed arcs get new heads, and only
+tasks before them new tails, so the exact makespan after a move costs far
+less than a full evaluation.
+
+Release times in the instance (``job_release``, ``machine_release``; see
+solver.py) are honoured.
+"""
+
+import heapq
+import os
+import sys
+from typing import List
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+
+from src.helperFunctions.schedule import Schedule
+
+
+class MachineSequences:
+    """
+    Attributes:
+        machines_count: Machines (0-based)
+        job_ids, task_ids, durations: Per task index
+        job_pred, job_succ: Index of the task before / after in the same job, or -1
+        release: Earliest start of each task from the instance's job releases
+        machine_release: Time each machine becomes free
+        machine: Machine of each task
+        sequences: Task indices per machine, in processing order
+        position: Index of each task in its machine's sequence
+        heads, tails, makespan: Set by ``evaluate``
+    """
+
+    def __init__(self, problem_data, schedule: Schedule):
+        """
+        Raises:
+            ValueError: If the schedule does not place every task of the instance exactly once
+        """
+        self.machines_count = problem_data['machines_count']
+        job_release = problem_data.get('job_release') or {}
+        self.machine_release = list(problem_data.get('machine_release') or [0] * self.machines_count)
+        self.job_ids: List[int] = []
+        self.task_ids: List[int] = []
+        self.durations: List[int] = []
+        self.job_pred: List[int] = []
+        self.job_succ: List[int] = []
+        self.release: List[int] = []
+        index_of = {}
+        for job in problem_data['jobs']:
+            tasks = job['tasks']
+            for k, task in enumerate(tasks):
+                v = len(self.durations)
+                index_of[(job['job_id'], task['task_id'])] = v
+                self.job_ids.append(job['job_id'])
+                self.task_ids.append(task['task_id'])
+                self.durations.append(task['execution_time'])
+                self.job_pred.append(v - 1 if k else -1)
+                self.job_succ.append(v + 1 if k + 1 < len(tasks) else -1)
+                self.release.append(job_release.get(job['job_id'], 0) if k == 0 else 0)
+
+        n = len(self.durations)
+        self.machine = [0] * n
+        self.sequences: List[List[int]] = [[] for _ in range(self.machines_count)]
+        placed = [index_of.get(key) for key in zip(schedule.job_ids, schedule.task_ids)]
+        if len(placed) != n or None in placed or len(set(placed)) != n:
+            raise ValueError("The schedule must place every task of the instance exactly once")
+        for row, v in enumerate(placed):
+            self.machine[v] = schedule.machines[row]
+            self.sequences[schedule.machines[row]].append(v)
+        starts = [0] * n
+        for row, v in enumerate(placed):
+            starts[v] = schedule.starts[row]
+        for sequence in self.sequences:
+            # Index breaks ties between zero-length tasks, so a job's tasks keep their order
+            sequence.sort(key=lambda v: (starts[v], v))
+        self.position = [0] * n
+        self._index_positions()
+
+        # No head can exceed this unless the sequences contain a cycle
+        self._horizon = sum(self.durations) + max(self.release + self.machine_release, default=0)
+        self.heads = [0] * n
+        self.tails = [0] * n
+        self.makespan = 0
+        if not self.evaluate():
+            raise ValueError("The schedule's machine orders contradict its job orders")
+
+    def _index_positions(self):
+        for sequence in self.sequences:
+            for i, v in enumerate(sequence):
+                self.position[v] = i
+
+    def __len__(self):
+        return len(self.durations)
+
+    def machine_pred(self, v: int) -> int:
+        p = self.position[v]
+        return self.sequences[self.machine[v]][p - 1] if p else -1
+
+    def machine_succ(self, v: int) -> int:
+        sequence = self.sequences[self.machine[v]]
+        p = self.position[v] + 1
+        return sequence[p] if p < len(sequence) else -1
+
+    def end(self, v: int) -> int:
+        """End of a task, 0 for -1 (no task)."""
+        return self.heads[v] + self.durations[v] if v >= 0 else 0
+
+    def _path_after(self, v: int) -> int:
+        """Work from the start of a task to the end of the schedule, 0 for -1."""
+        return self.durations[v] + self.tails[v] if v >= 0 else 0
+
+    def _machine_ready(self, u: int, machine: int) -> int:
+        """When a task placed right after ``u`` (-1: first) on ``machine`` can start, as far as the machine goes."""
+        return self.heads[u] + self.durations[u] if u >= 0 else self.machine_release[machine]
+
+    def evaluate(self) -> bool:
+        """
+        Recompute heads, tails and makespan from the sequences (topological order, O(n)).
+
+        Returns:
+            bool: False if the sequences contain a cycle (the heads and tails are then meaningless)
+        """
+        n = len(self.durations)
+        durations = self.durations
+        job_succ = self.job_succ
+        heads = list(self.release)
+        waiting = [0] * n
+        for v in range(n):
+            waiting[v] = (self.job_pred[v] >= 0) + (self.position[v] > 0)
+        for machine, sequence in enumerate(self.sequences):
+            if sequence and heads[sequence[0]] < self.machine_release[machine]:
+                heads[sequence[0]] = self.machine_release[machine]
+
+        stack = [v for v in range(n) if not waiting[v]]
+        order = []
+        while stack:
+            v = stack.pop()
+            order.append(v)
+            end = heads[v] + durations[v]
+            for w in (job_succ[v], self.machine_succ(v)):
+                if w >= 0:
+                    if end > heads[w]:
+                        heads[w] = end
+                    waiting[w] -= 1
+                    if not waiting[w]:
+                        stack.append(w)
+        if len(order) < n:
+            return False
+
+        tails = [0] * n
+        for v in reversed(order):
+            tail = 0
+            for w in (job_succ[v], self.machine_succ(v)):
+                if w >= 0 and durations[w] + tails[w] > tail:
+                    tail = durations[w] + tails[w]
+            tails[v] = tail
+        self.heads = heads
+        self.tails = tails
+        self.makespan = max(map(int.__add__, heads, durations), default=0)
+        return True
+
+    @property
+    def idle_time(self) -> int:
+        """Machine time not spent on tasks up to the makespan (unused machines count as idle)."""
+        return self.machines_count * self.makespan - sum(self.durations)
+
+    def critical_tasks(self) -> List[int]:
+        """Tasks on a longest path (head + duration + tail == makespan)."""
+        makespan = self.makespan
+        return [v for v, (head, duration, tail) in enumerate(zip(self.heads, self.durations, self.tails))
+                if head + duration + tail == makespan]
+
+    def lower_bound(self) -> int:
+        """Trivial bound: the longest job (after its release), or all work spread evenly over the machines."""
+        longest = 0
+        for v in range(len(self.durations)):
+            if self.job_pred[v] < 0:
+                work = self.release[v]
+                w = v
+                while w >= 0:
+                    work += self.durations[w]
+                    w = self.job_succ[w]
+                longest = max(longest, work)
+        total = sum(self.durations) + sum(self.machine_release)
+        return max(longest, -(-total // max(self.machines_count, 1)))
+
+    # Moves: a task to another machine, or two adjacent tasks of a machine swapped
+
+    def insertion_point(self, v: int, machine: int) -> int:
+        """
+        Position on another ``machine`` for task ``v``: before the first task
+        there that starts once ``v``'s job predecessor has ended (O(log n)).
+        Inserting there never creates a cycle when durations are positive.
+        """
+        ready = max(self.release[v], self.end(self.job_pred[v]))
+        sequence = self.sequences[machine]
+        heads = self.heads
+        low, high = 0, len(sequence)
+        while low < high:
+            middle = (low + high) // 2
+            if heads[sequence[middle]] < ready:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def estimate_reassign(self, v: int, machine: int, k: int) -> int:
+        """Estimated makespan after moving ``v`` to position ``k`` of another ``machine`` (O(1))."""
+        durations = self.durations
+        # The old machine closes the gap: v's machine successor now follows its predecessor
+        estimate = 0
+        b = self.machine_succ(v)
+        if b >= 0:
+            b_start = max(self.release[b], self.end(self.job_pred[b]),
+                          self._machine_ready(self.machine_pred(v), self.machine[v]))
+            estimate = b_start + durations[b] + self.tails[b]
+        sequence = self.sequences[machine]
+        c = sequence[k - 1] if k else -1
+        d = sequence[k] if k < len(sequence) else -1
+        start = max(self.release[v], self.end(self.job_pred[v]), self._machine_ready(c, machine))
+        tail = max(self._path_after(self.job_succ[v]), self._path_after(d))
+        return max(estimate, start + durations[v] + tail)
+
+    def estimate_swap(self, u: int, v: int) -> int:
+        """Estimated makespan after swapping ``u`` and its machine successor ``v`` (O(1))."""
+        durations = self.durations
+        machine = self.machine[u]
+        v_start = max(self.release[v], self.end(self.job_pred[v]), self._machine_ready(self.machine_pred(u), machine))
+        u_start = max(self.release[u], self.end(self.job_pred[u]), v_start + durations[v])
+        u_tail = max(self._path_after(self.job_succ[u]), self._path_after(self.machine_succ(v)))
+        v_tail = max(self._path_after(self.job_succ[v]), durations[u] + u_tail)
+        return max(v_start + durations[v] + v_tail, u_start + durations[u] + u_tail)
+
+    def reassign(self, v: int, machine: int, k: int):
+        """
+        Move ``v`` to position ``k`` of ``machine``; call ``evaluate`` afterwards.
+
+        Returns:
+            tuple: (old machine, old position), which ``reassign`` takes to undo the move
+        """
+        old, p = self.machine[v], self.position[v]
+        sequence = self.sequences[old]
+        del sequence[p]
+        for i in range(p, len(sequence)):
+            self.position[sequence[i]] = i
+        sequence = self.sequences[machine]
+        sequence.insert(k, v)
+        for i in range(k, len(sequence)):
+            self.position[sequence[i]] = i
+        self.machine[v] = machine
+        return old, p
+
+    def swap(self, u: int, v: int):
+        """Swap ``u`` and its machine successor ``v``; ``swap(v, u)`` undoes it. Call ``evaluate`` afterwards."""
+        sequence = self.sequences[self.machine[u]]
+        p = self.position[u]
+        sequence[p], sequence[p + 1] = v, u
+        self.position[v], self.position[u] = p, p + 1
+
+    def apply_reassign(self, v: int, machine: int, k: int):
+        """
+        ``reassign`` with heads, tails and makespan updated incrementally.
+
+        Returns:
+            tuple: (old machine, old position), which ``apply_reassign`` takes to undo the move;
+                None if the move would create a cycle (nothing is changed then)
+        """
+        a, b = self.machine_pred(v), self.machine_succ(v)
+        undo = self.reassign(v, machine, k)
+        c, d = self.machine_pred(v), self.machine_succ(v)
+        if not self._propagate((v, b, d), (v, a, c)):
+            self.reassign(v, *undo)
+            self.evaluate()
+            return None
+        return undo
+
+    def apply_swap(self, u: int, v: int) -> bool:
+        """
+        ``swap`` with heads, tails and makespan updated incrementally; ``apply_swap(v, u)`` undoes it.
+
+        Returns:
+            bool: False if the swap would create a cycle (nothing is changed then)
+        """
+        a, b = self.machine_pred(u), self.machine_succ(v)
+        self.swap(u, v)
+        if not self._propagate((v, u, b), (u, v, a)):
+            self.swap(v, u)
+            self.evaluate()
+            return False
+        return True
+
+    def _propagate(self, head_seeds, tail_seeds) -> bool:
+        """
+        Repair heads forward from the tasks whose predecessors changed and tails
+        backward from the tasks whose successors changed; a task's neighbours are
+        only revisited when its own value changed.
+
+        Returns:
+            bool: False if the heads grow without bound (a cycle); heads and tails are then invalid
+        """
+        heads, tails, durations = self.heads, self.tails, self.durations
+        release, job_pred, job_succ = self.release, self.job_pred, self.job_succ
+        position, machine_of, sequences = self.position, self.machine, self.sequences
+
+        # Earliest tentative head first, which is close to topological order
+        heap = [(heads[v], v) for v in head_seeds if v >= 0]
+        heapq.heapify(heap)
+        while heap:
+            _, v = heapq.heappop(heap)
+            p = position[v]
+            sequence = sequences[machine_of[v]]
+            if p:
+                u = sequence[p - 1]
+                head = heads[u] + durations[u]
+            else:
+                head = self.machine_release[machine_of[v]]
+            if release[v] > head:
+                head = release[v]
+            u = job_pred[v]
+            if u >= 0 and heads[u] + durations[u] > head:
+                head = heads[u] + durations[u]
+            if head == heads[v]:
+                continue
+            if head > self._horizon:
+                return False
+            heads[v] = head
+            end = head + durations[v]
+            if job_succ[v] >= 0:
+                heapq.heappush(heap, (end, job_succ[v]))
+            if p + 1 < len(sequence):
+                heapq.heappush(heap, (end, sequence[p + 1]))
+
+        # Latest head first for the tails
+        heap = [(-heads[v], v) for v in tail_seeds if v >= 0]
+        heapq.heapify(heap)
+        while heap:
+            _, v = heapq.heappop(heap)
+            p = position[v]
+            sequence = sequences[machine_of[v]]
+            tail = 0
+            w = job_succ[v]
+            if w >= 0:
+                tail = durations[w] + tails[w]
+            if p + 1 < len(sequence):
+                w = sequence[p + 1]
+                if durations[w] + tails[w] > tail:
+                    tail = durations[w] + tails[w]
+            if tail == tails[v]:
+                continue
+            tails[v] = tail
+            if job_pred[v] >= 0:
+                heapq.heappush(heap, (-heads[job_pred[v]], job_pred[v]))
+            if p:
+                heapq.heappush(heap, (-heads[sequence[p - 1]], sequence[p - 1]))
+
+        # Every task's end is covered by the last task on some machine
+        self.makespan = max((heads[sequence[-1]] + durations[sequence[-1]] for sequence in sequences if sequence),
+                            default=0)
+        return True
+
+    def snapshot(self) -> List[List[int]]:
+        return [list(sequence) for sequence in self.sequences]
+
+    def restore(self, snapshot: List[List[int]]):
+        """Go back to the sequences of a ``snapshot`` (and re-evaluate)."""
+        self.sequences = [list(sequence) for sequence in snapshot]
+        for machine, sequence in enumerate(self.sequences):
+            for v in sequence:
+                self.machine[v] = machine
+        self._index_positions()
+        self.evaluate()
+
+    def to_schedule(self) -> Schedule:
+        """Current sequences as a ``Schedule`` (every task at its head), rows in instance order."""
+        schedule = Schedule()
+        for v, duration in enumerate(self.durations):
+            schedule.add(self.job_ids[v], self.task_ids[v], self.machine[v], self.heads[v], duration)
+        return schedule
@@ -4,11 +4,291 @@ CSV Reader Helper Function
 
 This module provides functionality to read job schedule datasets from CSV files
 and convert them into dictionary format for easy processing.
+
+``read_instance`` parses a file (or file object) in one streaming pass into a
+columnar ``Instance``; ``read_dataset`` returns the legacy dict built from it.
 """
 
 import csv
+import json
 import os
-from typing import Dict, List, Any
+import sys
+from array import array
+from typing import Dict, List, Any, Optional, Tuple
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+
+from src.helperFunctions.instance import Instance, INT_TYPECODE
+from src.helperFunctions.binaryInstance import BINARY_EXTENSION, is_binary_instance, read_binary
+
+
+# Bundled datasets live in the project tree, not relative to the working directory
+DATASETS_DIR = os.path.normpath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'testingDataset', 'datasets')
+)
+
+DATASET_FILES = {
+    'small': 'small_dataset.csv',
+    'medium': 'medium_dataset.csv',
+    'large': 'large_dataset.csv'
+}
+
+# Column order written by makeDataSet.py; files in this layout take the fast path
+STANDARD_HEADER = ('job_id', 'task_id', 'execution_time', 'machines_count')
+
+# Characters parsed per streaming chunk
+CHUNK_SIZE = 1 << 22
+
+
+def resolve_dataset(size: str) -> Tuple[str, str]:
+    """
+    Map a tier name, CSV path or binary instance path to (path, short name).
+
+    Raises:
+        ValueError: If size is not 'small', 'medium', 'large' or a dataset path
+    """
+    if size.lower() in DATASET_FILES:
+        return os.path.join(DATASETS_DIR, DATASET_FILES[size.lower()]), size.lower()
+    if size.lower().endswith(('.csv', BINARY_EXTENSION)) or os.path.sep in size:
+        return size, os.path.splitext(os.path.basename(size))[0]
+    raise ValueError(f"Size must be one of {list(DATASET_FILES)} or a dataset path, got '{size}'")
+
+
+def read_instance(source, name: Optional[str] = None) -> Instance:
+    """
+    Read a dataset into a columnar ``Instance`` in one streaming pass.
+
+    Args:
+        source: Tier name ('small', 'medium', 'large'), file path, or an open
+            text/binary file object positioned at the header. Binary instance
+            files (see binaryInstance.py) are memory-mapped instead of parsed.
+        name: Instance name (defaults to the tier or file stem)
+
+    Returns:
+        Instance: Validated instance; jobs are ordered by job_id
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        ValueError: If the header lacks a required column, a value is not an
+            integer, machines_count differs between rows, or a job's task IDs
+            do not run 1, 2, ... without gaps or duplicates
+    """
+    if isinstance(source, (str, os.PathLike)):
+        path = os.fspath(source)
+        if path.lower() in DATASET_FILES:
+            path, tier = resolve_dataset(path)
+            name = name or tier
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Dataset file not found: {path}")
+        if is_binary_instance(path):
+            return read_binary(path, name)
+        with open(path, 'r', newline='', encoding='utf-8') as csvfile:
+            return _parse_instance(csvfile, name or os.path.splitext(os.path.basename(path))[0], path)
+
+    source_name = getattr(source, 'name', None)
+    if name is None and isinstance(source_name, str):
+        name = os.path.splitext(os.path.basename(source_name))[0]
+    return _parse_instance(source, name, source_name if isinstance(source_name, str) else None)
+
+
+def _read_text(f, size=-1) -> str:
+    chunk = f.read(size)
+    return chunk.decode('utf-8') if isinstance(chunk, bytes) else chunk
+
+
+def _parse_instance(f, name, source) -> Instance:
+    header_line = f.readline()
+    if isinstance(header_line, bytes):
+        header_line = header_line.decode('utf-8-sig')
+    header = [column.strip().lstrip('\ufeff') for column in next(csv.reader([header_line]), [])]
+    if not header:
+        raise ValueError(f"Dataset {name} is empty")
+
+    if tuple(header) == STANDARD_HEADER:
+        columns = _read_standard_rows(f)
+    else:
+        columns = _read_csv_rows(f, header)
+    return _build_instance(*columns, name=name, source=source)
+
+
+# Deletes the digits of a chunk; a plain chunk leaves exactly ',,,' per row
+_DIGITS = str.maketrans('', '', '0123456789')
+_ROW_SEPARATORS = ',' * (len(STANDARD_HEADER) - 1)
+
+
+def _parse_chunk(text, values, first_line):
+    """
+    Append the integers of complete rows to ``values``. Plain chunks are
+    parsed as one JSON array in C; anything else (spaces, blank lines, signs,
+    rows with the wrong number of fields) goes through the csv module row by
+    row, so errors name the line. ``first_line`` is the line number of the
+    chunk's first row.
+    """
+    if '\r' in text:
+        # csv.writer ends rows with CRLF
+        text = text.replace('\r', '')
+    text = text.rstrip('\n')
+    if not text:
+        return
+    separators = text.translate(_DIGITS)
+    if separators == (_ROW_SEPARATORS + '\n') * separators.count('\n') + _ROW_SEPARATORS:
+        try:
+            values.extend(json.loads('[' + text.replace('\n', ',') + ']'))
+            return
+        except ValueError:
+            pass
+    for line_number, row in enumerate(csv.reader(text.split('\n')), first_line):
+        if not row or not any(value.strip() for value in row):
+            continue
+        if len(row) != len(STANDARD_HEADER):
+            raise ValueError(f"Line {line_number}: expected {len(STANDARD_HEADER)} values "
+                             f"{list(STANDARD_HEADER)}, got {row}")
+        try:
+            values.extend(int(value) for value in row)
+        except ValueError:
+            raise ValueError(f"Line {line_number}: expected integer {list(STANDARD_HEADER)}, got {row}") from None
+
+
+def _read_standard_rows(f):
+    """Fast path for the four integer columns: parse whole chunks instead of rows."""
+    values = []
+    rest = ''
+    line_number = 2
+    while True:
+        chunk = _read_text(f, CHUNK_SIZE)
+        if not chunk:
+            break
+        chunk = rest + chunk
+        cut = chunk.rfind('\n') + 1
+        rest = chunk[cut:]
+        _parse_chunk(chunk[:cut], values, line_number)
+        line_number += chunk.count('\n', 0, cut)
+    _parse_chunk(rest, values, line_number)
+    return values[0::4], values[1::4], values[2::4], values[3::4]
+
+
+def _read_csv_rows(f, header):
+    """General path: any column order and extra columns, parsed with the csv module."""
+    missing = [column for column in STANDARD_HEADER if column not in header]
+    if missing:
+        raise ValueError(f"Dataset header is missing columns {missing}, got {header}")
+    indices = [header.index(column) for column in STANDARD_HEADER]
+
+    columns = tuple([] for _ in STANDARD_HEADER)
+    lines = (line.decode('utf-8') if isinstance(line, bytes) else line for line in f)
+    for line_number, row in enumerate(csv.reader(lines), 2):
+        if not row or not any(value.strip() for value in row):
+            continue
+        try:
+            for column, index in zip(columns, indices):
+                column.append(int(row[index]))
+        except (ValueError, IndexError):
+            raise ValueError(f"Line {line_number}: expected integer {list(STANDARD_HEADER)}, got {row}") from None
+    return columns
+
+
+def _index_jobs(job_column, task_column):
+    """
+    Start row of every job, if rows are grouped by increasing job ID with
+    task IDs 1..k inside each job; otherwise None.
+    """
+    starts = [row for row, task in enumerate(task_column) if task == 1]
+    if not starts or starts[0] != 0:
+        return None
+    ends = starts[1:] + [len(task_column)]
+    previous_job = None
+    for start, end in zip(starts, ends):
+        job = job_column[start]
+        if previous_job is not None and job <= previous_job:
+            return None
+        if task_column[start:end] != list(range(1, end - start + 1)) or \
+                job_column[start:end].count(job) != end - start:
+            return None
+        previous_job = job
+    return starts
+
+
+def _chain_error(job_column, task_column):
+    """Describe the first broken job chain in rows sorted by (job, task)."""
+    previous_job = None
+    previous_task = 0
+    for job, task in zip(job_column, task_column):
+        if job != previous_job and task != 1:
+            return ValueError(f"Job {job}: task IDs must start at 1, found {task}")
+        if job == previous_job and task != previous_task + 1:
+            return ValueError(f"Job {job}: task IDs must run 1, 2, ... without gaps or duplicates, "
+                              f"found task {task} after task {previous_task}")
+        previous_job, previous_task = job, task
+    return ValueError("Task IDs are not contiguous")
+
+
+def _build_instance(job_column, task_column, duration_column, machines_column, name=None, source=None):
+    """Validate the raw columns and turn them into an Instance."""
+    if not job_column:
+        raise ValueError(f"Dataset {name} has no tasks")
+
+    machines_count = machines_column[0]
+    if machines_column.count(machines_count) != len(machines_column):
+        row = next(i for i, value in enumerate(machines_column) if value != machines_count)
+        raise ValueError(f"Inconsistent machines_count: {machines_count} on the first row, "
+                         f"{machines_column[row]} on row {row + 1}")
+    if machines_count < 1:
+        raise ValueError(f"machines_count must be positive, got {machines_count}")
+    if min(duration_column) < 0:
+        raise ValueError("Task execution times must not be negative")
+
+    starts = _index_jobs(job_column, task_column)
+    if starts is None:
+        # Rows out of order: sort by (job, task) and check again
+        order = sorted(range(len(job_column)), key=lambda i: (job_column[i], task_column[i]))
+        job_column = [job_column[i] for i in order]
+        task_column = [task_column[i] for i in order]
+        duration_column = [duration_column[i] for i in order]
+        starts = _index_jobs(job_column, task_column)
+        if starts is None:
+            raise _chain_error(job_column, task_column)
+
+    job_ids = array(INT_TYPECODE, [job_column[start] for start in starts])
+    job_offsets = array(INT_TYPECODE, starts)
+    job_offsets.append(len(job_column))
+    return Instance(machines_count, job_ids, job_offsets, array(INT_TYPECODE, duration_column), name, source)
+
+
+def instance_from_jobs(machines_count, jobs, name: Optional[str] = None) -> Instance:
+    """
+    Validate jobs in the ``read_dataset`` shape with the same checks as the
+    file loader and turn them into an ``Instance``.
+
+    Args:
+        machines_count: Number of machines
+        jobs: List of {'job_id', 'tasks': [{'task_id', 'execution_time'}, ...]};
+            each job lists its tasks in chain order
+        name: Instance name
+
+    Raises:
+        ValueError: If a value is not an integer, a job has no tasks, a job's
+            task IDs are not listed as 1, 2, ... in order, a job ID repeats,
+            machines_count is below 1 or an execution time is negative
+    """
+    columns = tuple([] for _ in STANDARD_HEADER)
+    seen = set()
+    try:
+        machines_count = int(machines_count)
+        for job in jobs:
+            job_id = int(job['job_id'])
+            if job_id in seen:
+                raise ValueError(f"Job ID {job_id} is used more than once")
+            seen.add(job_id)
+            task_ids = [int(task['task_id']) for task in job['tasks']]
+            if not task_ids:
+                raise ValueError(f"Job {job_id} has no tasks")
+            if task_ids != list(range(1, len(task_ids) + 1)):
+                raise ValueError(f"Job {job_id}: task IDs must be listed as 1, 2, ... in order, got {task_ids}")
+            for task_id, task in zip(task_ids, job['tasks']):
+                for column, value in zip(columns, (job_id, task_id, int(task['execution_time']), machines_count)):
+                    column.append(value)
+    except (TypeError, KeyError) as e:
+        raise ValueError(f"Malformed job: {type(e).__name__}: {e}") from None
+    return _build_instance(*columns, name=name)
 
 
 def read_dataset(size: str) -> Dict[str, Any]:
@@ -16,7 +296,8 @@ def read_dataset(size: str) -> Dict[str, Any]:
     Read job schedule dataset from CSV file based on size.
     
     Args:
-        size (str): Dataset size - 'small', 'medium', or 'large'
+        size (str): Dataset size - 'small', 'medium', or 'large', or a path
+            to any CSV file using the same schema or to a binary instance
     
     Returns:
         Dict[str, Any]: Dictionary containing:
@@ -27,84 +308,21 @@ def read_dataset(size: str) -> Dict[str, Any]:
             - 'total_jobs': Total number of jobs
     
     Raises:
-        ValueError: If size is not 'small', 'medium', or 'large'
+        ValueError: If size is not 'small', 'medium', 'large' or a dataset path
         FileNotFoundError: If the CSV file doesn't exist
     """
-    # Validate input
-    size = size.lower()
-    valid_sizes = ['small', 'medium', 'large']
-    if size not in valid_sizes:
-        raise ValueError(f"Size must be one of {valid_sizes}, got '{size}'")
-    
-    # Map size to filename
-    filename_map = {
-        'small': 'small_dataset.csv',
-        'medium': 'medium_dataset.csv',
-        'large': 'large_dataset.csv'
-    }
-    
-    # Construct file path relative to project root
-    csv_file_path = os.path.join(r'testingDataset/datasets', filename_map[size])
+    csv_file_path, name = resolve_dataset(size)
     
     # Check if file exists
     if not os.path.exists(csv_file_path):
         raise FileNotFoundError(f"Dataset file not found: {csv_file_path}")
     
-    # Read CSV data
-    tasks_list = []
-    machines_count = 0
+    # Parsed instances are shared process-wide (and across runs, on disk)
+    from src.helperFunctions.datasetCache import get_dataset_cache
     
     try:
-        with open(csv_file_path, 'r', newline='', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
-            
-            for row in reader:
-                # Convert data types and clean up
-                task = {
-                    'job_id': int(row['job_id']),
-                    'task_id': int(row['task_id']),
-                    'execution_time': int(row['execution_time'])
-                }
-                tasks_list.append(task)
-                
-                # Get machines count
-                if machines_count == 0:
-                    machines_count = int(row['machines_count'])
-    
+        instance = get_dataset_cache().load(csv_file_path, name).instance
     except Exception as e:
         raise RuntimeError(f"Error reading CSV file {csv_file_path}: {str(e)}")
     
-    # Organize tasks by job into an array (list of job objects)
-    # First build a temporary map of job_id -> tasks, then convert to a list
-    jobs_map = {}
-    for task in tasks_list:
-        job_id = task['job_id']
-        if job_id not in jobs_map:
-            jobs_map[job_id] = []
-        # Keep minimal task info inside each job
-        clean_task = {
-            'task_id': task['task_id'],
-            'execution_time': task['execution_time']
-        }
-        jobs_map[job_id].append(clean_task)
-
-    # Convert the map to a sorted list of jobs (array). Each job is a dict with 'job_id' and 'tasks'.
-    jobs_array = []
-    for job_id in sorted(jobs_map.keys()):
-        jobs_array.append({
-            'job_id': job_id,
-            'tasks': jobs_map[job_id]
-        })
-
-    # Create result dictionary (return jobs as an array)
-    result = {
-        'machines_count': machines_count,
-        'tasks': tasks_list,
-        'jobs': jobs_array,
-        'total_tasks': len(tasks_list),
-        'total_jobs': len(jobs_array),
-        'dataset_size': size.lower(),
-        'source_file': csv_file_path
-    }
-    
-    return result
\ No newline at end of file
+    return instance.to_dict()
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Compact Schedule
+
+One schedule type for every solver: parallel integer arrays with one entry
+per placed task (job ID, task ID, machine, start, duration). Machines are
+0-based, as in the backtracking searches.
+
+Lookups are cheap: ``locate`` finds a task in O(1), and ``machine_order``
+returns a machine's tasks sorted by start. Both indexes are built on first
+use and rebuilt only after ``add``.
+
+The legacy formats stay available as adapters:
+
+    Schedule.from_backtracking(timeline)   # 0-based machine -> list of task dicts
+    Schedule.from_cultural(timeline)       # 1-based machine -> list of {(job, task): (start, duration)}
+    schedule.to_backtracking()
+    schedule.cultural_view()               # read-only mapping, rows built per machine on access
+"""
+
+import os
+import sys
+from array import array
+from bisect import bisect_right
+from itertools import repeat
+from operator import add, mul, sub
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+
+from src.helperFunctions.instance import INT_TYPECODE
+from src.helperFunctions.scheduleMetrics import schedule_metrics, summary_metrics
+
+
+class Schedule:
+    """
+    Attributes:
+        job_ids: Job ID of every placed task
+        task_ids: Task ID (1-based position in its job) of every placed task
+        machines: Machine (0-based) of every placed task
+        starts: Start time of every placed task
+        durations: Execution time of every placed task
+    """
+
+    def __init__(self, job_ids=None, task_ids=None, machines=None, starts=None, durations=None):
+        self.job_ids = job_ids if job_ids is not None else array(INT_TYPECODE)
+        self.task_ids = task_ids if task_ids is not None else array(INT_TYPECODE)
+        self.machines = machines if machines is not None else array(INT_TYPECODE)
+        self.starts = starts if starts is not None else array(INT_TYPECODE)
+        self.durations = durations if durations is not None else array(INT_TYPECODE)
+        self._index = None
+        self._machine_order = None
+        self._makespan = None
+
+    def __len__(self):
+        return len(self.starts)
+
+    def add(self, job_id: int, task_id: int, machine: int, start: int, duration: int) -> int:
+        """Place a task; returns its row."""
+        self.job_ids.append(job_id)
+        self.task_ids.append(task_id)
+        self.machines.append(machine)
+        self.starts.append(start)
+        self.durations.append(duration)
+        self._index = self._machine_order = self._makespan = None
+        return len(self.starts) - 1
+
+    def end(self, row: int) -> int:
+        return self.starts[row] + self.durations[row]
+
+    def row(self, row: int) -> Tuple[int, int, int, int, int]:
+        """(job_id, task_id, machine, start, duration) of one row."""
+        return (self.job_ids[row], self.task_ids[row], self.machines[row], self.starts[row], self.durations[row])
+
+    def rows(self) -> Iterator[Tuple[int, int, int, int, int]]:
+        return zip(self.job_ids, self.task_ids, self.machines, self.starts, self.durations)
+
+    def locate(self, job_id: int, task_id: int) -> Optional[int]:
+        """Row of a task, or None if it is not placed."""
+        if self._index is None:
+            self._index = {key: row for row, key in enumerate(zip(self.job_ids, self.task_ids))}
+        return self._index.get((job_id, task_id))
+
+    def _machine_rows(self) -> Dict[int, List[int]]:
+        if self._machine_order is None:
+            # One sort on a (machine, start) key packed into an int, then split at machine boundaries
+            machines = self.machines
+            starts = self.starts
+            order = []
+            if len(starts):
+                low = min(starts)
+                span = max(starts) - low + 1
+                keys = list(map(add, map(mul, machines, repeat(span)), map(sub, starts, repeat(low))))
+                order = sorted(range(len(keys)), key=keys.__getitem__)
+            ordered_machines = [machines[row] for row in order]
+            self._machine_order = {}
+            i = 0
+            while i < len(order):
+                machine = ordered_machines[i]
+                j = bisect_right(ordered_machines, machine, i)
+                self._machine_order[machine] = order[i:j]
+                i = j
+        return self._machine_order
+
+    def machine_order(self, machine: int) -> List[int]:
+        """Rows placed on a machine, sorted by start time."""
+        return self._machine_rows().get(machine, [])
+
+    def used_machines(self) -> List[int]:
+        """Machines with at least one task, ascending."""
+        return sorted(self._machine_rows())
+
+    @property
+    def makespan(self) -> int:
+        if self._makespan is None:
+            self._makespan = max(map(int.__add__, self.starts, self.durations), default=0)
+        return self._makespan
+
+    def metrics(self, machines_count: int) -> Dict[str, Any]:
+        """Scalar metrics (``summary_metrics``); ``schedule_metrics`` has the per-machine and per-job ones."""
+        return summary_metrics(schedule_metrics(self, machines_count))
+
+    @classmethod
+    def from_backtracking(cls, timeline) -> 'Schedule':
+        """Schedule from a backtracking timeline (0-based machine -> list of task dicts)."""
+        schedule = cls()
+        for machine, tasks in timeline.items():
+            for task in tasks:
+                schedule.job_ids.append(task['job_id'])
+                schedule.task_ids.append(task['task_id'])
+                schedule.machines.append(machine)
+                schedule.starts.append(task['start_time'])
+                schedule.durations.append(task['execution_time'])
+        return schedule
+
+    @classmethod
+    def from_cultural(cls, timeline) -> 'Schedule':
+        """Schedule from a cultural timeline (1-based machine -> list of {(job, task): (start, duration)})."""
+        if isinstance(timeline, CulturalView):
+            return timeline.schedule
+        schedule = cls()
+        for machine, tasks in timeline.items():
+            for task_dict in tasks:
+                for (job_id, task_id), (start, duration) in task_dict.items():
+                    schedule.job_ids.append(job_id)
+                    schedule.task_ids.append(task_id)
+                    schedule.machines.append(machine - 1)
+                    schedule.starts.append(start)
+                    schedule.durations.append(duration)
+        return schedule
+
+    def to_backtracking(self) -> Dict[int, List[Dict[str, int]]]:
+        """Backtracking timeline, each machine's tasks sorted by start."""
+        timeline = {}
+        for machine in self.used_machines():
+            timeline[machine] = [{
+                'job_id': self.job_ids[row],
+                'task_id': self.task_ids[row],
+                'execution_time': self.durations[row],
+                'start_time': self.starts[row],
+                'end_time': self.end(row),
+                'machine': machine,
+            } for row in self.machine_order(machine)]
+        return timeline
+
+    def cultural_view(self) -> 'CulturalView':
+        return CulturalView(self)
+
+    def __repr__(self):
+        return f"Schedule(tasks={len(self)}, makespan={self.makespan})"
+
+
+class CulturalView(Mapping):
+    """
+    Read-only cultural-format view of a ``Schedule`` (1-based machine ->
+    list of {(job_id, task_id): (start, duration)}, sorted by start). A
+    machine's list is built the first time it is read.
+    """
+
+    def __init__(self, schedule: Schedule):
+        self.schedule = schedule
+        self._rows = {}
+
+    def __getitem__(self, machine):
+        rows = self._rows.get(machine)
+        if rows is None:
+            schedule = self.schedule
+            machine_rows = schedule._machine_rows()
+            if machine - 1 not in machine_rows:
+                raise KeyError(machine)
+            rows = [{(schedule.job_ids[row], schedule.task_ids[row]): (schedule.starts[row], schedule.durations[row])}
+                    for row in machine_rows[machine - 1]]
+            self._rows[machine] = rows
+        return rows
+
+    def __iter__(self):
+        return (machine + 1 for machine in self.schedule.used_machines())
+
+    def __len__(self):
+        return len(self.schedule._machine_rows())
+
+    def __repr__(self):
+        return repr(dict(self))
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Schedule Metrics
+
+The one place schedule quality is measured. Every solver, the benchmarks and
+the GUI report the same numbers with the same definitions:
+
+    makespan            latest task end
+    busy_time           total execution time of all tasks
+    idle_time           makespan x machines - busy_time (unused machines count as idle)
+    utilization         busy_time / (makespan x machines), in percent
+    machine_busy        busy time per machine (0-based list)
+    machine_idle        makespan - busy time per machine
+    machine_utilization busy time / makespan per machine, in percent
+    job_flow_times      completion time per job (all jobs are released at 0)
+    mean_flow_time      average job completion time
+    longest_job         most work scheduled for one job (the critical path, a makespan
+                        lower bound, only when every task is scheduled)
+
+All values are numbers; units and rounding for display belong to the front-end.
+"""
+
+from operator import add
+from typing import Any, Dict
+
+
+# Scalar metrics carried by solver results and batch records
+SUMMARY_KEYS = ('makespan', 'idle_time', 'utilization', 'mean_flow_time', 'longest_job')
+
+
+def _percent(part, whole):
+    return round(part / whole * 100, 2) if whole > 0 else 0.0
+
+
+def schedule_metrics(schedule, machines_count: int) -> Dict[str, Any]:
+    """
+    Every metric of a schedule, computed in a single pass over its rows
+    (a plain loop: NumPy is not a dependency of this project).
+
+    Args:
+        schedule: ``Schedule`` (anything with job_ids, machines, starts and durations arrays)
+        machines_count: Machines in the instance, used or not
+
+    Returns:
+        Dict: The metrics listed in the module docstring
+
+    Raises:
+        ValueError: If a row's machine is outside 0..machines_count - 1
+    """
+    machine_busy = [0] * machines_count
+    job_completion = {}
+    job_work = {}
+    ends = list(map(add, schedule.starts, schedule.durations))
+
+    for job_id, machine, duration, end in zip(schedule.job_ids, schedule.machines, schedule.durations, ends):
+        if not 0 <= machine < machines_count:
+            raise ValueError(f"J{job_id} is on machine {machine}, expected 0..{machines_count - 1}")
+        machine_busy[machine] += duration
+        if end > job_completion.get(job_id, -1):
+            job_completion[job_id] = end
+        job_work[job_id] = job_work.get(job_id, 0) + duration
+
+    makespan = max(ends, default=0)
+    busy_time = sum(machine_busy)
+    available_time = makespan * machines_count
+    flow_times = job_completion.values()
+    return {
+        'makespan': makespan,
+        'busy_time': busy_time,
+        'idle_time': available_time - busy_time,
+        'utilization': _percent(busy_time, available_time),
+        'machine_busy': machine_busy,
+        'machine_idle': [makespan - busy for busy in machine_busy],
+        'machine_utilization': [_percent(busy, makespan) for busy in machine_busy],
+        'job_flow_times': job_completion,
+        'mean_flow_time': round(sum(flow_times) / len(flow_times), 2) if flow_times else 0.0,
+        'longest_job': max(job_work.values(), default=0),
+    }
+
+
+def summary_metrics(metrics: Dict[str, Any]) -> Dict[str, Any]:
+    """The scalar subset (``SUMMARY_KEYS``) of ``schedule_metrics``."""
+    return {key: metrics[key] for key in SUMMARY_KEYS}
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Schedule Feasibility Validator
+
+Checks a finished schedule against its instance and reports every way it is
+infeasible:
+
+    unknown         task that is not part of the instance
+    duplicate       task placed more than once
+    missing         task never placed
+    duration        placed with a different execution time than the instance's
+    machine         machine outside 0 .. machines_count - 1
+    negative_start  start time below zero
+    overlap         two tasks on one machine overlapping in time
+    precedence      task starting before its predecessor in the job ends
+
+Tasks are mapped to their flat position in the instance once (O(n)), job
+chains are checked along those positions (O(n)), and machine overlaps are
+found by sorting each machine's intervals by start (O(n log n)), with the
+task each overlap collides with tracked as the running latest end.
+
+    report = validate_schedule(result.schedule, problem_data)
+    if not report.valid:
+        print(report.summary())
+"""
+
+import os
+import sys
+from collections import namedtuple
+from itertools import repeat
+from operator import add, le, ne
+from typing import Any, Dict, List
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+
+from src.helperFunctions.instance import Instance
+from src.helperFunctions.schedule import Schedule
+
+
+# Violations kept in a report; the counts always cover all of them
+DEFAULT_MAX_VIOLATIONS = 100
+
+VIOLATION_KINDS = ('unknown', 'duplicate', 'missing', 'duration', 'machine', 'negative_start',
+                   'overlap', 'precedence')
+
+Violation = namedtuple('Violation', ['kind', 'job_id', 'task_id', 'machine', 'detail'])
+
+
+class ScheduleValidationError(ValueError):
+    """Raised by ``check_schedule`` when a schedule is infeasible."""
+
+    def __init__(self, report: 'ValidationReport'):
+        super().__init__(report.summary())
+        self.report = report
+
+
+class ValidationReport:
+    """
+    Attributes:
+        counts: Violations found per kind
+        violations: The first ``max_violations`` violations, in check order
+        tasks_checked: Rows in the validated schedule
+    """
+
+    def __init__(self, max_violations: int = DEFAULT_MAX_VIOLATIONS):
+        self.max_violations = max_violations
+        self.counts = dict.fromkeys(VIOLATION_KINDS, 0)
+        self.violations: List[Violation] = []
+        self.tasks_checked = 0
+
+    def add(self, kind, job_id=None, task_id=None, machine=None, detail=''):
+        self.counts[kind] += 1
+        if len(self.violations) < self.max_violations:
+            self.violations.append(Violation(kind, job_id, task_id, machine, detail))
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    @property
+    def valid(self) -> bool:
+        return self.total == 0
+
+    def summary(self) -> str:
+        if self.valid:
+            return f"Schedule is feasible ({self.tasks_checked} tasks checked)"
+        found = ', '.join(f"{count} {kind}" for kind, count in self.counts.items() if count)
+        first = self.violations[0]
+        return f"Schedule is infeasible: {found} (first: {first.kind} {first.detail})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'valid': self.valid,
+            'tasks_checked': self.tasks_checked,
+            'total': self.total,
+            'counts': {kind: count for kind, count in self.counts.items() if count},
+            'violations': [violation._asdict() for violation in self.violations],
+        }
+
+
+def validate_schedule(schedule, problem, max_violations: int = DEFAULT_MAX_VIOLATIONS) -> ValidationReport:
+    """
+    Validate a schedule against its instance.
+
+    Args:
+        schedule: ``Schedule`` or cultural-format timeline
+        problem: ``Instance`` or ``read_dataset``-shaped dict
+        max_violations: Violations kept in the report (all are counted)
+
+    Returns:
+        ValidationReport
+    """
+    if not isinstance(schedule, Schedule):
+        schedule = Schedule.from_cultural(schedule)
+    instance = problem if isinstance(problem, Instance) else Instance.from_dict(problem)
+    report = ValidationReport(max_violations)
+    report.tasks_checked = len(schedule)
+
+    ends = list(map(add, schedule.starts, schedule.durations))
+    row_at = _check_tasks(schedule, instance, report)
+    _check_chains(schedule, instance, row_at, report, ends)
+    _check_machines(schedule, report, ends)
+    return report
+
+
+def _label(schedule, row):
+    return f"J{schedule.job_ids[row]}T{schedule.task_ids[row]}"
+
+
+def _check_tasks(schedule, instance, report):
+    """
+    Map every row to its flat instance position and check the per-task fields.
+
+    Returns:
+        list: Flat instance position -> schedule row, -1 where unplaced
+    """
+    offsets = instance.job_offsets
+    durations = instance.durations
+    job_ids = schedule.job_ids
+    task_ids = schedule.task_ids
+    machines = schedule.machines
+    starts = schedule.starts
+
+    # Position of task 1 minus one, and task count, per job
+    job_base = {job_id: offsets[j] - 1 for j, job_id in enumerate(instance.job_ids)}
+    job_size = {job_id: offsets[j + 1] - offsets[j] for j, job_id in enumerate(instance.job_ids)}
+    bases = list(map(job_base.get, job_ids))
+    sizes = list(map(job_size.get, job_ids))
+    if None not in bases and (not task_ids or min(task_ids) > 0) and all(map(le, task_ids, sizes)):
+        positions = list(map(add, bases, task_ids))
+    else:
+        # -1 for tasks that are not in the instance
+        positions = [base + task_id if base is not None and 0 < task_id <= size else -1
+                     for base, size, task_id in zip(bases, sizes, task_ids)]
+        for row in [row for row, position in enumerate(positions) if position == -1]:
+            report.add('unknown', job_ids[row], task_ids[row], machines[row],
+                       f"{_label(schedule, row)} is not in the instance")
+
+    placed = dict(zip(positions, range(len(positions))))
+    placed.pop(-1, None)
+    if len(placed) < len(positions) - report.counts['unknown']:
+        for row, position in enumerate(positions):
+            # ``placed`` kept the last row of each position; every other row is a repeat
+            if position != -1 and placed[position] != row:
+                report.add('duplicate', job_ids[row], task_ids[row], machines[row],
+                           f"{_label(schedule, row)} is placed more than once")
+
+    # Unknown rows compare against the last task's duration; they are filtered below. An instance without
+    # tasks has no durations to compare against, and every row is already reported unknown
+    if durations and any(map(ne, map(durations.__getitem__, positions), schedule.durations)):
+        for row in [row for row, (position, duration) in enumerate(zip(positions, schedule.durations))
+                    if position != -1 and duration != durations[position]]:
+            report.add('duration', job_ids[row], task_ids[row], machines[row],
+                       f"{_label(schedule, row)} runs {schedule.durations[row]}, expected {durations[positions[row]]}")
+
+    machines_count = instance.machines_count
+    if machines and (min(machines) < 0 or max(machines) >= machines_count):
+        for row in [row for row, machine in enumerate(machines) if not 0 <= machine < machines_count]:
+            report.add('machine', job_ids[row], task_ids[row], machines[row],
+                       f"{_label(schedule, row)} is on machine {machines[row]}, expected 0..{machines_count - 1}")
+
+    if starts and min(starts) < 0:
+        for row in [row for row, start in enumerate(starts) if start < 0]:
+            report.add('negative_start', job_ids[row], task_ids[row], machines[row],
+                       f"{_label(schedule, row)} starts at {starts[row]}")
+
+    row_at = list(map(placed.get, range(instance.total_tasks), repeat(-1)))
+    if len(placed) < instance.total_tasks:
+        for j, job_id in enumerate(instance.job_ids):
+            for position in range(offsets[j], offsets[j + 1]):
+                if row_at[position] == -1:
+                    task_id = position - offsets[j] + 1
+                    report.add('missing', job_id, task_id, None, f"J{job_id}T{task_id} is not scheduled")
+    return row_at
+
+
+def _check_chains(schedule, instance, row_at, report, ends):
+    """
+    Every task starts after the nearest scheduled task before it in its job
+    ends; a missing task neither waits nor blocks.
+    """
+    starts = schedule.starts
+    offsets = instance.job_offsets
+    for j in range(instance.total_jobs):
+        previous = -1
+        for position in range(offsets[j], offsets[j + 1]):
+            row = row_at[position]
+            if row == -1:
+                continue
+            if previous != -1 and starts[row] < ends[previous]:
+                report.add('precedence', schedule.job_ids[row], schedule.task_ids[row], schedule.machines[row],
+                           f"{_label(schedule, row)} starts at {starts[row]}, before {_label(schedule, previous)} "
+                           f"ends at {ends[previous]}")
+            previous = row
+
+
+def _check_machines(schedule, report, ends):
+    """A task overlaps if it starts before the latest end of the tasks started before it on its machine."""
+    starts = schedule.starts
+    durations = schedule.durations
+    for machine in schedule.used_machines():
+        rows = schedule.machine_order(machine)
+        # The task holding the machine: the earliest-started one that ends at the latest end so far
+        holder = rows[0]
+        latest_end = ends[holder]
+        for row in rows[1:]:
+            if starts[row] < latest_end and durations[row] != 0:
+                report.add('overlap', schedule.job_ids[row], schedule.task_ids[row], machine,
+                           f"{_label(schedule, row)} starts at {starts[row]} on machine {machine}, "
+                           f"before {_label(schedule, holder)} ends at {latest_end}")
+            if ends[row] > latest_end:
+                holder = row
+                latest_end = ends[row]
+
+
+def check_schedule(schedule, problem):
+    """
+    Raise if a schedule is infeasible.
+
+    Raises:
+        ScheduleValidationError: With the full report attached
+    """
+    report = validate_schedule(schedule, problem)
+    if not report.valid:
+        raise ScheduleValidationError(report)
+    return report
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Persistent Solution Cache
+
+Stores the best schedule found for an instance in an SQLite file so repeated
+or equivalent instances (same jobs in a different order, or the same
+durations with renumbered job IDs) are answered without re-running a solver.
+
+Instances are canonicalized by sorting jobs on their duration signature and
+replacing job/task IDs with positions; cached schedules are stored in that
+canonical numbering and remapped to the caller's IDs on lookup.
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class CanonicalInstance:
+    """
+    Canonical form of an instance in the ``read_dataset`` dict shape.
+
+    Attributes:
+        machines_count: Number of machines
+        signatures: Duration tuple of every job, in canonical order
+        job_ids: Caller's job_id for every canonical job
+        task_ids: Caller's task_ids for every canonical job, in chain order
+        hash: Hex digest identifying the instance up to job order and IDs
+    """
+
+    def __init__(self, problem_data: Dict[str, Any]):
+        jobs = [
+            (tuple(task['execution_time'] for task in job['tasks']), job['job_id'],
+             [task['task_id'] for task in job['tasks']])
+            for job in problem_data['jobs']
+        ]
+        # Ties are jobs with identical durations, which are interchangeable
+        jobs.sort(key=lambda job: job[0])
+
+        self.machines_count = problem_data['machines_count']
+        self.signatures = [signature for signature, _, _ in jobs]
+        self.job_ids = [job_id for _, job_id, _ in jobs]
+        self.task_ids = [task_ids for _, _, task_ids in jobs]
+
+        payload = json.dumps([self.machines_count, self.signatures], separators=(',', ':'))
+        self.hash = hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+        self._canonical_index = {}
+        for job_index, (job_id, task_ids) in enumerate(zip(self.job_ids, self.task_ids)):
+            for position, task_id in enumerate(task_ids):
+                self._canonical_index[(job_id, task_id)] = (job_index, position)
+
+    def to_canonical(self, timeline) -> List[Tuple[int, int, int, int]]:
+        """Convert a cultural-format timeline into (job_index, position, machine, start) rows."""
+        rows = []
+        for machine, tasks in timeline.items():
+            for task_dict in tasks:
+                for task_key, (start, _) in task_dict.items():
+                    job_index, position = self._canonical_index[task_key]
+                    rows.append((job_index, position, machine, start))
+        rows.sort(key=lambda row: (row[2], row[3]))
+        return rows
+
+    def from_canonical(self, rows) -> Dict[int, List[Dict[Tuple[int, int], Tuple[int, int]]]]:
+        """Remap canonical rows back to a cultural-format timeline in the caller's IDs."""
+        timeline = {}
+        for job_index, position, machine, start in rows:
+            task_key = (self.job_ids[job_index], self.task_ids[job_index][position])
+            duration = self.signatures[job_index][position]
+            timeline.setdefault(machine, []).append({task_key: (start, duration)})
+        return timeline
+
+
+class SolutionCache:
+    """
+    SQLite-backed map from (canonical instance, solver, parameters) to the
+    best schedule and metrics found so far, with least-recently-used eviction.
+
+    Safe to share between processes; each process opens its own connection.
+    """
+
+    def __init__(self, path: str, max_entries: int = 10000):
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        self.connection = sqlite3.connect(path, timeout=30)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('''
+            CREATE TABLE IF NOT EXISTS solutions (
+                key TEXT PRIMARY KEY,
+                instance_hash TEXT NOT NULL,
+                solver TEXT NOT NULL,
+                params TEXT NOT NULL,
+                makespan INTEGER NOT NULL,
+                schedule TEXT NOT NULL,
+                metrics TEXT NOT NULL,
+                created REAL NOT NULL,
+                last_access REAL NOT NULL,
+                hits INTEGER NOT NULL DEFAULT 0
+            )
+        ''')
+        self.connection.execute('CREATE INDEX IF NOT EXISTS solutions_last_access ON solutions (last_access)')
+        self.connection.commit()
+
+    @staticmethod
+    def make_key(canonical: CanonicalInstance, solver: str, params: Dict[str, Any]) -> str:
+        payload = json.dumps([canonical.hash, solver, params], sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, problem_data, solver, params) -> Optional[Tuple[Dict, Dict[str, Any]]]:
+        """
+        Look up the cached solution for an instance.
+
+        Returns:
+            tuple or None: (timeline in the caller's IDs, stored metrics) on a hit
+        """
+        canonical = CanonicalInstance(problem_data)
+        key = self.make_key(canonical, solver, params)
+        row = self.connection.execute(
+            'SELECT schedule, metrics FROM solutions WHERE key = ?', (key,)
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        with self.connection:
+            self.connection.execute(
+                'UPDATE solutions SET last_access = ?, hits = hits + 1 WHERE key = ?', (time.time(), key)
+            )
+        return canonical.from_canonical(json.loads(row[0])), json.loads(row[1])
+
+    def put(self, problem_data, solver, params, timeline, metrics) -> bool:
+        """
+        Store a solution unless an equal or better one is already cached.
+
+        Returns:
+            bool: True if the entry was written
+        """
+        canonical = CanonicalInstance(problem_data)
+        key = self.make_key(canonical, solver, params)
+        makespan = int(metrics['makespan'])
+        now = time.time()
+
+        with self.connection:
+            row = self.connection.execute('SELECT makespan FROM solutions WHERE key = ?', (key,)).fetchone()
+            if row is not None and row[0] <= makespan:
+                return False
+            self.connection.execute(
+                'INSERT OR REPLACE INTO solutions '
+                '(key, instance_hash, solver, params, makespan, schedule, metrics, created, last_access) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (key, canonical.hash, solver, json.dumps(params, sort_keys=True), makespan,
+                 json.dumps(canonical.to_canonical(timeline)), json.dumps(metrics), now, now)
+            )
+            self._evict()
+        return True
+
+    def _evict(self):
+        """Drop the least recently used entries beyond ``max_entries``."""
+        self.connection.execute(
+            'DELETE FROM solutions WHERE key IN ('
+            '  SELECT key FROM solutions ORDER BY last_access DESC LIMIT -1 OFFSET ?'
+            ')', (self.max_entries,)
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        entries = self.connection.execute('SELECT COUNT(*) FROM solutions').fetchone()[0]
+        lookups = self.hits + self.misses
+        return {
+            'entries': entries,
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+    def close(self):
+        self.connection.close()
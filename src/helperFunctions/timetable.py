@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Machine Timetable
+
+Busy intervals per machine, kept sorted by start, for the constructive
+heuristics that place one task at a time into the earliest gap that fits
+(online insertion, repair and decoding of sequence-based searches).
+
+Intervals on a machine never overlap, so their ends are sorted too and the
+first interval that can block a task is found by bisection; a lookup only
+walks the gaps after the task's ready time.
+"""
+
+import os
+import sys
+from bisect import bisect_right
+from typing import List, Tuple
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+
+
+class Timetable:
+    """
+    Attributes:
+        machines_count: Machines (0-based) tasks can be placed on
+        starts: Sorted interval starts per machine
+        ends: Matching interval ends per machine
+    """
+
+    def __init__(self, machines_count: int):
+        self.machines_count = machines_count
+        self.starts: List[List[int]] = [[] for _ in range(machines_count)]
+        self.ends: List[List[int]] = [[] for _ in range(machines_count)]
+
+    @classmethod
+    def from_schedule(cls, schedule, machines_count: int, rows=None) -> 'Timetable':
+        """Timetable holding the given rows of a ``Schedule`` (all rows by default)."""
+        timetable = cls(machines_count)
+        if rows is None:
+            for machine in schedule.used_machines():
+                # Zero-length tasks occupy nothing (and would break the sorted ends)
+                rows_on_machine = [row for row in schedule.machine_order(machine) if schedule.durations[row] > 0]
+                timetable.starts[machine] = [schedule.starts[row] for row in rows_on_machine]
+                timetable.ends[machine] = [schedule.end(row) for row in rows_on_machine]
+        else:
+            for row in rows:
+                timetable.add(schedule.machines[row], schedule.starts[row], schedule.end(row))
+        return timetable
+
+    def add(self, machine: int, start: int, end: int):
+        if end <= start:
+            return
+        starts = self.starts[machine]
+        i = bisect_right(starts, start)
+        starts.insert(i, start)
+        self.ends[machine].insert(i, end)
+
+    def earliest_start(self, machine: int, ready: int, duration: int) -> int:
+        """Earliest start at or after ``ready`` where ``duration`` fits on a machine."""
+        starts = self.starts[machine]
+        ends = self.ends[machine]
+        start = ready
+        for i in range(bisect_right(ends, ready), len(starts)):
+            if start + duration <= starts[i]:
+                return start
+            if ends[i] > start:
+                start = ends[i]
+        return start
+
+    def best_slot(self, ready: int, duration: int) -> Tuple[int, int]:
+        """(start, machine) of the earliest gap fitting a task on any machine; ties go to the lower machine."""
+        best_start = None
+        best_machine = 0
+        for machine in range(self.machines_count):
+            start = self.earliest_start(machine, ready, duration)
+            if best_start is None or start < best_start:
+                best_start = start
+                best_machine = machine
+                if start == ready:
+                    break
+        return best_start, best_machine
+
+    def place(self, ready: int, duration: int) -> Tuple[int, int]:
+        """Place a task in its earliest gap; returns (start, machine)."""
+        start, machine = self.best_slot(ready, duration)
+        self.add(machine, start, start + duration)
+        return start, machine
+
+    def makespan(self) -> int:
+        return max((ends[-1] for ends in self.ends if ends), default=0)
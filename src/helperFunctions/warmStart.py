@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Warm Starts
+
+Turns a schedule of a previous, slightly different instance (a duration
+edited, a job added or removed) into a feasible schedule of the current one,
+so solvers can start from it instead of from scratch:
+
+1. Tasks that still exist keep their machine and their order; they are
+   re-timed with the current durations (each starts as soon as its machine
+   and its job predecessor allow).
+2. Tasks of removed jobs are dropped. New tasks, and every task of a job
+   after the first one that could not be kept, are placed into the earliest
+   machine gap after their predecessor.
+
+``mutate_schedule`` perturbs a schedule the same way (a few tasks moved to
+another machine, then re-timed), for population-based solvers seeding
+individuals around a warm start.
+
+Release times in the instance (``job_release``, ``machine_release``; see
+solver.py) are honoured, so the same re-timing makes any solver's schedule
+of a sub-problem fit around the tasks fixed before it.
+"""
+
+import os
+import sys
+from typing import Dict, Tuple
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+
+from src.helperFunctions.schedule import Schedule
+from src.helperFunctions.timetable import Timetable
+
+
+def _task_durations(problem_data) -> Dict[Tuple[int, int], int]:
+    return {(job['job_id'], task['task_id']): task['execution_time']
+            for job in problem_data['jobs'] for task in job['tasks']}
+
+
+def _retime(schedule, problem_data, machine_of=None) -> Schedule:
+    """
+    Semi-active schedule keeping each machine's task order (by previous start)
+    and each job's longest placed prefix, with the current durations.
+    """
+    durations = _task_durations(problem_data)
+    machines_count = problem_data['machines_count']
+    machines = schedule.machines if machine_of is None else machine_of
+
+    # Previous start order; predecessors never start later, ties go to the lower task ID
+    order = sorted(range(len(schedule)), key=lambda row: (schedule.starts[row], schedule.task_ids[row]))
+    machine_release = list(problem_data.get('machine_release') or [0] * machines_count)
+    machine_ready = list(machine_release)
+    job_ready = dict(problem_data.get('job_release') or {})
+    next_task = {}
+    retimed = Schedule()
+    for row in order:
+        job_id = schedule.job_ids[row]
+        task_id = schedule.task_ids[row]
+        machine = machines[row]
+        # Keep a task only if the instance has it, its machine exists and it extends the job's placed chain
+        if ((job_id, task_id) not in durations or not 0 <= machine < machines_count
+                or next_task.get(job_id, 1) != task_id):
+            continue
+        duration = durations[(job_id, task_id)]
+        start = max(machine_ready[machine], job_ready.get(job_id, 0))
+        retimed.add(job_id, task_id, machine, start, duration)
+        machine_ready[machine] = job_ready[job_id] = start + duration
+        next_task[job_id] = task_id + 1
+
+    # Everything not kept goes into the earliest gaps after its predecessor
+    timetable = Timetable.from_schedule(retimed, machines_count)
+    for machine, release in enumerate(machine_release):
+        timetable.add(machine, 0, release)
+    for job in problem_data['jobs']:
+        job_id = job['job_id']
+        ready = job_ready.get(job_id, 0)
+        for task in job['tasks'][next_task.get(job_id, 1) - 1:]:
+            duration = task['execution_time']
+            start, machine = timetable.place(ready, duration)
+            retimed.add(job_id, task['task_id'], machine, start, duration)
+            ready = start + duration
+    return retimed
+
+
+def adapt_schedule(schedule, problem_data) -> Schedule:
+    """
+    Feasible schedule of ``problem_data`` that follows ``schedule`` as closely as possible.
+
+    Args:
+        schedule: ``Schedule`` or cultural-format timeline, possibly of another version of the instance
+        problem_data: Current instance dict
+
+    Returns:
+        Schedule
+    """
+    if not isinstance(schedule, Schedule):
+        schedule = Schedule.from_cultural(schedule)
+    return _retime(schedule, problem_data)
+
+
+def mutate_schedule(schedule: Schedule, problem_data, rng, moves: int = 2) -> Schedule:
+    """Copy of a feasible schedule with ``moves`` random tasks moved to another machine, re-timed."""
+    machines = list(schedule.machines)
+    machines_count = problem_data['machines_count']
+    if len(machines) and machines_count > 1:
+        for _ in range(moves):
+            row = rng.randrange(len(machines))
+            machines[row] = (machines[row] + rng.randrange(1, machines_count)) % machines_count
+    return _retime(schedule, problem_data, machines)
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Large Neighbourhood Search
+
+Improves a fast heuristic schedule by repeatedly freeing a small part of it
+and re-solving that part exactly:
+
+    destroy   free ``size`` tasks chosen by one of three operators:
+              'window'   tasks starting in a random stretch of time
+              'jobs'     the tasks of randomly chosen jobs
+              'critical' the last tasks on the machine that ends last
+    repair    run the backTracking2 branch & bound over the freed tasks only,
+              with every other task fixed where it is, starting from their
+              current placement and bounded by ``repair_time`` seconds and/or
+              ``repair_nodes`` search nodes; it makes the
+              freed tasks end as early as possible, then the whole schedule
+              is compacted so later tasks move into the room that was made
+
+Freed tasks become sub-jobs of consecutive tasks: each starts after its
+fixed predecessor (a release time) and must end before its fixed successor
+starts (a deadline), so every repair is feasible and never makes the
+makespan longer.
+
+The destroy size adapts: a repair that proves its neighbourhood optimal
+without improving it means the neighbourhood is too small (grow); a repair
+that runs out of time means it is too large (shrink). Operators that
+improve the schedule are picked more often.
+"""
+
+import contextlib
+import heapq
+import os
+import random
+import sys
+import time
+from typing import Optional
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+
+from src.backTracking.backTracking2 import backTracking2
+from src.helperFunctions.schedule import Schedule
+from src.helperFunctions.timetable import Timetable
+from src.helperFunctions.warmStart import adapt_schedule
+from src.solvers.liveMetrics import LiveMetrics, DEFAULT_METRICS_INTERVAL
+from src.solvers.registry import register_solver
+from src.solvers.solver import Budget, ProgressEvent, SolveResult, debug_validate, OPTIMAL, FEASIBLE, CANCELLED
+
+
+DESTROY_OPERATORS = ('window', 'jobs', 'critical')
+DEFAULT_DESTROY_SIZE = 8
+MIN_DESTROY_SIZE = 3
+MAX_DESTROY_SIZE = 40
+
+
+def initial_schedule(problem_data) -> Schedule:
+    """
+    Fast heuristic start (list scheduling): whenever a machine frees up, start
+    the ready task whose job has the most work left (or the task that becomes
+    ready first, if none is ready yet). O(n log n).
+    """
+    jobs = problem_data['jobs']
+    remaining = [sum(task['execution_time'] for task in job['tasks']) for job in jobs]
+    waiting = [(0, j, 0) for j, job in enumerate(jobs) if job['tasks']]  # (ready time, job, task index)
+    available = []  # (-remaining work, ready time, job, task index)
+    free = [(0, machine) for machine in range(problem_data['machines_count'])]
+    schedule = Schedule()
+    while waiting or available:
+        machine_free, machine = heapq.heappop(free)
+        while waiting and waiting[0][0] <= machine_free:
+            ready, j, index = heapq.heappop(waiting)
+            heapq.heappush(available, (-remaining[j], ready, j, index))
+        if available:
+            _, ready, j, index = heapq.heappop(available)
+        else:
+            ready, j, index = heapq.heappop(waiting)
+        task = jobs[j]['tasks'][index]
+        start = max(ready, machine_free)
+        end = start + task['execution_time']
+        schedule.add(jobs[j]['job_id'], task['task_id'], machine, start, task['execution_time'])
+        heapq.heappush(free, (end, machine))
+        remaining[j] -= task['execution_time']
+        if index + 1 < len(jobs[j]['tasks']):
+            heapq.heappush(waiting, (end, j, index + 1))
+    return schedule
+
+
+def destroy(schedule: Schedule, operator: str, size: int, rng) -> set:
+    """Rows of ``schedule`` freed by a destroy operator."""
+    rows = len(schedule)
+    size = min(size, rows)
+    if operator == 'window':
+        # A run of consecutive tasks in start order
+        by_start = sorted(range(rows), key=schedule.starts.__getitem__)
+        first = rng.randrange(rows - size + 1)
+        return set(by_start[first:first + size])
+    if operator == 'jobs':
+        job_rows = {}
+        for row in sorted(range(rows), key=schedule.task_ids.__getitem__):
+            job_rows.setdefault(schedule.job_ids[row], []).append(row)
+        jobs = sorted(job_rows)
+        rng.shuffle(jobs)
+        freed = set()
+        for job_id in jobs:
+            freed.update(job_rows[job_id][:size - len(freed)])
+            if len(freed) >= size:
+                break
+        return freed
+    if operator == 'critical':
+        # Tasks on the machine that ends last, from its end backwards
+        critical = max(schedule.used_machines(), key=lambda m: schedule.end(schedule.machine_order(m)[-1]))
+        return set(schedule.machine_order(critical)[-size:])
+    raise ValueError(f"Unknown destroy operator '{operator}', expected one of {list(DESTROY_OPERATORS)}")
+
+
+def compact(schedule: Schedule, problem_data) -> Schedule:
+    """Same machines and machine orders, every task started as early as possible (never a longer makespan)."""
+    return adapt_schedule(schedule, problem_data)
+
+
+def repair(schedule: Schedule, freed: set, problem_data, time_limit: Optional[float], cancel=None,
+           node_limit: Optional[int] = None):
+    """
+    Re-solve the freed rows with branch & bound around the fixed ones.
+
+    The search minimises the latest end of the freed tasks; the result is then
+    compacted (every task started as early as its machine order and job allow),
+    which passes the room it made on to the fixed tasks after it.
+
+    Returns:
+        tuple: (new schedule, or None if the freed tasks could not end earlier; True if the repair was
+            proven optimal)
+    """
+    fixed_rows = [row for row in range(len(schedule)) if row not in freed]
+    located = {(schedule.job_ids[row], schedule.task_ids[row]): row for row in range(len(schedule))}
+
+    # Consecutive freed tasks of a job form one sub-job, numbered from 1
+    segments = []  # (job_id, first task_id, rows)
+    for row in sorted(freed, key=lambda r: (schedule.job_ids[r], schedule.task_ids[r])):
+        job_id, task_id = schedule.job_ids[row], schedule.task_ids[row]
+        if segments and segments[-1][0] == job_id and segments[-1][1] + len(segments[-1][2]) == task_id:
+            segments[-1][2].append(row)
+        else:
+            segments.append((job_id, task_id, [row]))
+
+    machines_count = problem_data['machines_count']
+    bt = backTracking2()
+    bt.machines_count = machines_count
+    bt.machine_release = [0] * machines_count
+    bt.blocked = Timetable.from_schedule(schedule, machines_count, rows=fixed_rows)
+    bt.jobs = []
+    bt.job_release = {}
+    bt.task_deadline = {}
+    warm = Schedule()
+    for sub_job_id, (job_id, first_task, rows) in enumerate(segments):
+        bt.jobs.append({'job_id': sub_job_id, 'tasks': [{'task_id': k, 'execution_time': schedule.durations[row]}
+                                                        for k, row in enumerate(rows, 1)]})
+        previous = located.get((job_id, first_task - 1))
+        if previous is not None:
+            bt.job_release[sub_job_id] = schedule.end(previous)
+        following = located.get((job_id, first_task + len(rows)))
+        if following is not None:
+            # Latest end of each task so the rest of the segment still fits before the fixed successor
+            deadline = schedule.starts[following]
+            for k in range(len(rows), 0, -1):
+                bt.task_deadline[(sub_job_id, k)] = deadline
+                deadline -= schedule.durations[rows[k - 1]]
+        for k, row in enumerate(rows, 1):
+            warm.add(sub_job_id, k, schedule.machines[row], schedule.starts[row], schedule.durations[row])
+    bt.total_jobs = len(bt.jobs)
+    bt.total_tasks = len(freed)
+    bt.job_next_task = [0] * bt.total_jobs
+
+    bt.schedule_tasks(time_limit=time_limit, node_limit=node_limit, cancel=cancel, warm_start=warm)
+    proven = not bt.time_expired
+    if bt.best_makespan >= warm.makespan:
+        return None, proven
+
+    repaired = Schedule()
+    for row in fixed_rows:
+        repaired.add(*schedule.row(row))
+    for tasks in bt.best_timeline.values():
+        for task in tasks:
+            job_id, first_task, _ = segments[task['job_id']]
+            repaired.add(job_id, first_task + task['task_id'] - 1, task['machine'], task['start_time'],
+                         task['execution_time'])
+    return compact(repaired, problem_data), proven
+
+
+def large_neighbourhood_search(problem_data, budget: Budget, repair_time: Optional[float] = 0.5,
+                               destroy_size: int = DEFAULT_DESTROY_SIZE, seed: Optional[int] = None,
+                               warm_start=None, cancel=None, on_improvement=None, repair_nodes: int = 0):
+    """
+    Run LNS until the budget (time_limit and/or generation_limit, counted in iterations) runs out,
+    or the schedule reaches the trivial lower bound.
+
+    Args:
+        repair_time: Seconds per repair at most, None for no time limit
+        repair_nodes: Search nodes per repair at most, 0 for no node limit; with
+            ``repair_time=None`` every repair does a fixed amount of work
+        on_improvement: Optional callback(iteration, schedule) for every new best schedule
+
+    Returns:
+        tuple: (best schedule, iterations, statistics dict)
+    """
+    start_time = time.time()
+    rng = random.Random(seed)
+    machines_count = problem_data['machines_count']
+    best = adapt_schedule(warm_start, problem_data) if warm_start is not None else initial_schedule(problem_data)
+    initial_makespan = best.makespan
+    job_work = [sum(task['execution_time'] for task in job['tasks']) for job in problem_data['jobs']]
+    lower_bound = max(max(job_work, default=0), -(-sum(job_work) // machines_count))
+    if on_improvement:
+        on_improvement(0, best)
+
+    weights = dict.fromkeys(DESTROY_OPERATORS, 1.0)
+    improvements = dict.fromkeys(DESTROY_OPERATORS, 0)
+    size = destroy_size
+    iterations = 0
+    while len(best) > 1 and best.makespan > lower_bound:
+        if budget.time_exceeded(start_time) or (cancel is not None and cancel.cancelled):
+            break
+        if budget.generation_limit is not None and iterations >= budget.generation_limit:
+            break
+        iterations += 1
+
+        operator = rng.choices(DESTROY_OPERATORS, weights=[weights[op] for op in DESTROY_OPERATORS])[0]
+        freed = destroy(best, operator, size, rng)
+        limit = repair_time
+        if budget.time_limit is not None:
+            remaining = budget.remaining_time(start_time)
+            limit = remaining if limit is None else min(limit, remaining)
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            repaired, proven = repair(best, freed, problem_data, limit, cancel, repair_nodes or None)
+
+        # Operators that improve are picked more often; weights decay back toward 1
+        improved = repaired is not None and repaired.makespan < best.makespan
+        weights[operator] = 0.8 * weights[operator] + 0.2 * (5.0 if improved else 1.0 if repaired else 0.5)
+        if repaired is not None:
+            # Equal makespans are accepted too: the freed tasks end earlier, which opens room for later moves
+            best = repaired
+            if improved:
+                improvements[operator] += 1
+                if on_improvement:
+                    on_improvement(iterations, best)
+        elif proven:
+            size = min(size + 1, MAX_DESTROY_SIZE, len(best))
+        else:
+            size = max(size - 1, MIN_DESTROY_SIZE)
+
+    stats = {'initial_makespan': initial_makespan, 'lower_bound': lower_bound, 'destroy_size': size,
+             'improvements': improvements}
+    return best, iterations, stats
+
+
+@register_solver
+class LNSSolver:
+    """Large neighbourhood search with branch & bound repairs, exposed through the common Solver interface."""
+    name = 'lns'
+    display_name = 'Large Neighbourhood Search'
+    description = ("Starts from a fast greedy schedule, then repeatedly frees a small neighbourhood (a time "
+                   "window, some jobs, or the busiest machine's last tasks) and re-solves it exactly with "
+                   "Branch & Bound while everything else stays fixed.")
+    features = ('Near-optimal on large instances', 'Exact repairs', 'Adaptive neighbourhood size')
+    progress_unit = 'iteration'
+    objective_name = 'Best Makespan'
+    default_budget = Budget(time_limit=60.0)
+    default_params = {'repair_time': 0.5, 'repair_nodes': 0, 'destroy_size': DEFAULT_DESTROY_SIZE, 'seed': 0,
+                      'metrics_interval': DEFAULT_METRICS_INTERVAL}
+
+    def solve(self, problem_data, budget=None, cancel=None, on_progress=None, repair_time=0.5, repair_nodes=0,
+              destroy_size=DEFAULT_DESTROY_SIZE, seed=0, metrics_interval=DEFAULT_METRICS_INTERVAL, warm_start=None,
+              incumbent=None):
+        budget = budget or self.default_budget
+        start_time = time.time()
+        live = LiveMetrics(self.name, problem_data, on_progress, metrics_interval)
+        history = []
+
+        def on_improvement(iteration, schedule):
+            history.append((iteration, schedule.makespan))
+            if incumbent is not None:
+                incumbent.offer(schedule.makespan, schedule)
+            if on_progress:
+                elapsed = time.time() - start_time
+                on_progress(ProgressEvent(self.name, 'progress', iteration, elapsed, schedule.makespan,
+                                          schedule.makespan))
+                live.update(schedule.makespan)
+                live.publish(iteration, elapsed)
+
+        schedule, iterations, stats = large_neighbourhood_search(
+            problem_data, budget, repair_time, destroy_size, seed, warm_start, cancel, on_improvement, repair_nodes
+        )
+
+        if cancel is not None and cancel.cancelled:
+            status = CANCELLED
+        else:
+            # Reaching the lower bound proves the schedule optimal
+            status = OPTIMAL if schedule.makespan <= stats['lower_bound'] else FEASIBLE
+
+        result = SolveResult(
+            solver=self.name,
+            status=status,
+            schedule=schedule,
+            makespan=schedule.makespan,
+            metrics=schedule.metrics(problem_data['machines_count']),
+            wall_time=time.time() - start_time,
+            generations=iterations,
+            history=history,
+            stats=stats,
+        )
+        debug_validate(result, problem_data)
+        live.update(result.makespan)
+        live.flush(iterations, result.wall_time)
+        if on_progress:
+            on_progress(ProgressEvent(self.name, 'finished', iterations, result.wall_time,
+                                      result.makespan, result.makespan))
+        return result
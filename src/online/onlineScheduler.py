@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Online Job Insertion
+
+Reacts to jobs that arrive while a schedule is already executing, without
+re-solving the instance from scratch:
+
+1. Every task that has started by ``now`` is frozen where it is.
+2. The new jobs (longest first) are placed task by task into the earliest
+   machine gap that fits after ``now`` and after their predecessor; tasks
+   already planned but not started keep their slots. This takes
+   milliseconds and disturbs nothing that was planned.
+3. Optionally, within ``improve_time`` seconds, all tasks that have not
+   started (planned and new) are repacked around the frozen ones in
+   different job orders, keeping the best schedule found.
+
+    scheduler = OnlineScheduler(problem_data, result.schedule)
+    insertion = scheduler.add_jobs(new_jobs, now=120, improve_time=0.05)
+    print(insertion.makespan, scheduler.schedule)
+"""
+
+import os
+import random
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+
+from src.helperFunctions.schedule import Schedule
+from src.helperFunctions.timetable import Timetable
+
+
+@dataclass
+class InsertionResult:
+    """
+    Outcome of one ``insert_jobs`` call.
+
+    Attributes:
+        schedule: Schedule of the old and new jobs
+        problem_data: Instance dict including the new jobs
+        makespan: Makespan of ``schedule``
+        inserted_makespan: Makespan right after gap insertion (before improvement)
+        frozen: Tasks that had started by ``now`` and were left untouched
+        orders_tried: Job orders evaluated by the improvement phase
+        elapsed: Seconds spent
+    """
+    schedule: Schedule
+    problem_data: Dict[str, Any]
+    makespan: int
+    inserted_makespan: int
+    frozen: int
+    orders_tried: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def improved(self) -> bool:
+        return self.makespan < self.inserted_makespan
+
+
+def merge_jobs(problem_data, new_jobs) -> Dict[str, Any]:
+    """
+    Instance dict with ``new_jobs`` appended (``read_dataset`` job shape).
+
+    Raises:
+        ValueError: If a new job reuses a job ID or its task IDs are not 1..n in order
+    """
+    known = {job['job_id'] for job in problem_data['jobs']}
+    for job in new_jobs:
+        if job['job_id'] in known:
+            raise ValueError(f"Job {job['job_id']} is already in the instance")
+        known.add(job['job_id'])
+        if [task['task_id'] for task in job['tasks']] != list(range(1, len(job['tasks']) + 1)):
+            raise ValueError(f"Job {job['job_id']} must have task IDs 1..{len(job['tasks'])} in order")
+
+    merged = dict(problem_data)
+    merged['jobs'] = list(problem_data['jobs']) + list(new_jobs)
+    merged['total_jobs'] = len(merged['jobs'])
+    merged['total_tasks'] = problem_data['total_tasks'] + sum(len(job['tasks']) for job in new_jobs)
+    return merged
+
+
+def _job_work(job):
+    return sum(task['execution_time'] for task in job['tasks'])
+
+
+def _place_jobs(timetable, schedule, jobs, job_ready, now, skip=frozenset()):
+    """Place each job's tasks (except ``skip``ped ones) in order into the earliest gaps."""
+    for job in jobs:
+        job_id = job['job_id']
+        ready = max(now, job_ready.get(job_id, 0))
+        for task in job['tasks']:
+            if (job_id, task['task_id']) in skip:
+                continue
+            duration = task['execution_time']
+            start, machine = timetable.place(ready, duration)
+            schedule.add(job_id, task['task_id'], machine, start, duration)
+            ready = start + duration
+    return schedule
+
+
+def insert_jobs(problem_data, schedule, new_jobs, now: int = 0, improve_time: float = 0.0,
+                seed: Optional[int] = None) -> InsertionResult:
+    """
+    Insert newly arrived jobs into an executing schedule.
+
+    Args:
+        problem_data: Instance dict the schedule was built for
+        schedule: ``Schedule`` or cultural-format timeline of ``problem_data``
+        new_jobs: Jobs to add, in the ``read_dataset`` shape
+        now: Current time; tasks starting before it are frozen, new tasks start at or after it
+        improve_time: Seconds allowed for repacking the unstarted tasks (0 keeps the plain insertion)
+        seed: Seed for the random job orders of the improvement phase
+
+    Returns:
+        InsertionResult
+    """
+    start_time = time.time()
+    if not isinstance(schedule, Schedule):
+        schedule = Schedule.from_cultural(schedule)
+    merged = merge_jobs(problem_data, new_jobs)
+    machines_count = merged['machines_count']
+
+    frozen_rows = [row for row, start in enumerate(schedule.starts) if start < now]
+    frozen_keys = {(schedule.job_ids[row], schedule.task_ids[row]) for row in frozen_rows}
+    # Jobs can't continue before their last started task ends
+    frozen_ready = {}
+    for row in frozen_rows:
+        job_id = schedule.job_ids[row]
+        frozen_ready[job_id] = max(frozen_ready.get(job_id, 0), schedule.end(row))
+
+    # Keep the existing plan, fill its gaps with the new jobs
+    new_jobs = sorted(new_jobs, key=_job_work, reverse=True)
+    inserted = Schedule(schedule.job_ids[:], schedule.task_ids[:], schedule.machines[:], schedule.starts[:],
+                        schedule.durations[:])
+    _place_jobs(Timetable.from_schedule(schedule, machines_count), inserted, new_jobs, {}, now)
+    best = inserted
+
+    # Repack everything that has not started around the frozen tasks
+    orders_tried = 0
+    if improve_time > 0:
+        rng = random.Random(seed)
+        deadline = start_time + improve_time
+        pending_jobs = [job for job in merged['jobs']
+                        if any((job['job_id'], task['task_id']) not in frozen_keys for task in job['tasks'])]
+        remaining_work = {job['job_id']: sum(task['execution_time'] for task in job['tasks']
+                                             if (job['job_id'], task['task_id']) not in frozen_keys)
+                          for job in pending_jobs}
+        # Most remaining work first, then latest possible finish first, then random moves on the best order
+        best_order = sorted(pending_jobs, key=lambda job: -remaining_work[job['job_id']])
+        orders = [best_order,
+                  sorted(pending_jobs, key=lambda job: frozen_ready.get(job['job_id'], now) +
+                         remaining_work[job['job_id']], reverse=True)]
+        while time.time() < deadline:
+            order = orders.pop(0) if orders else _perturb(best_order, rng)
+            candidate = _repack(schedule, frozen_rows, frozen_keys, frozen_ready, order, machines_count, now)
+            orders_tried += 1
+            if candidate.makespan < best.makespan:
+                best = candidate
+                best_order = order
+
+    return InsertionResult(
+        schedule=best,
+        problem_data=merged,
+        makespan=best.makespan,
+        inserted_makespan=inserted.makespan,
+        frozen=len(frozen_rows),
+        orders_tried=orders_tried,
+        elapsed=time.time() - start_time,
+    )
+
+
+def _repack(schedule, frozen_rows, frozen_keys, frozen_ready, order, machines_count, now):
+    """Schedule of the frozen rows plus every other task placed job by job in ``order``."""
+    repacked = Schedule()
+    for row in frozen_rows:
+        repacked.add(*schedule.row(row))
+    timetable = Timetable.from_schedule(schedule, machines_count, rows=frozen_rows)
+    return _place_jobs(timetable, repacked, order, frozen_ready, now, skip=frozen_keys)
+
+
+def _perturb(order, rng):
+    """Copy of a job order with one job moved to another position."""
+    order = list(order)
+    if len(order) > 1:
+        order.insert(rng.randrange(len(order)), order.pop(rng.randrange(len(order))))
+    return order
+
+
+class OnlineScheduler:
+    """
+    Holds the executing schedule of a growing instance and inserts arriving jobs into it.
+
+    Attributes:
+        problem_data: Instance dict of every job received so far
+        schedule: Current schedule of all those jobs
+    """
+
+    def __init__(self, problem_data, schedule=None):
+        self.history: List[InsertionResult] = []
+        if schedule is None:
+            # No plan yet: every known job arrives at time 0
+            self.problem_data = dict(problem_data, jobs=[], total_jobs=0, total_tasks=0)
+            self.schedule = Schedule()
+            self.add_jobs(problem_data['jobs'])
+        else:
+            self.problem_data = problem_data
+            self.schedule = schedule if isinstance(schedule, Schedule) else Schedule.from_cultural(schedule)
+
+    def add_jobs(self, new_jobs, now: int = 0, improve_time: float = 0.0, seed: Optional[int] = None):
+        """Insert ``new_jobs`` at time ``now`` and make the result the current schedule (see ``insert_jobs``)."""
+        result = insert_jobs(self.problem_data, self.schedule, new_jobs, now, improve_time, seed)
+        self.problem_data = result.problem_data
+        self.schedule = result.schedule
+        self.history.append(result)
+        return result
+
+    @property
+    def makespan(self) -> int:
+        return self.schedule.makespan
@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Parallel Portfolio
+
+Races several registered solvers (or several configurations of one) in
+separate processes, so they don't contend for the GIL, under one shared
+deadline:
+
+    members = 'backtracking2 + tabu + annealing:seed=1 + annealing:seed=2,chains=4'
+
+Each member is a solver spec as the batch runner takes it: a registry name,
+optionally followed by ``:param=value,...`` overrides (budget fields
+included, e.g. ``cultural:generation_limit=50``). When the member list is
+itself a parameter of a spec, as in ``portfolio:members=...,time_limit=10``,
+a member override named like one of the portfolio's own parameters (its
+budget fields, ``members``, ``metrics_interval``) would be read as the
+portfolio's; bracket the list to keep it whole:
+``portfolio:members=[tabu:seed=1,time_limit=2+annealing],time_limit=10``.
+Every member runs until the portfolio's deadline unless it stops earlier.
+At the deadline (or on cancellation, or a proof) every member is told to
+stop; members that have not returned ``DEADLINE_GRACE`` seconds later (e.g. a branch & bound still
+setting up before its first checkpoint) are terminated and reported as
+``timed_out``, and the schedules they offered to the incumbent still count.
+
+The members cooperate through a ``SharedIncumbent``: each new best any
+member reports is offered to it (with its schedule, by the members that
+accept an ``incumbent``), and the branch & bound reads it at its checkpoints
+to prune with, and take over, the metaheuristics' schedules. The branch &
+bound publishes its root bound and, if it completes, its proof back; once
+the shared makespan meets the shared lower bound, or a member proves
+optimality, every member is stopped.
+
+The result is the best schedule of any member; ``stats['winner']`` names
+the member that found it first.
+
+The cooperative hybrid is the same race with the branch & bound and the
+metaheuristics feeding it as the members.
+"""
+
+import contextlib
+import inspect
+import multiprocessing
+import os
+import queue
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, wait
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+
+from src.helperFunctions.schedule import Schedule
+from src.solvers.liveMetrics import LiveMetrics, DEFAULT_METRICS_INTERVAL
+from src.solvers.registry import get_solver, parse_spec, register_solver, resolve_params
+from src.solvers.sharedIncumbent import SharedIncumbent
+from src.solvers.solver import (Budget, CancellationToken, ProgressEvent, SolveResult, debug_validate, OPTIMAL,
+                                FEASIBLE, NO_SOLUTION, CANCELLED)
+
+
+# Joins member specs; a comma already separates the parameters within a spec
+MEMBER_SEPARATOR = '+'
+DEFAULT_MEMBERS = 'backtracking2+tabu+annealing+lns'
+# Seconds members get to hand back their results after the deadline before they are terminated
+DEADLINE_GRACE = 1.0
+TIMED_OUT = 'timed_out'
+
+
+def parse_members(members):
+    """
+    Member specs of a portfolio.
+
+    Args:
+        members: ``solver[:param=value,...]`` entries joined by '+'
+
+    Returns:
+        list: (spec, solver name, parameter overrides) per member
+
+    Raises:
+        ValueError: For an empty list, the portfolio itself, an unknown solver or parameter, or a malformed entry
+    """
+    parsed = []
+    for spec in (entry.strip() for entry in members.split(MEMBER_SEPARATOR)):
+        if not spec:
+            continue
+        name, overrides = parse_spec(spec)
+        if name in (PortfolioSolver.name, HybridSolver.name):
+            raise ValueError("A portfolio can't race another portfolio")
+        resolve_params(name, overrides)  # validates the solver and its parameters
+        parsed.append((spec, name, overrides))
+    if not parsed:
+        raise ValueError("A portfolio needs at least one member")
+    return parsed
+
+
+def _run_member(problem_data, index, name, overrides, deadline, warm_start, incumbent, stop, improvements):
+    """
+    Process pool worker: solve with one member until the shared deadline, offering every new best to the
+    shared incumbent and reporting it as (member index, makespan) on ``improvements``.
+    """
+    reported = [float('inf')]
+    solver = get_solver(name)
+    params = resolve_params(name, overrides)
+    limits = {key: params.pop(key) for key in Budget.FIELDS}
+    time_limit = max(0.0, deadline - time.time())
+    if 'time_limit' in overrides and limits['time_limit'] is not None:
+        time_limit = min(time_limit, limits['time_limit'])
+    budget = Budget(time_limit=time_limit, node_limit=limits['node_limit'],
+                    generation_limit=limits['generation_limit'])
+
+    def on_progress(event):
+        # Members that accept the incumbent offer their schedules themselves; this covers the others
+        if event.kind in ('progress', 'incumbent') and event.best_makespan is not None \
+                and event.best_makespan < reported[0]:
+            reported[0] = event.best_makespan
+            incumbent.offer(event.best_makespan)
+            improvements.put((index, event.best_makespan))
+
+    if 'incumbent' in inspect.signature(solver.solve).parameters:
+        params['incumbent'] = incumbent
+    if warm_start is not None:
+        params['warm_start'] = warm_start
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        result = solver.solve(problem_data, budget, cancel=CancellationToken(stop), on_progress=on_progress,
+                              **params)
+    if result.makespan is not None:
+        incumbent.offer(result.makespan, result.schedule)
+    return result
+
+
+def _terminate(pool):
+    """Kill the worker processes of a pool whose members ignored the stop signal."""
+    for process in list((pool._processes or {}).values()):
+        if process.is_alive():
+            process.terminate()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _proven(result, best_makespan):
+    """True if a member's result proves ``best_makespan`` optimal."""
+    if result.makespan is not None and result.status == OPTIMAL and result.makespan <= best_makespan:
+        return True
+    lower_bound = result.stats.get('lower_bound')
+    return lower_bound is not None and best_makespan <= lower_bound
+
+
+@register_solver
+class PortfolioSolver:
+    """Several solvers racing in separate processes, exposed through the common Solver interface."""
+    name = 'portfolio'
+    display_name = 'Parallel Portfolio'
+    description = ("Runs Branch & Bound, Tabu Search, Simulated Annealing and LNS at the same time in separate "
+                   "processes. They share the best makespan so far, so Branch & Bound prunes with what the "
+                   "others find; the best schedule wins.")
+    features = ('Uses every CPU core', 'Best of several algorithms', 'Exact pruning with heuristic solutions')
+    progress_unit = 'improvement'
+    objective_name = 'Best Makespan'
+    default_budget = Budget(time_limit=30.0)
+    default_params = {'members': DEFAULT_MEMBERS, 'metrics_interval': DEFAULT_METRICS_INTERVAL}
+
+    def solve(self, problem_data, budget=None, cancel=None, on_progress=None, members=DEFAULT_MEMBERS,
+              metrics_interval=DEFAULT_METRICS_INTERVAL, warm_start=None):
+        budget = budget or self.default_budget
+        start_time = time.time()
+        members = parse_members(members)
+        time_limit = budget.time_limit if budget.time_limit is not None else self.default_budget.time_limit
+        deadline = start_time + time_limit
+        live = LiveMetrics(self.name, problem_data, on_progress, metrics_interval)
+        history = []
+        results = [None] * len(members)
+        found_by = {}  # makespan -> index of the member that reported it first
+
+        with multiprocessing.Manager() as manager:
+            pool = ProcessPoolExecutor(max_workers=len(members))
+            incumbent = SharedIncumbent(manager)
+            stop = manager.Event()
+            improvements = manager.Queue()
+            futures = {pool.submit(_run_member, problem_data, index, name, overrides, deadline, warm_start,
+                                   incumbent, stop, improvements): index
+                       for index, (_, name, overrides) in enumerate(members)}
+            pending = set(futures)
+            stopped_at = None
+            try:
+                while pending:
+                    done, pending = wait(pending, timeout=0.1)
+                    if cancel is not None and cancel.cancelled:
+                        stop.set()
+                    for future in done:
+                        index = futures[future]
+                        try:
+                            results[index] = future.result()
+                        except Exception as error:
+                            print(f"Portfolio member '{members[index][0]}' failed: {error}")
+                            continue
+                        # One proof of optimality ends the race
+                        if _proven(results[index], incumbent.makespan):
+                            stop.set()
+                    if incumbent.solved:
+                        stop.set()
+                    while True:
+                        try:
+                            index, makespan = improvements.get_nowait()
+                        except queue.Empty:
+                            break
+                        if history and makespan >= history[-1][1]:
+                            continue
+                        history.append((len(history) + 1, makespan))
+                        found_by[makespan] = index
+                        if on_progress:
+                            elapsed = time.time() - start_time
+                            on_progress(ProgressEvent(self.name, 'progress', len(history), elapsed, makespan,
+                                                      makespan, {'member': members[index][0]}))
+                            live.update(makespan)
+                            live.publish(len(history), elapsed)
+                    # The deadline is shared: stop everyone, and give up on members that don't return in time
+                    now = time.time()
+                    if now >= deadline:
+                        stop.set()
+                    if stopped_at is None and stop.is_set():
+                        stopped_at = now
+                    if stopped_at is not None and now >= stopped_at + DEADLINE_GRACE:
+                        break
+                timed_out = {futures[future] for future in pending}
+                offered = incumbent.best_schedule()
+                shared_lower_bound = incumbent.lower_bound
+            finally:
+                if pending:
+                    _terminate(pool)
+                else:
+                    pool.shutdown()
+
+        # Best schedule of any member; ties go to the member that found it first (others may have taken it
+        # over through the incumbent), then to the member listed first
+        finished = [index for index, result in enumerate(results)
+                    if result is not None and result.makespan is not None]
+        winner = min(finished, key=lambda index: (results[index].makespan,
+                                                  found_by.get(results[index].makespan) != index,
+                                                  index)) if finished else None
+        schedule = results[winner].schedule if winner is not None else Schedule()
+        makespan = results[winner].makespan if winner is not None else None
+        if offered is not None and (makespan is None or offered.makespan < makespan):
+            # A member that was terminated had offered a better schedule
+            schedule = offered
+            makespan = offered.makespan
+            winner = found_by.get(makespan)
+
+        if cancel is not None and cancel.cancelled:
+            status = CANCELLED
+        elif winner is None:
+            status = NO_SOLUTION
+        else:
+            proven = makespan <= shared_lower_bound or any(result is not None and _proven(result, makespan)
+                                                           for result in results)
+            status = OPTIMAL if proven else FEASIBLE
+
+        stats = {
+            'winner': members[winner][0] if winner is not None else None,
+            'members': [{'member': spec,
+                         'status': (results[index].status if results[index] is not None
+                                    else TIMED_OUT if index in timed_out else 'failed'),
+                         'makespan': results[index].makespan if results[index] is not None else None,
+                         'wall_time': round(results[index].wall_time, 3) if results[index] is not None else None}
+                        for index, (spec, _, _) in enumerate(members)],
+        }
+        bounds = [result.stats['lower_bound'] for result in results
+                  if result is not None and result.stats.get('lower_bound') is not None]
+        if shared_lower_bound > 0:
+            bounds.append(shared_lower_bound)
+        if bounds:
+            stats['lower_bound'] = max(bounds)
+
+        result = SolveResult(
+            solver=self.name,
+            status=status,
+            schedule=schedule,
+            makespan=makespan,
+            metrics=schedule.metrics(problem_data['machines_count']),
+            wall_time=time.time() - start_time,
+            generations=len(history),
+            history=history,
+            stats=stats,
+        )
+        debug_validate(result, problem_data)
+        if status == OPTIMAL:
+            live.update(result.makespan, lower_bound=result.makespan)
+        elif makespan is not None:
+            live.update(makespan)
+        live.flush(len(history), result.wall_time)
+        if on_progress:
+            on_progress(ProgressEvent(self.name, 'finished', len(history), result.wall_time,
+                                      result.makespan, result.makespan))
+        return result
+
+
+@register_solver
+class HybridSolver(PortfolioSolver):
+    """Branch & bound fed by metaheuristics running alongside, exposed through the common Solver interface."""
+    name = 'hybrid'
+    display_name = 'Cooperative Hybrid'
+    description = ("Runs Branch & Bound together with metaheuristics in separate processes. Their best "
+                   "schedules flow into the running Branch & Bound, which prunes and finishes with them, and "
+                   "its proven bounds flow back, so everyone stops once the best schedule is proven optimal.")
+    features = ('Optimal when it finishes', 'Good schedules early', 'Heuristic schedules tighten exact pruning')
+    default_params = {'partners': 'tabu', 'metrics_interval': DEFAULT_METRICS_INTERVAL}
+
+    def solve(self, problem_data, budget=None, cancel=None, on_progress=None, partners='tabu',
+              metrics_interval=DEFAULT_METRICS_INTERVAL, warm_start=None):
+        """``partners``: portfolio member specs, joined by '+', running alongside the branch & bound."""
+        return super().solve(problem_data, budget, cancel, on_progress,
+                             members=f'backtracking2{MEMBER_SEPARATOR}{partners}',
+                             metrics_interval=metrics_interval, warm_start=warm_start)
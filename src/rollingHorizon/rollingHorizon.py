@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Rolling Horizon
+
+Decomposes instances too large for the exact search into a sequence of
+small windows solved one after another:
+
+1. The window takes the next ``window_tasks`` tasks in the order a list
+   schedule would start them (each job contributes the next part of its chain).
+2. The window is solved as a sub-problem by a registered solver
+   (``backtracking2`` by default) within its share of the budget and at most
+   ``window_nodes`` search nodes, if given. Everything
+   fixed before it enters as release times: when each job may continue and
+   when each machine becomes free.
+3. The window's schedule is frozen and the horizon advances.
+
+Release times in the instance (``job_release``, ``machine_release``; see
+solver.py) are where the first window starts from.
+
+Windows are yielded as soon as they are frozen, so the beginning of the
+schedule can be dispatched long before the whole horizon is solved:
+
+    for window in rolling_horizon(problem_data, window_tasks=12, window_time=0.5):
+        dispatch(window.schedule)
+"""
+
+import contextlib
+import heapq
+import os
+import sys
+import time
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+
+from src.helperFunctions.schedule import Schedule
+from src.helperFunctions.warmStart import adapt_schedule
+from src.solvers.liveMetrics import LiveMetrics, DEFAULT_METRICS_INTERVAL
+from src.solvers.registry import get_solver, register_solver
+from src.solvers.solver import Budget, ProgressEvent, SolveResult, debug_validate, FEASIBLE, CANCELLED
+
+
+DEFAULT_WINDOW_TASKS = 12
+DEFAULT_WINDOW_TIME = 1.0
+
+
+@dataclass
+class Window:
+    """
+    One frozen window.
+
+    Attributes:
+        index: Window number, from 1
+        schedule: The window's tasks (original job and task IDs)
+        makespan: Makespan of everything frozen so far
+        tasks_done: Tasks frozen so far, this window included
+        solver_status: Status the window's solver returned (or 'greedy' when the budget had run out)
+    """
+    index: int
+    schedule: Schedule
+    makespan: int
+    tasks_done: int
+    solver_status: str
+
+
+def _select_window(jobs, job_next, job_ready, machine_release, window_tasks):
+    """
+    Next tasks in list-schedule start order: simulate placing the ready task
+    of the earliest-ready job (longest remaining chain first on ties) on the
+    earliest free machine, ``window_tasks`` times.
+
+    Returns:
+        dict: job index -> number of its next tasks in the window
+    """
+    free = sorted(machine_release)
+    heap = [(job_ready[j], -len(job['tasks']) + job_next[j], j) for j, job in enumerate(jobs)
+            if job_next[j] < len(job['tasks'])]
+    heapq.heapify(heap)
+    taken = {}
+    while heap and window_tasks > 0:
+        ready, remaining, j = heapq.heappop(heap)
+        count = taken.get(j, 0)
+        machine_free = heapq.heappop(free)
+        end = max(ready, machine_free) + jobs[j]['tasks'][job_next[j] + count]['execution_time']
+        heapq.heappush(free, end)
+        taken[j] = count + 1
+        window_tasks -= 1
+        if remaining + 1 < 0:
+            heapq.heappush(heap, (end, remaining + 1, j))
+    return taken
+
+
+def rolling_horizon(problem_data, window_tasks: int = DEFAULT_WINDOW_TASKS,
+                    window_time: Optional[float] = DEFAULT_WINDOW_TIME, window_solver: str = 'backtracking2',
+                    budget: Optional[Budget] = None, cancel=None, window_nodes: int = 0) -> Iterator[Window]:
+    """
+    Solve an instance window by window.
+
+    Args:
+        problem_data: Instance dict
+        window_tasks: Tasks per window
+        window_time: Seconds per window at most, None for no time limit; with an overall
+            ``budget`` the remaining time is also shared evenly among the remaining windows
+        window_solver: Registered solver used on every window
+        budget: Overall limit (time_limit only); windows after it ran out are placed greedily
+        cancel: Optional CancellationToken; windows after a cancellation are placed greedily
+        window_nodes: Search nodes per window at most, 0 for no node limit; with
+            ``window_time=None`` every window does a fixed amount of work
+
+    Yields:
+        Window: Each window once it is frozen
+    """
+    start_time = time.time()
+    if window_solver == RollingHorizonSolver.name:
+        raise ValueError("The rolling horizon can't solve its own windows")
+    solver = get_solver(window_solver)
+    jobs = problem_data['jobs']
+    machines_count = problem_data['machines_count']
+    total_tasks = sum(len(job['tasks']) for job in jobs)
+
+    job_release = problem_data.get('job_release') or {}
+    job_next = [0] * len(jobs)
+    job_ready = [job_release.get(job['job_id'], 0) for job in jobs]
+    machine_release = list(problem_data.get('machine_release') or [0] * machines_count)
+    tasks_done = 0
+    makespan = 0
+    index = 0
+
+    while tasks_done < total_tasks:
+        index += 1
+        taken = _select_window(jobs, job_next, job_ready, machine_release, window_tasks)
+
+        # Sub-problem: the window's part of each job, renumbered 1..k, with release times
+        sub_jobs = []
+        for j, count in taken.items():
+            tasks = jobs[j]['tasks'][job_next[j]:job_next[j] + count]
+            sub_jobs.append({'job_id': jobs[j]['job_id'],
+                             'tasks': [{'task_id': k, 'execution_time': task['execution_time']}
+                                       for k, task in enumerate(tasks, 1)]})
+        sub_problem = {
+            'machines_count': machines_count,
+            'total_jobs': len(sub_jobs),
+            'total_tasks': sum(taken.values()),
+            'jobs': sub_jobs,
+            'job_release': {jobs[j]['job_id']: job_ready[j] for j in taken},
+            'machine_release': list(machine_release),
+        }
+
+        windows_left = max(1, -(-(total_tasks - tasks_done) // window_tasks))
+        window_budget = window_time
+        if budget is not None and budget.time_limit is not None:
+            share = budget.remaining_time(start_time) / windows_left
+            window_budget = share if window_budget is None else min(window_budget, share)
+        if (window_budget is None or window_budget > 0) and not (cancel is not None and cancel.cancelled):
+            with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                result = solver.solve(sub_problem, Budget(time_limit=window_budget, node_limit=window_nodes or None),
+                                      cancel=cancel)
+            sub_schedule, status = result.schedule, result.status
+        else:
+            sub_schedule, status = Schedule(), 'greedy'
+
+        # Re-time around the frozen part (fills in anything the solver left unplaced)
+        window_schedule = adapt_schedule(sub_schedule, sub_problem)
+        first_task = {jobs[j]['job_id']: job_next[j] for j in taken}
+        job_end = {}
+        for row in range(len(window_schedule)):
+            job_id = window_schedule.job_ids[row]
+            window_schedule.task_ids[row] += first_task[job_id]
+            machine = window_schedule.machines[row]
+            end = window_schedule.end(row)
+            machine_release[machine] = max(machine_release[machine], end)
+            job_end[job_id] = max(job_end.get(job_id, 0), end)
+        for j, count in taken.items():
+            job_next[j] += count
+            job_ready[j] = job_end[jobs[j]['job_id']]
+
+        tasks_done += len(window_schedule)
+        makespan = max(makespan, window_schedule.makespan)
+        yield Window(index, window_schedule, makespan, tasks_done, status)
+
+
+@register_solver
+class RollingHorizonSolver:
+    """Rolling-horizon decomposition, exposed through the common Solver interface."""
+    name = 'rolling_horizon'
+    display_name = 'Rolling Horizon'
+    description = ("Splits the schedule into consecutive windows of tasks, solves each window with another "
+                   "solver (Branch & Bound by default) around everything already fixed, then freezes it and "
+                   "moves on.")
+    features = ('Scales to thousands of tasks', 'Schedule available window by window', 'Exact within each window')
+    progress_unit = 'window'
+    objective_name = 'Makespan So Far'
+    default_budget = Budget(time_limit=60.0)
+    default_params = {'window_tasks': DEFAULT_WINDOW_TASKS, 'window_time': DEFAULT_WINDOW_TIME, 'window_nodes': 0,
+                      'window_solver': 'backtracking2', 'metrics_interval': DEFAULT_METRICS_INTERVAL}
+
+    def solve(self, problem_data, budget=None, cancel=None, on_progress=None, window_tasks=DEFAULT_WINDOW_TASKS,
+              window_time=DEFAULT_WINDOW_TIME, window_nodes=0, window_solver='backtracking2',
+              metrics_interval=DEFAULT_METRICS_INTERVAL, warm_start=None):
+        budget = budget or self.default_budget
+        start_time = time.time()
+        live = LiveMetrics(self.name, problem_data, on_progress, metrics_interval)
+        schedule = Schedule()
+        history = []
+        statuses = {}
+
+        # Windows are cut from the live state, so a warm start has nothing to seed and is ignored
+        for window in rolling_horizon(problem_data, window_tasks, window_time, window_solver, budget, cancel,
+                                      window_nodes):
+            for row in window.schedule.rows():
+                schedule.add(*row)
+            history.append((window.index, window.makespan))
+            statuses[window.solver_status] = statuses.get(window.solver_status, 0) + 1
+            if on_progress:
+                elapsed = time.time() - start_time
+                # The window's rows let a dispatcher start executing before the solve ends
+                on_progress(ProgressEvent(self.name, 'progress', window.index, elapsed, window.makespan,
+                                          window.makespan, {'tasks_done': window.tasks_done,
+                                                            'rows': list(window.schedule.rows())}))
+                live.update(window.makespan)
+                live.publish(window.index, elapsed)
+
+        result = SolveResult(
+            solver=self.name,
+            status=CANCELLED if cancel is not None and cancel.cancelled else FEASIBLE,
+            schedule=schedule,
+            makespan=schedule.makespan,
+            metrics=schedule.metrics(problem_data['machines_count']),
+            wall_time=time.time() - start_time,
+            history=history,
+            stats={'windows': len(history), 'window_statuses': statuses},
+        )
+        debug_validate(result, problem_data)
+        live.update(result.makespan)
+        live.flush(len(history), result.wall_time)
+        if on_progress:
+            on_progress(ProgressEvent(self.name, 'finished', len(history), result.wall_time,
+                                      result.makespan, result.makespan))
+        return result
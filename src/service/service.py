@@ -0,0 +1,440 @@
+"""
+Local scheduling service
+
+A small HTTP/JSON server that lets other processes on the same host submit
+instances (in the ``read_dataset`` dict shape), queues them, and runs them on
+a bounded pool of solver worker processes.
+
+Endpoints:
+    POST   /jobs              submit {"instance": {...}, "solver": "...", "params": {...}, "deadline": seconds}
+    GET    /jobs/<id>         status, latest progress and (when finished) the result
+    GET    /jobs/<id>/events  stream progress and the final result as JSON Lines
+    DELETE /jobs/<id>         cancel a job that has not started yet
+    GET    /stats             throughput, latency and queue counters
+    GET    /solvers           solvers and their default parameters
+"""
+
+import json
+import multiprocessing
+import os
+import sys
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+
+from src.batch.batch import solve_problem
+from src.helperFunctions.readFromCSV import instance_from_jobs
+from src.helperFunctions.scheduleValidator import validate_schedule
+from src.solvers.registry import available_solvers, resolve_params, split_params
+from src.solvers.solver import CancellationToken
+
+
+def _serialize_timeline(timeline):
+    """Flatten a cultural-format timeline into JSON-friendly task records."""
+    return [
+        {'machine': machine, 'job_id': job_id, 'task_id': task_id, 'start': start, 'duration': duration}
+        for machine, tasks in sorted(timeline.items())
+        for task_dict in tasks
+        for (job_id, task_id), (start, duration) in task_dict.items()
+    ]
+
+
+def _solve_job(job_id, problem_data, solver, params, deadline, progress_queue, cache_path=None):
+    """Worker-process entry point: run one request and report progress through the queue."""
+    started = time.time()
+    if deadline is not None and started >= deadline:
+        return {'status': 'expired', 'started': started}
+
+    progress_queue.put((job_id, {'solver': solver, 'kind': 'started', 'step': 0, 'time': started}))
+    budget = None
+    if deadline is not None:
+        # Clamp the time budget so the solver hands back its best schedule by the deadline; the caller's
+        # params stay the cache key, so requests with deadlines still share cache entries
+        budget, _ = split_params(params)
+        remaining = max(0.0, deadline - started)
+        budget.time_limit = remaining if budget.time_limit is None else min(budget.time_limit, remaining)
+
+    # Safety net for solvers that only check their time budget coarsely
+    cancel = CancellationToken()
+
+    def progress(event):
+        if deadline is not None and time.time() > deadline:
+            cancel.cancel()
+        progress_queue.put((job_id, dict(event.to_dict(), time=time.time())))
+
+    timeline, record = solve_problem(problem_data, solver, params, progress=progress,
+                                     cache_path=cache_path, cancel=cancel, budget=budget)
+    record['started'] = started
+    record['schedule'] = _serialize_timeline(timeline)
+    if timeline:
+        record['validation'] = validate_schedule(timeline, problem_data).to_dict()
+    return record
+
+
+class _Job:
+    """Book-keeping for one submitted request."""
+
+    def __init__(self, job_id, solver, params, deadline):
+        self.id = job_id
+        self.solver = solver
+        self.params = params
+        self.deadline = deadline
+        self.status = 'queued'
+        self.submitted = time.time()
+        self.started = None
+        self.finished = None
+        self.result = None
+        self.events = []
+        self.metrics = None  # info of the latest 'metrics' event
+        self.future = None
+        self.changed = threading.Condition()
+
+    def add_event(self, event):
+        with self.changed:
+            self.events.append(event)
+            if event.get('kind') == 'metrics':
+                self.metrics = event['info']
+            self.changed.notify_all()
+
+    def to_dict(self, include_result=True):
+        data = {
+            'id': self.id,
+            'solver': self.solver,
+            'params': self.params,
+            'status': self.status,
+            'submitted': self.submitted,
+            'started': self.started,
+            'finished': self.finished,
+            'progress': self.events[-1] if self.events else None,
+            'metrics': self.metrics,
+        }
+        if include_result and self.result is not None:
+            data['result'] = self.result
+        return data
+
+
+class SchedulingService:
+    """
+    Request queue in front of a bounded pool of solver worker processes.
+
+    Admission is bounded by ``max_pending`` (queued plus running requests);
+    submissions beyond that are rejected so callers can back off.
+    """
+
+    FINISHED = ('done', 'failed', 'expired', 'cancelled')
+
+    def __init__(self, workers=None, max_pending=64, max_retained=1000, latency_window=1000, cache_path=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.cache_path = cache_path
+        self.max_pending = max_pending
+        self.max_retained = max_retained
+        self.jobs = OrderedDict()
+        self.lock = threading.Lock()
+        self.pending = 0
+
+        self.manager = multiprocessing.Manager()
+        self.progress_queue = self.manager.Queue()
+        self.pool = ProcessPoolExecutor(max_workers=self.workers)
+
+        # Counters
+        self.started_at = time.time()
+        self.counters = {'submitted': 0, 'rejected': 0, 'completed': 0, 'failed': 0, 'expired': 0, 'cancelled': 0}
+        self.queue_waits = deque(maxlen=latency_window)
+        self.latencies = deque(maxlen=latency_window)
+
+        self._progress_thread = threading.Thread(target=self._drain_progress, daemon=True)
+        self._progress_thread.start()
+
+    # -------------------------
+    # Request handling
+    # -------------------------
+    def submit(self, request):
+        """
+        Queue a request.
+
+        Returns:
+            _Job or None: The queued job, or None when the service is saturated
+
+        Raises:
+            ValueError: If the request is malformed
+        """
+        problem_data = self._validate_instance(request.get('instance'))
+        solver = request.get('solver', 'backtracking2')
+        params = resolve_params(solver, request.get('params') or {})
+
+        deadline = request.get('deadline')
+        deadline = time.time() + float(deadline) if deadline is not None else None
+
+        with self.lock:
+            if self.pending >= self.max_pending:
+                self.counters['rejected'] += 1
+                return None
+            self.pending += 1
+            self.counters['submitted'] += 1
+            job = _Job(uuid.uuid4().hex, solver, params, deadline)
+            self.jobs[job.id] = job
+            self._evict_finished()
+
+        job.future = self.pool.submit(_solve_job, job.id, problem_data, solver, params, deadline,
+                                      self.progress_queue, self.cache_path)
+        job.future.add_done_callback(lambda future, job=job: self._on_done(job, future))
+        return job
+
+    def cancel(self, job_id):
+        """Cancel a job that has not started yet. Returns True if it was cancelled."""
+        job = self.get(job_id)
+        if job is None or not job.future.cancel():
+            return False
+        return True
+
+    def get(self, job_id):
+        with self.lock:
+            return self.jobs.get(job_id)
+
+    def stats(self):
+        """Throughput, latency and queue counters."""
+        with self.lock:
+            uptime = time.time() - self.started_at
+            running = sum(1 for job in self.jobs.values() if job.status == 'running')
+            stats = dict(self.counters)
+            stats.update({
+                'uptime': round(uptime, 3),
+                'workers': self.workers,
+                'max_pending': self.max_pending,
+                'pending': self.pending,
+                'running': running,
+                'queued': self.pending - running,
+                'throughput_per_min': round(self.counters['completed'] / uptime * 60, 3) if uptime > 0 else 0.0,
+                'queue_wait': self._summarize(self.queue_waits),
+                'latency': self._summarize(self.latencies),
+            })
+        return stats
+
+    def shutdown(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
+        self.manager.shutdown()
+
+    # -------------------------
+    # Internals
+    # -------------------------
+    @staticmethod
+    def _validate_instance(instance):
+        """
+        Instance dict of a request, checked like a dataset file (see ``instance_from_jobs``).
+
+        Raises:
+            ValueError: If the instance is malformed
+        """
+        if not isinstance(instance, dict) or 'machines_count' not in instance or 'jobs' not in instance:
+            raise ValueError("'instance' must be an object with 'machines_count' and 'jobs'")
+        if not isinstance(instance['jobs'], list):
+            raise ValueError("'jobs' must be a list")
+
+        checked = instance_from_jobs(instance['machines_count'], instance['jobs'], name='request')
+        if min(checked.durations) <= 0:
+            raise ValueError("Task execution times must be positive")
+        problem_data = checked.to_dict()
+        del problem_data['dataset_size'], problem_data['source_file']
+        return problem_data
+
+    @staticmethod
+    def _summarize(samples):
+        if not samples:
+            return {'count': 0}
+        ordered = sorted(samples)
+        return {
+            'count': len(ordered),
+            'mean': round(sum(ordered) / len(ordered), 4),
+            'p50': round(ordered[len(ordered) // 2], 4),
+            'p95': round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 4),
+            'max': round(ordered[-1], 4),
+        }
+
+    def _evict_finished(self):
+        """Forget the oldest finished jobs once more than ``max_retained`` are kept."""
+        excess = len(self.jobs) - self.max_retained
+        for job_id in [job_id for job_id, job in self.jobs.items() if job.status in self.FINISHED][:max(excess, 0)]:
+            del self.jobs[job_id]
+
+    def _drain_progress(self):
+        while True:
+            try:
+                job_id, event = self.progress_queue.get()
+            except (EOFError, OSError):
+                return
+            job = self.get(job_id)
+            if job is None:
+                continue
+            with job.changed:
+                if job.status == 'queued':
+                    job.status = 'running'
+                    job.started = event['time']
+            job.add_event(event)
+
+    def _on_done(self, job, future):
+        now = time.time()
+        if future.cancelled():
+            status, result = 'cancelled', None
+        elif future.exception() is not None:
+            error = future.exception()
+            status, result = 'failed', {'error': f"{type(error).__name__}: {error}"}
+        else:
+            result = future.result()
+            status = 'expired' if result['status'] == 'expired' else 'done'
+
+        with self.lock:
+            self.pending -= 1
+            job.finished = now
+            job.result = result
+            job.started = (result or {}).get('started', job.started)
+            counter = {'done': 'completed', 'failed': 'failed', 'expired': 'expired', 'cancelled': 'cancelled'}[status]
+            self.counters[counter] += 1
+            if status == 'done':
+                self.queue_waits.append(job.started - job.submitted)
+                self.latencies.append(now - job.submitted)
+
+        with job.changed:
+            job.status = status
+            job.changed.notify_all()
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """Routes HTTP requests to the service attached to the server."""
+
+    server_version = 'JobScheduleService/1.0'
+
+    @property
+    def service(self):
+        return self.server.service
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send_json(self, status, payload, headers=None):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _route(self):
+        parts = [part for part in self.path.split('?')[0].split('/') if part]
+        job = None
+        if len(parts) >= 2 and parts[0] == 'jobs':
+            job = self.service.get(parts[1])
+            if job is None:
+                self._send_json(404, {'error': f"unknown job '{parts[1]}'"})
+                return parts, False
+        return parts, job
+
+    def do_GET(self):
+        parts, job = self._route()
+        if job is False:
+            return
+        if parts == ['stats']:
+            self._send_json(200, self.service.stats())
+        elif parts == ['solvers']:
+            self._send_json(200, {name: resolve_params(name, {}) for name in available_solvers()})
+        elif len(parts) == 2 and job:
+            self._send_json(200, job.to_dict())
+        elif len(parts) == 3 and job and parts[2] == 'events':
+            self._stream_events(job)
+        else:
+            self._send_json(404, {'error': 'not found'})
+
+    def do_POST(self):
+        if self.path.rstrip('/') != '/jobs':
+            self._send_json(404, {'error': 'not found'})
+            return
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            request = json.loads(self.rfile.read(length) or b'{}')
+            job = self.service.submit(request)
+        except (ValueError, KeyError, TypeError) as e:
+            self._send_json(400, {'error': str(e)})
+            return
+
+        if job is None:
+            self._send_json(503, {'error': 'service saturated, retry later'}, headers={'Retry-After': '1'})
+        else:
+            self._send_json(202, job.to_dict(include_result=False), headers={'Location': f'/jobs/{job.id}'})
+
+    def do_DELETE(self):
+        parts, job = self._route()
+        if job is False:
+            return
+        if len(parts) != 2:
+            self._send_json(404, {'error': 'not found'})
+        elif self.service.cancel(job.id):
+            self._send_json(200, {'id': job.id, 'status': 'cancelled'})
+        else:
+            self._send_json(409, {'error': f"job '{job.id}' is already {job.status}"})
+
+    def _stream_events(self, job):
+        """Write progress events as JSON Lines until the job finishes (HTTP/1.0, connection close)."""
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson')
+        self.end_headers()
+
+        sent = 0
+        while True:
+            with job.changed:
+                while sent == len(job.events) and job.status not in SchedulingService.FINISHED:
+                    job.changed.wait(timeout=1.0)
+                events = job.events[sent:]
+                finished = job.status in SchedulingService.FINISHED
+            try:
+                for event in events:
+                    self.wfile.write((json.dumps({'event': 'progress', **event}) + '\n').encode('utf-8'))
+                sent += len(events)
+                if finished:
+                    self.wfile.write((json.dumps({'event': 'finished', **job.to_dict()}) + '\n').encode('utf-8'))
+                    return
+                self.wfile.flush()
+            except (BrokenPipeError, ConnectionResetError):
+                return
+
+
+def serve(host='127.0.0.1', port=8765, workers=None, max_pending=64, verbose=False, cache_path=None):
+    """Run the scheduling service until interrupted."""
+    service = SchedulingService(workers=workers, max_pending=max_pending, cache_path=cache_path)
+    server = ThreadingHTTPServer((host, port), _RequestHandler)
+    server.daemon_threads = True
+    server.service = service
+    server.verbose = verbose
+    print(f"Scheduling service listening on http://{host}:{server.server_address[1]} "
+          f"({service.workers} workers, {max_pending} pending max)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nShutting down scheduling service...")
+    finally:
+        server.server_close()
+        service.shutdown()
+
+
+def main(argv=None):
+    """Command line entry point: ``python -m src.service``."""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog='python -m src.service', description='Local job scheduling service.')
+    parser.add_argument('--host', default='127.0.0.1', help='bind address (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8765, help='port (default: 8765)')
+    parser.add_argument('-w', '--workers', type=int, default=None, help='solver worker processes (default: CPU count)')
+    parser.add_argument('--max-pending', type=int, default=64, help='queued + running requests before rejecting')
+    parser.add_argument('-v', '--verbose', action='store_true', help='log every HTTP request')
+    parser.add_argument('--cache', default=None, metavar='PATH',
+                        help='SQLite solution cache; reuse schedules of equivalent instances')
+    args = parser.parse_args(argv)
+
+    serve(args.host, args.port, args.workers, args.max_pending, args.verbose, args.cache)
+    return 0
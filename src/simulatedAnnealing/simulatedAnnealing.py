@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Simulated Annealing
+
+Cheap anytime search over machine sequences (see machineSequences.py). Each
+move picks a task on a longest path and either moves it to another machine
+or swaps it with its machine successor. The energy is the cultural
+algorithm's fitness, makespan + idle time; idle time is machines x makespan
+minus the (fixed) total work, so both deltas follow from the makespan delta.
+
+A move is judged in two steps, so most cost next to nothing:
+
+1. The makespan after it is estimated in O(1) from heads and tails; moves
+   the Metropolis test rejects on the estimate are dropped right there.
+2. The rest are applied with incremental head/tail updates, which give the
+   exact delta; the same test decides again, and a rejected move is undone.
+
+Cooling is adaptive: moves are made in epochs, and after each epoch the
+temperature goes down if more uphill moves were accepted than the target
+rate, up otherwise. The target rate falls from START_ACCEPTANCE to
+END_ACCEPTANCE over the budget. After REHEAT_EPOCHS epochs without a new
+best, the chain goes back to its best schedule and is reheated.
+
+Several independent chains can run in a process pool (``chains``); the best
+schedule of any chain is returned and the chains stop as soon as one of them
+proves its schedule optimal (trivial lower bound).
+"""
+
+import math
+import multiprocessing
+import os
+import queue
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, wait
+from typing import Optional
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+
+from src.helperFunctions.machineSequences import MachineSequences
+from src.helperFunctions.warmStart import adapt_schedule
+from src.lns.lns import initial_schedule
+from src.solvers.liveMetrics import LiveMetrics, DEFAULT_METRICS_INTERVAL
+from src.solvers.registry import register_solver
+from src.solvers.solver import (Budget, CancellationToken, ProgressEvent, SolveResult, debug_validate, OPTIMAL,
+                                FEASIBLE, CANCELLED)
+
+
+EPOCH_MOVES = 1000
+START_ACCEPTANCE = 0.4
+END_ACCEPTANCE = 0.002
+COOLING_FACTOR = 0.9
+REHEAT_EPOCHS = 40
+# Temperature after a reheat, as a share of the initial one
+REHEAT_SHARE = 0.5
+
+
+def _pick_critical(sequences, critical, rng):
+    """
+    Random task of the critical list. The list goes stale as moves are
+    accepted; it is rebuilt (O(n)) only when a pick turns out not to be critical.
+    """
+    v = critical[rng.randrange(len(critical))]
+    if sequences.heads[v] + sequences.durations[v] + sequences.tails[v] != sequences.makespan:
+        critical[:] = sequences.critical_tasks()
+        v = critical[rng.randrange(len(critical))]
+    return v
+
+
+def _propose(sequences, v, rng):
+    """(estimated makespan, move) for a random move of task ``v``, or None if it has none."""
+    machines_count = sequences.machines_count
+    w = sequences.machine_succ(v)
+    can_swap = w >= 0 and sequences.job_pred[w] != v
+    if machines_count > 1 and (not can_swap or rng.random() < 0.5):
+        machine = rng.randrange(machines_count - 1)
+        if machine >= sequences.machine[v]:
+            machine += 1
+        k = sequences.insertion_point(v, machine)
+        return sequences.estimate_reassign(v, machine, k), ('reassign', v, machine, k)
+    if can_swap:
+        return sequences.estimate_swap(v, w), ('swap', v, w)
+    return None
+
+
+def _energy_delta(makespan_delta, machines_count):
+    """Delta of makespan + idle time; the idle time changes by machines x the makespan delta."""
+    return makespan_delta + machines_count * makespan_delta
+
+
+def simulated_annealing(problem_data, budget: Budget, seed: Optional[int] = None, warm_start=None, cancel=None,
+                        on_improvement=None, incumbent=None):
+    """
+    Run one annealing chain until the budget (time_limit and/or generation_limit, counted in epochs of
+    EPOCH_MOVES moves) runs out, or the schedule reaches the trivial lower bound.
+
+    Args:
+        on_improvement: Optional callback(epoch, makespan) for every new best makespan
+        incumbent: Optional SharedIncumbent offered every new best schedule that beats it
+
+    Returns:
+        tuple: (best schedule, epochs, statistics dict)
+    """
+    start_time = time.time()
+    rng = random.Random(seed)
+    machines_count = problem_data['machines_count']
+    initial = adapt_schedule(warm_start, problem_data) if warm_start is not None else initial_schedule(problem_data)
+    sequences = MachineSequences(problem_data, initial)
+    lower_bound = sequences.lower_bound()
+    best = sequences.snapshot()
+    best_makespan = initial_makespan = sequences.makespan
+    critical = sequences.critical_tasks()
+    if on_improvement:
+        on_improvement(0, best_makespan)
+
+    # Initial temperature: the average uphill move is accepted half of the time
+    uphill = []
+    for _ in range(100 if critical else 0):
+        proposal = _propose(sequences, _pick_critical(sequences, critical, rng), rng)
+        if proposal is not None and proposal[0] > sequences.makespan:
+            uphill.append(_energy_delta(proposal[0] - sequences.makespan, machines_count))
+    initial_temperature = sum(uphill) / len(uphill) / math.log(2) if uphill else machines_count + 1.0
+    temperature = initial_temperature
+
+    moves = accepted = epochs = reheats = stale_epochs = 0
+    while critical and best_makespan > lower_bound:
+        if budget.time_exceeded(start_time) or (cancel is not None and cancel.cancelled):
+            break
+        if budget.generation_limit is not None and epochs >= budget.generation_limit:
+            break
+        epochs += 1
+
+        uphill_tried = uphill_accepted = 0
+        improved = False
+        for _ in range(EPOCH_MOVES):
+            moves += 1
+            proposal = _propose(sequences, _pick_critical(sequences, critical, rng), rng)
+            if proposal is None:
+                continue
+            estimate, move = proposal
+            threshold = rng.random()
+            makespan = sequences.makespan
+            delta = _energy_delta(estimate - makespan, machines_count)
+            if delta > 0:
+                uphill_tried += 1
+                if threshold >= math.exp(-delta / temperature):
+                    continue
+
+            # Exact delta from the incremental update; undo the move if it fails the same test
+            if move[0] == 'reassign':
+                undo = sequences.apply_reassign(*move[1:])
+                if undo is None:
+                    continue
+            elif not sequences.apply_swap(*move[1:]):
+                continue
+            delta = _energy_delta(sequences.makespan - makespan, machines_count)
+            if delta > 0 and threshold >= math.exp(-delta / temperature):
+                if move[0] == 'reassign':
+                    sequences.apply_reassign(move[1], *undo)
+                else:
+                    sequences.apply_swap(move[2], move[1])
+                continue
+
+            accepted += 1
+            uphill_accepted += delta > 0
+            if sequences.makespan < best_makespan:
+                best = sequences.snapshot()
+                best_makespan = sequences.makespan
+                improved = True
+                if on_improvement:
+                    on_improvement(epochs, best_makespan)
+                if incumbent is not None and best_makespan < incumbent.makespan:
+                    incumbent.offer(best_makespan, sequences.to_schedule())
+                if best_makespan <= lower_bound:
+                    break
+
+        # Adaptive cooling toward the target acceptance rate of uphill moves
+        if budget.time_limit is not None:
+            progress = min(1.0, (time.time() - start_time) / budget.time_limit)
+        elif budget.generation_limit:
+            progress = epochs / budget.generation_limit
+        else:
+            progress = 0.0
+        target = START_ACCEPTANCE * (END_ACCEPTANCE / START_ACCEPTANCE) ** progress
+        rate = uphill_accepted / uphill_tried if uphill_tried else 0.0
+        temperature = temperature * COOLING_FACTOR if rate > target else temperature / COOLING_FACTOR
+
+        stale_epochs = 0 if improved else stale_epochs + 1
+        if stale_epochs >= REHEAT_EPOCHS:
+            sequences.restore(best)
+            critical = sequences.critical_tasks()
+            temperature = max(temperature, initial_temperature * REHEAT_SHARE)
+            stale_epochs = 0
+            reheats += 1
+
+    sequences.restore(best)
+    stats = {'initial_makespan': initial_makespan, 'lower_bound': lower_bound, 'moves': moves,
+             'accepted': accepted, 'reheats': reheats, 'temperature': round(temperature, 4),
+             'idle_time': sequences.idle_time}
+    return sequences.to_schedule(), epochs, stats
+
+
+def _run_chain(problem_data, budget, seed, warm_start, chain, stop, improvements, incumbent):
+    """Process pool worker: one chain, reporting new bests as (chain, epoch, makespan) on ``improvements``."""
+    def on_improvement(epoch, makespan):
+        improvements.put((chain, epoch, makespan))
+
+    schedule, epochs, stats = simulated_annealing(problem_data, budget, seed, warm_start, CancellationToken(stop),
+                                                  on_improvement, incumbent)
+    if schedule.makespan <= stats['lower_bound']:
+        stop.set()  # Proven optimal: the other chains can't do better
+    return schedule, epochs, stats
+
+
+def parallel_annealing(problem_data, budget: Budget, chains: int = 1, seed: Optional[int] = None, warm_start=None,
+                       cancel=None, on_improvement=None, incumbent=None):
+    """
+    Run independent annealing chains (chain i seeded with ``seed + i``) and keep the best.
+
+    With ``chains`` > 1 the chains run in a process pool; the first chain to
+    reach the lower bound stops the others.
+
+    Args:
+        on_improvement: Optional callback(epoch, makespan) for every new best makespan of any chain
+        incumbent: Optional SharedIncumbent (created from a manager when ``chains`` > 1) the chains offer to
+
+    Returns:
+        tuple: (best schedule, epochs of all chains, statistics dict of the best chain plus
+            'best_chain' and 'chain_makespans')
+    """
+    if chains <= 1:
+        schedule, epochs, stats = simulated_annealing(problem_data, budget, seed, warm_start, cancel,
+                                                      on_improvement, incumbent)
+        return schedule, epochs, dict(stats, best_chain=0, chain_makespans=[schedule.makespan])
+
+    best_makespan = None
+    with multiprocessing.Manager() as manager, ProcessPoolExecutor(max_workers=chains) as pool:
+        stop = manager.Event()
+        improvements = manager.Queue()
+        futures = [pool.submit(_run_chain, problem_data, budget, None if seed is None else seed + chain,
+                               warm_start, chain, stop, improvements, incumbent)
+                   for chain in range(chains)]
+        pending = set(futures)
+        while pending:
+            _, pending = wait(pending, timeout=0.1)
+            if cancel is not None and cancel.cancelled:
+                stop.set()
+            while True:
+                try:
+                    chain, epoch, makespan = improvements.get_nowait()
+                except queue.Empty:
+                    break
+                if best_makespan is None or makespan < best_makespan:
+                    best_makespan = makespan
+                    if on_improvement:
+                        on_improvement(epoch, makespan)
+        results = [future.result() for future in futures]
+
+    best_chain = min(range(chains), key=lambda chain: results[chain][0].makespan)
+    schedule, _, stats = results[best_chain]
+    stats = dict(stats, best_chain=best_chain, chain_makespans=[result[0].makespan for result in results])
+    return schedule, sum(result[1] for result in results), stats
+
+
+@register_solver
+class SimulatedAnnealingSolver:
+    """Simulated annealing with incremental move evaluation, exposed through the common Solver interface."""
+    name = 'annealing'
+    display_name = 'Simulated Annealing'
+    description = ("Makes many small changes to a fast greedy schedule (a critical task to another machine, or "
+                   "past its machine neighbour), sometimes accepting worse schedules while the temperature is "
+                   "high. Runs several independent chains in parallel if asked to.")
+    features = ('Hundreds of thousands of moves per second', 'Anytime: good schedules early',
+                'Parallel independent chains')
+    progress_unit = 'epoch'
+    objective_name = 'Best Makespan'
+    default_budget = Budget(time_limit=10.0)
+    default_params = {'chains': 1, 'seed': 0, 'metrics_interval': DEFAULT_METRICS_INTERVAL}
+
+    def solve(self, problem_data, budget=None, cancel=None, on_progress=None, chains=1, seed=0,
+              metrics_interval=DEFAULT_METRICS_INTERVAL, warm_start=None, incumbent=None):
+        budget = budget or self.default_budget
+        start_time = time.time()
+        live = LiveMetrics(self.name, problem_data, on_progress, metrics_interval)
+        history = []
+
+        def on_improvement(epoch, makespan):
+            history.append((epoch, makespan))
+            if on_progress:
+                elapsed = time.time() - start_time
+                on_progress(ProgressEvent(self.name, 'progress', epoch, elapsed, makespan, makespan))
+                live.update(makespan)
+                live.publish(epoch, elapsed)
+
+        schedule, epochs, stats = parallel_annealing(problem_data, budget, chains, seed, warm_start, cancel,
+                                                     on_improvement, incumbent)
+
+        if cancel is not None and cancel.cancelled:
+            status = CANCELLED
+        else:
+            # Reaching the lower bound proves the schedule optimal
+            status = OPTIMAL if schedule.makespan <= stats['lower_bound'] else FEASIBLE
+
+        result = SolveResult(
+            solver=self.name,
+            status=status,
+            schedule=schedule,
+            makespan=schedule.makespan,
+            metrics=schedule.metrics(problem_data['machines_count']),
+            wall_time=time.time() - start_time,
+            generations=epochs,
+            history=history,
+            stats=stats,
+        )
+        debug_validate(result, problem_data)
+        live.update(result.makespan)
+        live.flush(epochs, result.wall_time)
+        if on_progress:
+            on_progress(ProgressEvent(self.name, 'finished', epochs, result.wall_time,
+                                      result.makespan, result.makespan))
+        return result
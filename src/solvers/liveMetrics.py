@@ -0,0 +1,89 @@
+"""
+Live incumbent metrics
+
+Anytime quality of a running solve, published as 'metrics' ProgressEvents
+while the solver works. Everything except the incumbent's makespan is fixed
+by the instance (total work, machines, trivial lower bound), so a snapshot
+costs O(1) and never touches the schedule:
+
+    idle_time    = makespan x machines - total work
+    utilization  = total work / (makespan x machines), in percent
+    gap          = (makespan - lower_bound) / lower_bound
+
+Solvers call ``update`` for every new incumbent and ``publish`` at their
+usual checkpoints; events go out at most once per ``interval`` seconds and
+only when something changed, and ``flush`` sends the last pending one.
+"""
+
+import math
+import time
+from typing import Any, Callable, Dict, Optional
+
+from src.solvers.solver import ProgressEvent
+
+
+# Seconds between 'metrics' events (0 publishes every incumbent)
+DEFAULT_METRICS_INTERVAL = 0.5
+
+
+class LiveMetrics:
+    """
+    Attributes:
+        makespan: Makespan of the latest incumbent (None until one is found)
+        lower_bound: Best known makespan lower bound
+        total_work: Sum of all task durations
+    """
+
+    def __init__(self, solver_name: str, problem_data, on_progress: Optional[Callable[[ProgressEvent], None]] = None,
+                 interval: float = DEFAULT_METRICS_INTERVAL):
+        self.solver_name = solver_name
+        self.on_progress = on_progress
+        self.interval = interval
+        self.machines_count = problem_data['machines_count']
+
+        job_work = [sum(task['execution_time'] for task in job['tasks']) for job in problem_data['jobs']]
+        self.total_work = sum(job_work)
+        self.lower_bound = max(max(job_work, default=0), math.ceil(self.total_work / self.machines_count))
+        self.makespan = None
+
+        self._pending = False
+        self._next_publish = 0.0
+
+    def update(self, makespan: Optional[int], lower_bound: Optional[int] = None):
+        """Record the current incumbent (and a tighter lower bound, if the solver has one)."""
+        if lower_bound is not None and lower_bound > self.lower_bound:
+            self.lower_bound = lower_bound
+            self._pending = True
+        if makespan is not None and makespan != self.makespan:
+            self.makespan = makespan
+            self._pending = True
+
+    def snapshot(self) -> Dict[str, Any]:
+        makespan = self.makespan
+        if makespan is None:
+            return {'makespan': None, 'idle_time': None, 'utilization': None,
+                    'lower_bound': self.lower_bound, 'gap': None}
+        available_time = makespan * self.machines_count
+        return {
+            'makespan': makespan,
+            'idle_time': available_time - self.total_work,
+            'utilization': round(self.total_work / available_time * 100, 2) if available_time > 0 else 0.0,
+            'lower_bound': self.lower_bound,
+            'gap': round((makespan - self.lower_bound) / self.lower_bound, 4) if self.lower_bound > 0 else None,
+        }
+
+    def publish(self, step: int, elapsed: float, force: bool = False):
+        """Send a 'metrics' event if something changed and the interval has passed (or ``force``)."""
+        if self.on_progress is None or not self._pending:
+            return
+        now = time.time()
+        if not force and now < self._next_publish:
+            return
+        self._pending = False
+        self._next_publish = now + self.interval
+        self.on_progress(ProgressEvent(self.solver_name, 'metrics', step, elapsed, self.makespan, self.makespan,
+                                       self.snapshot()))
+
+    def flush(self, step: int, elapsed: float):
+        """Send the last pending update regardless of the interval."""
+        self.publish(step, elapsed, force=True)
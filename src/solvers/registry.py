@@ -0,0 +1,156 @@
+"""
+Solver registry
+
+Front-ends discover solvers here instead of importing algorithm modules
+directly. Solver modules register their ``Solver`` class with
+``@register_solver``; the modules listed in ``SOLVER_MODULES`` are imported
+lazily the first time the registry is queried.
+"""
+
+import importlib
+from typing import Any, Dict, List, Tuple
+
+from src.solvers.solver import Budget
+
+
+# Modules that define and register solvers, in display order
+SOLVER_MODULES = [
+    'src.backTracking.backTracking',
+    'src.backTracking.backTracking2',
+    'src.cultural.cultural',
+    'src.rollingHorizon.rollingHorizon',
+    'src.lns.lns',
+    'src.tabuSearch.tabuSearch',
+    'src.simulatedAnnealing.simulatedAnnealing',
+    'src.portfolio.portfolio',
+]
+
+_solvers = {}
+_loaded = False
+
+
+def register_solver(solver_cls):
+    """Class decorator: instantiate a Solver and register it under its ``name``."""
+    solver = solver_cls()
+    if solver.name in _solvers:
+        raise ValueError(f"Solver '{solver.name}' is already registered")
+    _solvers[solver.name] = solver
+    return solver_cls
+
+
+def _load_solvers():
+    global _loaded
+    if not _loaded:
+        _loaded = True
+        for module in SOLVER_MODULES:
+            importlib.import_module(module)
+
+
+def available_solvers() -> List[str]:
+    """Names of all registered solvers, in registration order."""
+    _load_solvers()
+    return list(_solvers)
+
+
+def get_solver(name: str):
+    """
+    Look up a registered solver.
+
+    Raises:
+        ValueError: If no solver is registered under ``name``
+    """
+    _load_solvers()
+    try:
+        return _solvers[name]
+    except KeyError:
+        raise ValueError(f"Unknown solver '{name}', expected one of {list(_solvers)}") from None
+
+
+def solver_params(name: str) -> Dict[str, Any]:
+    """Default budget fields and parameters of a solver, as one flat dict."""
+    solver = get_solver(name)
+    params = {key: getattr(solver.default_budget, key) for key in Budget.FIELDS}
+    params.update(solver.default_params)
+    return params
+
+
+def resolve_params(name: str, overrides: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Merge user supplied parameters over a solver's defaults, coercing types.
+
+    Raises:
+        ValueError: If a parameter is not accepted by the solver
+    """
+    solver = get_solver(name)
+    params = solver_params(name)
+    for key, value in overrides.items():
+        if key not in params:
+            raise ValueError(f"Invalid parameter '{key}' for solver '{name}', expected {list(params)}")
+        if value is None or (isinstance(value, str) and value.lower() == 'none'):
+            params[key] = None
+            continue
+        param_type = Budget.FIELDS.get(key) or type(solver.default_params[key])
+        params[key] = param_type(value)
+    return params
+
+
+def _split_items(raw_params: str) -> List[str]:
+    """Split ``key=value,...`` on the commas outside square brackets."""
+    items, depth, item_start = [], 0, 0
+    for position, char in enumerate(raw_params):
+        if char == '[':
+            depth += 1
+        elif char == ']':
+            depth -= 1
+        elif char == ',' and depth == 0:
+            items.append(raw_params[item_start:position])
+            item_start = position + 1
+    if depth != 0:
+        raise ValueError(f"Unbalanced brackets in '{raw_params}'")
+    items.append(raw_params[item_start:])
+    return items
+
+
+def parse_spec(spec: str) -> Tuple[str, Dict[str, str]]:
+    """
+    Split a solver spec of the form ``name[:key=value,...]`` into its name and raw parameter overrides.
+
+    A value may itself hold specs, e.g. portfolio members joined by '+'
+    (``portfolio:members=tabu+annealing:seed=1,chains=2``): a comma separated
+    item whose key is not a parameter of the outer solver continues the
+    previous value when that value is a spec (contains ':'). A value in square
+    brackets is taken as is, commas included, so nested specs may also use the
+    outer solver's parameters (``portfolio:members=[tabu:time_limit=2,seed=1+annealing],time_limit=5``).
+
+    Raises:
+        ValueError: If the solver is unknown, an item is not key=value or the brackets don't match
+    """
+    name, _, raw_params = spec.partition(':')
+    name = name.strip().lower()
+    params = solver_params(name)
+
+    overrides = {}
+    key = None
+    for item in (item.strip() for item in _split_items(raw_params)):
+        if not item:
+            continue
+        item_key, sep, value = item.partition('=')
+        if key is not None and item_key.strip() not in params and ':' in overrides[key]:
+            overrides[key] += ',' + item
+            continue
+        if not sep:
+            raise ValueError(f"Invalid parameter '{item}' for solver '{name}', expected key=value")
+        key = item_key.strip()
+        value = value.strip()
+        if value.startswith('[') and value.endswith(']'):
+            overrides[key] = value[1:-1].strip()
+            key = None  # a bracketed value is complete
+        else:
+            overrides[key] = value
+    return name, overrides
+
+
+def split_params(params: Dict[str, Any]) -> Tuple[Budget, Dict[str, Any]]:
+    """Split a flat parameter dict into a ``Budget`` and the remaining solver parameters."""
+    budget = Budget(**{key: params.get(key) for key in Budget.FIELDS})
+    return budget, {key: value for key, value in params.items() if key not in Budget.FIELDS}
@@ -0,0 +1,99 @@
+"""
+Shared incumbent
+
+Channel between solvers running at the same time on one instance:
+
+    makespan       best makespan any of them found (``offer``)
+    schedule       best schedule offered along with a makespan (``best_schedule``)
+    lower_bound    best proven lower bound (``raise_lower_bound``)
+
+Metaheuristics offer every new best schedule; a branch & bound reads the
+makespan at its checkpoints and prunes every subtree that cannot beat it,
+and when it finishes it takes over the offered schedule if that is better
+than its own. In the other direction, the branch & bound publishes the bounds
+it proves, so everyone can stop once the makespan meets the lower bound.
+
+Created from a ``multiprocessing.Manager`` the incumbent can be passed to
+worker processes (its values and lock are manager proxies); without a manager
+it works between threads of one process.
+
+    with multiprocessing.Manager() as manager:
+        incumbent = SharedIncumbent(manager)
+        pool.submit(worker, ..., incumbent)
+"""
+
+import os
+import sys
+import threading
+from types import SimpleNamespace
+from typing import Optional
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+
+from src.helperFunctions.schedule import Schedule
+
+
+class SharedIncumbent:
+    """
+    Attributes:
+        makespan: Best makespan offered so far (``inf`` before the first offer)
+        lower_bound: Best lower bound proven so far (0 before the first one)
+    """
+
+    def __init__(self, manager=None):
+        if manager is None:
+            self._makespan = SimpleNamespace(value=float('inf'))
+            self._lower_bound = SimpleNamespace(value=0.0)
+            self._schedule = {}
+            self._lock = threading.Lock()
+        else:
+            self._makespan = manager.Value('d', float('inf'))
+            self._lower_bound = manager.Value('d', 0.0)
+            self._schedule = manager.dict()
+            self._lock = manager.Lock()
+
+    @property
+    def makespan(self) -> float:
+        return self._makespan.value
+
+    @property
+    def lower_bound(self) -> float:
+        return self._lower_bound.value
+
+    @property
+    def solved(self) -> bool:
+        """True once the best makespan is proven optimal."""
+        return self.makespan <= self.lower_bound
+
+    def offer(self, makespan, schedule: Optional[Schedule] = None) -> bool:
+        """Publish a makespan, and the schedule behind it if there is one; returns True if it is a new best."""
+        if makespan is None or makespan >= self._makespan.value:
+            return False
+        rows = list(schedule.rows()) if schedule is not None else None
+        with self._lock:
+            if makespan >= self._makespan.value:
+                return False
+            self._makespan.value = makespan
+            if rows is not None:
+                self._schedule['best'] = (makespan, rows)
+        return True
+
+    def best_schedule(self) -> Optional[Schedule]:
+        """Best schedule offered (its makespan may trail ``makespan`` if better ones came without a schedule)."""
+        best = self._schedule.get('best')
+        if best is None:
+            return None
+        schedule = Schedule()
+        for row in best[1]:
+            schedule.add(*row)
+        return schedule
+
+    def raise_lower_bound(self, lower_bound) -> bool:
+        """Publish a proven lower bound; returns True if it is better than the known one."""
+        if lower_bound is None or lower_bound <= self._lower_bound.value:
+            return False
+        with self._lock:
+            if lower_bound <= self._lower_bound.value:
+                return False
+            self._lower_bound.value = lower_bound
+        return True
@@ -0,0 +1,199 @@
+"""
+Common solver interface
+
+Every scheduling algorithm is exposed through the ``Solver`` protocol so the
+GUI, the batch CLI and the service can run any of them the same way:
+
+    result = get_solver('cultural').solve(problem_data, Budget(time_limit=10), on_progress=print)
+
+Solvers receive a ``Budget`` (time, node and generation limits), an optional
+``CancellationToken`` checked cooperatively, report typed ``ProgressEvent``s,
+and return a uniform ``SolveResult``.
+
+``problem_data`` is the ``read_dataset`` dict. Sub-problems built by
+decomposition solvers may add ``job_release`` (job_id -> earliest start of the
+job's first task) and ``machine_release`` (time each 0-based machine becomes
+free); solvers that ignore them are re-timed with ``adapt_schedule``.
+"""
+
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass, field, asdict
+from typing import Any, Callable, Dict, List, Optional, Protocol, Tuple, runtime_checkable
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+
+from src.helperFunctions.schedule import Schedule
+from src.helperFunctions.scheduleValidator import check_schedule
+
+
+# Result statuses
+OPTIMAL = 'optimal'          # search completed, schedule proven optimal
+FEASIBLE = 'feasible'        # best schedule found within the budget
+NO_SOLUTION = 'no_solution'  # budget ran out before any schedule was found
+CANCELLED = 'cancelled'      # stopped by a cancellation token (best schedule so far, if any)
+
+# Set (to anything non-empty) to validate every solver result against its instance
+VALIDATE_ENV = 'JOBSCHEDULE_VALIDATE'
+
+
+@dataclass
+class Budget:
+    """Resource limits for one solve; ``None`` means unlimited."""
+    time_limit: Optional[float] = None
+    node_limit: Optional[int] = None
+    generation_limit: Optional[int] = None
+
+    # Budget fields accepted as solver parameters, with their types
+    FIELDS = {'time_limit': float, 'node_limit': int, 'generation_limit': int}
+
+    def time_exceeded(self, start_time):
+        return self.time_limit is not None and (time.time() - start_time) > self.time_limit
+
+    def remaining_time(self, start_time):
+        if self.time_limit is None:
+            return None
+        return max(0.0, self.time_limit - (time.time() - start_time))
+
+
+class CancellationToken:
+    """
+    Cooperative cancellation flag shared between a caller and a running solver.
+    Wraps a ``threading.Event`` by default; pass a ``multiprocessing.Event`` to
+    cancel a solver running in another process.
+    """
+
+    def __init__(self, event=None):
+        self._event = event if event is not None else threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+
+@dataclass(frozen=True)
+class ProgressEvent:
+    """
+    One progress notification from a running solver.
+
+    Attributes:
+        solver: Registry name of the solver
+        kind: 'started', 'progress', 'incumbent', 'metrics' (see liveMetrics) or 'finished'
+        step: Nodes visited (search) or generations completed (population)
+        elapsed: Seconds since the solve started
+        best_makespan: Makespan of the best schedule so far, if any
+        objective: The solver's own objective for its best solution
+            (makespan for searches, fitness for the cultural algorithm)
+        info: Solver-specific extras
+    """
+    solver: str
+    kind: str
+    step: int
+    elapsed: float
+    best_makespan: Optional[int] = None
+    objective: Optional[float] = None
+    info: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self):
+        return asdict(self)
+
+
+@dataclass
+class SolveResult:
+    """
+    Uniform result of ``Solver.solve``.
+
+    Attributes:
+        schedule: The best schedule found (empty if none)
+        metrics: Numeric makespan, idle_time and utilization (percent)
+        history: (step, objective) pairs recorded while solving
+        stats: Solver-specific statistics (pruned nodes, fitness, lower bound, ...)
+    """
+    solver: str
+    status: str
+    schedule: Schedule
+    makespan: Optional[int]
+    metrics: Dict[str, Any]
+    wall_time: float
+    nodes: Optional[int] = None
+    generations: Optional[int] = None
+    history: List[Tuple[int, Any]] = field(default_factory=list)
+    stats: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def timeline(self):
+        """Legacy view: machine (1-based) -> list of {(job_id, task_id): (start, duration)}."""
+        return self.schedule.cultural_view()
+
+    def to_record(self):
+        """Flat JSON-friendly summary (without the schedule itself)."""
+        record = {'solver': self.solver, 'status': self.status, 'wall_time': round(self.wall_time, 4)}
+        record.update(self.metrics)
+        record.update({'nodes': self.nodes, 'generations': self.generations})
+        record.update(self.stats)
+        return record
+
+
+@runtime_checkable
+class Solver(Protocol):
+    """
+    Protocol implemented by every registered solver.
+
+    Attributes:
+        name: Registry key (e.g. 'backtracking')
+        display_name: Human readable name for front-ends
+        description: One paragraph describing the algorithm
+        features: Short bullet points shown by the GUI
+        progress_unit: What ``ProgressEvent.step`` counts ('node' or 'generation')
+        objective_name: Label of ``ProgressEvent.objective``
+        default_budget: Budget used when the caller does not pass one
+        default_params: Extra solver parameters with their (typed) defaults
+
+    Every solver also accepts ``warm_start``: a schedule of this or a slightly
+    different version of the instance to start from (see warmStart.py).
+    """
+    name: str
+    display_name: str
+    description: str
+    features: Tuple[str, ...]
+    progress_unit: str
+    objective_name: str
+    default_budget: Budget
+    default_params: Dict[str, Any]
+
+    def solve(self, problem_data, budget: Optional[Budget] = None, cancel: Optional[CancellationToken] = None,
+              on_progress: Optional[Callable[[ProgressEvent], None]] = None, **params) -> SolveResult:
+        ...
+
+
+def debug_validate(result: SolveResult, problem_data):
+    """
+    Debug mode: with ``JOBSCHEDULE_VALIDATE`` set, check a result's schedule before it is returned.
+
+    Raises:
+        ScheduleValidationError: If the schedule is infeasible
+    """
+    if os.environ.get(VALIDATE_ENV) and len(result.schedule):
+        check_schedule(result.schedule, problem_data)
+    return result
+
+
+def to_cultural_timeline(timeline):
+    """Convert a backtracking timeline (0-based machine -> task dicts) to the 1-based cultural format."""
+    converted_timeline = {}
+    for machine, tasks in timeline.items():
+        converted_timeline[machine + 1] = [
+            {(task['job_id'], task['task_id']): (task['start_time'], task['execution_time'])}
+            for task in sorted(tasks, key=lambda t: t['start_time'])
+        ]
+    return converted_timeline
+
+
+def timeline_metrics(timeline, machines_count):
+    """Scalar metrics of a cultural-format timeline (see ``src.helperFunctions.scheduleMetrics``)."""
+    return Schedule.from_cultural(timeline).metrics(machines_count)
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Tabu Search
+
+Local search over machine sequences (see machineSequences.py), starting from
+the fast list schedule. Each iteration looks only at tasks on a longest path,
+since nothing else can shorten the makespan:
+
+    reassign   a critical task moves to another machine, inserted where its
+               job predecessor ends
+    swap       a critical task changes places with its machine successor,
+               when the successor starts right as it ends (a critical arc)
+
+Every candidate is estimated in O(1) from heads and tails (the insertion
+point is found in O(log n)); the best estimate is applied with
+``apply_reassign`` / ``apply_swap``, which update only the heads and tails
+the move changes. Even a move that makes the schedule worse is taken
+when it is the best one, which is how the search leaves local optima.
+
+To keep it from undoing its own moves, a moved task may not return to its
+old machine, and a swapped pair may not be swapped back, for ``tabu_tenure``
+iterations. A tabu move is still allowed when its estimate beats the best
+makespan found so far (aspiration). After a long run without improvement
+the search restarts from the best schedule.
+"""
+
+import os
+import random
+import sys
+import time
+from typing import Optional
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+
+from src.helperFunctions.machineSequences import MachineSequences
+from src.helperFunctions.warmStart import adapt_schedule
+from src.lns.lns import initial_schedule
+from src.solvers.liveMetrics import LiveMetrics, DEFAULT_METRICS_INTERVAL
+from src.solvers.registry import register_solver
+from src.solvers.solver import Budget, ProgressEvent, SolveResult, debug_validate, OPTIMAL, FEASIBLE, CANCELLED
+
+
+DEFAULT_TABU_TENURE = 10
+# Critical tasks examined per iteration (a random sample when there are more)
+MAX_CRITICAL_TASKS = 64
+# Iterations without a new best before going back to the best schedule
+STALL_LIMIT = 300
+
+
+def _neighbourhood(sequences, critical, critical_set):
+    """Yield (estimate, move) for every reassign and swap move of the critical tasks."""
+    machines_count = sequences.machines_count
+    heads = sequences.heads
+    for v in critical:
+        current = sequences.machine[v]
+        for machine in range(machines_count):
+            if machine != current:
+                k = sequences.insertion_point(v, machine)
+                yield sequences.estimate_reassign(v, machine, k), ('reassign', v, machine, k)
+        w = sequences.machine_succ(v)
+        if w in critical_set and heads[w] == sequences.end(v) and sequences.job_pred[w] != v:
+            yield sequences.estimate_swap(v, w), ('swap', v, w)
+
+
+def tabu_search(problem_data, budget: Budget, tabu_tenure: int = DEFAULT_TABU_TENURE, seed: Optional[int] = None,
+                warm_start=None, cancel=None, on_improvement=None):
+    """
+    Run tabu search until the budget (time_limit and/or generation_limit, counted in iterations) runs out,
+    or the schedule reaches the trivial lower bound.
+
+    Args:
+        tabu_tenure: Iterations a move's reversal stays forbidden
+        on_improvement: Optional callback(iteration, schedule) for every new best schedule
+
+    Returns:
+        tuple: (best schedule, iterations, statistics dict)
+    """
+    start_time = time.time()
+    rng = random.Random(seed)
+    initial = adapt_schedule(warm_start, problem_data) if warm_start is not None else initial_schedule(problem_data)
+    sequences = MachineSequences(problem_data, initial)
+    lower_bound = sequences.lower_bound()
+    best = sequences.snapshot()
+    best_makespan = initial_makespan = sequences.makespan
+    if on_improvement:
+        on_improvement(0, sequences.to_schedule())
+
+    tabu_machine = {}  # (task, machine) -> last iteration the task may not move back there
+    tabu_swap = {}  # (task, task) -> last iteration the pair may not be swapped again
+    iterations = stall = restarts = aspirations = 0
+    while best_makespan > lower_bound:
+        if budget.time_exceeded(start_time) or (cancel is not None and cancel.cancelled):
+            break
+        if budget.generation_limit is not None and iterations >= budget.generation_limit:
+            break
+        iterations += 1
+
+        critical = sequences.critical_tasks()
+        critical_set = set(critical)
+        if len(critical) > MAX_CRITICAL_TASKS:
+            critical = rng.sample(critical, MAX_CRITICAL_TASKS)
+        chosen = None
+        chosen_key = None
+        chosen_aspiration = False
+        has_moves = False
+        for estimate, move in _neighbourhood(sequences, critical, critical_set):
+            has_moves = True
+            if move[0] == 'reassign':
+                tabu = tabu_machine.get((move[1], move[2]), 0) >= iterations
+            else:
+                tabu = tabu_swap.get((min(move[1], move[2]), max(move[1], move[2])), 0) >= iterations
+            if tabu and estimate >= best_makespan:
+                continue
+            key = (estimate, rng.random())  # random tie-breaking
+            if chosen is None or key < chosen_key:
+                chosen, chosen_key, chosen_aspiration = move, key, tabu
+        if not has_moves:
+            break  # Nothing on the critical path can move (e.g. a single machine)
+        if chosen is None:
+            # Every move is tabu: forget them rather than stall
+            tabu_machine.clear()
+            tabu_swap.clear()
+            continue
+
+        # Applied with incremental head and tail updates; a move that would create a cycle (only possible with
+        # zero-length tasks) is undone with a full evaluation and skipped
+        if chosen[0] == 'reassign':
+            _, v, machine, k = chosen
+            undo = sequences.apply_reassign(v, machine, k)
+            if undo is None:
+                continue
+            tabu_machine[(v, undo[0])] = iterations + tabu_tenure
+        else:
+            _, u, v = chosen
+            if not sequences.apply_swap(u, v):
+                continue
+            tabu_swap[(min(u, v), max(u, v))] = iterations + tabu_tenure
+        aspirations += chosen_aspiration
+
+        if sequences.makespan < best_makespan:
+            best = sequences.snapshot()
+            best_makespan = sequences.makespan
+            stall = 0
+            if on_improvement:
+                on_improvement(iterations, sequences.to_schedule())
+        else:
+            stall += 1
+            if stall >= STALL_LIMIT:
+                sequences.restore(best)
+                tabu_machine.clear()
+                tabu_swap.clear()
+                stall = 0
+                restarts += 1
+
+    sequences.restore(best)
+    stats = {'initial_makespan': initial_makespan, 'lower_bound': lower_bound, 'restarts': restarts,
+             'aspirations': aspirations}
+    return sequences.to_schedule(), iterations, stats
+
+
+@register_solver
+class TabuSearchSolver:
+    """Tabu search over critical-path moves, exposed through the common Solver interface."""
+    name = 'tabu'
+    display_name = 'Tabu Search'
+    description = ("Starts from a fast greedy schedule and keeps moving tasks on the critical path to another "
+                   "machine or past their machine neighbour, remembering recent moves so it does not undo them.")
+    features = ('Fast on any instance size', 'Near-optimal schedules', 'Escapes local optima')
+    progress_unit = 'iteration'
+    objective_name = 'Best Makespan'
+    default_budget = Budget(time_limit=10.0)
+    default_params = {'tabu_tenure': DEFAULT_TABU_TENURE, 'seed': 0, 'metrics_interval': DEFAULT_METRICS_INTERVAL}
+
+    def solve(self, problem_data, budget=None, cancel=None, on_progress=None, tabu_tenure=DEFAULT_TABU_TENURE,
+              seed=0, metrics_interval=DEFAULT_METRICS_INTERVAL, warm_start=None, incumbent=None):
+        budget = budget or self.default_budget
+        start_time = time.time()
+        live = LiveMetrics(self.name, problem_data, on_progress, metrics_interval)
+        history = []
+
+        def on_improvement(iteration, schedule):
+            history.append((iteration, schedule.makespan))
+            if incumbent is not None:
+                incumbent.offer(schedule.makespan, schedule)
+            if on_progress:
+                elapsed = time.time() - start_time
+                on_progress(ProgressEvent(self.name, 'progress', iteration, elapsed, schedule.makespan,
+                                          schedule.makespan))
+                live.update(schedule.makespan)
+                live.publish(iteration, elapsed)
+
+        schedule, iterations, stats = tabu_search(problem_data, budget, tabu_tenure, seed, warm_start, cancel,
+                                                  on_improvement)
+
+        if cancel is not None and cancel.cancelled:
+            status = CANCELLED
+        else:
+            # Reaching the lower bound proves the schedule optimal
+            status = OPTIMAL if schedule.makespan <= stats['lower_bound'] else FEASIBLE
+
+        result = SolveResult(
+            solver=self.name,
+            status=status,
+            schedule=schedule,
+            makespan=schedule.makespan,
+            metrics=schedule.metrics(problem_data['machines_count']),
+            wall_time=time.time() - start_time,
+            generations=iterations,
+            history=history,
+            stats=stats,
+        )
+        debug_validate(result, problem_data)
+        live.update(result.makespan)
+        live.flush(iterations, result.wall_time)
+        if on_progress:
+            on_progress(ProgressEvent(self.name, 'finished', iterations, result.wall_time,
+                                      result.makespan, result.makespan))
+        return result
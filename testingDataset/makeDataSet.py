@@ -10,16 +10,199 @@ Generates 3 CSV files with different sizes:
 Each dataset contains:
 - Number of machines
 - Jobs with execution times and optional dependencies (uncommon)
+
+Custom instances of any size (up to millions of tasks) are streamed to disk
+in batches instead of being built as dicts:
+
+    python makeDataSet.py --seed 1
+    python makeDataSet.py --jobs 100000 --tasks 2-18 --machines 64 --distribution lognormal \
+        --seed 7 -o big.csv
+    python makeDataSet.py --jobs 500 --tasks 10 --machines 20 --count 32 --workers 8 -o runs/inst.csv
+
+Draws are batched through NumPy when it is installed and through the random
+module otherwise; a seed reproduces the same file for the same backend.
 """
 
 import csv
+import math
 import random
 import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Dict, Tuple
 
+try:
+    import numpy as np
+except ImportError:  # optional: batched draws fall back to the random module
+    np = None
+
+
+# Datasets live next to this script
+DATASETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'datasets')
+
+DISTRIBUTIONS = ('uniform', 'normal', 'exponential', 'lognormal')
+
+# Tasks drawn and written per batch when streaming an instance
+DEFAULT_BATCH_SIZE = 65536
+
+CSV_FIELDS = ['job_id', 'task_id', 'execution_time', 'machines_count']
+
+
+class DurationSampler:
+    """
+    Seeded source of integer task durations and task counts, drawn in batches.
+
+    Durations follow ``distribution`` and are clipped to [min_time, max_time]:
+        uniform      every integer in the range equally likely
+        normal       mean/std (defaults: range midpoint, range / 6)
+        exponential  min_time plus an exponential tail with the given mean
+        lognormal    right-skewed with the given mean/std
+    """
+
+    def __init__(self, distribution='uniform', min_time=5, max_time=60, mean=None, std=None,
+                 seed=None, use_numpy=True):
+        if distribution not in DISTRIBUTIONS:
+            raise ValueError(f"Distribution must be one of {list(DISTRIBUTIONS)}, got '{distribution}'")
+        if not 0 < min_time <= max_time:
+            raise ValueError(f"Execution times need 0 < min_time <= max_time, got {min_time}-{max_time}")
+
+        self.distribution = distribution
+        self.min_time = min_time
+        self.max_time = max_time
+        self.mean = mean if mean is not None else (min_time + max_time) / 2
+        self.std = std if std is not None else (max_time - min_time) / 6
+        if self.mean <= 0 or self.std < 0 or (distribution == 'exponential' and self.mean <= min_time):
+            raise ValueError(f"Invalid mean/std {self.mean}/{self.std} for a {distribution} distribution")
+
+        # Log-space parameters giving the requested mean/std
+        self.sigma = math.sqrt(math.log(1 + (self.std / self.mean) ** 2))
+        self.mu = math.log(self.mean) - self.sigma ** 2 / 2
+
+        self.use_numpy = use_numpy and np is not None
+        if self.use_numpy:
+            self.np_rng = np.random.default_rng(seed)
+        else:
+            self.rng = random.Random(seed)
+
+    def draw(self, n: int) -> List[int]:
+        """Draw ``n`` durations."""
+        if self.use_numpy:
+            rng = self.np_rng
+            if self.distribution == 'uniform':
+                return rng.integers(self.min_time, self.max_time + 1, n).tolist()
+            if self.distribution == 'normal':
+                values = rng.normal(self.mean, self.std, n)
+            elif self.distribution == 'exponential':
+                values = self.min_time + rng.exponential(self.mean - self.min_time, n)
+            else:
+                values = rng.lognormal(self.mu, self.sigma, n)
+            return np.clip(np.rint(values), self.min_time, self.max_time).astype(np.int64).tolist()
+
+        rng = self.rng
+        if self.distribution == 'uniform':
+            return [rng.randint(self.min_time, self.max_time) for _ in range(n)]
+        if self.distribution == 'normal':
+            values = (rng.gauss(self.mean, self.std) for _ in range(n))
+        elif self.distribution == 'exponential':
+            rate = 1 / (self.mean - self.min_time)
+            values = (self.min_time + rng.expovariate(rate) for _ in range(n))
+        else:
+            values = (rng.lognormvariate(self.mu, self.sigma) for _ in range(n))
+        return [min(self.max_time, max(self.min_time, round(value))) for value in values]
+
+    def counts(self, low: int, high: int, n: int) -> List[int]:
+        """Draw ``n`` integers uniformly from [low, high] (tasks per job)."""
+        if self.use_numpy:
+            return self.np_rng.integers(low, high + 1, n).tolist()
+        return [self.rng.randint(low, high) for _ in range(n)]
+
+
+def write_instance(path: str, jobs: int, tasks_per_job: Tuple[int, int], machines: int,
+                   sampler: DurationSampler, batch_size: int = DEFAULT_BATCH_SIZE) -> Dict:
+    """
+    Stream one instance to a CSV file in the ``read_dataset`` schema.
+
+    Only one batch of jobs is held in memory at a time, so the size of the
+    instance is bounded by disk, not RAM.
+
+    Args:
+        path: Output CSV path (parent directories are created)
+        jobs: Number of jobs
+        tasks_per_job: (low, high) inclusive range of tasks per job
+        machines: Number of machines
+        sampler: Source of durations and task counts
+        batch_size: Approximate number of tasks drawn and written per batch
+
+    Returns:
+        Dict: path, jobs, tasks, machines and total_work of the written instance
+    """
+    low, high = tasks_per_job
+    jobs_per_batch = max(1, batch_size // high)
+    total_tasks = 0
+    total_work = 0
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(CSV_FIELDS)
+
+        for first_job in range(1, jobs + 1, jobs_per_batch):
+            batch_jobs = min(jobs_per_batch, jobs - first_job + 1)
+            counts = sampler.counts(low, high, batch_jobs)
+            durations = sampler.draw(sum(counts))
+
+            rows = []
+            position = 0
+            for offset, count in enumerate(counts):
+                job_id = first_job + offset
+                for task_id in range(1, count + 1):
+                    rows.append((job_id, task_id, durations[position], machines))
+                    position += 1
+            writer.writerows(rows)
+
+            total_tasks += len(durations)
+            total_work += sum(durations)
+
+    return {'path': path, 'jobs': jobs, 'tasks': total_tasks, 'machines': machines, 'total_work': total_work}
+
+
+def _write_instance_job(job):
+    """Process pool entry point: build a sampler from plain arguments and write one instance."""
+    path, jobs, tasks_per_job, machines, sampler_kwargs, batch_size = job
+    return write_instance(path, jobs, tasks_per_job, machines, DurationSampler(**sampler_kwargs), batch_size)
+
+
+def generate_instances(path: str, jobs: int, tasks_per_job: Tuple[int, int], machines: int, count: int = 1,
+                       workers: int = 1, seed=None, batch_size: int = DEFAULT_BATCH_SIZE, **sampler_kwargs):
+    """
+    Write ``count`` instances, in parallel when ``workers`` > 1.
+
+    With count > 1 the files are ``<stem>_<i><ext>`` and instance ``i`` uses
+    seed ``seed + i``, so any single file can be regenerated on its own.
+
+    Yields:
+        Dict: Summary of each written instance, in completion order
+    """
+    stem, ext = os.path.splitext(path)
+    width = len(str(count - 1))
+    instance_jobs = []
+    for i in range(count):
+        instance_path = path if count == 1 else f"{stem}_{i:0{width}d}{ext or '.csv'}"
+        instance_seed = None if seed is None else seed + i
+        instance_jobs.append((instance_path, jobs, tasks_per_job, machines,
+                              dict(sampler_kwargs, seed=instance_seed), batch_size))
+
+    if workers <= 1 or count == 1:
+        for job in instance_jobs:
+            yield _write_instance_job(job)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(_write_instance_job, instance_jobs)
+
 
 class JobScheduleDatasetGenerator:
-    def __init__(self):
+    def __init__(self, output_dir=DATASETS_DIR, seed=None):
         # Dataset configurations with ranges
         self.datasets = {
             'small': {
@@ -46,13 +229,16 @@ class JobScheduleDatasetGenerator:
         self.min_execution_time = 5
         self.max_execution_time = 60
         
+        # Seeded generator so tiers can be reproduced
+        self.rng = random.Random(seed)
+
         # Ensure output directory exists
-        self.output_dir = r'D:\code\python\mlAiDs\Aiproject\testingDataset\datasets'
+        self.output_dir = output_dir
         os.makedirs(self.output_dir, exist_ok=True)
     
     def generate_task_execution_time(self) -> int:
         """Generate a random execution time for a task."""
-        return random.randint(self.min_execution_time, self.max_execution_time)
+        return self.rng.randint(self.min_execution_time, self.max_execution_time)
     
 
     
@@ -62,12 +248,12 @@ class JobScheduleDatasetGenerator:
         tasks = []  # All tasks (flattened from all jobs)
         
         # Generate random counts within specified ranges
-        machines_count = random.randint(*config['machines_range'])
-        jobs_count = random.randint(*config['jobs_range'])
+        machines_count = self.rng.randint(*config['machines_range'])
+        jobs_count = self.rng.randint(*config['jobs_range'])
         
         for job_id in range(1, jobs_count + 1):
             # Generate number of tasks for this job
-            tasks_in_job = random.randint(*config['tasks_per_job_range'])
+            tasks_in_job = self.rng.randint(*config['tasks_per_job_range'])
             
             # Generate tasks for this job (task_id starts from 1 for each job)
             for task_id in range(1, tasks_in_job + 1):
@@ -143,11 +329,66 @@ class JobScheduleDatasetGenerator:
             f.write("- Jobs are independent of each other\n")
         
 
-def main():
-    """Main function to generate all datasets."""
-    generator = JobScheduleDatasetGenerator()
-    generator.generate_all_datasets()
+def _parse_range(value: str) -> Tuple[int, int]:
+    """'8' -> (8, 8), '2-10' -> (2, 10)."""
+    low, _, high = value.partition('-')
+    low, high = int(low), int(high or low)
+    if not 0 < low <= high:
+        raise ValueError(f"Invalid range '{value}'")
+    return low, high
+
+
+def main(argv=None):
+    """Generate the three tiers, or custom instances when --jobs is given."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Generate job scheduling datasets.')
+    parser.add_argument('--seed', type=int, default=None, help='random seed (default: unseeded)')
+    parser.add_argument('--output-dir', default=DATASETS_DIR, help='directory for the tier datasets')
+    custom = parser.add_argument_group('custom instances')
+    custom.add_argument('--jobs', type=int, default=None, help='number of jobs (enables custom mode)')
+    custom.add_argument('--tasks', default='2-10', help='tasks per job, N or LOW-HIGH (default: %(default)s)')
+    custom.add_argument('--machines', type=int, default=10, help='number of machines (default: %(default)s)')
+    custom.add_argument('--distribution', choices=DISTRIBUTIONS, default='uniform',
+                        help='task execution time distribution (default: %(default)s)')
+    custom.add_argument('--min-time', type=int, default=5, help='shortest execution time (default: %(default)s)')
+    custom.add_argument('--max-time', type=int, default=60, help='longest execution time (default: %(default)s)')
+    custom.add_argument('--mean', type=float, default=None, help='mean execution time (non-uniform distributions)')
+    custom.add_argument('--std', type=float, default=None, help='execution time spread (normal, lognormal)')
+    custom.add_argument('-o', '--output', default=None,
+                        help='output CSV (default: <output-dir>/generated_<jobs>x<tasks>x<machines>.csv)')
+    custom.add_argument('--count', type=int, default=1, help='number of instances, seeded seed+i (default: 1)')
+    custom.add_argument('-w', '--workers', type=int, default=1, help='parallel writer processes (default: 1)')
+    custom.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                        help='tasks drawn and written per batch (default: %(default)s)')
+    custom.add_argument('--no-numpy', dest='use_numpy', action='store_false',
+                        help='draw with the random module even if NumPy is installed')
+    args = parser.parse_args(argv)
+
+    if args.jobs is None:
+        generator = JobScheduleDatasetGenerator(args.output_dir, args.seed)
+        generator.generate_all_datasets()
+        return 0
+
+    try:
+        tasks_per_job = _parse_range(args.tasks)
+        if args.jobs < 1 or args.machines < 1 or args.count < 1:
+            raise ValueError('--jobs, --machines and --count must be positive')
+        # Validate the distribution before starting any workers
+        DurationSampler(args.distribution, args.min_time, args.max_time, args.mean, args.std)
+    except ValueError as e:
+        parser.error(str(e))
+
+    output = args.output or os.path.join(args.output_dir, f'generated_{args.jobs}x{args.tasks}x{args.machines}.csv')
+    for summary in generate_instances(output, args.jobs, tasks_per_job, args.machines, count=args.count,
+                                      workers=args.workers, seed=args.seed, batch_size=args.batch_size,
+                                      distribution=args.distribution, min_time=args.min_time,
+                                      max_time=args.max_time, mean=args.mean, std=args.std,
+                                      use_numpy=args.use_numpy):
+        print(f"Wrote {summary['path']}: {summary['jobs']} jobs, {summary['tasks']} tasks, "
+              f"{summary['machines']} machines, total work {summary['total_work']}")
+    return 0
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,4 @@
+import os
+
+# Importing the solvers reads the bundled datasets; keep the suite out of the user's dataset cache
+os.environ.setdefault('JOBSCHEDULE_DATASET_CACHE', 'off')
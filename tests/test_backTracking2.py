@@ -0,0 +1,89 @@
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.backTracking.backTracking2 import backTracking2, BranchAndBoundSolver, BEAM, BEST_FIRST, SEARCH_MODES
+from src.backTracking.searchHooks import SearchMonitor
+from src.helperFunctions.schedule import Schedule
+from src.helperFunctions.scheduleValidator import validate_schedule
+from src.solvers.solver import Budget, OPTIMAL
+
+
+def random_problem(seed, jobs=3, machines=2, max_tasks=3):
+    rng = random.Random(seed)
+    job_list = [{'job_id': job_id, 'tasks': [{'task_id': task_id, 'execution_time': rng.randint(1, 9)}
+                                             for task_id in range(1, rng.randint(1, max_tasks) + 1)]}
+                for job_id in range(1, jobs + 1)]
+    return {'machines_count': machines, 'jobs': job_list,
+            'total_tasks': sum(len(job['tasks']) for job in job_list), 'total_jobs': jobs}
+
+
+# Instances that take every mode many expansions; in the first four the root bound is below the optimum
+@pytest.mark.parametrize('seed, jobs, machines', [(0, 3, 2), (3, 3, 2), (11, 3, 2), (14, 3, 2), (2, 4, 3), (4, 4, 2)])
+def test_search_modes_agree_on_the_optimum(seed, jobs, machines, capsys):
+    problem = random_problem(seed, jobs=jobs, machines=machines)
+    makespans = {}
+    for mode in SEARCH_MODES:
+        result = BranchAndBoundSolver().solve(problem, budget=Budget(time_limit=30), mode=mode)
+        assert result.status == OPTIMAL, mode
+        assert validate_schedule(result.schedule, problem).valid, mode
+        makespans[mode] = result.makespan
+    # Past its memory cap best-first search goes depth-first; beam search from width 1 has to widen
+    makespans['best_first capped'] = BranchAndBoundSolver().solve(problem, budget=Budget(time_limit=30),
+                                                                mode=BEST_FIRST, max_open_nodes=2).makespan
+    makespans['beam width 1'] = BranchAndBoundSolver().solve(problem, budget=Budget(time_limit=30),
+                                                           mode=BEAM, beam_width=1).makespan
+    assert len(set(makespans.values())) == 1, makespans
+
+
+def search_over(problem, job_release=None, machine_release=None):
+    bt = backTracking2()
+    bt.machines_count = problem['machines_count']
+    bt.jobs = problem['jobs']
+    bt.total_jobs = problem['total_jobs']
+    bt.total_tasks = problem['total_tasks']
+    bt.job_next_task = [0] * bt.total_jobs
+    bt.job_release = job_release or {}
+    bt.machine_release = machine_release or [0] * bt.machines_count
+    bt.monitor = SearchMonitor(bt)
+    return bt
+
+
+@pytest.mark.parametrize('seed', range(6))
+def test_incremental_child_bounds_match_full_recomputation(seed, capsys):
+    rng = random.Random(seed)
+    problem = random_problem(seed, jobs=3, machines=3)
+    job_release = {job['job_id']: rng.randint(0, 6) for job in problem['jobs']} if seed % 2 else None
+    machine_release = [rng.randint(0, 6) for _ in range(3)] if seed % 2 else None
+    bt = search_over(problem, job_release, machine_release)
+
+    # Expand every child the search keeps, down to complete schedules
+    stack = [bt._compact_root()]
+    checked = 0
+    while stack:
+        node = stack.pop()
+        for child in bt._compact_children(node):
+            lower_bound, _, _, progress, machine_ready, job_ready, _ = child
+            assert lower_bound == bt._compact_lower_bound(progress, machine_ready, job_ready)
+            checked += 1
+            stack.append(child)
+    assert checked > 0
+
+
+def test_default_machine_release_follows_the_final_machine_count(capsys):
+    # The constructor runs before machines_count is set; more machines than its default instance must work
+    problem = random_problem(5, jobs=4, machines=6)
+    bt = backTracking2()
+    bt.machines_count = problem['machines_count']
+    bt.jobs = problem['jobs']
+    bt.total_jobs = problem['total_jobs']
+    bt.total_tasks = problem['total_tasks']
+    bt.job_next_task = [0] * bt.total_jobs
+    assert bt.schedule_tasks(time_limit=10)
+    assert bt.machine_release == [0] * 6
+    schedule = Schedule.from_backtracking(bt.best_timeline)
+    assert validate_schedule(schedule, problem).valid
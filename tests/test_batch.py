@@ -0,0 +1,62 @@
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.batch.batch import parse_solver_spec
+from src.portfolio.portfolio import parse_members
+
+
+def test_parse_solver_spec_fills_defaults():
+    name, params = parse_solver_spec('backtracking2:time_limit=30')
+    assert name == 'backtracking2'
+    assert params['time_limit'] == 30.0
+    assert params['mode'] == 'dfs'
+
+
+def test_parse_solver_spec_multi_member_portfolio():
+    name, params = parse_solver_spec('portfolio:members=tabu+annealing:seed=1,chains=2,time_limit=5')
+    assert name == 'portfolio'
+    assert params['members'] == 'tabu+annealing:seed=1,chains=2'
+    assert params['time_limit'] == 5.0
+
+    members = parse_members(params['members'])
+    assert [(name, overrides) for _, name, overrides in members] == [
+        ('tabu', {}),
+        ('annealing', {'seed': '1', 'chains': '2'}),
+    ]
+
+
+def test_parse_solver_spec_bracketed_members_keep_their_budget():
+    # Unbracketed, the member's time_limit would be taken for the portfolio's
+    name, params = parse_solver_spec('portfolio:members=[tabu:seed=1,time_limit=2+annealing],time_limit=5')
+    assert params['members'] == 'tabu:seed=1,time_limit=2+annealing'
+    assert params['time_limit'] == 5.0
+
+    members = parse_members(params['members'])
+    assert [(name, overrides) for _, name, overrides in members] == [
+        ('tabu', {'seed': '1', 'time_limit': '2'}),
+        ('annealing', {}),
+    ]
+
+
+def test_parse_solver_spec_unbalanced_brackets():
+    with pytest.raises(ValueError, match='Unbalanced'):
+        parse_solver_spec('portfolio:members=[tabu:seed=1,time_limit=2')
+
+
+def test_parse_solver_spec_rejects_unknown_parameter():
+    with pytest.raises(ValueError):
+        parse_solver_spec('backtracking2:time_limit=30,bogus=1')
+    _, params = parse_solver_spec('portfolio:members=tabu+annealing:bogus=1')
+    with pytest.raises(ValueError):
+        parse_members(params['members'])
+
+
+def test_parse_solver_spec_hybrid_partners():
+    name, params = parse_solver_spec('hybrid:partners=tabu+annealing:seed=3,time_limit=5')
+    assert name == 'hybrid'
+    assert params['partners'] == 'tabu+annealing:seed=3'
+    assert params['time_limit'] == 5.0
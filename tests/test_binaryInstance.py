@@ -0,0 +1,77 @@
+import os
+import sys
+from array import array
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.helperFunctions.binaryInstance import HEADER_SIZE, read_binary, write_binary, write_csv
+from src.helperFunctions.instance import Instance, INT_TYPECODE
+from src.helperFunctions.readFromCSV import read_instance
+
+
+CSV = 'job_id,task_id,execution_time,machines_count\n1,1,5,3\n1,2,7,3\n2,1,3,3\n4,1,0,3\n4,2,9,3\n'
+
+
+def make_instance(job_ids, job_offsets, durations, machines_count=2):
+    return Instance(machines_count, array(INT_TYPECODE, job_ids), array(INT_TYPECODE, job_offsets),
+                    array(INT_TYPECODE, durations))
+
+
+def columns(instance):
+    return (instance.machines_count, list(instance.job_ids), list(instance.job_offsets),
+            list(instance.durations))
+
+
+@pytest.mark.parametrize('use_mmap', [True, False])
+def test_csv_binary_csv_round_trip(tmp_path, use_mmap):
+    csv_path = tmp_path / 'instance.csv'
+    csv_path.write_text(CSV)
+    original = read_instance(str(csv_path))
+
+    binary_path = str(tmp_path / 'instance.jsb')
+    write_binary(original, binary_path)
+    loaded = read_binary(binary_path, use_mmap=use_mmap)
+    assert columns(loaded) == columns(original)
+    # The loader recognises the format by its magic, whatever the extension
+    assert columns(read_instance(binary_path)) == columns(original)
+
+    round_trip = tmp_path / 'round_trip.csv'
+    write_csv(loaded, str(round_trip))
+    assert round_trip.read_text() == CSV
+
+
+@pytest.mark.parametrize('use_mmap', [True, False])
+def test_corrupted_byte_fails_the_checksum(tmp_path, use_mmap):
+    path = tmp_path / 'instance.jsb'
+    write_binary(make_instance([1, 2], [0, 2, 3], [5, 7, 3]), str(path))
+    data = bytearray(path.read_bytes())
+    # Highest byte of the first duration
+    data[HEADER_SIZE + 5 * 8 + 7] ^= 0x7f
+    path.write_bytes(bytes(data))
+    with pytest.raises(ValueError, match='corrupted'):
+        read_binary(str(path), use_mmap=use_mmap)
+
+
+def test_truncated_file(tmp_path):
+    path = tmp_path / 'instance.jsb'
+    write_binary(make_instance([1, 2], [0, 2, 3], [5, 7, 3]), str(path))
+    path.write_bytes(path.read_bytes()[:-8])
+    with pytest.raises(ValueError, match='truncated'):
+        read_binary(str(path))
+
+
+@pytest.mark.parametrize('job_ids, job_offsets, durations, message', [
+    ([1, 2], [1, 2, 3], [5, 7, 3], 'offsets must run from 0'),
+    ([1, 2], [0, 2, 2], [5, 7, 3], 'offsets must run from 0'),
+    ([1, 2], [0, 3, 3], [5, 7, 3], 'offsets must increase'),
+    ([1, 2], [0, 2, 3], [5, -7, 3], 'must not be negative'),
+    ([1, 1], [0, 2, 3], [5, 7, 3], 'unique'),
+])
+def test_invalid_columns_are_rejected(tmp_path, job_ids, job_offsets, durations, message):
+    # Written with a valid checksum, so only the column checks can catch them
+    path = str(tmp_path / 'instance.jsb')
+    write_binary(make_instance(job_ids, job_offsets, durations), path)
+    with pytest.raises(ValueError, match=message):
+        read_binary(path)
@@ -0,0 +1,81 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.helperFunctions.datasetCache import DatasetCache
+
+
+CSV = 'job_id,task_id,execution_time,machines_count\n1,1,5,2\n1,2,7,2\n2,1,3,2\n'
+
+
+def write(path, text, mtime_ns=None):
+    path.write_text(text)
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_memory_hit_and_derived_data(tmp_path):
+    path = tmp_path / 'instance.csv'
+    write(path, CSV)
+    cache = DatasetCache()
+    first = cache.load(str(path))
+    second = cache.load(str(path))
+    assert list(second.instance.durations) == [5, 7, 3]
+    assert second.instance.durations is first.instance.durations
+    assert list(first.derived['job_totals']) == [12, 3]
+    assert first.derived['critical_path'] == 12
+    assert first.derived['lower_bound'] == 12
+    assert (cache.misses, cache.memory_hits, cache.invalidations) == (1, 1, 0)
+
+
+def test_touched_file_is_not_reparsed(tmp_path):
+    path = tmp_path / 'instance.csv'
+    write(path, CSV, mtime_ns=1_000_000_000)
+    cache = DatasetCache()
+    cache.load(str(path))
+    os.utime(path, ns=(2_000_000_000, 2_000_000_000))
+    cache.load(str(path))
+    assert (cache.misses, cache.memory_hits, cache.invalidations) == (1, 1, 0)
+
+
+def test_size_change_invalidates(tmp_path):
+    path = tmp_path / 'instance.csv'
+    write(path, CSV)
+    cache = DatasetCache()
+    cache.load(str(path))
+    write(path, CSV + '3,1,4,2\n')
+    loaded = cache.load(str(path))
+    assert list(loaded.instance.job_ids) == [1, 2, 3]
+    assert (cache.misses, cache.invalidations) == (2, 1)
+
+
+def test_same_size_content_change_invalidates(tmp_path):
+    path = tmp_path / 'instance.csv'
+    write(path, CSV, mtime_ns=1_000_000_000)
+    cache = DatasetCache()
+    cache.load(str(path))
+    # Same size, new mtime: only the content hash can tell
+    write(path, CSV.replace('1,2,7,2', '1,2,8,2'), mtime_ns=2_000_000_000)
+    loaded = cache.load(str(path))
+    assert list(loaded.instance.durations) == [5, 8, 3]
+    assert (cache.misses, cache.invalidations) == (2, 1)
+
+
+def test_disk_layer_is_shared_and_invalidated(tmp_path):
+    path = tmp_path / 'instance.csv'
+    cache_dir = str(tmp_path / 'cache')
+    write(path, CSV, mtime_ns=1_000_000_000)
+    DatasetCache(cache_dir).load(str(path))
+
+    cache = DatasetCache(cache_dir)
+    loaded = cache.load(str(path))
+    assert list(loaded.instance.durations) == [5, 7, 3]
+    assert list(loaded.derived['job_totals']) == [12, 3]
+    assert (cache.disk_hits, cache.misses) == (1, 0)
+
+    write(path, CSV.replace('2,1,3,2', '2,1,4,2'), mtime_ns=2_000_000_000)
+    cache = DatasetCache(cache_dir)
+    loaded = cache.load(str(path))
+    assert list(loaded.instance.durations) == [5, 7, 4]
+    assert (cache.disk_hits, cache.misses, cache.invalidations) == (0, 1, 1)
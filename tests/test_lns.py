@@ -0,0 +1,71 @@
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.helperFunctions.schedule import Schedule
+from src.helperFunctions.scheduleValidator import validate_schedule
+from src.lns import lns
+
+
+PROBLEM = {
+    'machines_count': 2,
+    'jobs': [
+        {'job_id': 1, 'tasks': [{'task_id': 1, 'execution_time': 3}, {'task_id': 2, 'execution_time': 4},
+                                {'task_id': 3, 'execution_time': 2}]},
+        {'job_id': 2, 'tasks': [{'task_id': 1, 'execution_time': 5}]},
+        {'job_id': 3, 'tasks': [{'task_id': 1, 'execution_time': 2}, {'task_id': 2, 'execution_time': 3}]},
+    ],
+    'total_tasks': 6,
+    'total_jobs': 3,
+}
+
+
+def serial_schedule():
+    """Every task on machine 0, job after job."""
+    schedule = Schedule()
+    start = 0
+    for job in PROBLEM['jobs']:
+        for task in job['tasks']:
+            schedule.add(job['job_id'], task['task_id'], 0, start, task['execution_time'])
+            start += task['execution_time']
+    return schedule
+
+
+def freed_rows(schedule, *keys):
+    return {schedule.locate(job_id, task_id) for job_id, task_id in keys}
+
+
+def test_repair_keeps_fixed_tasks_in_place(monkeypatch):
+    # Without the final compaction the fixed tasks must come back exactly where they were
+    monkeypatch.setattr(lns, 'compact', lambda schedule, problem_data: schedule)
+    schedule = serial_schedule()
+    # J1T2 sits between fixed J1T1 and J1T3; job 3 is freed whole
+    freed = freed_rows(schedule, (1, 2), (3, 1), (3, 2))
+    repaired, proven = lns.repair(schedule, freed, PROBLEM, time_limit=5)
+
+    assert repaired is not None and proven
+    for row in set(range(len(schedule))) - freed:
+        job_id, task_id = schedule.job_ids[row], schedule.task_ids[row]
+        assert repaired.row(repaired.locate(job_id, task_id)) == schedule.row(row)
+    assert validate_schedule(repaired, PROBLEM).valid
+    # J1T2 stays between its fixed neighbours
+    j1t2 = repaired.locate(1, 2)
+    assert repaired.starts[j1t2] >= 3 and repaired.end(j1t2) <= 7
+    assert max(repaired.end(repaired.locate(3, task_id)) for task_id in (1, 2)) < 19
+
+
+def test_repair_then_compact_never_lengthens():
+    schedule = serial_schedule()
+    freed = freed_rows(schedule, (2, 1), (3, 1), (3, 2))
+    repaired, _ = lns.repair(schedule, freed, PROBLEM, time_limit=5)
+    assert repaired is not None
+    assert validate_schedule(repaired, PROBLEM).valid
+    assert repaired.makespan < schedule.makespan
+
+
+def test_repair_without_room_returns_none():
+    schedule = serial_schedule()
+    # J1T2 is boxed in by J1T1 and J1T3, and machine 1 cannot start it earlier than 3
+    repaired, proven = lns.repair(schedule, freed_rows(schedule, (1, 2)), PROBLEM, time_limit=5)
+    assert repaired is None and proven
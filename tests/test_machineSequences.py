@@ -0,0 +1,187 @@
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.helperFunctions.machineSequences import MachineSequences
+from src.helperFunctions.schedule import Schedule
+from src.helperFunctions.scheduleValidator import validate_schedule
+from src.lns.lns import initial_schedule
+from src.solvers.solver import Budget
+from src.tabuSearch import tabuSearch
+from src.tabuSearch.tabuSearch import tabu_search
+
+
+def random_problem(seed, jobs=8, machines=3, max_tasks=4, releases=False, tasks=None, max_time=9):
+    rng = random.Random(seed)
+    job_list = [{'job_id': job_id, 'tasks': [{'task_id': task_id, 'execution_time': rng.randint(1, max_time)}
+                                             for task_id in range(1, (tasks or rng.randint(1, max_tasks)) + 1)]}
+                for job_id in range(1, jobs + 1)]
+    problem = {'machines_count': machines, 'jobs': job_list,
+               'total_tasks': sum(len(job['tasks']) for job in job_list), 'total_jobs': jobs}
+    if releases:
+        problem['job_release'] = {job['job_id']: rng.randint(0, 10) for job in job_list}
+        problem['machine_release'] = [rng.randint(0, 10) for _ in range(machines)]
+    return problem
+
+
+def evaluated(sequences):
+    """Heads, tails and makespan of a full evaluation of the current sequences."""
+    current = (list(sequences.heads), list(sequences.tails), sequences.makespan)
+    assert sequences.evaluate()
+    return current, (sequences.heads, sequences.tails, sequences.makespan)
+
+
+@pytest.mark.parametrize('seed', range(6))
+def test_incremental_moves_match_full_evaluation(seed):
+    rng = random.Random(seed)
+    problem = random_problem(seed, releases=bool(seed % 2))
+    sequences = MachineSequences(problem, initial_schedule(problem))
+    for _ in range(300):
+        v = rng.randrange(len(sequences))
+        before = sequences.snapshot()
+        if rng.random() < 0.5:
+            machine = rng.choice([m for m in range(problem['machines_count']) if m != sequences.machine[v]])
+            # Any position, not just the insertion point, so some moves close a cycle
+            k = rng.randint(0, len(sequences.sequences[machine]))
+            applied = sequences.apply_reassign(v, machine, k) is not None
+        else:
+            w = sequences.machine_succ(v)
+            if w < 0:
+                continue
+            applied = sequences.apply_swap(v, w)
+        if not applied:
+            assert sequences.snapshot() == before
+        incremental, full = evaluated(sequences)
+        assert incremental == full
+
+
+def test_undo_restores_heads_and_tails():
+    problem = random_problem(3)
+    sequences = MachineSequences(problem, initial_schedule(problem))
+    original = (list(sequences.heads), list(sequences.tails), sequences.makespan)
+    v = sequences.critical_tasks()[0]
+    machine = (sequences.machine[v] + 1) % problem['machines_count']
+    undo = sequences.apply_reassign(v, machine, sequences.insertion_point(v, machine))
+    assert undo is not None
+    sequences.apply_reassign(v, *undo)
+    assert (sequences.heads, sequences.tails, sequences.makespan) == original
+
+
+def test_estimates_are_exact_for_an_isolated_move():
+    # Two one-task jobs on one machine: the estimates have no neighbours they could miss
+    problem = {'machines_count': 2, 'total_tasks': 2, 'total_jobs': 2,
+               'jobs': [{'job_id': 1, 'tasks': [{'task_id': 1, 'execution_time': 3}]},
+                        {'job_id': 2, 'tasks': [{'task_id': 1, 'execution_time': 5}]}]}
+    schedule = Schedule()
+    schedule.add(1, 1, 0, 0, 3)
+    schedule.add(2, 1, 0, 3, 5)
+    sequences = MachineSequences(problem, schedule)
+    assert sequences.makespan == 8
+    assert sequences.estimate_swap(0, 1) == 8
+    assert sequences.estimate_reassign(1, 1, 0) == 5
+    sequences.apply_reassign(1, 1, 0)
+    assert sequences.makespan == 5
+
+
+def tabu_trace(monkeypatch, problem, tabu_tenure, generation_limit, seed):
+    """
+    Run tabu search, recording per iteration the estimates of the candidate moves
+    and, in order, the applied moves and the points where the tabu lists are cleared.
+    """
+    iteration = [0]
+    estimates = {}
+    events = []
+    neighbourhood = tabuSearch._neighbourhood
+
+    def recorded_neighbourhood(sequences, critical, critical_set):
+        # An iteration with candidates but no move found them all tabu and cleared the lists
+        previous = iteration[0]
+        if any(key[0] == previous for key in estimates) and not (events and events[-1][1] == previous):
+            events.append(('clear', previous, None, None))
+        iteration[0] += 1
+        for estimate, move in neighbourhood(sequences, critical, critical_set):
+            estimates[(iteration[0], move)] = estimate
+            yield estimate, move
+
+    apply_reassign = MachineSequences.apply_reassign
+    apply_swap = MachineSequences.apply_swap
+
+    def recorded_reassign(self, v, machine, k):
+        events.append(('move', iteration[0], ('reassign', v, machine, k), self.machine[v]))
+        return apply_reassign(self, v, machine, k)
+
+    def recorded_swap(self, u, v):
+        events.append(('move', iteration[0], ('swap', u, v), None))
+        return apply_swap(self, u, v)
+
+    restore = MachineSequences.restore
+
+    def recorded_restore(self, snapshot):
+        # A restart from the best schedule clears the tabu lists
+        events.append(('clear', iteration[0], None, None))
+        return restore(self, snapshot)
+
+    monkeypatch.setattr(tabuSearch, '_neighbourhood', recorded_neighbourhood)
+    monkeypatch.setattr(MachineSequences, 'apply_reassign', recorded_reassign)
+    monkeypatch.setattr(MachineSequences, 'apply_swap', recorded_swap)
+    monkeypatch.setattr(MachineSequences, 'restore', recorded_restore)
+
+    improvements = []
+    schedule, iterations, stats = tabu_search(
+        problem, Budget(generation_limit=generation_limit), tabu_tenure=tabu_tenure, seed=seed,
+        on_improvement=lambda i, best: improvements.append((i, best.makespan))
+    )
+    return schedule, stats, estimates, events, improvements
+
+
+# Instances whose list schedule misses the trivial lower bound, so the search runs its full budget
+HARD_INSTANCES = [(0, 7, 5, 3, 50), (2, 7, 5, 3, 50), (3, 7, 5, 3, 50), (0, 9, 4, 5, 60), (2, 9, 4, 5, 60)]
+
+
+@pytest.mark.parametrize('seed, jobs, machines, tasks, max_time', HARD_INSTANCES + [(0, 12, 4, None, 9)])
+def test_tabu_search_improves_on_the_initial_schedule(seed, jobs, machines, tasks, max_time):
+    problem = random_problem(seed, jobs=jobs, machines=machines, tasks=tasks, max_time=max_time)
+    schedule, iterations, stats = tabu_search(problem, Budget(generation_limit=300), seed=seed)
+    assert validate_schedule(schedule, problem).valid
+    assert schedule.makespan <= initial_schedule(problem).makespan == stats['initial_makespan']
+    assert schedule.makespan >= stats['lower_bound']
+
+
+@pytest.mark.parametrize('seed, jobs, machines, tasks, max_time', HARD_INSTANCES)
+def test_tabu_moves_are_only_reversed_by_aspiration(monkeypatch, seed, jobs, machines, tasks, max_time):
+    tenure = 8
+    problem = random_problem(seed, jobs=jobs, machines=machines, tasks=tasks, max_time=max_time)
+    _, stats, estimates, events, improvements = tabu_trace(monkeypatch, problem, tenure, 300, seed)
+
+    left = {}  # (task, machine) -> iteration the task left the machine
+    swapped = {}  # pair -> iteration it was swapped
+    tabu_moves = 0
+    for kind, iteration, move, old_machine in events:
+        if kind == 'clear':
+            left.clear()
+            swapped.clear()
+            continue
+        if move[0] == 'reassign':
+            key, last = (move[1], move[2]), left.get((move[1], move[2]))
+            left[(move[1], old_machine)] = iteration
+        else:
+            key = (min(move[1], move[2]), max(move[1], move[2]))
+            last = swapped.get(key)
+            swapped[key] = iteration
+        if last is not None and iteration - last <= tenure:
+            # A tabu move must promise a new best makespan
+            best = min(makespan for found, makespan in improvements if found < iteration)
+            assert estimates[(iteration, move)] < best, (iteration, move)
+            tabu_moves += 1
+    assert tabu_moves == stats['aspirations'] > 0
+
+
+def test_zero_tenure_never_needs_aspiration():
+    problem = random_problem(0, jobs=7, machines=5, tasks=3, max_time=50)
+    _, iterations, stats = tabu_search(problem, Budget(generation_limit=300), tabu_tenure=0, seed=0)
+    assert iterations == 300
+    assert stats['aspirations'] == 0
@@ -0,0 +1,58 @@
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.helperFunctions.readFromCSV import read_instance
+from src.helperFunctions.scheduleValidator import validate_schedule
+from src.online.onlineScheduler import OnlineScheduler, insert_jobs, merge_jobs
+
+
+NEW_JOBS = [
+    {'job_id': 101, 'tasks': [{'task_id': 1, 'execution_time': 12}, {'task_id': 2, 'execution_time': 5}]},
+    {'job_id': 102, 'tasks': [{'task_id': 1, 'execution_time': 7}]},
+]
+
+
+@pytest.fixture(scope='module')
+def scheduler():
+    return OnlineScheduler(read_instance('small').to_dict())
+
+
+@pytest.mark.parametrize('improve_time', [0.0, 0.05])
+def test_started_tasks_stay_frozen(scheduler, improve_time):
+    schedule = scheduler.schedule
+    now = schedule.makespan // 3
+    result = insert_jobs(scheduler.problem_data, schedule, NEW_JOBS, now=now, improve_time=improve_time, seed=1)
+
+    started = [schedule.row(row) for row in range(len(schedule)) if schedule.starts[row] < now]
+    assert started and result.frozen == len(started)
+    for job_id, task_id, machine, start, duration in started:
+        row = result.schedule.locate(job_id, task_id)
+        assert result.schedule.row(row) == (job_id, task_id, machine, start, duration)
+
+    # Nothing that had not started moves before now
+    new_ids = {job['job_id'] for job in NEW_JOBS}
+    for job_id, task_id, machine, start, duration in result.schedule.rows():
+        if job_id in new_ids:
+            assert start >= now
+        elif (job_id, task_id, machine, start, duration) not in started:
+            assert start >= now
+
+    assert validate_schedule(result.schedule, result.problem_data).valid
+    assert result.makespan <= result.inserted_makespan
+
+
+def test_scheduler_keeps_the_merged_instance(scheduler):
+    online = OnlineScheduler(scheduler.problem_data, scheduler.schedule)
+    online.add_jobs(NEW_JOBS, now=10)
+    assert online.problem_data['total_jobs'] == scheduler.problem_data['total_jobs'] + 2
+    assert validate_schedule(online.schedule, online.problem_data).valid
+
+
+def test_merge_rejects_a_known_job_id(scheduler):
+    known = scheduler.problem_data['jobs'][0]['job_id']
+    with pytest.raises(ValueError, match='already in the instance'):
+        merge_jobs(scheduler.problem_data, [dict(NEW_JOBS[1], job_id=known)])
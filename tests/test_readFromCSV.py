@@ -0,0 +1,85 @@
+import io
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.helperFunctions import readFromCSV
+from src.helperFunctions.readFromCSV import read_instance
+
+
+HEADER = 'job_id,task_id,execution_time,machines_count\n'
+
+
+def load(body, header=HEADER):
+    return read_instance(io.StringIO(header + body), 'test')
+
+
+def test_standard_rows():
+    instance = load('1,1,5,2\n1,2,7,2\n2,1,3,2\n')
+    assert instance.machines_count == 2
+    assert list(instance.job_ids) == [1, 2]
+    assert list(instance.job_offsets) == [0, 2, 3]
+    assert list(instance.durations) == [5, 7, 3]
+
+
+def test_rows_with_spaces_blank_lines_and_crlf():
+    instance = load('1, 1, 5, 2\r\n\r\n1,2,7,2\r\n2,1,3,2')
+    assert list(instance.durations) == [5, 7, 3]
+
+
+def test_reordered_columns_and_rows():
+    instance = load('3,2,2,9,1\n7,1,2,0,2\n5,1,2,0,1\n',
+                    header='execution_time,job_id,machines_count,extra,task_id\n')
+    assert list(instance.job_ids) == [1, 2]
+    assert list(instance.durations) == [5, 7, 3]
+
+
+@pytest.mark.parametrize('body', [
+    '1,1,5,2\n1,2,7\n2,1,3,2,2\n',
+    '1,1,5,2\n1,2,7,2,\n2,1,3,2\n',
+    '1,1,5,2\n1,x,7,2\n2,1,3,2\n',
+    '1,1,5,2\n1,,7,2\n2,1,3,2\n',
+])
+def test_malformed_row_names_its_line(body):
+    with pytest.raises(ValueError, match='Line 3'):
+        load(body)
+
+
+def test_malformed_row_in_a_later_chunk(monkeypatch):
+    monkeypatch.setattr(readFromCSV, 'CHUNK_SIZE', 16)
+    body = ''.join(f'{job},1,4,2\n' for job in range(1, 11)) + '11,1,4\n'
+    with pytest.raises(ValueError, match='Line 12'):
+        load(body)
+
+
+def test_task_ids_with_a_gap():
+    with pytest.raises(ValueError, match='Job 1'):
+        load('1,1,5,2\n1,3,7,2\n')
+
+
+def test_task_ids_not_starting_at_one():
+    with pytest.raises(ValueError, match='must start at 1'):
+        load('1,2,5,2\n')
+
+
+def test_duplicate_task_id():
+    with pytest.raises(ValueError, match='Job 1'):
+        load('1,1,5,2\n1,1,7,2\n')
+
+
+def test_inconsistent_machines_count():
+    with pytest.raises(ValueError, match='Inconsistent machines_count'):
+        load('1,1,5,2\n1,2,7,3\n')
+
+
+def test_negative_duration():
+    with pytest.raises(ValueError, match='must not be negative'):
+        load('1,1,-5,2\n')
+
+
+def test_missing_column():
+    with pytest.raises(ValueError, match='missing columns'):
+        load('1,1,5\n', header='job_id,task_id,execution_time\n')
@@ -0,0 +1,94 @@
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.helperFunctions.schedule import Schedule
+from src.helperFunctions.scheduleValidator import validate_schedule
+from src.rollingHorizon.rollingHorizon import RollingHorizonSolver, _select_window, rolling_horizon
+from src.solvers.solver import Budget, FEASIBLE
+
+
+def random_problem(seed, jobs=10, machines=3, max_tasks=5):
+    rng = random.Random(seed)
+    job_list = [{'job_id': job_id, 'tasks': [{'task_id': task_id, 'execution_time': rng.randint(1, 9)}
+                                             for task_id in range(1, rng.randint(1, max_tasks) + 1)]}
+                for job_id in range(1, jobs + 1)]
+    return {'machines_count': machines, 'jobs': job_list,
+            'total_tasks': sum(len(job['tasks']) for job in job_list), 'total_jobs': jobs}
+
+
+def chain(*durations):
+    return {'tasks': [{'task_id': task_id, 'execution_time': duration} for task_id, duration in enumerate(durations, 1)]}
+
+
+def test_window_takes_tasks_in_list_schedule_order():
+    jobs = [chain(2, 2, 2), chain(5)]
+    # The longer chain goes first, then the other job on the second machine, then the chain's next task
+    assert _select_window(jobs, [0, 0], [0, 0], [0, 0], 3) == {0: 2, 1: 1}
+
+
+def test_window_starts_from_the_frozen_state():
+    jobs = [chain(2, 2, 2), chain(5), chain(1, 1)]
+    # Job 0's last task is not ready before 10; of the ready jobs the longer chain goes first
+    taken = _select_window(jobs, [2, 0, 0], [10, 0, 0], [8, 0], 3)
+    assert taken == {2: 2, 1: 1}
+    assert _select_window(jobs, [3, 1, 2], [0, 0, 0], [0, 0], 3) == {}
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_windows_are_feasible_one_after_another(seed):
+    problem = random_problem(seed)
+    machine_end = [0] * problem['machines_count']
+    schedule = Schedule()
+    index = tasks_done = makespan = 0
+    for window in rolling_horizon(problem, window_tasks=6, window_time=None, window_nodes=2000):
+        index += 1
+        assert window.index == index
+        assert 0 < len(window.schedule) <= 6
+        assert window.tasks_done == tasks_done + len(window.schedule)
+        assert window.makespan >= makespan
+        # A window only uses each machine after everything frozen on it before
+        for _, _, machine, start, _ in window.schedule.rows():
+            assert start >= machine_end[machine]
+        for row in range(len(window.schedule)):
+            machine = window.schedule.machines[row]
+            machine_end[machine] = max(machine_end[machine], window.schedule.end(row))
+        for row in window.schedule.rows():
+            schedule.add(*row)
+        tasks_done, makespan = window.tasks_done, window.makespan
+
+    assert tasks_done == problem['total_tasks']
+    assert makespan == schedule.makespan
+    # Job order across windows and machine overlaps are the validator's to check
+    assert validate_schedule(schedule, problem).valid
+
+
+def test_windows_honour_instance_releases():
+    problem = dict(random_problem(1), job_release={1: 20, 2: 5}, machine_release=[0, 15, 3])
+    schedule = Schedule()
+    for window in rolling_horizon(problem, window_tasks=5, window_time=None, window_nodes=2000):
+        for row in window.schedule.rows():
+            schedule.add(*row)
+    assert validate_schedule(schedule, problem).valid
+    for job_id, task_id, machine, start, _ in schedule.rows():
+        if task_id == 1:
+            assert start >= problem['job_release'].get(job_id, 0)
+        assert start >= problem['machine_release'][machine]
+
+
+def test_spent_budget_places_windows_greedily():
+    problem = random_problem(2)
+    result = RollingHorizonSolver().solve(problem, Budget(time_limit=0), window_tasks=6)
+    assert result.status == FEASIBLE
+    assert set(result.stats['window_statuses']) == {'greedy'}
+    assert validate_schedule(result.schedule, problem).valid
+    assert len(result.schedule) == problem['total_tasks']
+
+
+def test_solver_can_not_solve_its_own_windows():
+    with pytest.raises(ValueError, match='own windows'):
+        next(rolling_horizon(random_problem(0), window_solver='rolling_horizon'))
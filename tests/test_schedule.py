@@ -0,0 +1,84 @@
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.helperFunctions.schedule import CulturalView, Schedule
+
+
+def backtracking_task(job_id, task_id, machine, start, duration):
+    return {'job_id': job_id, 'task_id': task_id, 'execution_time': duration, 'start_time': start,
+            'end_time': start + duration, 'machine': machine}
+
+
+# 0-based machines, each machine's tasks sorted by start; machine 1 is unused
+BACKTRACKING = {
+    0: [backtracking_task(1, 1, 0, 0, 3), backtracking_task(2, 2, 0, 5, 2), backtracking_task(1, 2, 0, 7, 4)],
+    2: [backtracking_task(2, 1, 2, 0, 5), backtracking_task(3, 1, 2, 5, 1)],
+}
+# The same schedule in the cultural format: 1-based machines
+CULTURAL = {
+    1: [{(1, 1): (0, 3)}, {(2, 2): (5, 2)}, {(1, 2): (7, 4)}],
+    3: [{(2, 1): (0, 5)}, {(3, 1): (5, 1)}],
+}
+
+
+def test_backtracking_round_trip():
+    schedule = Schedule.from_backtracking(BACKTRACKING)
+    assert len(schedule) == 5
+    assert schedule.makespan == 11
+    assert schedule.to_backtracking() == BACKTRACKING
+
+
+def test_cultural_round_trip():
+    schedule = Schedule.from_cultural(CULTURAL)
+    view = schedule.cultural_view()
+    assert dict(view) == CULTURAL
+    assert Schedule.from_cultural(dict(view)).to_backtracking() == schedule.to_backtracking()
+    # A view converts back without copying
+    assert Schedule.from_cultural(view) is schedule
+
+
+def test_formats_convert_into_each_other():
+    assert dict(Schedule.from_backtracking(BACKTRACKING).cultural_view()) == CULTURAL
+    assert Schedule.from_cultural(CULTURAL).to_backtracking() == BACKTRACKING
+    assert list(Schedule.from_cultural(CULTURAL).rows()) == [
+        (1, 1, 0, 0, 3), (2, 2, 0, 5, 2), (1, 2, 0, 7, 4), (2, 1, 2, 0, 5), (3, 1, 2, 5, 1),
+    ]
+
+
+def test_unsorted_input_comes_back_sorted_by_start():
+    shuffled = {machine: list(reversed(tasks)) for machine, tasks in BACKTRACKING.items()}
+    assert Schedule.from_backtracking(shuffled).to_backtracking() == BACKTRACKING
+    shuffled = {machine: list(reversed(tasks)) for machine, tasks in CULTURAL.items()}
+    assert dict(Schedule.from_cultural(shuffled).cultural_view()) == CULTURAL
+
+
+def test_cultural_view_is_a_mapping_of_used_machines():
+    view = Schedule.from_backtracking(BACKTRACKING).cultural_view()
+    assert isinstance(view, CulturalView)
+    assert list(view) == [1, 3]
+    assert len(view) == 2
+    assert 2 not in view
+    with pytest.raises(KeyError):
+        view[2]
+
+
+def test_indexes_follow_added_tasks():
+    schedule = Schedule.from_cultural(CULTURAL)
+    assert schedule.locate(3, 2) is None
+    assert [schedule.row(row)[:2] for row in schedule.machine_order(2)] == [(2, 1), (3, 1)]
+    row = schedule.add(3, 2, 2, 6, 9)
+    assert schedule.locate(3, 2) == row
+    assert [schedule.row(row)[:2] for row in schedule.machine_order(2)] == [(2, 1), (3, 1), (3, 2)]
+    assert schedule.makespan == 15
+    assert schedule.to_backtracking()[2][-1] == backtracking_task(3, 2, 2, 6, 9)
+
+
+def test_empty_schedule():
+    schedule = Schedule.from_cultural({})
+    assert schedule.makespan == 0
+    assert schedule.to_backtracking() == {}
+    assert dict(schedule.cultural_view()) == {}
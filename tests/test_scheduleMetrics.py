@@ -0,0 +1,33 @@
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.helperFunctions.schedule import Schedule
+from src.helperFunctions.scheduleMetrics import schedule_metrics
+
+
+def make_schedule(*rows):
+    schedule = Schedule()
+    for row in rows:
+        schedule.add(*row)
+    return schedule
+
+
+def test_metrics_count_unused_machines_as_idle():
+    metrics = schedule_metrics(make_schedule((1, 1, 0, 0, 3), (1, 2, 0, 3, 2), (2, 1, 1, 0, 4)), 3)
+    assert metrics['makespan'] == 5
+    assert metrics['busy_time'] == 9
+    assert metrics['idle_time'] == 6
+    assert metrics['utilization'] == 60.0
+    assert metrics['machine_busy'] == [5, 4, 0]
+    assert metrics['job_flow_times'] == {1: 5, 2: 4}
+    assert metrics['longest_job'] == 5
+
+
+@pytest.mark.parametrize('machine', [2, -1])
+def test_out_of_range_machine(machine):
+    with pytest.raises(ValueError, match='machine'):
+        schedule_metrics(make_schedule((1, 1, 0, 0, 3), (2, 1, machine, 0, 4)), 2)
@@ -0,0 +1,90 @@
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.helperFunctions.schedule import Schedule
+from src.helperFunctions.scheduleValidator import validate_schedule
+
+
+PROBLEM = {
+    'machines_count': 2,
+    'jobs': [
+        {'job_id': 1, 'tasks': [{'task_id': 1, 'execution_time': 3}, {'task_id': 2, 'execution_time': 2}]},
+        {'job_id': 2, 'tasks': [{'task_id': 1, 'execution_time': 4}]},
+    ],
+    'total_tasks': 3,
+    'total_jobs': 2,
+}
+
+EMPTY_PROBLEM = {'machines_count': 2, 'jobs': [], 'total_tasks': 0, 'total_jobs': 0}
+
+
+def make_schedule(*rows):
+    schedule = Schedule()
+    for row in rows:
+        schedule.add(*row)
+    return schedule
+
+
+def test_feasible_schedule():
+    report = validate_schedule(make_schedule((1, 1, 0, 0, 3), (1, 2, 0, 3, 2), (2, 1, 1, 0, 4)), PROBLEM)
+    assert report.valid
+    assert report.tasks_checked == 3
+
+
+def test_infeasible_schedule():
+    # J1T2 starts before J1T1 ends and overlaps it on machine 0; J2T1 is missing
+    report = validate_schedule(make_schedule((1, 1, 0, 0, 3), (1, 2, 0, 1, 2)), PROBLEM)
+    assert not report.valid
+    assert report.counts['precedence'] == 1
+    assert report.counts['overlap'] == 1
+    assert report.counts['missing'] == 1
+
+
+def test_precedence_across_a_missing_task():
+    problem = {
+        'machines_count': 2,
+        'jobs': [{'job_id': 1, 'tasks': [{'task_id': task_id, 'execution_time': 3} for task_id in (1, 2, 3)]}],
+        'total_tasks': 3,
+        'total_jobs': 1,
+    }
+    # J1T2 is missing and J1T3 starts before J1T1 ends
+    report = validate_schedule(make_schedule((1, 1, 0, 0, 3), (1, 3, 1, 1, 3)), problem)
+    assert report.counts['missing'] == 1
+    assert report.counts['precedence'] == 1
+    assert report.violations[-1].detail == "J1T3 starts at 1, before J1T1 ends at 3"
+
+
+def test_empty_instance_with_empty_schedule():
+    assert validate_schedule(Schedule(), EMPTY_PROBLEM).valid
+
+
+def test_empty_instance_with_tasks_scheduled():
+    report = validate_schedule(make_schedule((1, 1, 0, 0, 5)), EMPTY_PROBLEM)
+    assert not report.valid
+    assert report.counts['unknown'] == 1
+    assert report.total == 1
+    assert report.violations[0].kind == 'unknown'
+
+
+def test_staggered_overlaps_scale():
+    # Every task starts one unit into the previous one on the same machine
+    count = 20000
+    problem = {
+        'machines_count': 1,
+        'jobs': [{'job_id': job_id, 'tasks': [{'task_id': 1, 'execution_time': 2}]}
+                 for job_id in range(1, count + 1)],
+        'total_tasks': count,
+        'total_jobs': count,
+    }
+    schedule = make_schedule(*((job_id, 1, 0, job_id - 1, 2) for job_id in range(1, count + 1)))
+
+    start_time = time.perf_counter()
+    report = validate_schedule(schedule, problem)
+    elapsed = time.perf_counter() - start_time
+
+    assert report.counts['overlap'] == count - 1
+    assert report.violations[0].detail == "J2T1 starts at 1 on machine 0, before J1T1 ends at 2"
+    assert elapsed < 2.0
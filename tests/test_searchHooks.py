@@ -0,0 +1,123 @@
+import contextlib
+import io
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.backTracking.backTracking2 import BranchAndBoundSolver, SEARCH_MODES
+from src.backTracking.searchHooks import (DEFAULT_CHECK_INTERVAL, INCUMBENT, NODE, PRUNE, SearchHooks,
+                                          SearchMonitor)
+from src.solvers.solver import Budget, OPTIMAL
+
+
+class Search:
+    """The counters a search keeps for its monitor."""
+
+    def __init__(self):
+        self.nodes_visited = 0
+        self.nodes_pruned = 0
+        self.best_makespan = float('inf')
+        self.external_bound = float('inf')
+
+
+def expand(search, monitor, nodes):
+    """Visit up to ``nodes`` nodes the way the searches do; True if the monitor stopped the search."""
+    for _ in range(nodes):
+        search.nodes_visited += 1
+        if search.nodes_visited >= monitor.next_check and monitor.node_checkpoint():
+            return True
+    return False
+
+
+def test_node_subscriptions_fire_every_n_nodes():
+    hooks = SearchHooks()
+    every_10, every_30 = [], []
+    hooks.subscribe(NODE, lambda e: every_10.append(e.nodes_visited), every_nodes=10)
+    hooks.subscribe(NODE, lambda e: every_30.append(e.nodes_visited), every_nodes=30)
+    search = Search()
+    monitor = SearchMonitor(search, hooks)
+    assert not expand(search, monitor, 95)
+    assert every_10 == [10, 20, 30, 40, 50, 60, 70, 80, 90]
+    assert every_30 == [30, 60, 90]
+
+
+def test_prune_subscription_fires_every_n_prunes():
+    hooks = SearchHooks()
+    fired = []
+    hooks.subscribe(PRUNE, lambda e: fired.append(e.nodes_pruned), every_nodes=4)
+    search = Search()
+    monitor = SearchMonitor(search, hooks)
+    for _ in range(10):
+        search.nodes_pruned += 1
+        if search.nodes_pruned >= monitor.next_prune:
+            monitor.prune_checkpoint()
+    assert fired == [4, 8]
+
+
+@pytest.mark.parametrize('subscribed', [False, True])
+def test_node_budget_stops_at_exactly_node_limit(subscribed):
+    hooks = SearchHooks()
+    fired = []
+    if subscribed:
+        hooks.subscribe(NODE, lambda e: fired.append(e.nodes_visited), every_nodes=10)
+    search = Search()
+    monitor = SearchMonitor(search, hooks, node_limit=37)
+    assert expand(search, monitor, 1000)
+    assert search.nodes_visited == 37
+    assert fired == ([10, 20, 30] if subscribed else [])
+
+
+@pytest.mark.parametrize('mode', SEARCH_MODES)
+def test_solver_reports_exactly_node_limit_nodes(mode):
+    rng = random.Random(0)
+    jobs = [{'job_id': job_id, 'tasks': [{'task_id': task_id, 'execution_time': rng.randint(1, 9)}
+                                         for task_id in range(1, 5)]} for job_id in range(1, 9)]
+    problem = {'machines_count': 3, 'total_jobs': 8, 'total_tasks': 32, 'jobs': jobs}
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = BranchAndBoundSolver().solve(problem, Budget(node_limit=20), mode=mode)
+    assert result.status != OPTIMAL
+    assert result.nodes == 20
+
+
+def test_unobserved_unbudgeted_search_never_checks():
+    hooks = SearchHooks()
+    hooks.subscribe(INCUMBENT, lambda e: None)
+    for monitor_hooks in (None, hooks):
+        monitor = SearchMonitor(Search(), monitor_hooks)
+        assert monitor.next_check == float('inf')
+        assert monitor.next_prune == float('inf')
+
+
+def test_budgets_and_time_sampling_set_finite_thresholds():
+    assert SearchMonitor(Search(), node_limit=5).next_check == 6
+    assert SearchMonitor(Search(), time_limit=1).next_check == DEFAULT_CHECK_INTERVAL
+    hooks = SearchHooks()
+    hooks.subscribe(NODE, lambda e: None, every_seconds=0.5)
+    assert SearchMonitor(Search(), hooks).next_check == DEFAULT_CHECK_INTERVAL
+
+
+def test_unsubscribe_stops_delivery():
+    hooks = SearchHooks()
+    fired = []
+    subscription = hooks.subscribe(NODE, lambda e: fired.append(e.nodes_visited), every_nodes=5)
+    search = Search()
+    expand(search, SearchMonitor(search, hooks), 10)
+    assert fired == [5, 10]
+
+    hooks.unsubscribe(subscription)
+    assert not hooks.has(NODE)
+    assert hooks.check_interval(NODE) is None
+    search = Search()
+    monitor = SearchMonitor(search, hooks)
+    assert monitor.next_check == float('inf')
+    expand(search, monitor, 10)
+    assert fired == [5, 10]
+
+
+def test_unknown_event_kind():
+    with pytest.raises(ValueError, match='Unknown search event'):
+        SearchHooks().subscribe('branch', lambda e: None)
@@ -0,0 +1,101 @@
+import os
+import sys
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.helperFunctions.readFromCSV import read_dataset
+from src.service.service import SchedulingService
+
+
+SMALL = {'machines_count': 2, 'jobs': [
+    {'job_id': 1, 'tasks': [{'task_id': 1, 'execution_time': 3}, {'task_id': 2, 'execution_time': 4}]},
+    {'job_id': 2, 'tasks': [{'task_id': 1, 'execution_time': 5}]},
+]}
+
+
+def slow_request(seconds=1.0):
+    """A request the branch & bound can't finish early: it uses its whole time budget."""
+    medium = read_dataset('medium')
+    return {'instance': {'machines_count': medium['machines_count'], 'jobs': medium['jobs']},
+            'solver': 'backtracking2', 'params': {'time_limit': seconds}}
+
+
+def wait_finished(job, timeout=60):
+    with job.changed:
+        job.changed.wait_for(lambda: job.status in SchedulingService.FINISHED, timeout)
+    return job.status
+
+
+@pytest.fixture
+def service():
+    service = SchedulingService(workers=1, max_pending=3)
+    yield service
+    service.shutdown()
+
+
+def test_solves_a_request(service):
+    job = service.submit({'instance': SMALL, 'solver': 'backtracking2'})
+    assert wait_finished(job) == 'done'
+    assert job.result['validation']['valid']
+    assert job.result['makespan'] == 7
+    assert service.stats()['completed'] == 1
+
+
+def test_rejects_when_the_queue_is_full(service):
+    jobs = [service.submit(slow_request(0.5)) for _ in range(3)]
+    assert all(job is not None for job in jobs)
+    assert service.submit({'instance': SMALL}) is None
+    stats = service.stats()
+    assert (stats['submitted'], stats['rejected'], stats['pending']) == (3, 1, 3)
+
+    # The last job is still queued behind the worker
+    assert service.cancel(jobs[2].id)
+    assert wait_finished(jobs[2]) == 'cancelled'
+    assert [wait_finished(job) for job in jobs[:2]] == ['done', 'done']
+    stats = service.stats()
+    assert (stats['completed'], stats['cancelled'], stats['pending']) == (2, 1, 0)
+    assert service.submit({'instance': SMALL}) is not None
+
+
+def test_finished_job_can_not_be_cancelled(service):
+    job = service.submit({'instance': SMALL})
+    wait_finished(job)
+    assert not service.cancel(job.id)
+    assert not service.cancel('no-such-job')
+
+
+def test_job_past_its_deadline_expires(service):
+    blocker = service.submit(slow_request(0.5))
+    job = service.submit({'instance': SMALL, 'deadline': 0.1})
+    assert wait_finished(job) == 'expired'
+    wait_finished(blocker)
+    assert service.stats()['expired'] == 1
+
+
+def test_deadline_cuts_the_time_limit_short(service):
+    job = service.submit(dict(slow_request(30), deadline=1.0))
+    assert wait_finished(job) == 'done'
+    assert job.finished - job.submitted < 10
+    assert job.result['validation']['valid']
+    # The caller's parameters are kept, not the clamped budget
+    assert job.params['time_limit'] == 30
+
+
+@pytest.mark.parametrize('instance, message', [
+    (None, 'instance'),
+    ({'machines_count': 2}, 'instance'),
+    ({'machines_count': 2, 'jobs': {}}, 'list'),
+    ({'machines_count': 0, 'jobs': SMALL['jobs']}, 'machines_count'),
+    ({'machines_count': 2, 'jobs': [{'job_id': 1, 'tasks': [{'task_id': 1, 'execution_time': 0}]}]}, 'positive'),
+    ({'machines_count': 2, 'jobs': SMALL['jobs'] + [SMALL['jobs'][0]]}, 'more than once'),
+    ({'machines_count': 2, 'jobs': [{'job_id': 1, 'tasks': [{'task_id': 2, 'execution_time': 3}]}]}, 'in order'),
+    ({'machines_count': 2, 'jobs': [{'job_id': 1, 'tasks': []}]}, 'no tasks'),
+    ({'machines_count': 2, 'jobs': [{'job_id': 1}]}, 'Malformed'),
+])
+def test_malformed_instances_are_rejected(service, instance, message):
+    with pytest.raises(ValueError, match=message):
+        service.submit({'instance': instance})
+    assert service.stats()['submitted'] == 0
+    assert not service.jobs
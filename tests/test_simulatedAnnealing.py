@@ -0,0 +1,73 @@
+import multiprocessing
+import os
+import random
+import sys
+import time
+
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.helperFunctions.schedule import Schedule
+from src.helperFunctions.scheduleValidator import validate_schedule
+from src.simulatedAnnealing import simulatedAnnealing
+from src.simulatedAnnealing.simulatedAnnealing import parallel_annealing, simulated_annealing
+from src.solvers.solver import Budget
+
+
+def random_problem(seed, jobs, machines, tasks, max_time):
+    rng = random.Random(seed)
+    job_list = [{'job_id': job_id, 'tasks': [{'task_id': task_id, 'execution_time': rng.randint(1, max_time)}
+                                             for task_id in range(1, tasks + 1)]}
+                for job_id in range(1, jobs + 1)]
+    return {'machines_count': machines, 'jobs': job_list, 'total_tasks': jobs * tasks, 'total_jobs': jobs}
+
+
+def test_parallel_chains_return_the_best_chain():
+    # Neither chain reaches the lower bound in 10 epochs, so both run their whole, seeded, budget
+    problem = random_problem(2, jobs=7, machines=5, tasks=3, max_time=50)
+    budget = Budget(generation_limit=10)
+    schedule, epochs, stats = parallel_annealing(problem, budget, chains=2, seed=1)
+
+    sequential = [simulated_annealing(problem, budget, seed)[0].makespan for seed in (1, 2)]
+    assert stats['chain_makespans'] == sequential
+    assert schedule.makespan == min(sequential) == sequential[stats['best_chain']]
+    assert epochs == 20
+    assert validate_schedule(schedule, problem).valid
+
+
+def test_single_chain_reports_itself():
+    problem = random_problem(2, jobs=7, machines=5, tasks=3, max_time=50)
+    schedule, _, stats = parallel_annealing(problem, Budget(generation_limit=5), chains=1, seed=1)
+    assert stats['best_chain'] == 0
+    assert stats['chain_makespans'] == [schedule.makespan]
+
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != 'fork',
+                    reason='the chains must inherit the patched annealing function')
+def test_chain_at_the_lower_bound_stops_the_others(monkeypatch):
+    problem = {'machines_count': 2, 'total_tasks': 2, 'total_jobs': 2,
+               'jobs': [{'job_id': 1, 'tasks': [{'task_id': 1, 'execution_time': 3}]},
+                        {'job_id': 2, 'tasks': [{'task_id': 1, 'execution_time': 5}]}]}
+
+    def chain(problem_data, budget, seed, warm_start, cancel, on_improvement, incumbent):
+        schedule = Schedule()
+        schedule.add(1, 1, 0, 0, 3)
+        if seed == 0:
+            # At the lower bound right away
+            schedule.add(2, 1, 1, 0, 5)
+            return schedule, 1, {'lower_bound': 5}
+        # Runs until stopped (or a minute at most)
+        schedule.add(2, 1, 0, 3, 5)
+        give_up = time.time() + 60
+        while not cancel.cancelled and time.time() < give_up:
+            time.sleep(0.01)
+        return schedule, 0, {'lower_bound': 5}
+
+    monkeypatch.setattr(simulatedAnnealing, 'simulated_annealing', chain)
+    start_time = time.time()
+    schedule, _, stats = parallel_annealing(problem, Budget(time_limit=60), chains=3, seed=0)
+    assert time.time() - start_time < 30
+    assert stats['best_chain'] == 0
+    assert stats['chain_makespans'] == [5, 8, 8]
+    assert schedule.makespan == 5
@@ -0,0 +1,103 @@
+import itertools
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.helperFunctions import solutionCache
+from src.helperFunctions.scheduleValidator import validate_schedule
+from src.helperFunctions.solutionCache import CanonicalInstance, SolutionCache
+
+
+def make_problem(jobs, machines_count=2):
+    """``jobs``: (job_id, durations) pairs."""
+    job_list = [{'job_id': job_id, 'tasks': [{'task_id': task_id, 'execution_time': duration}
+                                             for task_id, duration in enumerate(durations, 1)]}
+                for job_id, durations in jobs]
+    return {'machines_count': machines_count, 'jobs': job_list,
+            'total_tasks': sum(len(durations) for _, durations in jobs), 'total_jobs': len(jobs)}
+
+
+PROBLEM = make_problem([(1, [3, 4]), (2, [5])])
+# The same instance with the jobs listed the other way round and renumbered
+RENUMBERED = make_problem([(20, [5]), (10, [3, 4])])
+
+# Cultural format: machines numbered from 1
+TIMELINE = {1: [{(1, 1): (0, 3)}, {(1, 2): (3, 4)}], 2: [{(2, 1): (0, 5)}]}
+METRICS = {'makespan': 7}
+PARAMS = {'time_limit': 10.0, 'seed': 0}
+
+
+class Clock:
+    """Strictly increasing stand-in for ``time``, so access order never ties."""
+
+    def __init__(self):
+        self._ticks = itertools.count(1)
+
+    def time(self):
+        return float(next(self._ticks))
+
+
+def test_equivalent_renumbered_instance_hits(tmp_path):
+    assert CanonicalInstance(PROBLEM).hash == CanonicalInstance(RENUMBERED).hash
+    cache = SolutionCache(str(tmp_path / 'cache.db'))
+    assert cache.put(PROBLEM, 'tabu', PARAMS, TIMELINE, METRICS)
+
+    timeline, metrics = cache.get(RENUMBERED, 'tabu', dict(reversed(list(PARAMS.items()))))
+    assert metrics == METRICS
+    # Remapped to the caller's job IDs
+    assert timeline == {1: [{(10, 1): (0, 3)}, {(10, 2): (3, 4)}], 2: [{(20, 1): (0, 5)}]}
+    assert validate_schedule(timeline, RENUMBERED).valid
+    assert cache.stats()['hits'] == 1
+
+
+def test_different_durations_miss(tmp_path):
+    cache = SolutionCache(str(tmp_path / 'cache.db'))
+    cache.put(PROBLEM, 'tabu', PARAMS, TIMELINE, METRICS)
+    assert cache.get(make_problem([(1, [4, 3]), (2, [5])]), 'tabu', PARAMS) is None
+    assert cache.get(make_problem([(1, [3, 4]), (2, [5])], machines_count=3), 'tabu', PARAMS) is None
+
+
+def test_different_solver_or_params_miss(tmp_path):
+    cache = SolutionCache(str(tmp_path / 'cache.db'))
+    cache.put(PROBLEM, 'tabu', PARAMS, TIMELINE, METRICS)
+    assert cache.get(PROBLEM, 'annealing', PARAMS) is None
+    assert cache.get(PROBLEM, 'tabu', dict(PARAMS, seed=1)) is None
+    assert cache.get(PROBLEM, 'tabu', dict(PARAMS, tabu_tenure=5)) is None
+    assert cache.stats()['misses'] == 3
+    assert cache.get(PROBLEM, 'tabu', PARAMS) is not None
+
+
+def test_only_better_solutions_replace_an_entry(tmp_path):
+    cache = SolutionCache(str(tmp_path / 'cache.db'))
+    worse = {1: [{(1, 1): (0, 3)}, {(1, 2): (3, 4)}, {(2, 1): (7, 5)}]}
+    assert cache.put(PROBLEM, 'tabu', PARAMS, worse, {'makespan': 12})
+    assert cache.put(PROBLEM, 'tabu', PARAMS, TIMELINE, METRICS)
+    assert not cache.put(PROBLEM, 'tabu', PARAMS, worse, {'makespan': 12})
+    assert not cache.put(PROBLEM, 'tabu', PARAMS, TIMELINE, METRICS)
+    assert cache.get(PROBLEM, 'tabu', PARAMS)[1] == METRICS
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path, monkeypatch):
+    monkeypatch.setattr(solutionCache, 'time', Clock())
+    cache = SolutionCache(str(tmp_path / 'cache.db'), max_entries=2)
+    for seed in (1, 2):
+        cache.put(PROBLEM, 'tabu', dict(PARAMS, seed=seed), TIMELINE, METRICS)
+    # Reading seed 1 makes seed 2 the least recently used
+    assert cache.get(PROBLEM, 'tabu', dict(PARAMS, seed=1)) is not None
+    cache.put(PROBLEM, 'tabu', dict(PARAMS, seed=3), TIMELINE, METRICS)
+
+    assert cache.stats()['entries'] == 2
+    assert cache.get(PROBLEM, 'tabu', dict(PARAMS, seed=2)) is None
+    assert cache.get(PROBLEM, 'tabu', dict(PARAMS, seed=1)) is not None
+    assert cache.get(PROBLEM, 'tabu', dict(PARAMS, seed=3)) is not None
+
+
+def test_entries_persist_across_connections(tmp_path):
+    path = str(tmp_path / 'cache.db')
+    cache = SolutionCache(path)
+    cache.put(PROBLEM, 'tabu', PARAMS, TIMELINE, METRICS)
+    cache.close()
+    reopened = SolutionCache(path)
+    assert reopened.get(RENUMBERED, 'tabu', PARAMS) is not None
+    reopened.close()
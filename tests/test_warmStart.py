@@ -0,0 +1,100 @@
+import os
+import random
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.helperFunctions.schedule import Schedule
+from src.helperFunctions.scheduleValidator import validate_schedule
+from src.helperFunctions.warmStart import adapt_schedule, mutate_schedule
+
+
+def make_problem(machines_count, jobs):
+    """``jobs``: job_id -> list of execution times."""
+    job_list = [{'job_id': job_id, 'tasks': [{'task_id': task_id, 'execution_time': duration}
+                                             for task_id, duration in enumerate(durations, 1)]}
+                for job_id, durations in jobs.items()]
+    return {'machines_count': machines_count, 'jobs': job_list,
+            'total_tasks': sum(len(durations) for durations in jobs.values()), 'total_jobs': len(jobs)}
+
+
+PROBLEM = make_problem(2, {1: [3, 4], 2: [2], 3: [2, 2]})
+
+
+def previous_schedule():
+    """A feasible schedule of PROBLEM; machine 1 is idle in [2, 3)."""
+    schedule = Schedule()
+    for row in [(1, 1, 0, 0, 3), (2, 1, 1, 0, 2), (1, 2, 1, 3, 4), (3, 1, 0, 3, 2), (3, 2, 0, 5, 2)]:
+        schedule.add(*row)
+    return schedule
+
+
+def placement(schedule):
+    """(job_id, task_id) -> (machine, start)."""
+    return {(job_id, task_id): (machine, start) for job_id, task_id, machine, start, _ in schedule.rows()}
+
+
+def machine_orders(schedule, machines_count=2):
+    """(job_id, task_id) of the tasks on each machine, in start order."""
+    return [[(schedule.job_ids[row], schedule.task_ids[row]) for row in schedule.machine_order(machine)]
+            for machine in range(machines_count)]
+
+
+def test_unchanged_instance_keeps_the_schedule():
+    adapted = adapt_schedule(previous_schedule(), PROBLEM)
+    assert placement(adapted) == placement(previous_schedule())
+
+
+def test_changed_duration_keeps_machines_and_order():
+    problem = make_problem(2, {1: [5, 4], 2: [2], 3: [2, 2]})
+    adapted = adapt_schedule(previous_schedule(), problem)
+    assert validate_schedule(adapted, problem).valid
+    assert machine_orders(adapted) == machine_orders(previous_schedule())
+    # Everything after the longer first task moves back by two
+    assert placement(adapted) == {(1, 1): (0, 0), (2, 1): (1, 0), (1, 2): (1, 5), (3, 1): (0, 5), (3, 2): (0, 7)}
+
+
+def test_removed_job_is_dropped():
+    problem = make_problem(2, {1: [3, 4], 3: [2, 2]})
+    adapted = adapt_schedule(previous_schedule(), problem)
+    assert validate_schedule(adapted, problem).valid
+    assert placement(adapted) == {(1, 1): (0, 0), (1, 2): (1, 3), (3, 1): (0, 3), (3, 2): (0, 5)}
+
+
+def test_new_job_fills_the_earliest_gap():
+    problem = make_problem(2, {1: [3, 4], 2: [2], 3: [2, 2], 4: [1]})
+    adapted = adapt_schedule(previous_schedule(), problem)
+    assert validate_schedule(adapted, problem).valid
+    assert placement(adapted)[(4, 1)] == (1, 2)
+    kept = [[key for key in order if key != (4, 1)] for order in machine_orders(adapted)]
+    assert kept == machine_orders(previous_schedule())
+
+
+def test_new_task_starts_after_its_job_predecessor():
+    problem = make_problem(2, {1: [3, 4, 1], 2: [2], 3: [2, 2]})
+    adapted = adapt_schedule(previous_schedule(), problem)
+    assert validate_schedule(adapted, problem).valid
+    _, start = placement(adapted)[(1, 3)]
+    assert start >= adapted.end(adapted.locate(1, 2))
+
+
+def test_tasks_on_a_removed_machine_are_placed_again():
+    problem = make_problem(1, {1: [3, 4], 2: [2], 3: [2, 2]})
+    adapted = adapt_schedule(previous_schedule(), problem)
+    assert validate_schedule(adapted, problem).valid
+    assert set(adapted.machines) == {0}
+
+
+def test_cultural_timeline_and_releases():
+    problem = dict(PROBLEM, job_release={2: 4}, machine_release=[1, 0])
+    adapted = adapt_schedule(previous_schedule().cultural_view(), problem)
+    assert validate_schedule(adapted, problem).valid
+    assert placement(adapted)[(1, 1)] == (0, 1)
+    assert placement(adapted)[(2, 1)][1] >= 4
+
+
+def test_mutated_schedules_stay_feasible():
+    rng = random.Random(0)
+    for _ in range(20):
+        mutated = mutate_schedule(previous_schedule(), PROBLEM, rng, moves=3)
+        assert validate_schedule(mutated, PROBLEM).valid